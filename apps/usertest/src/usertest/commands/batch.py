@@ -7,13 +7,19 @@ import os
 import shutil
 import subprocess
 import sys
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
-from runner_core import RunnerConfig, RunRequest, run_once
+from runner_core import RunnerConfig, RunRequest, RunResult, run_once
 from runner_core.catalog import load_catalog_config
+from runner_core.pathing import slugify
 from runner_core.python_interpreter_probe import probe_python_interpreters
 from runner_core.run_spec import RunSpecError, resolve_effective_run_inputs
 
@@ -21,6 +27,10 @@ from usertest.commands.shared import (
     _EXEC_CACHE_DIR_HELP,
     _EXEC_CACHE_HELP,
     _EXEC_NETWORK_HELP,
+    _PROBE_CACHE_HELP,
+    _REFRESH_PROBES_HELP,
+    _TARGET_CACHE_HELP,
+    _VENV_TEMPLATE_CACHE_HELP,
     _default_builtin_sandbox_cli_context,
     _load_runner_config,
     _looks_like_local_repo_input,
@@ -104,6 +114,29 @@ def add_batch_command(sub: argparse._SubParsersAction) -> None:
         help="Path to monorepo root (auto-detected by default).",
     )
     batch_p.add_argument("--keep-workspace", action="store_true")
+    batch_p.add_argument(
+        "--target-cache",
+        choices=["off", "mirror"],
+        default="mirror",
+        help=_TARGET_CACHE_HELP,
+    )
+    batch_p.add_argument(
+        "--probe-cache",
+        choices=["off", "process", "persist"],
+        default="off",
+        help=_PROBE_CACHE_HELP,
+    )
+    batch_p.add_argument(
+        "--refresh-probes",
+        action="store_true",
+        help=_REFRESH_PROBES_HELP,
+    )
+    batch_p.add_argument(
+        "--venv-template-cache",
+        choices=["off", "reuse"],
+        default="reuse",
+        help=_VENV_TEMPLATE_CACHE_HELP,
+    )
     batch_p.add_argument(
         "--preflight-command",
         action="append",
@@ -219,9 +252,41 @@ def add_batch_command(sub: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Skip initial command responsiveness probes.",
     )
+    _add_run_pool_arguments(batch_p)
 
     batch_p.set_defaults(func=_cmd_batch)
 
+
+def _add_run_pool_arguments(p: argparse.ArgumentParser) -> None:
+    """Register the concurrent execution flags shared by `batch` and `matrix run`."""
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Maximum number of runs executed concurrently (default: 1, strictly in-order).",
+    )
+    p.add_argument(
+        "--agent-jobs",
+        action="append",
+        default=[],
+        metavar="AGENT=N",
+        help="Repeatable per-agent concurrency cap applied on top of --jobs (e.g., codex=2).",
+    )
+    p.add_argument(
+        "--docker-jobs",
+        type=int,
+        default=None,
+        help="Optional cap on concurrently running --exec-backend docker runs.",
+    )
+    p.add_argument(
+        "--summary-out",
+        type=Path,
+        help=(
+            "Write the execution summary JSON here "
+            "(default: <runs_dir>/_batches/<ts>.<command>.summary.json)."
+        ),
+    )
+
 @dataclass(frozen=True)
 class _TargetsYamlLocations:
     targets_value: tuple[int, int] | None
@@ -590,6 +655,212 @@ def _prevalidate_batch_requests(
 
     return errors
 
+@dataclass(frozen=True)
+class _RunPoolLimits:
+    jobs: int
+    agent_jobs: dict[str, int]
+    docker_jobs: int | None
+
+
+def _parse_run_pool_limits(args: argparse.Namespace) -> tuple[_RunPoolLimits, list[str]]:
+    """Parse --jobs/--agent-jobs/--docker-jobs into limits plus validation errors."""
+    errors: list[str] = []
+    jobs_arg = getattr(args, "jobs", None)
+    jobs = 1 if jobs_arg is None else int(jobs_arg)
+    if jobs < 1:
+        errors.append(f"--jobs must be >= 1 (got {jobs}).")
+        jobs = 1
+    agent_jobs: dict[str, int] = {}
+    for raw in getattr(args, "agent_jobs", None) or []:
+        agent, sep, value = str(raw).partition("=")
+        agent = agent.strip()
+        try:
+            cap = int(value.strip()) if sep else 0
+        except ValueError:
+            cap = 0
+        if not agent or cap < 1:
+            errors.append(f"--agent-jobs expects AGENT=N with N >= 1 (got {raw!r}).")
+            continue
+        agent_jobs[agent] = cap
+    docker_jobs = getattr(args, "docker_jobs", None)
+    if docker_jobs is not None and int(docker_jobs) < 1:
+        errors.append(f"--docker-jobs must be >= 1 (got {docker_jobs}).")
+        docker_jobs = None
+    return (
+        _RunPoolLimits(
+            jobs=jobs,
+            agent_jobs=agent_jobs,
+            docker_jobs=int(docker_jobs) if docker_jobs is not None else None,
+        ),
+        errors,
+    )
+
+
+def _run_request_conflict_keys(req: RunRequest) -> tuple[str, ...]:
+    """
+    Keys that must not be held by two in-flight runs at once.
+
+    `run_once` names run directories `<target>/<timestamp>/<agent>/<seed>` with second
+    resolution, so concurrent runs sharing target/agent/seed (e.g. persona x mission cells)
+    would collide. Forced image rebuilds are serialized because they retag a shared image.
+    """
+    keys = [f"run_dir:{slugify(req.repo)}:{req.agent}:{req.seed}"]
+    if req.exec_backend == "docker" and req.exec_rebuild_image:
+        keys.append("docker:rebuild_image")
+    return tuple(keys)
+
+
+def _timed_run_once(
+    run: Callable[[RunnerConfig, RunRequest], RunResult],
+    cfg: RunnerConfig,
+    req: RunRequest,
+) -> tuple[RunResult, float]:
+    started = time.monotonic()
+    result = run(cfg, req)
+    return result, time.monotonic() - started
+
+
+def _execute_run_requests(
+    *,
+    cfg: RunnerConfig,
+    requests: list[tuple[int, RunRequest]],
+    run: Callable[[RunnerConfig, RunRequest], RunResult],
+    limits: _RunPoolLimits,
+    command: str,
+    summary_out: Path | None,
+) -> int:
+    """
+    Execute validated requests with up to `limits.jobs` concurrent runs.
+
+    Each completed run prints its run dir to stdout (completion order) and a progress line to
+    stderr. With `--jobs 1` runs start in file order, matching the historical sequential loop.
+    If a run raises, no further runs are launched; in-flight runs finish, the summary is written,
+    and the first exception is re-raised.
+    """
+    started_utc = datetime.now(timezone.utc)
+    wall_started = time.monotonic()
+    pending = list(requests)
+    total = len(pending)
+    in_flight: dict[Future[tuple[RunResult, float]], tuple[int, RunRequest, float]] = {}
+    active_keys: set[str] = set()
+    active_agents: Counter[str] = Counter()
+    active_docker = 0
+    outcomes: list[dict[str, Any]] = []
+    first_error: BaseException | None = None
+    exit_code = 0
+
+    def _pick_launchable() -> int | None:
+        for pos, (_idx, req) in enumerate(pending):
+            if set(_run_request_conflict_keys(req)) & active_keys:
+                continue
+            agent_cap = limits.agent_jobs.get(req.agent)
+            if agent_cap is not None and active_agents[req.agent] >= agent_cap:
+                continue
+            if (
+                limits.docker_jobs is not None
+                and req.exec_backend == "docker"
+                and active_docker >= limits.docker_jobs
+            ):
+                continue
+            return pos
+        return None
+
+    with ThreadPoolExecutor(max_workers=limits.jobs) as executor:
+        while pending or in_flight:
+            while first_error is None and len(in_flight) < limits.jobs:
+                pos = _pick_launchable()
+                if pos is None:
+                    break
+                idx, req = pending.pop(pos)
+                active_keys.update(_run_request_conflict_keys(req))
+                active_agents[req.agent] += 1
+                if req.exec_backend == "docker":
+                    active_docker += 1
+                future = executor.submit(_timed_run_once, run, cfg, req)
+                in_flight[future] = (idx, req, time.monotonic())
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, req, submitted = in_flight.pop(future)
+                active_keys.difference_update(_run_request_conflict_keys(req))
+                active_agents[req.agent] -= 1
+                if req.exec_backend == "docker":
+                    active_docker -= 1
+                outcome: dict[str, Any] = {
+                    "index": idx,
+                    "repo": req.repo,
+                    "agent": req.agent,
+                    "seed": req.seed,
+                    "persona_id": req.persona_id,
+                    "mission_id": req.mission_id,
+                    "run_dir": None,
+                    "exit_code": None,
+                    "report_validation_errors": 0,
+                    "duration_seconds": None,
+                    "error": None,
+                }
+                error = future.exception()
+                if error is not None:
+                    if first_error is None:
+                        first_error = error
+                    exit_code = 2
+                    outcome["duration_seconds"] = round(time.monotonic() - submitted, 3)
+                    outcome["error"] = f"{type(error).__name__}: {error}"
+                else:
+                    result, duration = future.result()
+                    print(str(result.run_dir), flush=True)
+                    if result.exit_code != 0 or result.report_validation_errors:
+                        exit_code = 2
+                    outcome.update(
+                        run_dir=str(result.run_dir),
+                        exit_code=result.exit_code,
+                        report_validation_errors=len(result.report_validation_errors),
+                        duration_seconds=round(duration, 3),
+                    )
+                outcomes.append(outcome)
+                print(
+                    f"[{len(outcomes)}/{total}] index={idx} agent={req.agent} seed={req.seed} "
+                    f"exit_code={outcome['exit_code']} seconds={outcome['duration_seconds']}"
+                    + (f" error={outcome['error']}" if outcome["error"] else ""),
+                    file=sys.stderr,
+                    flush=True,
+                )
+
+    wall_clock_seconds = time.monotonic() - wall_started
+    summed_run_seconds = sum(float(o["duration_seconds"] or 0.0) for o in outcomes)
+    summary = {
+        "schema_version": 1,
+        "command": command,
+        "started_utc": started_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "finished_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "jobs": limits.jobs,
+        "agent_jobs": dict(sorted(limits.agent_jobs.items())),
+        "docker_jobs": limits.docker_jobs,
+        "requested_runs": total,
+        "completed_runs": len(outcomes),
+        "not_started_runs": len(pending),
+        "wall_clock_seconds": round(wall_clock_seconds, 3),
+        "summed_run_seconds": round(summed_run_seconds, 3),
+        "parallel_speedup": (
+            round(summed_run_seconds / wall_clock_seconds, 3) if wall_clock_seconds > 0 else None
+        ),
+        "runs": sorted(outcomes, key=lambda o: int(o["index"])),
+    }
+    if summary_out is None:
+        timestamp = started_utc.strftime("%Y%m%dT%H%M%SZ")
+        summary_out = cfg.runs_dir / "_batches" / f"{timestamp}.{command}.summary.json"
+    summary_out.parent.mkdir(parents=True, exist_ok=True)
+    summary_out.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(
+        f"{command} summary: {summary_out} (wall_clock_seconds={summary['wall_clock_seconds']} "
+        f"summed_run_seconds={summary['summed_run_seconds']})",
+        file=sys.stderr,
+    )
+    if first_error is not None:
+        raise first_error
+    return exit_code
+
 def _cmd_batch(args: argparse.Namespace) -> int:
     """Execute the batch subcommand."""
     repo_root = _resolve_repo_root(args.repo_root)
@@ -1105,6 +1376,10 @@ def _cmd_batch(args: argparse.Namespace) -> int:
             agent_append_system_prompt=args.agent_append_system_prompt,
             agent_append_system_prompt_file=args.agent_append_system_prompt_file,
             keep_workspace=bool(args.keep_workspace),
+            target_cache=str(args.target_cache),
+            probe_cache=str(args.probe_cache),
+            refresh_probes=bool(args.refresh_probes),
+            venv_template_cache=str(args.venv_template_cache),
             preflight_commands=tuple(preflight_commands),
             preflight_required_commands=tuple(preflight_required_commands),
             verification_commands=tuple(verification_commands),
@@ -1157,7 +1432,8 @@ def _cmd_batch(args: argparse.Namespace) -> int:
         validate_only=validate_only,
         target_locations=target_locations,
     )
-    all_errors = [*parse_errors, *validation_errors]
+    pool_limits, pool_errors = _parse_run_pool_limits(args)
+    all_errors = [*parse_errors, *pool_errors, *validation_errors]
     if all_errors:
         print("Batch validation failed; no targets were executed.", file=sys.stderr)
         for e in all_errors:
@@ -1178,12 +1454,13 @@ def _cmd_batch(args: argparse.Namespace) -> int:
         print("Batch validation passed; no targets were executed (validate-only).", file=sys.stderr)
         return 0
 
-    exit_code = 0
-    for _idx, req in requests:
-        result = run_once(cfg, req)
-        print(str(result.run_dir))
-        if result.exit_code != 0 or result.report_validation_errors:
-            exit_code = 2
-    return exit_code
+    return _execute_run_requests(
+        cfg=cfg,
+        requests=requests,
+        run=run_once,
+        limits=pool_limits,
+        command="batch",
+        summary_out=_resolve_optional_path(repo_root, getattr(args, "summary_out", None)),
+    )
 
 __all__ = ['add_batch_command', '_cmd_batch']
@@ -15,11 +15,17 @@ from runner_core import RunnerConfig, RunRequest, run_once
 from runner_core.catalog import discover_missions, discover_personas, load_catalog_config
 from runner_core.pathing import slugify
 
-from usertest.commands.batch import _prevalidate_batch_requests
+from usertest.commands.batch import (
+    _add_run_pool_arguments,
+    _execute_run_requests,
+    _parse_run_pool_limits,
+    _prevalidate_batch_requests,
+)
 from usertest.commands.shared import (
     _EXEC_CACHE_DIR_HELP,
     _EXEC_CACHE_HELP,
     _EXEC_NETWORK_HELP,
+    _TARGET_CACHE_HELP,
     _coerce_string,
     _load_runner_config,
     _load_yaml,
@@ -112,6 +118,12 @@ def add_matrix_command(sub: argparse._SubParsersAction) -> None:
         )
         p.add_argument("--exec-keep-container", action="store_true")
         p.add_argument("--exec-rebuild-image", action="store_true")
+        p.add_argument(
+            "--target-cache",
+            choices=["off", "mirror"],
+            default="mirror",
+            help=_TARGET_CACHE_HELP,
+        )
 
         p.add_argument(
             "--skip-command-probes",
@@ -125,6 +137,8 @@ def add_matrix_command(sub: argparse._SubParsersAction) -> None:
             help="Timeout for each command responsiveness probe.",
         )
 
+    _add_run_pool_arguments(matrix_run_p)
+
     matrix_plan_p.set_defaults(func=_cmd_matrix_plan)
     matrix_run_p.set_defaults(func=_cmd_matrix_run)
 
@@ -625,6 +639,7 @@ def _cmd_matrix(args: argparse.Namespace, *, execute: bool) -> int:
                             exec_env=base_exec_env,
                             exec_keep_container=bool(getattr(args, "exec_keep_container", False)),
                             exec_rebuild_image=bool(getattr(args, "exec_rebuild_image", False)),
+                            target_cache=str(getattr(args, "target_cache", "mirror")),
                         )
 
                         # Record plan entry.
@@ -853,13 +868,20 @@ def _cmd_matrix(args: argparse.Namespace, *, execute: bool) -> int:
     if not execute:
         return 0
 
-    exit_code = 0
-    for _idx, req in requests:
-        result = run_once(cfg, req)
-        print(str(result.run_dir))
-        if result.exit_code != 0 or result.report_validation_errors:
-            exit_code = 2
+    pool_limits, pool_errors = _parse_run_pool_limits(args)
+    if pool_errors:
+        print("Matrix execution options are invalid; no runs were executed.", file=sys.stderr)
+        for e in pool_errors:
+            print(f"- {e}", file=sys.stderr)
+        return 2
 
-    return exit_code
+    return _execute_run_requests(
+        cfg=cfg,
+        requests=requests,
+        run=run_once,
+        limits=pool_limits,
+        command="matrix",
+        summary_out=_resolve_optional_path(repo_root, getattr(args, "summary_out", None)),
+    )
 
 __all__ = ['add_matrix_command', '_cmd_matrix', '_cmd_matrix_plan', '_cmd_matrix_run']
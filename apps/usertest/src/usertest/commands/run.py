@@ -11,6 +11,10 @@ from usertest.commands.shared import (
     _EXEC_CACHE_DIR_HELP,
     _EXEC_CACHE_HELP,
     _EXEC_NETWORK_HELP,
+    _PROBE_CACHE_HELP,
+    _REFRESH_PROBES_HELP,
+    _TARGET_CACHE_HELP,
+    _VENV_TEMPLATE_CACHE_HELP,
     _default_builtin_sandbox_cli_context,
     _load_runner_config,
     _resolve_optional_path,
@@ -123,6 +127,29 @@ def add_run_command(sub: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Keep cloned workspace (may be relocated).",
     )
+    run_p.add_argument(
+        "--target-cache",
+        choices=["off", "mirror"],
+        default="off",
+        help=_TARGET_CACHE_HELP,
+    )
+    run_p.add_argument(
+        "--probe-cache",
+        choices=["off", "process", "persist"],
+        default="off",
+        help=_PROBE_CACHE_HELP,
+    )
+    run_p.add_argument(
+        "--refresh-probes",
+        action="store_true",
+        help=_REFRESH_PROBES_HELP,
+    )
+    run_p.add_argument(
+        "--venv-template-cache",
+        choices=["off", "reuse"],
+        default="off",
+        help=_VENV_TEMPLATE_CACHE_HELP,
+    )
     run_p.add_argument(
         "--preflight-command",
         action="append",
@@ -342,6 +369,10 @@ def _cmd_run(args: argparse.Namespace) -> int:
             agent_append_system_prompt=args.agent_append_system_prompt,
             agent_append_system_prompt_file=args.agent_append_system_prompt_file,
             keep_workspace=bool(args.keep_workspace),
+            target_cache=str(args.target_cache),
+            probe_cache=str(args.probe_cache),
+            refresh_probes=bool(args.refresh_probes),
+            venv_template_cache=str(args.venv_template_cache),
             preflight_commands=tuple(preflight_commands),
             preflight_required_commands=tuple(preflight_required_commands),
             verification_commands=tuple(verification_commands),
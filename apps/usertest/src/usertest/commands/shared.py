@@ -34,6 +34,25 @@ _EXEC_CACHE_DIR_HELP = (
     "(default: <repo_root>/runs/_cache/usertest)."
 )
 
+_TARGET_CACHE_HELP = (
+    "Git target acquisition: 'mirror' clones each workspace from a shared bare mirror under "
+    "runs/usertest/_cache/git_mirrors (fetched at most once per invocation); 'off' clones the "
+    "source directly for every run."
+)
+
+_PROBE_CACHE_HELP = (
+    "Preflight capability probes (agent --version, Python interpreter, pip/pytest modules): "
+    "'process' reuses successful answers within this invocation; 'persist' also keeps them in "
+    "runs/usertest/_cache/capability_probes.json; 'off' re-probes for every run."
+)
+_REFRESH_PROBES_HELP = "Ignore cached capability probe answers and re-probe before each run."
+
+_VENV_TEMPLATE_CACHE_HELP = (
+    "Local pip/pdm bootstrap venvs: 'reuse' clones each .venv from a template under "
+    "runs/usertest/_cache/venv_templates keyed by the requirements/lock file hashes, interpreter "
+    "and index URLs (built on the first miss); 'off' installs from scratch for every run."
+)
+
 _LEGACY_RUN_TIMESTAMP_RE = re.compile(r"^[0-9]{8}T[0-9]{6}Z$")
 _WINDOWS_ABS_PATH_RE = re.compile(r"^[A-Za-z]:[\\/]")
 _SENSITIVE_KV_KEY_RE = re.compile(
@@ -208,6 +208,14 @@ def add_telemetry_command(
         type=Path,
         help="Prior cohort_metrics.json used for factual before/after deltas.",
     )
+    materialize.add_argument(
+        "--state-dir",
+        type=Path,
+        help=(
+            "Persist per-stream cursors and reconciled events here so later runs only "
+            "ingest appended events."
+        ),
+    )
     materialize.set_defaults(func=_cmd_telemetry_materialize)
 
 
@@ -751,6 +759,7 @@ def _refresh_metrics_after_write(events_path: Path) -> None:
         materialize_lifecycle_metrics(
             event_sources=[events_path],
             output_dir=events_path.parent,
+            state_dir=events_path.parent / "_cache" / "lifecycle_metrics",
         )
     except Exception as exc:  # noqa: BLE001 - disposition must survive metric outages
         warnings.warn(
@@ -771,6 +780,7 @@ def _cmd_telemetry_materialize(args: argparse.Namespace) -> int:
         cohort_id=args.cohort_id,
         case_lifecycle_ids=args.case_lifecycle_id or None,
         comparison_cohort=args.compare_to,
+        state_dir=args.state_dir,
     )
     print(
         json.dumps(
@@ -782,6 +792,7 @@ def _cmd_telemetry_materialize(args: argparse.Namespace) -> int:
                 ),
                 "source_event_count": result.source_event_count,
                 "retained_event_count": result.retained_event_count,
+                "ingest_mode": result.ingest_mode,
             },
             sort_keys=True,
         ),
@@ -38,6 +38,14 @@ def add_token_monitor_command(sub: argparse._SubParsersAction) -> None:
         type=Path,
         help="Override Codex sessions root (defaults to CODEX_HOME/sessions or ~/.codex/sessions).",
     )
+    token_monitor_analyze_p.add_argument(
+        "--codex-session-index",
+        type=Path,
+        help=(
+            "Persist the Codex session index at this JSON path so later lookups only rescan "
+            "new or changed session files."
+        ),
+    )
     token_monitor_analyze_p.add_argument(
         "--output-dir",
         type=Path,
@@ -138,13 +146,30 @@ def _cmd_token_monitor_analyze(args: argparse.Namespace) -> int:
         if args.output_dir is not None
         else None
     )
+    session_index_path = (
+        (
+            _resolve_optional_path(repo_root, args.codex_session_index)
+            or args.codex_session_index.resolve()
+        )
+        if args.codex_session_index is not None
+        else None
+    )
 
     if args.no_write:
-        analysis = analyze_token_run(run_dir, codex_sessions_root=sessions_root)
+        analysis = analyze_token_run(
+            run_dir,
+            codex_sessions_root=sessions_root,
+            codex_session_index_path=session_index_path,
+        )
         print(json.dumps(public_analysis_payload(analysis), indent=2, ensure_ascii=False))
         return 0
 
-    write_run_monitoring(run_dir, codex_sessions_root=sessions_root, output_dir=output_dir)
+    write_run_monitoring(
+        run_dir,
+        codex_sessions_root=sessions_root,
+        output_dir=output_dir,
+        codex_session_index_path=session_index_path,
+    )
     destination = output_dir or run_dir
     print(str(destination / "token_monitoring.json"))
     print(str(destination / "token_monitoring.md"))
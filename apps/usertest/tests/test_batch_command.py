@@ -504,3 +504,78 @@ def test_batch_invalid_seed_is_structured(
     assert "integer" in out.err
     assert "Traceback" not in out.err
     assert "docs/reference/targets-yaml.md" in out.err
+
+
+def test_batch_run_pool_respects_jobs_caps_and_run_dir_conflicts(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    import threading
+    import time
+
+    from runner_core import RunnerConfig, RunRequest, RunResult
+
+    cfg = RunnerConfig(repo_root=tmp_path, runs_dir=tmp_path / "runs", agents={}, policies={})
+    requests = [
+        (0, RunRequest(repo="repo-a", agent="codex", seed=0, persona_id="p1")),
+        (1, RunRequest(repo="repo-a", agent="codex", seed=0, persona_id="p2")),
+        (2, RunRequest(repo="repo-a", agent="codex", seed=1)),
+        (3, RunRequest(repo="repo-a", agent="claude", seed=0)),
+        (4, RunRequest(repo="repo-b", agent="claude", seed=0)),
+    ]
+    lock = threading.Lock()
+    active: dict[str, int] = {"total": 0, "codex": 0, "run_dir:codex:0": 0}
+    peaks: dict[str, int] = dict.fromkeys(active, 0)
+
+    def _fake_run(_cfg: RunnerConfig, req: RunRequest) -> RunResult:
+        keys = ["total", req.agent]
+        if req.agent == "codex" and req.seed == 0:
+            keys.append("run_dir:codex:0")
+        with lock:
+            for key in keys:
+                active[key] = active.get(key, 0) + 1
+                peaks[key] = max(peaks.get(key, 0), active[key])
+        time.sleep(0.05)
+        with lock:
+            for key in keys:
+                active[key] -= 1
+        run_dir = tmp_path / "runs" / req.repo / req.agent / str(req.seed) / str(req.persona_id)
+        return RunResult(run_dir=run_dir, exit_code=0, report_validation_errors=[])
+
+    args = batch_command.argparse.Namespace(jobs=3, agent_jobs=["codex=1"], docker_jobs=None)
+    limits, errors = batch_command._parse_run_pool_limits(args)
+    assert errors == []
+
+    summary_path = tmp_path / "summary.json"
+    exit_code = batch_command._execute_run_requests(
+        cfg=cfg,
+        requests=requests,
+        run=_fake_run,
+        limits=limits,
+        command="batch",
+        summary_out=summary_path,
+    )
+
+    assert exit_code == 0
+    assert peaks["total"] <= 3
+    assert peaks["codex"] == 1
+    assert peaks["run_dir:codex:0"] == 1
+    assert peaks["claude"] == 2
+    out = capsys.readouterr()
+    assert len(out.out.strip().splitlines()) == 5
+    assert "[5/5]" in out.err
+
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert summary["jobs"] == 3
+    assert summary["agent_jobs"] == {"codex": 1}
+    assert [run["index"] for run in summary["runs"]] == [0, 1, 2, 3, 4]
+    assert summary["summed_run_seconds"] >= summary["wall_clock_seconds"]
+
+
+def test_batch_run_pool_rejects_invalid_limits() -> None:
+    args = batch_command.argparse.Namespace(jobs=0, agent_jobs=["codex", "x=0"], docker_jobs=0)
+    limits, errors = batch_command._parse_run_pool_limits(args)
+
+    assert limits.jobs == 1
+    assert limits.agent_jobs == {}
+    assert limits.docker_jobs is None
+    assert len(errors) == 4
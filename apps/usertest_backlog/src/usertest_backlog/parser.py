@@ -454,6 +454,16 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable applying the backlog policy engine.",
     )
+    reports_backlog_p.add_argument(
+        "--case-registry-store",
+        action="store_true",
+        help=(
+            "Keep the case registry in a SQLite sidecar (<name>.case_registry.sqlite) so "
+            "registry writes only touch changed cases. <name>.case_registry.json is still "
+            "exported for readers of the JSON file. Once created, the sidecar stays in use "
+            "until it is deleted."
+        ),
+    )
     reports_backlog_p.add_argument(
         "--atom-actions-yaml",
         type=Path,
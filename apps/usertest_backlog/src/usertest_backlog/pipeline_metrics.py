@@ -1708,6 +1708,7 @@ def record_stage_telemetry(
         materialize_lifecycle_metrics(
             event_sources=[global_path],
             output_dir=global_path.parent,
+            state_dir=global_path.parent / "_cache" / "lifecycle_metrics",
         )
     except Exception as exc:  # noqa: BLE001 - metrics cannot block case disposition
         warnings.warn(
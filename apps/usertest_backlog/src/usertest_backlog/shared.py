@@ -156,6 +156,7 @@ try:
         update_case_registry_stage_lineage,
         write_case_registry,
     )
+    from backlog_core.case_registry_store import enable_case_registry_store
     from backlog_core.prioritization import compute_problem_priority_signals
     from backlog_core.relation_review import (
         apply_relation_decisions,
@@ -27,6 +27,7 @@ from backlog_miner.prompt_correction import (
     acquire_author_session,
     correction_metrics_with_session_acquisition,
 )
+from backlog_miner.stage_concurrency import run_stage_prompt_batches
 from backlog_repo import validate_case_relation_receipt, write_case_relation_receipt
 
 from usertest_backlog.shared import *
@@ -3592,10 +3593,13 @@ def _run_cross_job_problem_synthesis(
         next_nodes: list[dict[str, Any]] = []
         level_receipts: list[dict[str, Any]] = []
         level_keys_by_route: dict[str, list[str]] = {}
-        for batch_index, batch_atoms in enumerate(batches, start=1):
-            batch_route_ids = [str(atom["atom_id"]) for atom in batch_atoms]
-            batch_nodes = [nodes_by_route[route_id] for route_id in batch_route_ids]
-            pass_tag = f"cross_job_routing_l{level:02d}_b{batch_index:03d}"
+
+        def _route_batch(
+            batch_index: int,
+            batch_atoms: list[dict[str, Any]],
+            _level: int = level,
+        ) -> dict[str, Any]:
+            pass_tag = f"cross_job_routing_l{_level:02d}_b{batch_index:03d}"
             prompt = _render_problem_mining_contract_prompt(
                 template_text=template_text,
                 stage_guidance_text=stage_guidance_text,
@@ -3613,7 +3617,7 @@ def _run_cross_job_problem_synthesis(
                     "across all batches so middle themes remain semantically visible."
                 ),
             )
-            reviewed = _run_independently_reviewed_problem_pass(
+            return _run_independently_reviewed_problem_pass(
                 repo_root=repo_root,
                 stage_artifacts_dir=stage_artifacts_dir,
                 base_tag=pass_tag,
@@ -3624,6 +3628,12 @@ def _run_cross_job_problem_synthesis(
                 cfg=cfg,
                 template_name="cross_job_routing",
             )
+
+        # Batches of one level are independent; only the next level reads their receipts.
+        reviewed_batches = run_stage_prompt_batches(batches, _route_batch, agent=agent)
+        for batch_atoms, reviewed in zip(batches, reviewed_batches, strict=True):
+            batch_route_ids = [str(atom["atom_id"]) for atom in batch_atoms]
+            batch_nodes = [nodes_by_route[route_id] for route_id in batch_route_ids]
             level_receipts.append(dict(reviewed["receipt"]))
             batch_keys_by_route: dict[str, list[str]] = {}
             routing_decisions = {
@@ -5745,19 +5755,12 @@ def _run_relation_review_batches(
 
     decisions: list[dict[str, Any]] = []
     batch_meta: list[dict[str, Any]] = []
-    for batch_index, batch_focus_ids in enumerate(
-        _relation_review_prompt_batches(
-            relation_items=relation_items,
-            neighborhoods=neighborhoods,
-            focus_problem_ids=focus_problem_ids,
-            template=template,
-            allowed_actions=allowed_actions,
-            stage_guidance_text=stage_guidance_text,
-            max_foci=max_foci,
-            max_prompt_chars=max_prompt_chars,
-        ),
-        start=1,
-    ):
+
+    def _review_batch(
+        batch_index: int,
+        batch_focus_ids: list[str],
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        batch_output: list[dict[str, Any]] = []
         batch_tag = f"{tag}_batch_{batch_index:03d}"
         batch_payload, prompt = _render_relation_review_prompt(
             relation_items=relation_items,
@@ -6163,7 +6166,7 @@ def _run_relation_review_batches(
                     + correction.status
                 )
             batch_decisions = [dict(item) for item in retained.payload["decisions"]]
-            decisions.extend(batch_decisions)
+            batch_output = batch_decisions
             meta["status"] = "completed"
             meta["decision_count"] = len(batch_decisions)
             meta["successful_attempt_tag"] = retained.payload.get("tag")
@@ -6215,7 +6218,7 @@ def _run_relation_review_batches(
                 focus_id for focus_id in batch_focus_ids if focus_id not in retained_focus_ids
             ]
             fallback = _failed_relation_review_batch_decisions(missing_focus_ids, error=error)
-            decisions.extend([*partial, *fallback])
+            batch_output = [*partial, *fallback]
             meta["status"] = (
                 "failed_partial_provisional_keep_separate"
                 if partial
@@ -6224,6 +6227,14 @@ def _run_relation_review_batches(
             meta["error"] = error
             meta["retained_valid_decision_count"] = len(partial)
             meta["decision_count"] = len(partial) + len(fallback)
+        return batch_output, meta
+
+    def _checkpoint(
+        _batch_index: int,
+        result: tuple[list[dict[str, Any]], dict[str, Any]],
+    ) -> None:
+        batch_decisions, meta = result
+        decisions.extend(batch_decisions)
         batch_meta.append(meta)
         _write_relation_review_checkpoint(
             review_dir=review_dir,
@@ -6232,6 +6243,26 @@ def _run_relation_review_batches(
             batches=batch_meta,
         )
 
+    # Batches are independent prompts over disjoint foci; decisions and checkpoints are
+    # still accumulated in batch order.
+    run_stage_prompt_batches(
+        list(
+            _relation_review_prompt_batches(
+                relation_items=relation_items,
+                neighborhoods=neighborhoods,
+                focus_problem_ids=focus_problem_ids,
+                template=template,
+                allowed_actions=allowed_actions,
+                stage_guidance_text=stage_guidance_text,
+                max_foci=max_foci,
+                max_prompt_chars=max_prompt_chars,
+            )
+        ),
+        _review_batch,
+        agent=agent,
+        on_result=_checkpoint,
+    )
+
     _validate_relation_decision_focuses(
         decisions,
         work_unit_problem_ids=set(focus_problem_ids),
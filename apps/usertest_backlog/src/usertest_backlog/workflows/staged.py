@@ -6388,6 +6388,8 @@ def _cmd_reports_backlog(args: argparse.Namespace) -> int:
             )
             return 2
     try:
+        if bool(getattr(args, "case_registry_store", False)):
+            enable_case_registry_store(case_registry_json)
         registry_seed_raw = getattr(args, "qualification_case_registry_seed", None)
         if qualification_input_bundle is not None:
             # A sealed execution must begin with the sealed historical graph.  Outcome
@@ -6414,7 +6416,16 @@ def _cmd_reports_backlog(args: argparse.Namespace) -> int:
             embed="none",
         )
     )
-    atoms_doc_raw = extract_backlog_atoms(records, repo_root=repo_root)
+    # Sealed qualification keeps --runs-dir frozen, so only ordinary refreshes cache atoms.
+    atoms_doc_raw = extract_backlog_atoms(
+        records,
+        repo_root=repo_root,
+        cache_dir=(
+            runs_dir / "_cache" / "backlog_atoms"
+            if not qualification_prepare and qualification_input_bundle is None
+            else None
+        ),
+    )
     atoms_raw = atoms_doc_raw.get("atoms")
     extracted_atoms = (
         [item for item in atoms_raw if isinstance(item, dict)]
@@ -421,6 +421,11 @@ def test_reports_backlog_defaults_to_signed_in_codex_author() -> None:
     args = build_parser().parse_args(["reports", "backlog", "--target", "target_a"])
 
     assert args.agent == "codex"
+    assert args.case_registry_store is False
+    args = build_parser().parse_args(
+        ["reports", "backlog", "--target", "target_a", "--case-registry-store"]
+    )
+    assert args.case_registry_store is True
 
 
 def test_live_backlog_rejects_agent_without_exact_session_correction() -> None:
@@ -1,7 +1,8 @@
 # ruff: noqa: E501,F401,F403,F405
 from __future__ import annotations
 
-from usertest_implement.review_context import _run_gh_json
+from usertest_implement.github_client import GhCliClient, GitHubClient
+from usertest_implement.review_context import _run_gh_json, _run_gh_text
 from usertest_implement.shared import *
 
 
@@ -41,6 +42,7 @@ def _wait_for_ci_success(
     workflow: str,
     timeout_seconds: float | None,
     required_event: str = "push",
+    client: GitHubClient | None = None,
 ) -> dict[str, Any]:
     """
     Wait for GitHub Actions CI to pass for the current branch HEAD before opening a PR.
@@ -69,8 +71,8 @@ def _wait_for_ci_success(
         "timeout_seconds": timeout_seconds,
     }
 
-    def _gh_json(argv: list[str]) -> Any:
-        return _run_gh_json(cwd=workspace_dir, argv=argv)
+    if client is None:
+        client = GhCliClient(workspace_dir, run_json=_run_gh_json, run_text=_run_gh_text)
 
     def _pick_run(runs: list[dict[str, Any]]) -> dict[str, Any] | None:
         matches = [
@@ -86,7 +88,10 @@ def _wait_for_ci_success(
         return matches[0]
 
     run_id: int | None = None
+    # A push usually shows up within seconds; back off while it does not, so a slow runner
+    # queue does not turn into a `gh run list` call every five seconds.
     poll_interval_seconds = 5.0
+    max_discovery_poll_seconds = 30.0
     limit = 50
     while True:
         elapsed = time.monotonic() - started_monotonic
@@ -100,29 +105,14 @@ def _wait_for_ci_success(
             return summary
 
         try:
-            runs_raw = _gh_json(
-                [
-                    "gh",
-                    "run",
-                    "list",
-                    "--workflow",
-                    workflow,
-                    "--branch",
-                    branch,
-                    "--limit",
-                    str(limit),
-                    "--json",
-                    "databaseId,headSha,event,status,conclusion,createdAt,url",
-                ]
-            )
+            runs_list = client.workflow_runs(workflow=workflow, branch=branch, limit=limit)
         except Exception as e:  # noqa: BLE001
             summary["error"] = f"Failed to list GitHub Actions runs: {e}"
             summary["finished_at_utc"] = _utc_now_z()
             _write_json(run_dir / "ci_gate.json", summary)
             return summary
 
-        runs_list = runs_raw if isinstance(runs_raw, list) else []
-        picked = _pick_run([r for r in runs_list if isinstance(r, dict)])
+        picked = _pick_run(runs_list)
         if picked is not None:
             run_id_raw = picked.get("databaseId")
             run_id_parsed: int | None = None
@@ -141,6 +131,7 @@ def _wait_for_ci_success(
                 break
 
         time.sleep(poll_interval_seconds)
+        poll_interval_seconds = min(max_discovery_poll_seconds, poll_interval_seconds * 1.5)
 
     assert run_id is not None
 
@@ -156,16 +147,7 @@ def _wait_for_ci_success(
             return summary
 
         try:
-            view_raw = _gh_json(
-                [
-                    "gh",
-                    "run",
-                    "view",
-                    str(run_id),
-                    "--json",
-                    "status,conclusion,url,headSha,event,createdAt,updatedAt",
-                ]
-            )
+            view_raw = client.workflow_run(run_id)
         except Exception as e:  # noqa: BLE001
             summary["error"] = f"Failed to inspect GitHub Actions run {run_id}: {e}"
             summary["finished_at_utc"] = _utc_now_z()
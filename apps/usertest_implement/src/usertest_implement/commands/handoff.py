@@ -605,6 +605,7 @@ def _cmd_handoff_adopt_pr(args: Any) -> int:
                 commands=plan_commands,
                 timeout_seconds=timeout_seconds,
                 python_executable=str(python_executable),
+                runs_dir=runs_root,
             )
             capture_performed = True
         capture_finished_at = _utc_now_z()
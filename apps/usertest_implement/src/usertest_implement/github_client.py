@@ -0,0 +1,435 @@
+"""GitHub reads shared by review context, CI gating and review queue reconciliation.
+
+:class:`GitHubClient` is the seam these callers go through.  :class:`GhCliClient` backs it
+with the GitHub CLI, and :class:`FakeGitHubClient` serves canned data for tests.
+
+``GhCliClient.pull_request`` fetches PR state, the head commit's status check rollup and the
+changed files with one ``gh pr view --json`` call, which ``gh`` resolves in a single GraphQL
+query.  ``checks_from_status_check_rollup`` rebuilds the ``gh pr checks`` rows from that
+rollup.  The rollup does not carry the triggering workflow event, so ``GhCliClient`` fills in
+``event`` from one ``gh run list --commit`` read.  A run's event never changes, so it is
+cached per run id.
+
+PR diffs and changed-file lists are cached per (PR, head SHA, base SHA).  Those keys are
+content addresses, so entries never need revalidation.  Mutable state (PR state, checks, and
+workflow runs, which can be re-run under the same id) is always re-read.  The cache is kept
+in memory per process.  When ``USERTEST_IMPLEMENT_GITHUB_CACHE_DIR`` is set it is also
+stored there, so the continuous loop, review, resume and handoff commands share it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, Protocol
+
+GITHUB_CACHE_DIR_ENV = "USERTEST_IMPLEMENT_GITHUB_CACHE_DIR"
+PR_SNAPSHOT_FIELDS = (
+    "number",
+    "url",
+    "title",
+    "state",
+    "isDraft",
+    "mergedAt",
+    "headRefName",
+    "headRefOid",
+    "baseRefName",
+    "baseRefOid",
+    "mergeable",
+    "reviewDecision",
+    "statusCheckRollup",
+    "files",
+    "changedFiles",
+)
+# ``gh pr view`` reads at most this many rollup contexts; a full page may be truncated.
+_ROLLUP_PAGE_SIZE = 100
+_RUN_ID_PATTERN = re.compile(r"/actions/runs/(\d+)")
+_CHECK_BUCKETS = {
+    "SUCCESS": "pass",
+    "SKIPPED": "skipping",
+    "NEUTRAL": "skipping",
+    "ERROR": "fail",
+    "FAILURE": "fail",
+    "TIMED_OUT": "fail",
+    "ACTION_REQUIRED": "fail",
+    "CANCELLED": "cancel",
+}
+
+_MEMORY_LOCK = threading.Lock()
+_MEMORY_CACHE: dict[str, Any] = {}
+
+
+def _cache_key(*parts: object) -> str:
+    return hashlib.sha256(json.dumps(parts, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def _cache_get(cache_dir: Path | None, key: str) -> Any:
+    with _MEMORY_LOCK:
+        if key in _MEMORY_CACHE:
+            return _MEMORY_CACHE[key]
+    if cache_dir is None:
+        return None
+    try:
+        value = json.loads((cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    with _MEMORY_LOCK:
+        _MEMORY_CACHE[key] = value
+    return value
+
+
+def _cache_put(cache_dir: Path | None, key: str, value: Any) -> None:
+    with _MEMORY_LOCK:
+        _MEMORY_CACHE[key] = value
+    if cache_dir is None:
+        return
+    path = cache_dir / f"{key}.json"
+    temp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp.write_text(json.dumps(value, ensure_ascii=False), encoding="utf-8")
+        os.replace(temp, path)
+    except OSError:
+        # The on-disk cache only saves GitHub calls.
+        temp.unlink(missing_ok=True)
+
+
+def clear_github_memory_cache() -> None:
+    """Forget cached GitHub responses held by this process (on-disk entries are kept)."""
+
+    with _MEMORY_LOCK:
+        _MEMORY_CACHE.clear()
+
+
+def github_cache_dir_from_env() -> Path | None:
+    raw = (os.environ.get(GITHUB_CACHE_DIR_ENV) or "").strip()
+    return Path(raw).expanduser() if raw else None
+
+
+def _rollup_run_id(item: dict[str, Any]) -> int | None:
+    match = _RUN_ID_PATTERN.search(str(item.get("detailsUrl") or ""))
+    return int(match.group(1)) if match else None
+
+
+def checks_from_status_check_rollup(
+    rollup: Any,
+    *,
+    run_events: Mapping[int, str] | None = None,
+) -> list[dict[str, Any]]:
+    """Return ``gh pr checks --json``-shaped rows for a PR's ``statusCheckRollup``.
+
+    Like ``gh pr checks``, a check re-run on the same commit is reported once, from its most
+    recent start.  The rollup carries no workflow event; ``event`` is looked up in
+    ``run_events`` by the Actions run id in the check's details URL, and is empty for status
+    contexts and for checks whose run is unknown.
+    """
+
+    rows: list[dict[str, Any]] = []
+    seen: set[tuple[str, str]] = set()
+    contexts = [item for item in rollup or () if isinstance(item, dict)]
+    contexts.sort(key=lambda item: str(item.get("startedAt") or ""), reverse=True)
+    for item in contexts:
+        event = ""
+        if item.get("__typename") == "StatusContext" or "context" in item:
+            name = str(item.get("context") or "")
+            state = str(item.get("state") or "").upper()
+            link = item.get("targetUrl")
+            workflow = ""
+        else:
+            name = str(item.get("name") or "")
+            status = str(item.get("status") or "").upper()
+            state = str(item.get("conclusion") or "").upper() if status == "COMPLETED" else status
+            link = item.get("detailsUrl")
+            workflow = str(item.get("workflowName") or "")
+            run_id = _rollup_run_id(item)
+            if run_id is not None and run_events:
+                event = str(run_events.get(run_id) or "")
+        if (name, workflow) in seen:
+            continue
+        seen.add((name, workflow))
+        rows.append(
+            {
+                "name": name,
+                "state": state,
+                "startedAt": item.get("startedAt"),
+                "completedAt": item.get("completedAt"),
+                "link": link,
+                "bucket": _CHECK_BUCKETS.get(state, "pending"),
+                "event": event,
+                "workflow": workflow,
+            }
+        )
+    rows.reverse()
+    return rows
+
+
+def changed_files_from_snapshot(pr: dict[str, Any]) -> list[str]:
+    """Return the changed paths listed in the ``files`` field of PR snapshot ``pr``."""
+
+    files = pr.get("files")
+    if isinstance(files, list):
+        return [
+            str(item["path"]).strip()
+            for item in files
+            if isinstance(item, dict) and str(item.get("path") or "").strip()
+        ]
+    return []
+
+
+class GitHubClient(Protocol):
+    """PR and workflow-run reads used by review context and the CI gate."""
+
+    def pull_request(self, pr_url: str) -> dict[str, Any]:
+        """Return the PR with :data:`PR_SNAPSHOT_FIELDS` (``gh pr view --json`` shape)."""
+        ...
+
+    def pull_request_checks(self, pr_url: str, pr: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return ``gh pr checks --json`` rows for the head commit of snapshot ``pr``."""
+        ...
+
+    def pull_request_changed_files(self, pr_url: str, pr: dict[str, Any]) -> list[str]:
+        """Return the changed paths of snapshot ``pr``."""
+        ...
+
+    def pull_request_diff(self, pr_url: str, pr: dict[str, Any]) -> str:
+        """Return the full diff of snapshot ``pr``."""
+        ...
+
+    def workflow_runs(self, *, workflow: str, branch: str, limit: int) -> list[dict[str, Any]]:
+        """Return recent runs (``gh run list --json`` shape), newest first."""
+        ...
+
+    def workflow_run(self, run_id: int) -> dict[str, Any]:
+        """Return one run (``gh run view --json`` shape)."""
+        ...
+
+
+def _require_object(value: Any, *, label: str) -> dict[str, Any]:
+    if not isinstance(value, dict):
+        raise RuntimeError(f"{label} returned non-object JSON")
+    return value
+
+
+class GhCliClient:
+    """:class:`GitHubClient` over the GitHub CLI, caching immutable responses.
+
+    ``run_json``/``run_text`` take ``cwd`` and ``argv`` keywords and default to
+    ``review_context._run_gh_json``/``_run_gh_text``.
+    """
+
+    def __init__(
+        self,
+        cwd: Path,
+        *,
+        gh_bin: str = "gh",
+        cache_dir: Path | None = None,
+        run_json: Callable[..., Any] | None = None,
+        run_text: Callable[..., str] | None = None,
+    ) -> None:
+        if run_json is None or run_text is None:
+            from usertest_implement.review_context import _run_gh_json, _run_gh_text
+
+            run_json = run_json or _run_gh_json
+            run_text = run_text or _run_gh_text
+        self.cwd = cwd
+        self.gh_bin = gh_bin
+        self.cache_dir = cache_dir if cache_dir is not None else github_cache_dir_from_env()
+        self._run_json = run_json
+        self._run_text = run_text
+
+    def _json(self, *args: str) -> Any:
+        return self._run_json(cwd=self.cwd, argv=[self.gh_bin, *args])
+
+    def _text(self, *args: str) -> str:
+        return self._run_text(cwd=self.cwd, argv=[self.gh_bin, *args])
+
+    def _cached_text(self, key: str, fetch: Callable[[], str]) -> str:
+        cached = _cache_get(self.cache_dir, key)
+        if isinstance(cached, str):
+            return cached
+        text = fetch()
+        _cache_put(self.cache_dir, key, text)
+        return text
+
+    @staticmethod
+    def _revision(pr: dict[str, Any]) -> tuple[str, str] | None:
+        head = str(pr.get("headRefOid") or "").strip()
+        base = str(pr.get("baseRefOid") or "").strip()
+        return (head, base) if head and base else None
+
+    def pull_request(self, pr_url: str) -> dict[str, Any]:
+        raw = self._json("pr", "view", pr_url, "--json", ",".join(PR_SNAPSHOT_FIELDS))
+        return _require_object(raw, label="gh pr view")
+
+    def pull_request_checks(self, pr_url: str, pr: dict[str, Any]) -> list[dict[str, Any]]:
+        rollup = pr.get("statusCheckRollup")
+        if isinstance(rollup, list) and len(rollup) < _ROLLUP_PAGE_SIZE:
+            return checks_from_status_check_rollup(
+                rollup, run_events=self._run_events(pr, rollup)
+            )
+        raw = self._json(
+            "pr",
+            "checks",
+            pr_url,
+            "--json",
+            "name,state,startedAt,completedAt,link,bucket,event,workflow",
+        )
+        return [item for item in raw if isinstance(item, dict)] if isinstance(raw, list) else []
+
+    def _run_events(self, pr: dict[str, Any], rollup: list[Any]) -> dict[int, str]:
+        run_ids = {
+            run_id
+            for item in rollup
+            if isinstance(item, dict) and (run_id := _rollup_run_id(item)) is not None
+        }
+        events: dict[int, str] = {}
+        for run_id in run_ids:
+            cached = _cache_get(self.cache_dir, _cache_key("run-event", run_id))
+            if isinstance(cached, str):
+                events[run_id] = cached
+        head = str(pr.get("headRefOid") or "").strip()
+        if run_ids <= events.keys() or not head:
+            return events
+        try:
+            raw = self._json(
+                "run",
+                "list",
+                "--commit",
+                head,
+                "--limit",
+                str(_ROLLUP_PAGE_SIZE),
+                "--json",
+                "databaseId,event",
+            )
+        except RuntimeError:
+            # Events only annotate the check rows; the review can proceed without them.
+            return events
+        for run in raw if isinstance(raw, list) else ():
+            if not isinstance(run, dict) or not isinstance(run.get("databaseId"), int):
+                continue
+            event = str(run.get("event") or "")
+            events[run["databaseId"]] = event
+            _cache_put(self.cache_dir, _cache_key("run-event", run["databaseId"]), event)
+        return events
+
+    def pull_request_changed_files(self, pr_url: str, pr: dict[str, Any]) -> list[str]:
+        files = changed_files_from_snapshot(pr)
+        changed_count = pr.get("changedFiles")
+        if isinstance(pr.get("files"), list) and changed_count == len(files):
+            return files
+        revision = self._revision(pr)
+
+        def _fetch() -> str:
+            return self._text("pr", "diff", pr_url, "--name-only")
+
+        text = (
+            self._cached_text(_cache_key("pr-diff-names", pr_url, *revision), _fetch)
+            if revision is not None
+            else _fetch()
+        )
+        return [line.strip() for line in text.splitlines() if line.strip()]
+
+    def pull_request_diff(self, pr_url: str, pr: dict[str, Any]) -> str:
+        revision = self._revision(pr)
+
+        def _fetch() -> str:
+            return self._text("pr", "diff", pr_url)
+
+        if revision is None:
+            return _fetch()
+        return self._cached_text(_cache_key("pr-diff", pr_url, *revision), _fetch)
+
+    def workflow_runs(self, *, workflow: str, branch: str, limit: int) -> list[dict[str, Any]]:
+        raw = self._json(
+            "run",
+            "list",
+            "--workflow",
+            workflow,
+            "--branch",
+            branch,
+            "--limit",
+            str(limit),
+            "--json",
+            "databaseId,headSha,event,status,conclusion,createdAt,url",
+        )
+        return [item for item in raw if isinstance(item, dict)] if isinstance(raw, list) else []
+
+    def workflow_run(self, run_id: int) -> dict[str, Any]:
+        # Not cached: a re-run reuses the run id, so even a completed run can change again.
+        return _require_object(
+            self._json(
+                "run",
+                "view",
+                str(run_id),
+                "--json",
+                "status,conclusion,url,headSha,event,createdAt,updatedAt",
+            ),
+            label="gh run view",
+        )
+
+
+class FakeGitHubClient:
+    """In-memory :class:`GitHubClient` for tests; every read is recorded in ``calls``."""
+
+    def __init__(
+        self,
+        *,
+        pull_requests: dict[str, dict[str, Any]] | None = None,
+        diffs: dict[str, str] | None = None,
+        runs: list[dict[str, Any]] | None = None,
+        run_views: dict[int, list[dict[str, Any]]] | None = None,
+    ) -> None:
+        self.pull_requests = dict(pull_requests or {})
+        self.diffs = dict(diffs or {})
+        self.runs = list(runs or [])
+        # Successive ``workflow_run`` reads pop views until one remains.
+        self.run_views = {key: list(value) for key, value in (run_views or {}).items()}
+        self.calls: list[tuple[str, str]] = []
+
+    def pull_request(self, pr_url: str) -> dict[str, Any]:
+        self.calls.append(("pull_request", pr_url))
+        try:
+            return dict(self.pull_requests[pr_url])
+        except KeyError:
+            raise RuntimeError(f"no such pull request: {pr_url}") from None
+
+    def pull_request_checks(self, pr_url: str, pr: dict[str, Any]) -> list[dict[str, Any]]:
+        self.calls.append(("pull_request_checks", pr_url))
+        return checks_from_status_check_rollup(pr.get("statusCheckRollup"))
+
+    def pull_request_changed_files(self, pr_url: str, pr: dict[str, Any]) -> list[str]:
+        self.calls.append(("pull_request_changed_files", pr_url))
+        return changed_files_from_snapshot(pr)
+
+    def pull_request_diff(self, pr_url: str, pr: dict[str, Any]) -> str:
+        self.calls.append(("pull_request_diff", pr_url))
+        return self.diffs.get(pr_url, "")
+
+    def workflow_runs(self, *, workflow: str, branch: str, limit: int) -> list[dict[str, Any]]:
+        self.calls.append(("workflow_runs", branch))
+        return [dict(run) for run in self.runs[:limit]]
+
+    def workflow_run(self, run_id: int) -> dict[str, Any]:
+        self.calls.append(("workflow_run", str(run_id)))
+        views = self.run_views.get(int(run_id))
+        if not views:
+            raise RuntimeError(f"no such workflow run: {run_id}")
+        return dict(views.pop(0) if len(views) > 1 else views[0])
+
+
+__all__ = [
+    "GITHUB_CACHE_DIR_ENV",
+    "PR_SNAPSHOT_FIELDS",
+    "FakeGitHubClient",
+    "GhCliClient",
+    "GitHubClient",
+    "changed_files_from_snapshot",
+    "checks_from_status_check_rollup",
+    "clear_github_memory_cache",
+    "github_cache_dir_from_env",
+]
@@ -1,8 +1,30 @@
+"""Implementation ledger persistence.
+
+The ledger is one YAML document (``schema_version``, ``updated_at`` and ``actions`` keyed by
+fingerprint).  Writers serialize on an advisory lock on ``<ledger>.lock`` (``fcntl.flock`` on
+POSIX, ``msvcrt.locking`` on Windows), so a crashed worker never leaves a stale lock behind.
+
+With ``USERTEST_IMPLEMENT_LEDGER_JOURNAL=1``, :func:`update_ledger_file` appends one JSON record
+per changed fingerprint to ``<ledger>.journal.jsonl`` instead of rewriting the YAML document, and
+folds the journal back into the YAML shape every ``_JOURNAL_COMPACT_RECORDS`` records.  Readers
+going through :func:`load_ledger` always see snapshot plus journal; anything reading the YAML
+file directly should call :func:`compact_ledger_journal` first.  Each process keeps the last
+materialized ledger per path and only re-reads the YAML snapshot when its stat changes, so an
+update validates and serializes just the entry it changed.
+"""
+
 from __future__ import annotations
 
+import copy
+import json
 import os
+import sys
+import threading
 import time
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -18,18 +40,53 @@ from backlog_repo import (
     validate_outcome_record,
 )
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+LEDGER_JOURNAL_ENV = "USERTEST_IMPLEMENT_LEDGER_JOURNAL"
 _LOCK_TIMEOUT_SECONDS = 60.0
 _LOCK_POLL_SECONDS = 0.1
-_LOCK_STALE_SECONDS = 300.0
+_JOURNAL_COMPACT_RECORDS = 256
+_MAX_CACHED_SNAPSHOTS = 8
 
 
 def _utc_now_z() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def load_ledger(path: Path) -> dict[str, Any]:
-    """Load the implementation ledger and fail on corrupt durable state."""
+def ledger_journal_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.journal.jsonl")
+
+
+def ledger_journal_enabled() -> bool:
+    return os.environ.get(LEDGER_JOURNAL_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _validated_entry(fingerprint: Any, entry: Any, *, source: Path) -> dict[str, Any]:
+    if not isinstance(fingerprint, str) or not fingerprint.strip():
+        raise ValueError(f"Implementation ledger contains an invalid fingerprint: {source}")
+    if not isinstance(entry, dict):
+        raise ValueError(
+            f"Implementation ledger entry must be a mapping: {fingerprint!r} in {source}"
+        )
+    entry_copy = dict(entry)
+    entry_fingerprint = entry_copy.get("fingerprint")
+    if entry_fingerprint is not None and entry_fingerprint != fingerprint:
+        raise ValueError(
+            "Implementation ledger entry fingerprint mismatch: "
+            f"key={fingerprint!r} entry={entry_fingerprint!r}"
+        )
+    outcome = entry_copy.get("outcome")
+    if outcome is not None:
+        if not isinstance(outcome, dict):
+            raise ValueError(f"Ledger outcome must be a mapping: {fingerprint!r}")
+        entry_copy["outcome"] = validate_outcome_record(outcome)
+    return entry_copy
+
 
+def _load_snapshot(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {"schema_version": 1, "updated_at": None, "actions": {}}
     try:
@@ -45,25 +102,7 @@ def load_ledger(path: Path) -> dict[str, Any]:
         raise ValueError(f"Implementation ledger actions must be a mapping: {path}")
     actions_dict: dict[str, Any] = {}
     for fingerprint, entry in actions.items():
-        if not isinstance(fingerprint, str) or not fingerprint.strip():
-            raise ValueError(f"Implementation ledger contains an invalid fingerprint: {path}")
-        if not isinstance(entry, dict):
-            raise ValueError(
-                f"Implementation ledger entry must be a mapping: {fingerprint!r} in {path}"
-            )
-        entry_copy = dict(entry)
-        entry_fingerprint = entry_copy.get("fingerprint")
-        if entry_fingerprint is not None and entry_fingerprint != fingerprint:
-            raise ValueError(
-                "Implementation ledger entry fingerprint mismatch: "
-                f"key={fingerprint!r} entry={entry_fingerprint!r}"
-            )
-        outcome = entry_copy.get("outcome")
-        if outcome is not None:
-            if not isinstance(outcome, dict):
-                raise ValueError(f"Ledger outcome must be a mapping: {fingerprint!r}")
-            entry_copy["outcome"] = validate_outcome_record(outcome)
-        actions_dict[fingerprint] = entry_copy
+        actions_dict[fingerprint] = _validated_entry(fingerprint, entry, source=path)
     updated_at_raw = raw.get("updated_at")
     updated_at = (
         updated_at_raw
@@ -77,6 +116,111 @@ def load_ledger(path: Path) -> dict[str, Any]:
     }
 
 
+@dataclass(frozen=True)
+class _LedgerSnapshot:
+    """A materialized ledger; ``doc`` is shared between callers and never mutated."""
+
+    snapshot_stat: tuple[int, int, int] | None
+    journal_offset: int
+    journal_records: int
+    doc: dict[str, Any]
+
+
+_SNAPSHOTS: dict[Path, _LedgerSnapshot] = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _remember_snapshot(path: Path, snapshot: _LedgerSnapshot) -> None:
+    with _SNAPSHOTS_LOCK:
+        _SNAPSHOTS.pop(path, None)
+        _SNAPSHOTS[path] = snapshot
+        while len(_SNAPSHOTS) > _MAX_CACHED_SNAPSHOTS:
+            _SNAPSHOTS.pop(next(iter(_SNAPSHOTS)))
+
+
+def _replay_journal(path: Path, snapshot: _LedgerSnapshot) -> _LedgerSnapshot:
+    journal = ledger_journal_path(path)
+    try:
+        with journal.open("rb") as handle:
+            handle.seek(snapshot.journal_offset)
+            data = handle.read()
+    except FileNotFoundError:
+        return snapshot
+    actions = dict(snapshot.doc["actions"])
+    updated_at = snapshot.doc["updated_at"]
+    offset = snapshot.journal_offset
+    records = snapshot.journal_records
+    for line in data.splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            # A torn append from a crashed writer; the next writer truncates it.
+            break
+        offset += len(line)
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ValueError(f"Implementation ledger journal is corrupt: {journal}") from exc
+        if not isinstance(record, dict):
+            raise ValueError(f"Implementation ledger journal record must be a mapping: {journal}")
+        fingerprint = record.get("fingerprint")
+        actions[fingerprint] = _validated_entry(fingerprint, record.get("entry"), source=journal)
+        record_updated_at = record.get("updated_at")
+        if isinstance(record_updated_at, str) and record_updated_at.strip():
+            updated_at = record_updated_at
+        records += 1
+    return _LedgerSnapshot(
+        snapshot_stat=snapshot.snapshot_stat,
+        journal_offset=offset,
+        journal_records=records,
+        doc={"schema_version": 1, "updated_at": updated_at, "actions": actions},
+    )
+
+
+def _materialize(path: Path) -> _LedgerSnapshot:
+    """Return snapshot plus journal, re-reading only what changed since the last call."""
+
+    snapshot_stat = _stat_key(path)
+    try:
+        journal_size = ledger_journal_path(path).stat().st_size
+    except FileNotFoundError:
+        journal_size = 0
+    with _SNAPSHOTS_LOCK:
+        snapshot = _SNAPSHOTS.get(path)
+    if (
+        snapshot is None
+        or snapshot.snapshot_stat != snapshot_stat
+        or journal_size < snapshot.journal_offset
+    ):
+        snapshot = _LedgerSnapshot(
+            snapshot_stat=snapshot_stat,
+            journal_offset=0,
+            journal_records=0,
+            doc=_load_snapshot(path),
+        )
+    if journal_size > snapshot.journal_offset:
+        snapshot = _replay_journal(path, snapshot)
+    _remember_snapshot(path, snapshot)
+    return snapshot
+
+
+def load_ledger(path: Path) -> dict[str, Any]:
+    """Load the implementation ledger and fail on corrupt durable state."""
+
+    if not ledger_journal_path(path).exists():
+        return copy.deepcopy(_materialize(path).doc)
+    with _ledger_lock(path, shared=True):
+        return copy.deepcopy(_materialize(path).doc)
+
+
 def update_ledger_doc(
     doc: dict[str, Any],
     *,
@@ -125,61 +269,163 @@ def write_ledger(path: Path, doc: dict[str, Any]) -> None:
     """Persist the implementation ledger as deterministic YAML."""
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        yaml.safe_dump(doc, sort_keys=True, allow_unicode=True),
-        encoding="utf-8",
-    )
+    staged = path.with_name(f".{path.name}.{os.getpid()}-{uuid.uuid4().hex}.tmp")
+    try:
+        staged.write_text(
+            yaml.safe_dump(doc, sort_keys=True, allow_unicode=True),
+            encoding="utf-8",
+        )
+        os.replace(staged, path)
+    finally:
+        staged.unlink(missing_ok=True)
 
 
-def _acquire_lock(path: Path) -> Path:
+def _acquire_lock(path: Path, *, shared: bool = False) -> int:
     lock_path = path.with_name(f"{path.name}.lock")
     lock_path.parent.mkdir(parents=True, exist_ok=True)
-    started = time.monotonic()
-    while True:
-        try:
-            fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-        except FileExistsError as err:
-            try:
-                age = time.time() - lock_path.stat().st_mtime
-            except OSError:
-                age = None
-            if age is not None and age > _LOCK_STALE_SECONDS:
+    fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        if sys.platform == "win32":
+            # ``LK_LOCK`` itself retries for ~10 seconds; msvcrt has no shared mode.
+            deadline = time.monotonic() + _LOCK_TIMEOUT_SECONDS
+            while True:
+                os.lseek(fd, 0, os.SEEK_SET)
                 try:
-                    lock_path.unlink()
-                except OSError:
-                    pass
-                continue
-            if time.monotonic() - started > _LOCK_TIMEOUT_SECONDS:
-                raise TimeoutError(
-                    f"Timed out waiting for ledger lock: {lock_path}"
-                ) from err
-            time.sleep(_LOCK_POLL_SECONDS)
-            continue
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                handle.write(f"pid={os.getpid()}\n")
-                handle.write(f"started_at={_utc_now_z()}\n")
-        except Exception:
-            try:
-                lock_path.unlink()
-            except OSError:
-                pass
-            raise
-        return lock_path
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as err:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(
+                            f"Timed out waiting for ledger lock: {lock_path}"
+                        ) from err
+        else:
+            operation = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB
+            deadline = time.monotonic() + _LOCK_TIMEOUT_SECONDS
+            while True:
+                try:
+                    fcntl.flock(fd, operation)
+                    break
+                except BlockingIOError as err:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(
+                            f"Timed out waiting for ledger lock: {lock_path}"
+                        ) from err
+                    time.sleep(_LOCK_POLL_SECONDS)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _release_lock(fd: int) -> None:
+    try:
+        if sys.platform == "win32":
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
-def update_ledger_file(path: Path, *, fingerprint: str, updates: dict[str, Any]) -> dict[str, Any]:
-    lock_path = _acquire_lock(path)
+@contextmanager
+def _ledger_lock(path: Path, *, shared: bool = False) -> Iterator[None]:
+    fd = _acquire_lock(path, shared=shared)
     try:
-        doc = load_ledger(path)
-        updated = update_ledger_doc(doc, fingerprint=fingerprint, updates=updates)
-        write_ledger(path, updated)
-        return updated
+        yield
     finally:
-        try:
-            lock_path.unlink()
-        except OSError:
-            pass
+        _release_lock(fd)
+
+
+def _fold_journal_locked(path: Path) -> _LedgerSnapshot:
+    """Rewrite the YAML snapshot to include every journal record; caller holds the lock."""
+
+    snapshot = _materialize(path)
+    journal = ledger_journal_path(path)
+    if not journal.exists():
+        return snapshot
+    write_ledger(path, snapshot.doc)
+    journal.unlink(missing_ok=True)
+    folded = _LedgerSnapshot(
+        snapshot_stat=_stat_key(path),
+        journal_offset=0,
+        journal_records=0,
+        doc=snapshot.doc,
+    )
+    _remember_snapshot(path, folded)
+    return folded
+
+
+def compact_ledger_journal(path: Path) -> None:
+    """Fold ``<ledger>.journal.jsonl`` into the YAML ledger so it can be read directly."""
+
+    if not ledger_journal_path(path).exists():
+        return
+    with _ledger_lock(path):
+        _fold_journal_locked(path)
+
+
+def update_ledger_file(path: Path, *, fingerprint: str, updates: dict[str, Any]) -> dict[str, Any]:
+    """Apply *updates* to one ledger entry under the ledger lock and return the ledger.
+
+    As with :func:`update_ledger_doc`, an update that changes nothing keeps both
+    ``updated_at`` stamps; the ledger file is then left untouched instead of being
+    rewritten with identical content.
+    """
+
+    with _ledger_lock(path):
+        snapshot = _materialize(path)
+        actions = snapshot.doc["actions"]
+        current = actions.get(fingerprint)
+        # Only the touched entry is copied, validated and (in journal mode) serialized.
+        partial = update_ledger_doc(
+            {
+                "schema_version": 1,
+                "updated_at": snapshot.doc["updated_at"],
+                "actions": {} if current is None else {fingerprint: copy.deepcopy(current)},
+            },
+            fingerprint=fingerprint,
+            updates=updates,
+        )
+        entry = partial["actions"][fingerprint]
+        journal = ledger_journal_path(path)
+        persisted = snapshot.snapshot_stat is not None or snapshot.journal_records > 0
+        if entry == current and persisted:
+            return copy.deepcopy(snapshot.doc)
+        doc = {
+            "schema_version": 1,
+            "updated_at": partial["updated_at"],
+            "actions": {**actions, fingerprint: entry},
+        }
+        if ledger_journal_enabled() and snapshot.journal_records + 1 < _JOURNAL_COMPACT_RECORDS:
+            line = json.dumps(
+                {"fingerprint": fingerprint, "updated_at": doc["updated_at"], "entry": entry},
+                ensure_ascii=False,
+                sort_keys=True,
+            )
+            with journal.open("ab") as handle:
+                if handle.tell() != snapshot.journal_offset:
+                    handle.truncate(snapshot.journal_offset)
+                handle.write(line.encode("utf-8") + b"\n")
+            updated = _LedgerSnapshot(
+                snapshot_stat=snapshot.snapshot_stat,
+                journal_offset=snapshot.journal_offset + len(line.encode("utf-8")) + 1,
+                journal_records=snapshot.journal_records + 1,
+                doc=doc,
+            )
+        else:
+            write_ledger(path, doc)
+            journal.unlink(missing_ok=True)
+            updated = _LedgerSnapshot(
+                snapshot_stat=_stat_key(path),
+                journal_offset=0,
+                journal_records=0,
+                doc=doc,
+            )
+        _remember_snapshot(path, updated)
+        return copy.deepcopy(doc)
 
 
 def transition_outcome_files(
@@ -198,12 +444,13 @@ def transition_outcome_files(
     replacement fails, the first is restored while the ledger lock is held.
     """
 
-    lock_path = _acquire_lock(ledger_path)
+    lock_fd = _acquire_lock(ledger_path)
     token = f"{os.getpid()}-{uuid.uuid4().hex}"
     staged_ticket = ticket_path.with_name(f".{ticket_path.name}.{token}.tmp")
     staged_ledger = ledger_path.with_name(f".{ledger_path.name}.{token}.tmp")
     rollback_ledger = ledger_path.with_name(f".{ledger_path.name}.{token}.rollback")
     try:
+        _fold_journal_locked(ledger_path)
         ticket_bytes = ticket_path.read_bytes()
         try:
             ticket_markdown = ticket_bytes.decode("utf-8")
@@ -312,10 +559,7 @@ def transition_outcome_files(
                 temporary.unlink(missing_ok=True)
             except OSError:
                 pass
-        try:
-            lock_path.unlink()
-        except OSError:
-            pass
+        _release_lock(lock_fd)
 
 
 def bind_outcome_verification_amendment_files(
@@ -329,12 +573,13 @@ def bind_outcome_verification_amendment_files(
 ) -> dict[str, Any]:
     """Atomically bind one write-once verification descendant in ticket and ledger."""
 
-    lock_path = _acquire_lock(ledger_path)
+    lock_fd = _acquire_lock(ledger_path)
     token = f"{os.getpid()}-{uuid.uuid4().hex}"
     staged_ticket = ticket_path.with_name(f".{ticket_path.name}.{token}.tmp")
     staged_ledger = ledger_path.with_name(f".{ledger_path.name}.{token}.tmp")
     rollback_ledger = ledger_path.with_name(f".{ledger_path.name}.{token}.rollback")
     try:
+        _fold_journal_locked(ledger_path)
         ticket_bytes = ticket_path.read_bytes()
         try:
             ticket_markdown = ticket_bytes.decode("utf-8")
@@ -450,10 +695,7 @@ def bind_outcome_verification_amendment_files(
                 temporary.unlink(missing_ok=True)
             except OSError:
                 pass
-        try:
-            lock_path.unlink()
-        except OSError:
-            pass
+        _release_lock(lock_fd)
 
 
 def reconcile_terminal_outcome_stale_blockers_files(
@@ -464,12 +706,13 @@ def reconcile_terminal_outcome_stale_blockers_files(
 ) -> dict[str, Any]:
     """Atomically remove only stale runner blockers from a terminal outcome."""
 
-    lock_path = _acquire_lock(ledger_path)
+    lock_fd = _acquire_lock(ledger_path)
     token = f"{os.getpid()}-{uuid.uuid4().hex}"
     staged_ticket = ticket_path.with_name(f".{ticket_path.name}.{token}.tmp")
     staged_ledger = ledger_path.with_name(f".{ledger_path.name}.{token}.tmp")
     rollback_ledger = ledger_path.with_name(f".{ledger_path.name}.{token}.rollback")
     try:
+        _fold_journal_locked(ledger_path)
         ticket_bytes = ticket_path.read_bytes()
         try:
             ticket_markdown = ticket_bytes.decode("utf-8")
@@ -585,7 +828,4 @@ def reconcile_terminal_outcome_stale_blockers_files(
                 temporary.unlink(missing_ok=True)
             except OSError:
                 pass
-        try:
-            lock_path.unlink()
-        except OSError:
-            pass
+        _release_lock(lock_fd)
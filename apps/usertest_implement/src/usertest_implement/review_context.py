@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from backlog_repo.plan_scope import assess_pr_plan_scope
 
+from usertest_implement.github_client import GhCliClient, GitHubClient
 from usertest_implement.shared import *
 from usertest_implement.ticket_prompt import project_ticket_prompt_context
 
@@ -93,45 +94,20 @@ def _classify_pr_checks(checks: list[dict[str, Any]]) -> tuple[str, str | None]:
     return "completed", "success"
 
 
-def _collect_pr_review_context(*, workspace_dir: Path, pr_url: str) -> dict[str, Any]:
-    view_raw = _run_gh_json(
-        cwd=workspace_dir,
-        argv=[
-            "gh",
-            "pr",
-            "view",
-            pr_url,
-            "--json",
-            "number,url,title,state,isDraft,headRefName,headRefOid,baseRefName,baseRefOid,mergeable,reviewDecision,statusCheckRollup",
-        ],
-    )
-    if not isinstance(view_raw, dict):
-        raise RuntimeError("gh pr view returned non-object JSON")
-
-    checks_raw = _run_gh_json(
-        cwd=workspace_dir,
-        argv=[
-            "gh",
-            "pr",
-            "checks",
-            pr_url,
-            "--json",
-            "name,state,startedAt,completedAt,link,bucket,event",
-        ],
-    )
-    checks = [item for item in checks_raw if isinstance(item, dict)] if isinstance(checks_raw, list) else []
+def _collect_pr_review_context(
+    *,
+    workspace_dir: Path,
+    pr_url: str,
+    client: GitHubClient | None = None,
+) -> dict[str, Any]:
+    # One ``gh pr view`` carries state, checks and files; the diff is cached per head/base SHA.
+    if client is None:
+        client = GhCliClient(workspace_dir, run_json=_run_gh_json, run_text=_run_gh_text)
+    view_raw = client.pull_request(pr_url)
+    checks = client.pull_request_checks(pr_url, view_raw)
     ci_status, ci_conclusion = _classify_pr_checks(checks)
-
-    changed_files_text = _run_gh_text(
-        cwd=workspace_dir,
-        argv=["gh", "pr", "diff", pr_url, "--name-only"],
-    )
-    changed_files = [line.strip() for line in changed_files_text.splitlines() if line.strip()]
-
-    diff_full = _run_gh_text(
-        cwd=workspace_dir,
-        argv=["gh", "pr", "diff", pr_url],
-    )
+    changed_files = client.pull_request_changed_files(pr_url, view_raw)
+    diff_full = client.pull_request_diff(pr_url, view_raw)
     diff_excerpt = diff_full
     diff_truncated = False
     if len(diff_excerpt) > _MAX_REVIEW_DIFF_CHARS:
@@ -139,7 +115,11 @@ def _collect_pr_review_context(*, workspace_dir: Path, pr_url: str) -> dict[str,
         diff_truncated = True
 
     return {
-        "pr": view_raw,
+        "pr": {
+            key: value
+            for key, value in view_raw.items()
+            if key not in {"files", "changedFiles"}
+        },
         "checks": checks,
         "ci_status": ci_status,
         "ci_conclusion": ci_conclusion,
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from usertest_implement.ci import _wait_for_ci_success
+from usertest_implement.github_client import (
+    GITHUB_CACHE_DIR_ENV,
+    FakeGitHubClient,
+    GhCliClient,
+    checks_from_status_check_rollup,
+    clear_github_memory_cache,
+)
+from usertest_implement.review_context import _collect_pr_review_context
+
+_PR_URL = "https://example.invalid/pr/7"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(GITHUB_CACHE_DIR_ENV, raising=False)
+    clear_github_memory_cache()
+
+
+def test_checks_from_status_check_rollup_matches_gh_pr_checks_rows() -> None:
+    rows = checks_from_status_check_rollup(
+        [
+            {
+                "__typename": "CheckRun",
+                "name": "tests",
+                "workflowName": "CI",
+                "status": "COMPLETED",
+                "conclusion": "FAILURE",
+                "startedAt": "2026-07-01T10:00:00Z",
+                "detailsUrl": "https://example.invalid/run/1",
+            },
+            {
+                "__typename": "CheckRun",
+                "name": "tests",
+                "workflowName": "CI",
+                "status": "COMPLETED",
+                "conclusion": "SUCCESS",
+                "startedAt": "2026-07-01T11:00:00Z",
+                "detailsUrl": "https://example.invalid/run/2",
+            },
+            {
+                "__typename": "CheckRun",
+                "name": "lint",
+                "workflowName": "CI",
+                "status": "IN_PROGRESS",
+                "startedAt": "2026-07-01T11:01:00Z",
+            },
+            {
+                "__typename": "StatusContext",
+                "context": "deploy/preview",
+                "state": "SUCCESS",
+                "targetUrl": "https://example.invalid/preview",
+            },
+        ]
+    )
+
+    assert [(row["name"], row["state"], row["bucket"]) for row in rows] == [
+        ("deploy/preview", "SUCCESS", "pass"),
+        ("tests", "SUCCESS", "pass"),
+        ("lint", "IN_PROGRESS", "pending"),
+    ]
+    assert rows[1]["link"] == "https://example.invalid/run/2"
+
+
+def test_review_context_uses_one_pr_view_and_caches_diff_per_head(tmp_path: Path) -> None:
+    json_calls: list[list[str]] = []
+    text_calls: list[list[str]] = []
+    head = {"oid": "head1"}
+
+    def _run_json(*, cwd: Path, argv: list[str]) -> Any:
+        json_calls.append(argv)
+        return {
+            "url": _PR_URL,
+            "state": "OPEN",
+            "headRefOid": head["oid"],
+            "baseRefOid": "base1",
+            "statusCheckRollup": [
+                {
+                    "__typename": "CheckRun",
+                    "name": "CI",
+                    "status": "COMPLETED",
+                    "conclusion": "SUCCESS",
+                }
+            ],
+            "files": [{"path": "src/a.py"}, {"path": "src/b.py"}],
+            "changedFiles": 2,
+        }
+
+    def _run_text(*, cwd: Path, argv: list[str]) -> str:
+        text_calls.append(argv)
+        return f"diff at {head['oid']}\n"
+
+    client = GhCliClient(tmp_path, run_json=_run_json, run_text=_run_text)
+    context = _collect_pr_review_context(workspace_dir=tmp_path, pr_url=_PR_URL, client=client)
+
+    assert [argv[1:3] for argv in json_calls] == [["pr", "view"]]
+    assert context["ci_conclusion"] == "success"
+    assert context["changed_files"] == ["src/a.py", "src/b.py"]
+    assert context["diff_full"] == "diff at head1\n"
+    assert "files" not in context["pr"]
+
+    _collect_pr_review_context(workspace_dir=tmp_path, pr_url=_PR_URL, client=client)
+    assert len(text_calls) == 1
+
+    head["oid"] = "head2"
+    context = _collect_pr_review_context(workspace_dir=tmp_path, pr_url=_PR_URL, client=client)
+    assert context["diff_full"] == "diff at head2\n"
+    assert len(text_calls) == 2
+
+
+def test_rollup_checks_carry_run_events_cached_per_run_id(tmp_path: Path) -> None:
+    json_calls: list[list[str]] = []
+    pr = {
+        "headRefOid": "head1",
+        "baseRefOid": "base1",
+        "statusCheckRollup": [
+            {
+                "__typename": "CheckRun",
+                "name": "tests",
+                "workflowName": "CI",
+                "status": "COMPLETED",
+                "conclusion": "SUCCESS",
+                "detailsUrl": "https://github.com/o/r/actions/runs/41/job/9",
+            },
+            {"__typename": "StatusContext", "context": "deploy", "state": "SUCCESS"},
+        ],
+    }
+
+    def _run_json(*, cwd: Path, argv: list[str]) -> Any:
+        json_calls.append(argv)
+        return [{"databaseId": 41, "event": "pull_request"}]
+
+    client = GhCliClient(tmp_path, run_json=_run_json, run_text=lambda **_: "")
+    rows = client.pull_request_checks(_PR_URL, pr)
+    assert {row["name"]: row["event"] for row in rows} == {
+        "tests": "pull_request",
+        "deploy": "",
+    }
+    assert [argv[1:5] for argv in json_calls] == [["run", "list", "--commit", "head1"]]
+
+    client.pull_request_checks(_PR_URL, pr)
+    assert len(json_calls) == 1
+
+
+def test_diff_cache_is_shared_through_cache_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(GITHUB_CACHE_DIR_ENV, str(tmp_path / "cache"))
+    pr = {"headRefOid": "head1", "baseRefOid": "base1"}
+    first = GhCliClient(tmp_path, run_json=lambda **_: None, run_text=lambda **_: "diff\n")
+    assert first.pull_request_diff(_PR_URL, pr) == "diff\n"
+
+    clear_github_memory_cache()
+
+    def _unexpected(**_kwargs: Any) -> str:
+        raise AssertionError("diff should come from the cache dir")
+
+    second = GhCliClient(tmp_path, run_json=lambda **_: None, run_text=_unexpected)
+    assert second.pull_request_diff(_PR_URL, pr) == "diff\n"
+
+
+def test_wait_for_ci_success_accepts_fake_client(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("usertest_implement.ci.time.sleep", lambda _seconds: None)
+    client = FakeGitHubClient(
+        runs=[
+            {
+                "databaseId": 5,
+                "headSha": "abc123",
+                "event": "push",
+                "status": "queued",
+                "createdAt": "2026-07-01T10:00:00Z",
+                "url": "https://example.invalid/runs/5",
+            }
+        ],
+        run_views={
+            5: [
+                {"status": "in_progress", "conclusion": ""},
+                {"status": "completed", "conclusion": "success"},
+            ]
+        },
+    )
+
+    summary = _wait_for_ci_success(
+        run_dir=tmp_path,
+        workspace_dir=tmp_path,
+        branch="backlog/test",
+        head_sha="abc123",
+        workflow="CI",
+        timeout_seconds=60.0,
+        client=client,
+    )
+
+    assert summary["passed"] is True
+    assert client.calls == [
+        ("workflow_runs", "backlog/test"),
+        ("workflow_run", "5"),
+        ("workflow_run", "5"),
+    ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
@@ -10,8 +11,12 @@ from backlog_repo import (
     upsert_outcome_markdown,
 )
 
+from usertest_implement import ledger as ledger_module
 from usertest_implement.ledger import (
+    LEDGER_JOURNAL_ENV,
     bind_outcome_verification_amendment_files,
+    compact_ledger_journal,
+    ledger_journal_path,
     load_ledger,
     reconcile_terminal_outcome_stale_blockers_files,
     transition_outcome_files,
@@ -108,6 +113,42 @@ def test_update_ledger_file_is_idempotent(tmp_path: Path) -> None:
     assert first == second
 
 
+def test_unchanged_update_keeps_updated_at_and_skips_the_rewrite(tmp_path: Path) -> None:
+    path = tmp_path / "ledger.yaml"
+    updates = {"last_run_dir": "runs/x", "last_exit_code": 0}
+    first = update_ledger_file(path, fingerprint="deadbeefdeadbeef", updates=updates)
+    first["updated_at"] = "2026-01-01T00:00:00Z"
+    first["actions"]["deadbeefdeadbeef"]["updated_at"] = "2026-01-01T00:00:00Z"
+    ledger_module.write_ledger(path, first)
+    written = path.stat().st_mtime_ns
+
+    second = update_ledger_file(path, fingerprint="deadbeefdeadbeef", updates=updates)
+
+    assert second["updated_at"] == "2026-01-01T00:00:00Z"
+    assert second["actions"]["deadbeefdeadbeef"]["updated_at"] == "2026-01-01T00:00:00Z"
+    assert path.stat().st_mtime_ns == written
+
+    third = update_ledger_file(path, fingerprint="deadbeefdeadbeef", updates={"last_exit_code": 1})
+    assert third["updated_at"] != "2026-01-01T00:00:00Z"
+    assert third["actions"]["deadbeefdeadbeef"]["updated_at"] == third["updated_at"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl lock contention is POSIX-only")
+def test_update_ledger_file_times_out_when_the_lock_is_held(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import fcntl
+
+    path = tmp_path / "ledger.yaml"
+    monkeypatch.setattr(ledger_module, "_LOCK_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(ledger_module, "_LOCK_POLL_SECONDS", 0.01)
+    with (tmp_path / "ledger.yaml.lock").open("w") as holder:
+        fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+        with pytest.raises(TimeoutError, match="ledger lock"):
+            update_ledger_file(path, fingerprint="deadbeefdeadbeef", updates={"last_exit_code": 0})
+    assert not path.exists()
+
+
 def test_update_ledger_file_preserves_concurrent_updates(tmp_path: Path) -> None:
     path = tmp_path / "ledger.yaml"
 
@@ -133,6 +174,88 @@ def test_update_ledger_file_preserves_concurrent_updates(tmp_path: Path) -> None
         assert entry.get("last_run_dir") == f"runs/{i}"
 
 
+def test_journal_mode_appends_updates_and_compacts_to_yaml(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = tmp_path / "ledger.yaml"
+    update_ledger_file(path, fingerprint="0" * 16, updates={"last_run_dir": "runs/0"})
+    snapshot = path.read_bytes()
+    monkeypatch.setenv(LEDGER_JOURNAL_ENV, "1")
+
+    def _worker(i: int) -> None:
+        update_ledger_file(
+            path,
+            fingerprint=f"{i:016x}",
+            updates={"last_run_dir": f"runs/{i}", "last_exit_code": 0},
+        )
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(_worker, range(1, 13)))
+
+    journal = ledger_journal_path(path)
+    assert path.read_bytes() == snapshot
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 12
+    # A torn append from a crashed writer is ignored and then truncated.
+    with journal.open("ab") as handle:
+        handle.write(b'{"fingerprint": "ffff')
+    update_ledger_file(path, fingerprint="0" * 16, updates={"last_exit_code": 1})
+
+    expected = load_ledger(path)
+    assert len(expected["actions"]) == 13
+    assert expected["actions"]["0" * 16]["last_exit_code"] == 1
+    assert expected["actions"][f"{12:016x}"]["last_run_dir"] == "runs/12"
+
+    compact_ledger_journal(path)
+    assert not journal.exists()
+    assert load_ledger(path) == expected
+
+
+def test_transition_folds_pending_journal_records(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(LEDGER_JOURNAL_ENV, "1")
+    fingerprint = "feedfacefeedface"
+    ticket_path = tmp_path / "ticket.md"
+    ledger_path = tmp_path / "ledger.yaml"
+    current = _tests_verified_outcome()
+    ticket_path.write_text(
+        upsert_outcome_markdown(
+            "# Ticket\n"
+            f"- Fingerprint: `{fingerprint}`\n"
+            "- Case ID: `case:ledger`\n"
+            "- Plan revision ID: `plan:ledger:v1`\n",
+            current,
+        ),
+        encoding="utf-8",
+    )
+    update_ledger_file(
+        ledger_path,
+        fingerprint=fingerprint,
+        updates={"outcome": current, "last_outcome_state": "tests_verified"},
+    )
+    update_ledger_file(ledger_path, fingerprint="0" * 16, updates={"last_run_dir": "runs/0"})
+    assert ledger_journal_path(ledger_path).exists()
+
+    transitioned = transition_outcome_files(
+        ledger_path=ledger_path,
+        ticket_path=ticket_path,
+        fingerprint=fingerprint,
+        state="original_scenario_verified",
+        recorded_at="2026-07-10T00:00:00Z",
+        updates={
+            "original_scenario_evidence": [_passed("original_scenario", "runs/replay")],
+            "remaining_risks": ["Live verification pending"],
+        },
+    )
+
+    assert not ledger_journal_path(ledger_path).exists()
+    ledger = load_ledger(ledger_path)
+    assert ledger["actions"][fingerprint]["outcome"] == transitioned
+    assert ledger["actions"]["0" * 16]["last_run_dir"] == "runs/0"
+
+
 def test_load_ledger_rejects_corrupt_state_instead_of_resetting_it(tmp_path: Path) -> None:
     path = tmp_path / "ledger.yaml"
     path.write_text("schema_version: 1\nactions: []\n", encoding="utf-8")
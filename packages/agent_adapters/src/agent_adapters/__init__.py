@@ -26,6 +26,7 @@ from agent_adapters.codex_cli import (
 from agent_adapters.codex_normalize import normalize_codex_events
 from agent_adapters.gemini_cli import GeminiRunResult, run_gemini
 from agent_adapters.gemini_normalize import normalize_gemini_events
+from agent_adapters.live_normalize import LiveEventNormalizer, live_normalizer_for_agent
 from agent_adapters.shell_probe import AgentShellProbeResult, probe_agent_shell_launch
 
 
@@ -54,9 +55,11 @@ __all__ = [
     "CodexPersonalityConfigIssue",
     "CodexReasoningEffortConfigIssue",
     "GeminiRunResult",
+    "LiveEventNormalizer",
     "build_codex_subscription_config_overrides",
     "codex_subscription_config_errors",
     "AgentShellProbeResult",
+    "live_normalizer_for_agent",
     "normalize_claude_events",
     "normalize_codex_events",
     "normalize_gemini_events",
@@ -5,7 +5,7 @@ import os
 import re
 import shlex
 import subprocess
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -14,7 +14,7 @@ from agent_adapters.delegation import (
     delegation_result_data,
     is_delegation_tool,
 )
-from agent_adapters.events import make_event
+from agent_adapters.events import RawRecord, make_event
 from agent_adapters.failure_artifacts import (
     write_command_failure_artifacts,
     write_tool_failure_artifacts,
@@ -143,7 +143,14 @@ def normalize_claude_events(
     raw_ts_iter: Iterator[str] | None = None,
     workspace_root: Path | None = None,
     workspace_mount: str | None = None,
+    raw_records: Iterable[RawRecord] | None = None,
+    on_event: Callable[[dict[str, Any]], None] | None = None,
 ) -> None:
+    """Write normalized events for a raw agent event stream.
+
+    ``raw_records`` replaces reading ``raw_events_path`` with ``(line, payload, ts)`` records
+    supplied as they arrive; ``on_event`` receives each event after it is written and flushed.
+    """
     normalized_events_path.parent.mkdir(parents=True, exist_ok=True)
     run_dir = normalized_events_path.parent
     command_failure_idx = 0
@@ -159,6 +166,12 @@ def normalize_claude_events(
 
     line_ts: str | None = None
 
+    def _emit(event: dict[str, Any]) -> None:
+        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        if on_event is not None:
+            out_f.flush()
+            on_event(event)
+
     def _next_ts() -> str | None:
         if ts_iter is not None:
             try:
@@ -170,9 +183,14 @@ def normalize_claude_events(
     tool_uses: dict[str, dict[str, Any]] = {}
 
     with normalized_events_path.open("w", encoding="utf-8", newline="\n") as out_f:
-        for raw_line, payload in _iter_raw_lines(raw_events_path):
+        records = (
+            raw_records
+            if raw_records is not None
+            else ((raw, payload, None) for raw, payload in _iter_raw_lines(raw_events_path))
+        )
+        for raw_line, payload, record_ts in records:
             if ts_iter is None:
-                line_ts = _next_raw_ts()
+                line_ts = record_ts if record_ts is not None else _next_raw_ts()
             else:
                 line_ts = None
             if payload is None:
@@ -181,7 +199,7 @@ def normalize_claude_events(
                     {"category": "raw_non_json_line", "message": raw_line},
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                _emit(event)
                 continue
 
             obj_type = payload.get("type")
@@ -206,7 +224,7 @@ def normalize_claude_events(
                         event = make_event(
                             "agent_message", {"kind": "message", "text": text}, ts=_next_ts()
                         )
-                        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                        _emit(event)
                     continue
 
                 if block_type == "tool_use":
@@ -221,7 +239,7 @@ def normalize_claude_events(
                                 delegation_invocation_data(name, normalized_input),
                                 ts=_next_ts(),
                             )
-                            out_f.write(json.dumps(invocation, ensure_ascii=False) + "\n")
+                            _emit(invocation)
                         tool_uses[tool_id] = {
                             "name": name,
                             "input": normalized_input,
@@ -245,7 +263,7 @@ def normalize_claude_events(
                         },
                         ts=_next_ts(),
                     )
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
                     continue
 
                 name = _tool_name(tool_use.get("name"))
@@ -266,7 +284,7 @@ def normalize_claude_events(
                         ),
                         ts=_next_ts(),
                     )
-                    out_f.write(json.dumps(result, ensure_ascii=False) + "\n")
+                    _emit(result)
                     continue
 
                 if name == "bash":
@@ -305,7 +323,7 @@ def normalize_claude_events(
                                 duration=None,
                             )
                         event = make_event("run_command", data, ts=_next_ts())
-                        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                        _emit(event)
                     continue
 
                 if name == "read":
@@ -349,7 +367,7 @@ def normalize_claude_events(
                             },
                             ts=_next_ts(),
                         )
-                        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                        _emit(event)
                     continue
 
                 if name in {"edit", "write"}:
@@ -466,14 +484,14 @@ def normalize_claude_events(
                         event_data,
                         ts=_next_ts(),
                     )
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
                     continue
 
                 if name in {"websearch", "web_search"}:
                     query = tool_input.get("query") or tool_input.get("text")
                     if isinstance(query, str) and query.strip():
                         event = make_event("web_search", {"query": query.strip()}, ts=_next_ts())
-                        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                        _emit(event)
                     continue
 
                 if name in {"grep", "glob"}:
@@ -486,7 +504,7 @@ def normalize_claude_events(
                         },
                         ts=_next_ts(),
                     )
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
                     continue
 
                 event = make_event(
@@ -494,4 +512,4 @@ def normalize_claude_events(
                     {"category": "unhandled_tool", "message": str(tool_use.get("name", ""))},
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                _emit(event)
@@ -15,6 +15,7 @@ from uuid import UUID
 
 from agent_adapters.docker_exec_env import inject_docker_exec_env, looks_like_docker_exec_prefix
 from agent_adapters.events import utc_now_iso
+from agent_adapters.live_normalize import LiveEventNormalizer
 
 _CODEX_REFRESH_TOKEN_REUSED_MARKER = "[usertest] detected codex auth error: refresh_token_reused"
 _CODEX_REFRESH_TOKEN_REUSED_SUBSTRING = "refresh_token_reused"
@@ -865,6 +866,7 @@ def run_codex_exec(
     env_overrides: dict[str, str] | None = None,
     agent_last_message_path: str | None = None,
     resume_session_id: str | None = None,
+    live_normalizer: LiveEventNormalizer | None = None,
 ) -> CodexExecResult:
     raw_events_path.parent.mkdir(parents=True, exist_ok=True)
     last_message_path.parent.mkdir(parents=True, exist_ok=True)
@@ -998,8 +1000,11 @@ def run_codex_exec(
                 stdout_f.write(line)
                 stdout_f.flush()
                 if line.strip():
-                    ts_f.write(utc_now_iso() + "\n")
+                    line_ts = utc_now_iso()
+                    ts_f.write(line_ts + "\n")
                     ts_f.flush()
+                    if live_normalizer is not None:
+                        live_normalizer.feed(line, line_ts)
                 # Avoid false positives if the agent prints this token in normal output.
                 try:
                     payload = json.loads(line)
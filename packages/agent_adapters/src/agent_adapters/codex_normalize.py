@@ -5,7 +5,7 @@ import os
 import re
 import shlex
 import subprocess
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -14,7 +14,7 @@ from agent_adapters.delegation import (
     delegation_result_data,
     is_delegation_tool,
 )
-from agent_adapters.events import make_event
+from agent_adapters.events import RawRecord, make_event
 from agent_adapters.failure_artifacts import write_command_failure_artifacts
 from agent_adapters.read_attestation import observed_read_attestation
 
@@ -543,7 +543,14 @@ def normalize_codex_events(
     raw_ts_iter: Iterator[str] | None = None,
     workspace_root: Path | None = None,
     workspace_mount: str | None = None,
+    raw_records: Iterable[RawRecord] | None = None,
+    on_event: Callable[[dict[str, Any]], None] | None = None,
 ) -> None:
+    """Write normalized events for a raw agent event stream.
+
+    ``raw_records`` replaces reading ``raw_events_path`` with ``(line, payload, ts)`` records
+    supplied as they arrive; ``on_event`` receives each event after it is written and flushed.
+    """
     normalized_events_path.parent.mkdir(parents=True, exist_ok=True)
     run_dir = normalized_events_path.parent
     command_failure_idx = 0
@@ -558,6 +565,12 @@ def normalize_codex_events(
 
     line_ts: str | None = None
 
+    def _emit(event: dict[str, Any]) -> None:
+        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        if on_event is not None:
+            out_f.flush()
+            on_event(event)
+
     def _next_ts() -> str | None:
         if ts_iter is not None:
             try:
@@ -578,7 +591,7 @@ def normalize_codex_events(
                 delegation_invocation_data(tool_name, tool_input),
                 ts=_next_ts(),
             )
-            out_f.write(json.dumps(invocation, ensure_ascii=False) + "\n")
+            _emit(invocation)
             if call_id:
                 delegation_calls[call_id] = {"name": tool_name, "input": tool_input}
 
@@ -593,12 +606,17 @@ def normalize_codex_events(
                 is_error=False,
             )
             event = make_event("delegation_result", data, ts=_next_ts())
-            out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            _emit(event)
             return True
 
-        for raw_line, payload in _iter_codex_raw_lines(raw_events_path):
+        records = (
+            raw_records
+            if raw_records is not None
+            else ((raw, payload, None) for raw, payload in _iter_codex_raw_lines(raw_events_path))
+        )
+        for raw_line, payload, record_ts in records:
             if ts_iter is None:
-                line_ts = _next_raw_ts()
+                line_ts = record_ts if record_ts is not None else _next_raw_ts()
             else:
                 line_ts = None
             if payload is None:
@@ -607,7 +625,7 @@ def normalize_codex_events(
                     {"category": "raw_non_json_line", "message": raw_line},
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                _emit(event)
                 continue
 
             msg = payload.get("msg")
@@ -621,7 +639,7 @@ def normalize_codex_events(
                             {"kind": "message", "text": message},
                             ts=_next_ts(),
                         )
-                        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                        _emit(event)
                     continue
 
                 if msg_type == "agent_reasoning":
@@ -632,7 +650,7 @@ def normalize_codex_events(
                             {"kind": "observation", "text": text},
                             ts=_next_ts(),
                         )
-                        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                        _emit(event)
                     continue
 
                 if msg_type == "exec_command_begin":
@@ -738,7 +756,7 @@ def normalize_codex_events(
                     data,
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                _emit(event)
 
                 for read_event in _maybe_emit_read_events(
                     argv=argv,
@@ -750,7 +768,7 @@ def normalize_codex_events(
                     source_exit_code=exit_code,
                     fallback_ts=line_ts,
                 ):
-                    out_f.write(json.dumps(read_event, ensure_ascii=False) + "\n")
+                    _emit(read_event)
                 continue
 
             nested_payload = payload.get("payload")
@@ -858,7 +876,7 @@ def normalize_codex_events(
                         {"kind": "observation", "text": text},
                         ts=_next_ts(),
                     )
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
                 continue
 
             if item_type == "agent_message":
@@ -867,7 +885,7 @@ def normalize_codex_events(
                     event = make_event(
                         "agent_message", {"kind": "message", "text": text}, ts=_next_ts()
                     )
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
                 continue
 
             if item_type != "command_execution":
@@ -927,7 +945,7 @@ def normalize_codex_events(
                 data,
                 ts=_next_ts(),
             )
-            out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            _emit(event)
 
             for read_event in _maybe_emit_read_events(
                 argv=argv,
@@ -939,4 +957,4 @@ def normalize_codex_events(
                 source_exit_code=exit_code,
                 fallback_ts=line_ts,
             ):
-                out_f.write(json.dumps(read_event, ensure_ascii=False) + "\n")
+                _emit(read_event)
@@ -7,6 +7,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Protocol, cast
 
+# One raw agent stdout line: text without the trailing newline, parsed JSON object (``None``
+# when the line is not JSON) and the capture timestamp when known.
+RawRecord = tuple[str, dict[str, Any] | None, str | None]
+
 
 class MakeEvent(Protocol):
     def __call__(
@@ -71,6 +75,7 @@ else:
     write_events_jsonl = _fallback_write_events_jsonl
 
 __all__ = [
+    "RawRecord",
     "iter_events_jsonl",
     "make_event",
     "utc_now_iso",
@@ -12,6 +12,7 @@ from typing import Any
 
 from agent_adapters.docker_exec_env import inject_docker_exec_env, looks_like_docker_exec_prefix
 from agent_adapters.events import utc_now_iso
+from agent_adapters.live_normalize import LiveEventNormalizer
 
 
 @dataclass(frozen=True)
@@ -187,6 +188,7 @@ def run_gemini(
     include_directories: Iterable[str] = (),
     command_prefix: Iterable[str] = (),
     env_overrides: dict[str, str] | None = None,
+    live_normalizer: LiveEventNormalizer | None = None,
 ) -> GeminiRunResult:
     raw_events_path.parent.mkdir(parents=True, exist_ok=True)
     last_message_path.parent.mkdir(parents=True, exist_ok=True)
@@ -286,8 +288,11 @@ def run_gemini(
                 stdout_f.write(line)
                 stdout_f.flush()
                 if line.strip():
-                    ts_f.write(utc_now_iso() + "\n")
+                    line_ts = utc_now_iso()
+                    ts_f.write(line_ts + "\n")
                     ts_f.flush()
+                    if live_normalizer is not None:
+                        live_normalizer.feed(line, line_ts)
 
         proc.wait()
 
@@ -5,7 +5,7 @@ import os
 import re
 import shlex
 import subprocess
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -14,7 +14,7 @@ from agent_adapters.delegation import (
     delegation_result_data,
     is_delegation_tool,
 )
-from agent_adapters.events import make_event
+from agent_adapters.events import RawRecord, make_event
 from agent_adapters.failure_artifacts import (
     write_command_failure_artifacts,
     write_tool_failure_artifacts,
@@ -141,7 +141,14 @@ def normalize_gemini_events(
     raw_ts_iter: Iterator[str] | None = None,
     workspace_root: Path | None = None,
     workspace_mount: str | None = None,
+    raw_records: Iterable[RawRecord] | None = None,
+    on_event: Callable[[dict[str, Any]], None] | None = None,
 ) -> None:
+    """Write normalized events for a raw agent event stream.
+
+    ``raw_records`` replaces reading ``raw_events_path`` with ``(line, payload, ts)`` records
+    supplied as they arrive; ``on_event`` receives each event after it is written and flushed.
+    """
     normalized_events_path.parent.mkdir(parents=True, exist_ok=True)
     run_dir = normalized_events_path.parent
     command_failure_idx = 0
@@ -157,6 +164,12 @@ def normalize_gemini_events(
 
     line_ts: str | None = None
 
+    def _emit(event: dict[str, Any]) -> None:
+        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        if on_event is not None:
+            out_f.flush()
+            on_event(event)
+
     def _next_ts() -> str | None:
         if ts_iter is not None:
             try:
@@ -178,14 +191,19 @@ def normalize_gemini_events(
         event = make_event(
             "agent_message", {"kind": "message", "text": pending_message}, ts=event_ts
         )
-        out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        _emit(event)
         pending_message = ""
         pending_message_ts = None
 
     with normalized_events_path.open("w", encoding="utf-8", newline="\n") as out_f:
-        for raw_line, payload in _iter_raw_lines(raw_events_path):
+        records = (
+            raw_records
+            if raw_records is not None
+            else ((raw, payload, None) for raw, payload in _iter_raw_lines(raw_events_path))
+        )
+        for raw_line, payload, record_ts in records:
             if ts_iter is None:
-                line_ts = _next_raw_ts()
+                line_ts = record_ts if record_ts is not None else _next_raw_ts()
             else:
                 line_ts = None
             if payload is None:
@@ -195,7 +213,7 @@ def normalize_gemini_events(
                     {"category": "raw_non_json_line", "message": raw_line},
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                _emit(event)
                 continue
             if not isinstance(payload, dict):
                 _flush_message()
@@ -208,7 +226,7 @@ def normalize_gemini_events(
                     },
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                _emit(event)
                 continue
 
             event_type = payload.get("type")
@@ -241,7 +259,7 @@ def normalize_gemini_events(
                         },
                         ts=_next_ts(),
                     )
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
                 if not (isinstance(tool_id, str) and tool_id) and isinstance(name, str) and name:
                     event = make_event(
                         "error",
@@ -251,7 +269,7 @@ def normalize_gemini_events(
                         },
                         ts=_next_ts(),
                     )
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
 
                 if isinstance(tool_id, str) and tool_id and isinstance(name, str):
                     normalized_input = params if isinstance(params, dict) else {}
@@ -261,7 +279,7 @@ def normalize_gemini_events(
                             delegation_invocation_data(name, normalized_input),
                             ts=_next_ts(),
                         )
-                        out_f.write(json.dumps(invocation, ensure_ascii=False) + "\n")
+                        _emit(invocation)
                     tool_uses[tool_id] = {
                         "name": name,
                         "input": normalized_input,
@@ -283,7 +301,7 @@ def normalize_gemini_events(
                     },
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                _emit(event)
                 continue
 
             tool_use = tool_uses.pop(tool_id, None)
@@ -293,7 +311,7 @@ def normalize_gemini_events(
                     {"category": "tool_result_missing_use", "message": f"tool_id={tool_id}"},
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                _emit(event)
                 continue
 
             name = _tool_name(tool_use.get("name"))
@@ -315,7 +333,7 @@ def normalize_gemini_events(
                     ),
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(result, ensure_ascii=False) + "\n")
+                _emit(result)
                 continue
 
             if name == "read_file":
@@ -360,7 +378,7 @@ def normalize_gemini_events(
                         },
                         ts=_next_ts(),
                     )
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
                 continue
 
             if name in {"write_file", "replace"}:
@@ -472,7 +490,7 @@ def normalize_gemini_events(
                     event_data,
                     ts=_next_ts(),
                 )
-                out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                _emit(event)
                 continue
 
             if name == "run_shell_command":
@@ -525,14 +543,14 @@ def normalize_gemini_events(
                             duration=None,
                         )
                     event = make_event("run_command", data, ts=_next_ts())
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
                 continue
 
             if name == "google_web_search":
                 query = tool_input.get("query")
                 if isinstance(query, str) and query.strip():
                     event = make_event("web_search", {"query": query.strip()}, ts=_next_ts())
-                    out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                    _emit(event)
                 continue
 
             event = make_event(
@@ -544,6 +562,6 @@ def normalize_gemini_events(
                 },
                 ts=_next_ts(),
             )
-            out_f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            _emit(event)
 
         _flush_message()
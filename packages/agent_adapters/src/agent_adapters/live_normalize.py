@@ -0,0 +1,192 @@
+"""Normalize agent events while the agent process is still running.
+
+``run_codex_exec``, ``run_claude_print`` and ``run_gemini`` accept a :class:`LiveEventNormalizer`
+and feed it every stdout line together with the timestamp written to ``raw_events.ts.jsonl``.
+The normalizer runs the agent's ``normalize_*_events`` function on a background thread over
+those records, so ``normalized_events.jsonl`` grows in real time and matches what a post-run
+pass over the raw file would produce.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Protocol
+
+from agent_adapters.claude_normalize import normalize_claude_events
+from agent_adapters.codex_normalize import normalize_codex_events
+from agent_adapters.events import RawRecord
+from agent_adapters.gemini_normalize import normalize_gemini_events
+
+__all__ = [
+    "LiveEventNormalizer",
+    "live_normalizer_for_agent",
+]
+
+
+class _StreamNormalizer(Protocol):
+    def __call__(
+        self,
+        *,
+        raw_events_path: Path,
+        normalized_events_path: Path,
+        workspace_root: Path | None = None,
+        workspace_mount: str | None = None,
+        raw_records: Iterable[RawRecord] | None = None,
+        on_event: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None: ...
+
+
+_END = object()
+
+
+class LiveEventNormalizer:
+    """Consume raw agent stdout lines incrementally and write normalized events live.
+
+    ``on_event`` is called on the normalizer thread for every event after it has been flushed to
+    ``normalized_events_path``; pass ``queue.put`` to hand events to another thread.  Use as a
+    context manager, or call :meth:`close` once the agent process has exited.
+    """
+
+    def __init__(
+        self,
+        normalize: _StreamNormalizer,
+        *,
+        raw_events_path: Path,
+        normalized_events_path: Path,
+        workspace_root: Path | None = None,
+        workspace_mount: str | None = None,
+        on_event: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        self.raw_events_path = raw_events_path
+        self.normalized_events_path = normalized_events_path
+        self.events_written = 0
+        self._on_event = on_event
+        self._records: queue.SimpleQueue[RawRecord | object] = queue.SimpleQueue()
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            kwargs={
+                "normalize": normalize,
+                "workspace_root": workspace_root,
+                "workspace_mount": workspace_mount,
+            },
+            name="agent-event-normalizer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _iter_records(self) -> Iterator[RawRecord]:
+        while True:
+            record = self._records.get()
+            if record is _END:
+                return
+            assert isinstance(record, tuple)
+            yield record
+
+    def _dispatch(self, event: dict[str, Any]) -> None:
+        self.events_written += 1
+        if self._on_event is not None:
+            self._on_event(event)
+
+    def _run(
+        self,
+        *,
+        normalize: _StreamNormalizer,
+        workspace_root: Path | None,
+        workspace_mount: str | None,
+    ) -> None:
+        records = self._iter_records()
+        try:
+            normalize(
+                raw_events_path=self.raw_events_path,
+                normalized_events_path=self.normalized_events_path,
+                workspace_root=workspace_root,
+                workspace_mount=workspace_mount,
+                raw_records=records,
+                on_event=self._dispatch,
+            )
+        except BaseException as exc:  # noqa: BLE001 - surfaced from close()
+            self._error = exc
+            # Keep draining so producers never block on a dead consumer.
+            for _ in records:
+                pass
+
+    def feed(self, line: str, ts: str | None) -> None:
+        """Queue one raw stdout line (with or without its newline) captured at ``ts``."""
+
+        if self._closed:
+            raise RuntimeError("LiveEventNormalizer is closed")
+        raw = line.rstrip("\n")
+        if not raw.strip():
+            return
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError:
+            payload = None
+        self._records.put((raw, payload, ts))
+
+    def close(self, timeout: float | None = None) -> None:
+        """Finish normalizing queued lines; re-raise any normalizer failure."""
+
+        if not self._closed:
+            self._closed = True
+            self._records.put(_END)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise TimeoutError("agent event normalizer did not finish in time")
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> LiveEventNormalizer:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self.close()
+        except Exception:
+            # The original exception is more useful than a follow-on normalizer failure.
+            pass
+
+
+def live_normalizer_for_agent(
+    agent: str,
+    *,
+    raw_events_path: Path,
+    normalized_events_path: Path,
+    workspace_root: Path | None = None,
+    workspace_mount: str | None = None,
+    on_event: Callable[[dict[str, Any]], None] | None = None,
+) -> LiveEventNormalizer:
+    """Return a :class:`LiveEventNormalizer` using the normalizer for ``agent``."""
+
+    normalize: _StreamNormalizer
+    if agent == "codex":
+        normalize = normalize_codex_events
+    elif agent == "claude":
+        normalize = normalize_claude_events
+    elif agent == "gemini":
+        normalize = normalize_gemini_events
+    else:
+        raise ValueError(f"Unsupported agent for live normalization: {agent!r}")
+    return LiveEventNormalizer(
+        normalize,
+        raw_events_path=raw_events_path,
+        normalized_events_path=normalized_events_path,
+        workspace_root=workspace_root,
+        workspace_mount=workspace_mount,
+        on_event=on_event,
+    )
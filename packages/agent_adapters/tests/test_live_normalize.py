@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import queue
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from agent_adapters import (
+    LiveEventNormalizer,
+    live_normalizer_for_agent,
+    normalize_claude_events,
+    normalize_codex_events,
+    normalize_gemini_events,
+)
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
+def _load_jsonl(path: Path) -> list[dict[str, Any]]:
+    return [
+        json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()
+    ]
+
+
+@pytest.mark.parametrize(
+    ("agent", "fixture_name", "normalizer"),
+    [
+        ("codex", "minimal_codex_run", normalize_codex_events),
+        ("claude", "minimal_claude_run", normalize_claude_events),
+        ("gemini", "minimal_gemini_run", normalize_gemini_events),
+    ],
+)
+def test_live_normalization_matches_post_run_pass(
+    tmp_path: Path, agent: str, fixture_name: str, normalizer: Any
+) -> None:
+    raw_events = _repo_root() / "examples" / "golden_runs" / fixture_name / "raw_events.jsonl"
+    lines = raw_events.read_text(encoding="utf-8").splitlines(keepends=True)
+    timestamps = [f"2026-01-01T00:00:{idx:02d}+00:00" for idx in range(len(lines))]
+
+    post_run_dir = tmp_path / "post"
+    normalizer(
+        raw_events_path=raw_events,
+        normalized_events_path=post_run_dir / "normalized_events.jsonl",
+        raw_ts_iter=iter(ts for ts, line in zip(timestamps, lines, strict=True) if line.strip()),
+    )
+
+    received: queue.SimpleQueue[dict[str, Any]] = queue.SimpleQueue()
+    live_dir = tmp_path / "live"
+    with live_normalizer_for_agent(
+        agent,
+        raw_events_path=live_dir / "raw_events.jsonl",
+        normalized_events_path=live_dir / "normalized_events.jsonl",
+        on_event=received.put,
+    ) as live:
+        for ts, line in zip(timestamps, lines, strict=True):
+            live.feed(line, ts)
+
+    expected = _load_jsonl(post_run_dir / "normalized_events.jsonl")
+    assert expected
+    assert _load_jsonl(live_dir / "normalized_events.jsonl") == expected
+    assert live.events_written == len(expected)
+    assert [received.get_nowait() for _ in range(received.qsize())] == expected
+
+
+def test_live_normalizer_surfaces_normalizer_failures(tmp_path: Path) -> None:
+    def broken(**kwargs: Any) -> None:
+        for _ in kwargs["raw_records"]:
+            raise ValueError("boom")
+
+    live = LiveEventNormalizer(
+        broken,
+        raw_events_path=tmp_path / "raw_events.jsonl",
+        normalized_events_path=tmp_path / "normalized_events.jsonl",
+    )
+    live.feed('{"type": "x"}\n', None)
+    live.feed('{"type": "y"}\n', None)
+    with pytest.raises(ValueError, match="boom"):
+        live.close()
@@ -44,6 +44,11 @@ from backlog_core.case_lineage import (
     verified_mechanism_identities_from_case_registry,
     write_case_registry,
 )
+from backlog_core.case_registry_store import (
+    CaseRegistryStore,
+    enable_case_registry_store,
+    migrate_case_registry_json,
+)
 from backlog_core.causal_proof import (
     CAUSAL_PROOF_SCHEMA_VERSION,
     canonical_json_sha256,
@@ -108,6 +113,7 @@ from backlog_core.ticket_readiness import (
 
 __all__ = [
     "BacklogPolicyConfig",
+    "CaseRegistryStore",
     "CAUSAL_PROOF_SCHEMA_VERSION",
     "DOWNSTREAM_CHAIN_CONTRACT_REVISION",
     "SOURCE_EVIDENCE_PROJECTION_VERSION",
@@ -151,8 +157,10 @@ __all__ = [
     "dedupe_tickets",
     "enrich_tickets_with_atom_context",
     "eligible_problem_mining_atoms",
+    "enable_case_registry_store",
     "extract_backlog_atoms",
     "load_case_registry",
+    "migrate_case_registry_json",
     "make_atom_disposition_receipt",
     "infer_live_verification_requirement",
     "plan_revision_id_for",
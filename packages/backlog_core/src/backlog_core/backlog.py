@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import json
 import os
+import pickle
 import re
+import sys
 from collections import Counter
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
 from datetime import datetime, timezone
 from hashlib import sha256
 from json import JSONDecoder
@@ -13,6 +18,7 @@ from typing import Any
 
 from run_artifacts.capture import CaptureResult, TextCapturePolicy, capture_text_artifact
 from run_artifacts.history import MAINTENANCE_IMAGE_CLEANUP_ARTIFACT_PATH
+from run_artifacts.history_index import artifact_stamp
 from run_artifacts.lifecycle import classify_history_record_lifecycle
 from run_artifacts.path_normalization import normalize_agent_path
 from run_artifacts.run_failure_event import (
@@ -1236,568 +1242,522 @@ def _extract_modern_report_atoms(
             )
 
 
-def extract_backlog_atoms(
-    records: list[dict[str, Any]],
-    repo_root: Path | None = None,
-    capture_policy: TextCapturePolicy | None = None,
+def _extract_run_atom_bundle(
+    record: dict[str, Any],
+    *,
+    run_id: str,
+    repo_root: Path | None,
+    policy: TextCapturePolicy,
+    max_command_failure_atoms: int | None,
 ) -> dict[str, Any]:
-    policy = capture_policy or _default_capture_policy()
-    max_command_failure_atoms = _max_command_failure_atoms_per_run()
+    """Extract one history record's atoms, counters and capture manifest entries."""
+
     atoms: list[dict[str, Any]] = []
     source_counts: Counter[str] = Counter()
     severity_counts: Counter[str] = Counter()
-    run_ids: set[str] = set()
-    capture_manifest: dict[str, list[dict[str, Any]]] = {}
-
-    for record in records:
-        run_dir_raw = record.get("run_dir")
-        run_dir = Path(run_dir_raw) if isinstance(run_dir_raw, str) else Path(".")
-        run_id = str(record.get("run_rel") or run_dir_raw or f"run_{len(run_ids) + 1}")
-        run_rel = str(record.get("run_rel") or run_id)
-        run_path_display = normalize_agent_path(str(run_dir))
-        if repo_root is not None and isinstance(run_dir_raw, str):
-            run_path_display = _safe_relpath(Path(run_dir_raw), repo_root)
-        run_ids.add(run_id)
-
-        agent = str(record.get("agent") or "unknown")
-        lifecycle = classify_history_record_lifecycle(record)
-        status = lifecycle.status
-        timestamp_utc = record.get("timestamp_utc")
-        timestamp_utc_s = timestamp_utc if isinstance(timestamp_utc, str) else None
-        target_slug = _coerce_string(record.get("target_slug"))
-
-        repo_input = None
-        mission_id = None
-        persona_id = None
-        target_ref = record.get("target_ref")
-        if isinstance(target_ref, dict):
-            repo_input = _coerce_string(target_ref.get("repo_input"))
-            mission_id = _coerce_string(target_ref.get("mission_id")) or _coerce_string(
-                target_ref.get("requested_mission_id")
+    run_dir_raw = record.get("run_dir")
+    run_dir = Path(run_dir_raw) if isinstance(run_dir_raw, str) else Path(".")
+    run_rel = str(record.get("run_rel") or run_id)
+    run_path_display = normalize_agent_path(str(run_dir))
+    if repo_root is not None and isinstance(run_dir_raw, str):
+        run_path_display = _safe_relpath(Path(run_dir_raw), repo_root)
+
+    agent = str(record.get("agent") or "unknown")
+    lifecycle = classify_history_record_lifecycle(record)
+    status = lifecycle.status
+    timestamp_utc = record.get("timestamp_utc")
+    timestamp_utc_s = timestamp_utc if isinstance(timestamp_utc, str) else None
+    target_slug = _coerce_string(record.get("target_slug"))
+
+    repo_input = None
+    mission_id = None
+    persona_id = None
+    target_ref = record.get("target_ref")
+    if isinstance(target_ref, dict):
+        repo_input = _coerce_string(target_ref.get("repo_input"))
+        mission_id = _coerce_string(target_ref.get("mission_id")) or _coerce_string(
+            target_ref.get("requested_mission_id")
+        )
+        persona_id = _coerce_string(target_ref.get("persona_id"))
+
+    lineage_context = record_lineage_context(record, run_id=run_id)
+
+    source_index: Counter[str] = Counter()
+
+    def _emit(
+        source: str,
+        text: str,
+        *,
+        _run_id: str = run_id,
+        _run_rel: str = run_rel,
+        _run_dir: str = run_path_display,
+        _agent: str = agent,
+        _status: str = status,
+        _timestamp_utc: str | None = timestamp_utc_s,
+        _target_slug: str | None = target_slug,
+        _repo_input: str | None = repo_input,
+        _mission_id: str | None = mission_id,
+        _persona_id: str | None = persona_id,
+        _source_index: Counter[str] = source_index,
+        _lineage_context: dict[str, Any] = lineage_context,
+        **extras: Any,
+    ) -> str | None:
+        cleaned = _clean_atom_text(text)
+        if not cleaned:
+            return None
+        _source_index[source] += 1
+        atom_id = f"{_run_id}:{source}:{_source_index[source]}"
+        priority_hint = _coerce_string(extras.get("priority"))
+        severity_hint = _coerce_string(extras.get("severity_hint")) or _infer_severity_hint(
+            source=source,
+            text=cleaned,
+            priority=priority_hint,
+        )
+        atom: dict[str, Any] = {
+            "atom_id": atom_id,
+            "run_id": _run_id,
+            "run_rel": _run_rel,
+            "run_dir": _run_dir,
+            "agent": _agent,
+            "status": _status,
+            "timestamp_utc": _timestamp_utc,
+            "source": source,
+            "text": cleaned,
+            "evidence_class": (
+                "proposal" if source == "suggested_change" else "observed"
+            ),
+            "severity_hint": severity_hint,
+            "severity_score_hint": _severity_rank(severity_hint),
+            **_lineage_context,
+        }
+        if _target_slug:
+            atom["target_slug"] = _target_slug
+        if _repo_input:
+            atom["repo_input"] = _repo_input
+        if _mission_id:
+            atom["mission_id"] = _mission_id
+        if _persona_id:
+            atom["persona_id"] = _persona_id
+        for key, value in extras.items():
+            if value is None:
+                continue
+            if key == "severity_hint" or key in _lineage_context:
+                continue
+            atom[key] = value
+        if atom.get("disposition") == "supports_case":
+            authorities = atom.get("lineage_authorities")
+            source = (
+                str(authorities[-1])
+                if isinstance(authorities, list) and authorities
+                else "runner_parent_lineage"
             )
-            persona_id = _coerce_string(target_ref.get("persona_id"))
-
-        lineage_context = record_lineage_context(record, run_id=run_id)
-
-        source_index: Counter[str] = Counter()
-
-        def _emit(
-            source: str,
-            text: str,
-            *,
-            _run_id: str = run_id,
-            _run_rel: str = run_rel,
-            _run_dir: str = run_path_display,
-            _agent: str = agent,
-            _status: str = status,
-            _timestamp_utc: str | None = timestamp_utc_s,
-            _target_slug: str | None = target_slug,
-            _repo_input: str | None = repo_input,
-            _mission_id: str | None = mission_id,
-            _persona_id: str | None = persona_id,
-            _source_index: Counter[str] = source_index,
-            _lineage_context: dict[str, Any] = lineage_context,
-            **extras: Any,
-        ) -> str | None:
-            cleaned = _clean_atom_text(text)
-            if not cleaned:
-                return None
-            _source_index[source] += 1
-            atom_id = f"{_run_id}:{source}:{_source_index[source]}"
-            priority_hint = _coerce_string(extras.get("priority"))
-            severity_hint = _coerce_string(extras.get("severity_hint")) or _infer_severity_hint(
+            atom = apply_atom_disposition_decision(
+                atom,
+                disposition="supports_case",
                 source=source,
-                text=cleaned,
-                priority=priority_hint,
-            )
-            atom: dict[str, Any] = {
-                "atom_id": atom_id,
-                "run_id": _run_id,
-                "run_rel": _run_rel,
-                "run_dir": _run_dir,
-                "agent": _agent,
-                "status": _status,
-                "timestamp_utc": _timestamp_utc,
-                "source": source,
-                "text": cleaned,
-                "evidence_class": (
-                    "proposal" if source == "suggested_change" else "observed"
+                rationale=(
+                    "Runner-owned lineage attached this derived atom to "
+                    f"{atom.get('parent_case_id')}."
                 ),
-                "severity_hint": severity_hint,
-                "severity_score_hint": _severity_rank(severity_hint),
-                **_lineage_context,
-            }
-            if _target_slug:
-                atom["target_slug"] = _target_slug
-            if _repo_input:
-                atom["repo_input"] = _repo_input
-            if _mission_id:
-                atom["mission_id"] = _mission_id
-            if _persona_id:
-                atom["persona_id"] = _persona_id
-            for key, value in extras.items():
-                if value is None:
-                    continue
-                if key == "severity_hint" or key in _lineage_context:
-                    continue
-                atom[key] = value
-            if atom.get("disposition") == "supports_case":
-                authorities = atom.get("lineage_authorities")
-                source = (
-                    str(authorities[-1])
-                    if isinstance(authorities, list) and authorities
-                    else "runner_parent_lineage"
-                )
-                atom = apply_atom_disposition_decision(
-                    atom,
-                    disposition="supports_case",
-                    source=source,
-                    rationale=(
-                        "Runner-owned lineage attached this derived atom to "
-                        f"{atom.get('parent_case_id')}."
-                    ),
-                )
-            validate_atom_lineage(atom)
-            atoms.append(atom)
-            source_counts[source] += 1
-            severity_counts[severity_hint] += 1
-            return atom_id
-
-        cleanup_sidecar = record.get("maintenance_image_cleanup")
-        cleanup_read_raw = record.get("maintenance_image_cleanup_read")
-        cleanup_read = cleanup_read_raw if isinstance(cleanup_read_raw, dict) else None
-        cleanup_artifact_ref_raw = record.get(
-            "maintenance_image_cleanup_artifact_ref"
-        )
-        cleanup_artifact_ref = (
-            dict(cleanup_artifact_ref_raw)
-            if isinstance(cleanup_artifact_ref_raw, dict)
-            else {
-                "path": MAINTENANCE_IMAGE_CLEANUP_ARTIFACT_PATH,
-                "exists": cleanup_sidecar is not None,
-            }
+            )
+        validate_atom_lineage(atom)
+        atoms.append(atom)
+        source_counts[source] += 1
+        severity_counts[severity_hint] += 1
+        return atom_id
+
+    cleanup_sidecar = record.get("maintenance_image_cleanup")
+    cleanup_read_raw = record.get("maintenance_image_cleanup_read")
+    cleanup_read = cleanup_read_raw if isinstance(cleanup_read_raw, dict) else None
+    cleanup_artifact_ref_raw = record.get(
+        "maintenance_image_cleanup_artifact_ref"
+    )
+    cleanup_artifact_ref = (
+        dict(cleanup_artifact_ref_raw)
+        if isinstance(cleanup_artifact_ref_raw, dict)
+        else {
+            "path": MAINTENANCE_IMAGE_CLEANUP_ARTIFACT_PATH,
+            "exists": cleanup_sidecar is not None,
+        }
+    )
+    cleanup_exists = cleanup_sidecar is not None or (
+        cleanup_read is not None and cleanup_read.get("exists") is True
+    )
+    if cleanup_exists:
+        cleanup_lineage_context = _runner_operational_observation_lineage(
+            run_id=run_id,
+            origin_stage="runner_maintenance_image_cleanup",
         )
-        cleanup_exists = cleanup_sidecar is not None or (
-            cleanup_read is not None and cleanup_read.get("exists") is True
+        cleanup_observation, cleanup_contract_errors = (
+            _maintenance_cleanup_observation(cleanup_sidecar)
         )
-        if cleanup_exists:
-            cleanup_lineage_context = _runner_operational_observation_lineage(
-                run_id=run_id,
-                origin_stage="runner_maintenance_image_cleanup",
+        if cleanup_observation is not None:
+            kept_image_id_text = (
+                "kept_image_ids="
+                f"{cleanup_observation['kept_image_id_count']}; "
+                if "kept_image_id_count" in cleanup_observation
+                else ""
             )
-            cleanup_observation, cleanup_contract_errors = (
-                _maintenance_cleanup_observation(cleanup_sidecar)
+            _emit(
+                "maintenance_image_cleanup",
+                (
+                    "Maintenance image cleanup observation: "
+                    f"enabled={str(cleanup_observation['cleanup_enabled']).lower()}; "
+                    f"dry_run={str(cleanup_observation['dry_run']).lower()}; "
+                    "repos_scanned="
+                    f"{cleanup_observation['repos_scanned_count']}; "
+                    f"kept_tags={cleanup_observation['kept_tag_count']}; "
+                    "unique_retained_tag_suffixes="
+                    f"{cleanup_observation['unique_retained_tag_suffix_count']}; "
+                    f"{kept_image_id_text}"
+                    "physical_retained_identity_count=unknown; "
+                    f"deleted_tags={cleanup_observation['deleted_tag_count']}; "
+                    "deleted_image_ids="
+                    f"{cleanup_observation['deleted_image_id_count']}; "
+                    f"errors={cleanup_observation['error_count']}."
+                ),
+                **cleanup_observation,
+                artifact_ref=cleanup_artifact_ref,
+                artifact_read=cleanup_read,
+                severity_hint="medium",
+                _lineage_context=cleanup_lineage_context,
+            )
+        else:
+            read_failure = (
+                cleanup_read.get("error_type")
+                if cleanup_read is not None
+                else None
+            )
+            detail = read_failure or ",".join(cleanup_contract_errors) or "unknown"
+            _emit(
+                "maintenance_image_cleanup_artifact_error",
+                f"Maintenance image cleanup artifact is unreadable or invalid: {detail}.",
+                artifact_ref=cleanup_artifact_ref,
+                artifact_read=cleanup_read,
+                contract_errors=(
+                    cleanup_contract_errors if cleanup_contract_errors else None
+                ),
+                severity_hint="medium",
+                _lineage_context=cleanup_lineage_context,
             )
-            if cleanup_observation is not None:
-                kept_image_id_text = (
-                    "kept_image_ids="
-                    f"{cleanup_observation['kept_image_id_count']}; "
-                    if "kept_image_id_count" in cleanup_observation
-                    else ""
-                )
-                _emit(
-                    "maintenance_image_cleanup",
-                    (
-                        "Maintenance image cleanup observation: "
-                        f"enabled={str(cleanup_observation['cleanup_enabled']).lower()}; "
-                        f"dry_run={str(cleanup_observation['dry_run']).lower()}; "
-                        "repos_scanned="
-                        f"{cleanup_observation['repos_scanned_count']}; "
-                        f"kept_tags={cleanup_observation['kept_tag_count']}; "
-                        "unique_retained_tag_suffixes="
-                        f"{cleanup_observation['unique_retained_tag_suffix_count']}; "
-                        f"{kept_image_id_text}"
-                        "physical_retained_identity_count=unknown; "
-                        f"deleted_tags={cleanup_observation['deleted_tag_count']}; "
-                        "deleted_image_ids="
-                        f"{cleanup_observation['deleted_image_id_count']}; "
-                        f"errors={cleanup_observation['error_count']}."
-                    ),
-                    **cleanup_observation,
-                    artifact_ref=cleanup_artifact_ref,
-                    artifact_read=cleanup_read,
-                    severity_hint="medium",
-                    _lineage_context=cleanup_lineage_context,
-                )
-            else:
-                read_failure = (
-                    cleanup_read.get("error_type")
-                    if cleanup_read is not None
-                    else None
-                )
-                detail = read_failure or ",".join(cleanup_contract_errors) or "unknown"
-                _emit(
-                    "maintenance_image_cleanup_artifact_error",
-                    f"Maintenance image cleanup artifact is unreadable or invalid: {detail}.",
-                    artifact_ref=cleanup_artifact_ref,
-                    artifact_read=cleanup_read,
-                    contract_errors=(
-                        cleanup_contract_errors if cleanup_contract_errors else None
-                    ),
-                    severity_hint="medium",
-                    _lineage_context=cleanup_lineage_context,
-                )
 
-        token_monitoring, token_monitoring_error = _load_token_monitoring_artifacts(record, run_dir)
-        if isinstance(token_monitoring, dict):
-            signals_raw = token_monitoring.get("signals")
-            signals = signals_raw if isinstance(signals_raw, list) else []
-            for signal in signals:
-                if not isinstance(signal, dict):
+    token_monitoring, token_monitoring_error = _load_token_monitoring_artifacts(record, run_dir)
+    if isinstance(token_monitoring, dict):
+        signals_raw = token_monitoring.get("signals")
+        signals = signals_raw if isinstance(signals_raw, list) else []
+        for signal in signals:
+            if not isinstance(signal, dict):
+                continue
+            signal_id = _coerce_string(signal.get("signal_id"))
+            causal_mechanism = _coerce_string(signal.get("causal_mechanism"))
+            if signal_id is None or causal_mechanism is None:
+                continue
+            dimensions = _token_monitoring_dimensions(
+                signal.get("token_dimensions_affected")
+            )
+            mitigation = _coerce_string(signal.get("mitigation_lever"))
+            evidence_raw = signal.get("evidence")
+            evidence = evidence_raw if isinstance(evidence_raw, dict) else {}
+            call_count = _coerce_int(evidence.get("call_count"))
+            call_indexes_raw = evidence.get("call_indexes")
+            call_indexes = (
+                [
+                    parsed
+                    for item in call_indexes_raw[:20]
+                    for parsed in [_coerce_int(item)]
+                    if parsed is not None
+                ]
+                if isinstance(call_indexes_raw, list)
+                else []
+            )
+            paths_preview = _iter_unique_capped_strings(
+                [
+                    *_iter_unique_capped_strings(evidence.get("paths_from_calls"), limit=12),
+                    *_iter_unique_capped_strings(evidence.get("largest_read_files"), limit=12),
+                ],
+                limit=12,
+            )
+            _emit(
+                "token_monitoring_signal",
+                _token_monitoring_signal_text(
+                    signal_id=signal_id,
+                    causal_mechanism=causal_mechanism,
+                    dimensions=dimensions,
+                    mitigation=mitigation,
+                ),
+                token_signal_id=signal_id,
+                token_signal_confidence=_coerce_string(signal.get("confidence")),
+                token_dimensions_affected=dimensions if dimensions else None,
+                confirmed_by_counters=signal.get("confirmed_by_counters") is True,
+                mitigation_lever=mitigation,
+                false_positive_risk=_coerce_string(signal.get("false_positive_risk")),
+                evidence_call_count=call_count,
+                evidence_call_indexes=call_indexes if call_indexes else None,
+                evidence_paths_preview=paths_preview if paths_preview else None,
+                token_monitoring_artifact="token_monitoring.json",
+                severity_hint=_token_monitoring_signal_severity(dimensions),
+            )
+
+    if isinstance(token_monitoring_error, dict):
+        error_type = _coerce_string(token_monitoring_error.get("type")) or "unknown"
+        message = (
+            _coerce_string(token_monitoring_error.get("message"))
+            or "Token monitoring failed."
+        )
+        _emit(
+            "token_monitoring_error",
+            f"Token monitoring failed: type={error_type}; message={message}",
+            token_monitoring_artifact="token_monitoring_error.json",
+            error_type=error_type,
+            non_fatal=token_monitoring_error.get("non_fatal") is True,
+            generated_at_utc=_coerce_string(token_monitoring_error.get("generated_at_utc")),
+        )
+
+    report_raw = record.get("report")
+    report_for_context = report_raw if isinstance(report_raw, Mapping) else None
+
+    metrics_raw = record.get("metrics")
+    metrics = metrics_raw if isinstance(metrics_raw, dict) else None
+
+    failed_commands: list[dict[str, Any]] = []
+    failed_commands_omitted_hint: int | None = None
+    metrics_failed_commands_count: int | None = None
+    metrics_failed_commands_truncated = False
+    if metrics is not None:
+        failed_raw = metrics.get("failed_commands")
+        if isinstance(failed_raw, list):
+            for item in failed_raw:
+                if not isinstance(item, dict):
+                    continue
+                command = _coerce_string(item.get("command"))
+                exit_code = item.get("exit_code")
+                if command is None or not isinstance(exit_code, int) or exit_code == 0:
                     continue
-                signal_id = _coerce_string(signal.get("signal_id"))
-                causal_mechanism = _coerce_string(signal.get("causal_mechanism"))
-                if signal_id is None or causal_mechanism is None:
+                if _is_ripgrep_no_matches(command=command, exit_code=exit_code):
                     continue
-                dimensions = _token_monitoring_dimensions(
-                    signal.get("token_dimensions_affected")
-                )
-                mitigation = _coerce_string(signal.get("mitigation_lever"))
-                evidence_raw = signal.get("evidence")
-                evidence = evidence_raw if isinstance(evidence_raw, dict) else {}
-                call_count = _coerce_int(evidence.get("call_count"))
-                call_indexes_raw = evidence.get("call_indexes")
-                call_indexes = (
-                    [
-                        parsed
-                        for item in call_indexes_raw[:20]
-                        for parsed in [_coerce_int(item)]
-                        if parsed is not None
-                    ]
-                    if isinstance(call_indexes_raw, list)
-                    else []
+                failed_commands.append(
+                    {
+                        "command": command,
+                        "exit_code": exit_code,
+                        "cwd": _coerce_string(item.get("cwd")),
+                        "artifacts": item.get("artifacts")
+                        if isinstance(item.get("artifacts"), dict)
+                        else None,
+                        "output_excerpt": _coerce_string(item.get("output_excerpt")),
+                        "output_excerpt_truncated": item.get("output_excerpt_truncated")
+                        is True,
+                        "from_metrics": True,
+                    }
                 )
-                paths_preview = _iter_unique_capped_strings(
-                    [
-                        *_iter_unique_capped_strings(evidence.get("paths_from_calls"), limit=12),
-                        *_iter_unique_capped_strings(evidence.get("largest_read_files"), limit=12),
-                    ],
-                    limit=12,
+        commands_failed = metrics.get("commands_failed")
+        if isinstance(commands_failed, int) and commands_failed >= 0:
+            metrics_failed_commands_count = commands_failed
+        if metrics.get("failed_commands_truncated") is True:
+            metrics_failed_commands_truncated = True
+            omitted = metrics.get("failed_commands_omitted_count")
+            if isinstance(omitted, int) and omitted > 0:
+                failed_commands_omitted_hint = omitted
+
+    metrics_incomplete = False
+    if metrics_failed_commands_truncated:
+        metrics_incomplete = True
+    elif failed_commands_omitted_hint is not None and failed_commands_omitted_hint > 0:
+        metrics_incomplete = True
+    elif (
+        metrics_failed_commands_count is not None
+        and metrics_failed_commands_count > len(failed_commands)
+    ):
+        metrics_incomplete = True
+
+    events_path = run_dir / "normalized_events.jsonl"
+    run_command_events = (
+        _extract_run_commands_from_events(events_path=events_path)
+        if events_path.exists()
+        else []
+    )
+    if not failed_commands and events_path.exists():
+        failed_commands = _extract_failed_commands_from_events(
+            events_path=events_path,
+            max_items=max_command_failure_atoms,
+        )
+    elif failed_commands and metrics_incomplete and events_path.exists():
+        event_failed_commands = _extract_failed_commands_from_events(events_path=events_path)
+        if event_failed_commands:
+            deduped: list[dict[str, Any]] = []
+            seen_identities: set[str] = set()
+            for entry in failed_commands:
+                identity = _command_failure_entry_identity(entry)
+                if identity is not None and identity in seen_identities:
+                    continue
+                if identity is not None:
+                    seen_identities.add(identity)
+                deduped.append(entry)
+            for entry in event_failed_commands:
+                identity = _command_failure_entry_identity(entry)
+                if identity is not None and identity in seen_identities:
+                    continue
+                if identity is not None:
+                    seen_identities.add(identity)
+                deduped.append(entry)
+            failed_commands = deduped
+            if max_command_failure_atoms is None:
+                failed_commands_omitted_hint = None
+            else:
+                omitted_after_reconcile = (
+                    len(failed_commands) - max_command_failure_atoms
                 )
-                _emit(
-                    "token_monitoring_signal",
-                    _token_monitoring_signal_text(
-                        signal_id=signal_id,
-                        causal_mechanism=causal_mechanism,
-                        dimensions=dimensions,
-                        mitigation=mitigation,
-                    ),
-                    token_signal_id=signal_id,
-                    token_signal_confidence=_coerce_string(signal.get("confidence")),
-                    token_dimensions_affected=dimensions if dimensions else None,
-                    confirmed_by_counters=signal.get("confirmed_by_counters") is True,
-                    mitigation_lever=mitigation,
-                    false_positive_risk=_coerce_string(signal.get("false_positive_risk")),
-                    evidence_call_count=call_count,
-                    evidence_call_indexes=call_indexes if call_indexes else None,
-                    evidence_paths_preview=paths_preview if paths_preview else None,
-                    token_monitoring_artifact="token_monitoring.json",
-                    severity_hint=_token_monitoring_signal_severity(dimensions),
+                failed_commands_omitted_hint = (
+                    omitted_after_reconcile if omitted_after_reconcile > 0 else None
                 )
 
-        if isinstance(token_monitoring_error, dict):
-            error_type = _coerce_string(token_monitoring_error.get("type")) or "unknown"
-            message = (
-                _coerce_string(token_monitoring_error.get("message"))
-                or "Token monitoring failed."
+    if failed_commands:
+        if (
+            max_command_failure_atoms is not None
+            and len(failed_commands) > max_command_failure_atoms
+        ):
+            cap_omitted = len(failed_commands) - max_command_failure_atoms
+            failed_commands_omitted_hint = max(
+                cap_omitted,
+                failed_commands_omitted_hint or 0,
+            )
+        emitted = 0
+        claimed_event_ordinals: set[int] = set()
+        for entry in failed_commands:
+            if (
+                max_command_failure_atoms is not None
+                and emitted >= max_command_failure_atoms
+            ):
+                break
+            command = _coerce_string(entry.get("command"))
+            exit_code = entry.get("exit_code")
+            if command is None or not isinstance(exit_code, int) or exit_code == 0:
+                continue
+            output_excerpt = _coerce_string(entry.get("output_excerpt"))
+            output_excerpt_truncated = (
+                True if entry.get("output_excerpt_truncated") is True else None
+            )
+            same_run_context = _same_run_command_context(
+                failure=entry,
+                run_commands=run_command_events,
+                claimed_event_ordinals=claimed_event_ordinals,
+                lifecycle_status=status,
+                report=report_for_context,
             )
             _emit(
-                "token_monitoring_error",
-                f"Token monitoring failed: type={error_type}; message={message}",
-                token_monitoring_artifact="token_monitoring_error.json",
-                error_type=error_type,
-                non_fatal=token_monitoring_error.get("non_fatal") is True,
-                generated_at_utc=_coerce_string(token_monitoring_error.get("generated_at_utc")),
+                "command_failure",
+                f"Command failed: exit_code={exit_code}; command={command}",
+                command=command,
+                exit_code=exit_code,
+                cwd=_coerce_string(entry.get("cwd")),
+                artifacts=entry.get("artifacts")
+                if isinstance(entry.get("artifacts"), dict)
+                else None,
+                output_excerpt=output_excerpt,
+                output_excerpt_truncated=output_excerpt_truncated,
+                from_events=True if entry.get("from_events") else None,
+                from_metrics=True if entry.get("from_metrics") else None,
+                same_run_command_context=same_run_context,
             )
+            emitted += 1
 
-        report_raw = record.get("report")
-        report_for_context = report_raw if isinstance(report_raw, Mapping) else None
-
-        metrics_raw = record.get("metrics")
-        metrics = metrics_raw if isinstance(metrics_raw, dict) else None
-
-        failed_commands: list[dict[str, Any]] = []
-        failed_commands_omitted_hint: int | None = None
-        metrics_failed_commands_count: int | None = None
-        metrics_failed_commands_truncated = False
-        if metrics is not None:
-            failed_raw = metrics.get("failed_commands")
-            if isinstance(failed_raw, list):
-                for item in failed_raw:
-                    if not isinstance(item, dict):
-                        continue
-                    command = _coerce_string(item.get("command"))
-                    exit_code = item.get("exit_code")
-                    if command is None or not isinstance(exit_code, int) or exit_code == 0:
-                        continue
-                    if _is_ripgrep_no_matches(command=command, exit_code=exit_code):
-                        continue
-                    failed_commands.append(
-                        {
-                            "command": command,
-                            "exit_code": exit_code,
-                            "cwd": _coerce_string(item.get("cwd")),
-                            "artifacts": item.get("artifacts")
-                            if isinstance(item.get("artifacts"), dict)
-                            else None,
-                            "output_excerpt": _coerce_string(item.get("output_excerpt")),
-                            "output_excerpt_truncated": item.get("output_excerpt_truncated")
-                            is True,
-                            "from_metrics": True,
-                        }
-                    )
-            commands_failed = metrics.get("commands_failed")
-            if isinstance(commands_failed, int) and commands_failed >= 0:
-                metrics_failed_commands_count = commands_failed
-            if metrics.get("failed_commands_truncated") is True:
-                metrics_failed_commands_truncated = True
-                omitted = metrics.get("failed_commands_omitted_count")
-                if isinstance(omitted, int) and omitted > 0:
-                    failed_commands_omitted_hint = omitted
-
-        metrics_incomplete = False
-        if metrics_failed_commands_truncated:
-            metrics_incomplete = True
-        elif failed_commands_omitted_hint is not None and failed_commands_omitted_hint > 0:
-            metrics_incomplete = True
-        elif (
-            metrics_failed_commands_count is not None
-            and metrics_failed_commands_count > len(failed_commands)
-        ):
-            metrics_incomplete = True
-
-        events_path = run_dir / "normalized_events.jsonl"
-        run_command_events = (
-            _extract_run_commands_from_events(events_path=events_path)
-            if events_path.exists()
-            else []
-        )
-        if not failed_commands and events_path.exists():
-            failed_commands = _extract_failed_commands_from_events(
-                events_path=events_path,
-                max_items=max_command_failure_atoms,
+        if failed_commands_omitted_hint is not None and failed_commands_omitted_hint > 0:
+            _emit(
+                "command_failure_truncated",
+                (
+                    "Command failure list truncated by reporter: omitted "
+                    f"{failed_commands_omitted_hint} additional failures."
+                ),
+                omitted_count=failed_commands_omitted_hint,
+                severity_hint="low",
             )
-        elif failed_commands and metrics_incomplete and events_path.exists():
-            event_failed_commands = _extract_failed_commands_from_events(events_path=events_path)
-            if event_failed_commands:
-                deduped: list[dict[str, Any]] = []
-                seen_identities: set[str] = set()
-                for entry in failed_commands:
-                    identity = _command_failure_entry_identity(entry)
-                    if identity is not None and identity in seen_identities:
-                        continue
-                    if identity is not None:
-                        seen_identities.add(identity)
-                    deduped.append(entry)
-                for entry in event_failed_commands:
-                    identity = _command_failure_entry_identity(entry)
-                    if identity is not None and identity in seen_identities:
-                        continue
-                    if identity is not None:
-                        seen_identities.add(identity)
-                    deduped.append(entry)
-                failed_commands = deduped
-                if max_command_failure_atoms is None:
-                    failed_commands_omitted_hint = None
-                else:
-                    omitted_after_reconcile = (
-                        len(failed_commands) - max_command_failure_atoms
-                    )
-                    failed_commands_omitted_hint = (
-                        omitted_after_reconcile if omitted_after_reconcile > 0 else None
-                    )
 
-        if failed_commands:
-            if (
-                max_command_failure_atoms is not None
-                and len(failed_commands) > max_command_failure_atoms
-            ):
-                cap_omitted = len(failed_commands) - max_command_failure_atoms
-                failed_commands_omitted_hint = max(
-                    cap_omitted,
-                    failed_commands_omitted_hint or 0,
-                )
-            emitted = 0
-            claimed_event_ordinals: set[int] = set()
-            for entry in failed_commands:
-                if (
-                    max_command_failure_atoms is not None
-                    and emitted >= max_command_failure_atoms
-                ):
-                    break
-                command = _coerce_string(entry.get("command"))
-                exit_code = entry.get("exit_code")
-                if command is None or not isinstance(exit_code, int) or exit_code == 0:
+    report = report_raw
+    if isinstance(report, dict):
+        confusion = report.get("confusion_points")
+        if isinstance(confusion, list):
+            for item in confusion:
+                if not isinstance(item, dict):
                     continue
-                output_excerpt = _coerce_string(entry.get("output_excerpt"))
-                output_excerpt_truncated = (
-                    True if entry.get("output_excerpt_truncated") is True else None
-                )
-                same_run_context = _same_run_command_context(
-                    failure=entry,
-                    run_commands=run_command_events,
-                    claimed_event_ordinals=claimed_event_ordinals,
-                    lifecycle_status=status,
-                    report=report_for_context,
-                )
+                summary = _coerce_string(item.get("summary"))
+                if summary is None:
+                    continue
+                impact = _coerce_string(item.get("impact"))
+                evidence = _coerce_evidence_list(item.get("evidence"))
                 _emit(
-                    "command_failure",
-                    f"Command failed: exit_code={exit_code}; command={command}",
-                    command=command,
-                    exit_code=exit_code,
-                    cwd=_coerce_string(entry.get("cwd")),
-                    artifacts=entry.get("artifacts")
-                    if isinstance(entry.get("artifacts"), dict)
-                    else None,
-                    output_excerpt=output_excerpt,
-                    output_excerpt_truncated=output_excerpt_truncated,
-                    from_events=True if entry.get("from_events") else None,
-                    from_metrics=True if entry.get("from_metrics") else None,
-                    same_run_command_context=same_run_context,
+                    "confusion_point",
+                    summary,
+                    impact=impact,
+                    evidence=evidence if evidence else None,
+                    report_confusion_point=dict(item),
                 )
-                emitted += 1
 
-            if failed_commands_omitted_hint is not None and failed_commands_omitted_hint > 0:
+        suggested = report.get("suggested_changes")
+        if isinstance(suggested, list):
+            for item in suggested:
+                if not isinstance(item, dict):
+                    continue
+                change = _coerce_string(item.get("change"))
+                if change is None:
+                    continue
+                change_type = _coerce_string(item.get("type"))
+                location = _coerce_string(item.get("location"))
+                priority = _coerce_string(item.get("priority"))
+                expected_impact = _coerce_string(item.get("expected_impact"))
                 _emit(
-                    "command_failure_truncated",
-                    (
-                        "Command failure list truncated by reporter: omitted "
-                        f"{failed_commands_omitted_hint} additional failures."
-                    ),
-                    omitted_count=failed_commands_omitted_hint,
-                    severity_hint="low",
+                    "suggested_change",
+                    change,
+                    type=change_type,
+                    location=location,
+                    priority=priority,
+                    expected_impact=expected_impact,
+                    severity_hint=_severity_from_priority(priority),
                 )
 
-        report = report_raw
-        if isinstance(report, dict):
-            confusion = report.get("confusion_points")
-            if isinstance(confusion, list):
-                for item in confusion:
-                    if not isinstance(item, dict):
-                        continue
-                    summary = _coerce_string(item.get("summary"))
-                    if summary is None:
-                        continue
-                    impact = _coerce_string(item.get("impact"))
-                    evidence = _coerce_evidence_list(item.get("evidence"))
-                    _emit(
-                        "confusion_point",
-                        summary,
-                        impact=impact,
-                        evidence=evidence if evidence else None,
-                        report_confusion_point=dict(item),
-                    )
-
-            suggested = report.get("suggested_changes")
-            if isinstance(suggested, list):
-                for item in suggested:
-                    if not isinstance(item, dict):
-                        continue
-                    change = _coerce_string(item.get("change"))
-                    if change is None:
-                        continue
-                    change_type = _coerce_string(item.get("type"))
-                    location = _coerce_string(item.get("location"))
-                    priority = _coerce_string(item.get("priority"))
-                    expected_impact = _coerce_string(item.get("expected_impact"))
-                    _emit(
-                        "suggested_change",
-                        change,
-                        type=change_type,
-                        location=location,
-                        priority=priority,
-                        expected_impact=expected_impact,
-                        severity_hint=_severity_from_priority(priority),
-                    )
-
-            confidence = report.get("confidence_signals")
-            if isinstance(confidence, dict):
-                for missing in _coerce_string_list(confidence.get("missing")):
-                    _emit("confidence_missing", missing)
-
-            report_kind = _coerce_string(report.get("kind"))
-            report_status = _coerce_string(report.get("status"))
-            if report_kind is not None or report_status is not None:
-                terminal_text, terminal_fields = _modern_report_terminal_context(
-                    report=report,
-                    report_kind=report_kind or "unknown",
-                    report_status=(report_status or "unknown").casefold(),
-                )
-                _emit(
-                    "run_outcome_context",
-                    terminal_text,
-                    **terminal_fields,
-                )
-                _extract_modern_report_atoms(
-                    report=report,
-                    report_kind=report_kind or "unknown",
-                    emit=_emit,
-                )
+        confidence = report.get("confidence_signals")
+        if isinstance(confidence, dict):
+            for missing in _coerce_string_list(confidence.get("missing")):
+                _emit("confidence_missing", missing)
+
+        report_kind = _coerce_string(report.get("kind"))
+        report_status = _coerce_string(report.get("status"))
+        if report_kind is not None or report_status is not None:
+            terminal_text, terminal_fields = _modern_report_terminal_context(
+                report=report,
+                report_kind=report_kind or "unknown",
+                report_status=(report_status or "unknown").casefold(),
+            )
+            _emit(
+                "run_outcome_context",
+                terminal_text,
+                **terminal_fields,
+            )
+            _extract_modern_report_atoms(
+                report=report,
+                report_kind=report_kind or "unknown",
+                emit=_emit,
+            )
 
-        validation_values = coerce_validation_errors(record.get("report_validation_errors"))
-        sanitized_error = sanitize_error(record.get("error"))
-        artifacts = extract_error_artifacts(sanitized_error)
-        is_failure, failure_kind = classify_failure_kind(
-            status=status,
-            error=sanitized_error,
-            validation_errors=validation_values,
-        )
+    validation_values = coerce_validation_errors(record.get("report_validation_errors"))
+    sanitized_error = sanitize_error(record.get("error"))
+    artifacts = extract_error_artifacts(sanitized_error)
+    is_failure, failure_kind = classify_failure_kind(
+        status=status,
+        error=sanitized_error,
+        validation_errors=validation_values,
+    )
 
-        run_capture_entries: list[dict[str, Any]] = []
-        attachments: list[dict[str, Any]] = []
-        failure_attachment_atom_ids: list[str] = []
-        for filename, source in (
-            ("agent_stderr.txt", "agent_stderr_artifact"),
-            ("agent_last_message.txt", "agent_last_message_artifact"),
-        ):
-            capture = capture_text_artifact(run_dir / filename, policy=policy, root=run_dir)
-            run_capture_entries.append(_capture_manifest_entry(capture))
-            if is_failure:
-                if not capture.artifact.exists and not (
-                    isinstance(capture.error, str) and capture.error.strip()
-                ):
-                    continue
-                excerpt_head = capture.excerpt.head if capture.excerpt is not None else None
-                excerpt_tail = capture.excerpt.tail if capture.excerpt is not None else None
-                truncated = (
-                    bool(capture.excerpt.truncated) if capture.excerpt is not None else False
-                )
-                attachments.append(
-                    {
-                        "path": capture.artifact.path,
-                        "artifact_ref": _artifact_ref_public(capture),
-                        "truncated": truncated,
-                        "excerpt_head": excerpt_head,
-                        "excerpt_tail": excerpt_tail,
-                        "capture_error": capture.error,
-                    }
-                )
-                artifact_text = _clean_atom_text(_compose_artifact_text(capture))
-                if not artifact_text:
-                    artifact_text = (
-                        f"[capture_error] {capture.error}"
-                        if isinstance(capture.error, str) and capture.error.strip()
-                        else "[empty artifact]"
-                    )
-                attachment_atom_id = _emit(
-                    source,
-                    artifact_text,
-                    excerpt_head=excerpt_head,
-                    excerpt_tail=excerpt_tail,
-                    truncated=truncated,
-                    capture_error=capture.error,
-                    artifact_ref=_artifact_ref_public(capture),
-                    severity_hint="high",
-                )
-                if attachment_atom_id is not None:
-                    failure_attachment_atom_ids.append(attachment_atom_id)
-                continue
-            if not capture.artifact.exists:
-                continue
-            if (
-                source == "agent_stderr_artifact"
-                and status.strip().lower() == "ok"
-                and (capture.artifact.size_bytes == 0)
+    run_capture_entries: list[dict[str, Any]] = []
+    attachments: list[dict[str, Any]] = []
+    failure_attachment_atom_ids: list[str] = []
+    for filename, source in (
+        ("agent_stderr.txt", "agent_stderr_artifact"),
+        ("agent_last_message.txt", "agent_last_message_artifact"),
+    ):
+        capture = capture_text_artifact(run_dir / filename, policy=policy, root=run_dir)
+        run_capture_entries.append(_capture_manifest_entry(capture))
+        if is_failure:
+            if not capture.artifact.exists and not (
+                isinstance(capture.error, str) and capture.error.strip()
             ):
                 continue
             excerpt_head = capture.excerpt.head if capture.excerpt is not None else None
@@ -1805,42 +1765,69 @@ def extract_backlog_atoms(
             truncated = (
                 bool(capture.excerpt.truncated) if capture.excerpt is not None else False
             )
+            attachments.append(
+                {
+                    "path": capture.artifact.path,
+                    "artifact_ref": _artifact_ref_public(capture),
+                    "truncated": truncated,
+                    "excerpt_head": excerpt_head,
+                    "excerpt_tail": excerpt_tail,
+                    "capture_error": capture.error,
+                }
+            )
             artifact_text = _clean_atom_text(_compose_artifact_text(capture))
             if not artifact_text:
-                artifact_text = "[empty artifact]"
-            if source == "agent_stderr_artifact" and status.strip().lower() == "ok":
-                warning_meta = classify_known_stderr_warnings(artifact_text)
-                warning_only = bool(warning_meta.get("warning_only"))
-                warning_codes = warning_meta.get("codes")
-                warning_counts = warning_meta.get("counts")
-                if warning_only and isinstance(warning_codes, list):
-                    if warning_codes == ["shell_snapshot_powershell_unsupported"]:
-                        _emit(
-                            "capability_notice_artifact",
-                            (
-                                "Known capability notice in agent stderr: "
-                                "PowerShell shell snapshot metadata unavailable (expected)."
-                            ),
-                            warning_codes=warning_codes,
-                            warning_counts=warning_counts
-                            if isinstance(warning_counts, dict)
-                            else None,
-                            excerpt_head=excerpt_head,
-                            excerpt_tail=excerpt_tail,
-                            truncated=truncated,
-                            capture_error=capture.error,
-                            artifact_ref=_artifact_ref_public(capture),
-                            severity_hint="low",
-                        )
-                        continue
+                artifact_text = (
+                    f"[capture_error] {capture.error}"
+                    if isinstance(capture.error, str) and capture.error.strip()
+                    else "[empty artifact]"
+                )
+            attachment_atom_id = _emit(
+                source,
+                artifact_text,
+                excerpt_head=excerpt_head,
+                excerpt_tail=excerpt_tail,
+                truncated=truncated,
+                capture_error=capture.error,
+                artifact_ref=_artifact_ref_public(capture),
+                severity_hint="high",
+            )
+            if attachment_atom_id is not None:
+                failure_attachment_atom_ids.append(attachment_atom_id)
+            continue
+        if not capture.artifact.exists:
+            continue
+        if (
+            source == "agent_stderr_artifact"
+            and status.strip().lower() == "ok"
+            and (capture.artifact.size_bytes == 0)
+        ):
+            continue
+        excerpt_head = capture.excerpt.head if capture.excerpt is not None else None
+        excerpt_tail = capture.excerpt.tail if capture.excerpt is not None else None
+        truncated = (
+            bool(capture.excerpt.truncated) if capture.excerpt is not None else False
+        )
+        artifact_text = _clean_atom_text(_compose_artifact_text(capture))
+        if not artifact_text:
+            artifact_text = "[empty artifact]"
+        if source == "agent_stderr_artifact" and status.strip().lower() == "ok":
+            warning_meta = classify_known_stderr_warnings(artifact_text)
+            warning_only = bool(warning_meta.get("warning_only"))
+            warning_codes = warning_meta.get("codes")
+            warning_counts = warning_meta.get("counts")
+            if warning_only and isinstance(warning_codes, list):
+                if warning_codes == ["shell_snapshot_powershell_unsupported"]:
                     _emit(
-                        "capability_warning_artifact",
+                        "capability_notice_artifact",
                         (
-                            "Known capability warning(s) in agent stderr: "
-                            + ", ".join(str(code) for code in warning_codes)
+                            "Known capability notice in agent stderr: "
+                            "PowerShell shell snapshot metadata unavailable (expected)."
                         ),
                         warning_codes=warning_codes,
-                        warning_counts=warning_counts if isinstance(warning_counts, dict) else None,
+                        warning_counts=warning_counts
+                        if isinstance(warning_counts, dict)
+                        else None,
                         excerpt_head=excerpt_head,
                         excerpt_tail=excerpt_tail,
                         truncated=truncated,
@@ -1849,42 +1836,280 @@ def extract_backlog_atoms(
                         severity_hint="low",
                     )
                     continue
-            _emit(
-                source,
-                artifact_text,
-                excerpt_head=excerpt_head,
-                excerpt_tail=excerpt_tail,
-                truncated=truncated,
-                capture_error=capture.error,
-                artifact_ref=_artifact_ref_public(capture),
-            )
-        capture_manifest[run_rel] = run_capture_entries
+                _emit(
+                    "capability_warning_artifact",
+                    (
+                        "Known capability warning(s) in agent stderr: "
+                        + ", ".join(str(code) for code in warning_codes)
+                    ),
+                    warning_codes=warning_codes,
+                    warning_counts=warning_counts if isinstance(warning_counts, dict) else None,
+                    excerpt_head=excerpt_head,
+                    excerpt_tail=excerpt_tail,
+                    truncated=truncated,
+                    capture_error=capture.error,
+                    artifact_ref=_artifact_ref_public(capture),
+                    severity_hint="low",
+                )
+                continue
+        _emit(
+            source,
+            artifact_text,
+            excerpt_head=excerpt_head,
+            excerpt_tail=excerpt_tail,
+            truncated=truncated,
+            capture_error=capture.error,
+            artifact_ref=_artifact_ref_public(capture),
+        )
 
-        if is_failure:
-            failure_text = render_failure_text(
-                failure_kind=failure_kind,
-                agent=agent,
-                status=status,
-                error=sanitized_error,
-                report_validation_errors=validation_values,
-                artifacts=artifacts,
-                terminal_artifact_reads=record.get("terminal_artifact_reads"),
-                # Full bounded head/tail evidence is emitted as linked artifact atoms so
-                # one large failure record cannot hide or overflow the evidence chunks.
-                attachments=None,
-            )
-            _emit(
-                "run_failure_event",
-                failure_text,
-                severity_hint="high",
-                failure_kind=failure_kind,
-                error=sanitized_error,
-                report_validation_errors=validation_values,
-                artifacts=artifacts,
-                terminal_artifact_reads=record.get("terminal_artifact_reads"),
-                attachments=attachments,
-                linked_atom_ids=failure_attachment_atom_ids,
+    if is_failure:
+        failure_text = render_failure_text(
+            failure_kind=failure_kind,
+            agent=agent,
+            status=status,
+            error=sanitized_error,
+            report_validation_errors=validation_values,
+            artifacts=artifacts,
+            terminal_artifact_reads=record.get("terminal_artifact_reads"),
+            # Full bounded head/tail evidence is emitted as linked artifact atoms so
+            # one large failure record cannot hide or overflow the evidence chunks.
+            attachments=None,
+        )
+        _emit(
+            "run_failure_event",
+            failure_text,
+            severity_hint="high",
+            failure_kind=failure_kind,
+            error=sanitized_error,
+            report_validation_errors=validation_values,
+            artifacts=artifacts,
+            terminal_artifact_reads=record.get("terminal_artifact_reads"),
+            attachments=attachments,
+            linked_atom_ids=failure_attachment_atom_ids,
+        )
+
+    return {
+        "run_id": run_id,
+        "run_rel": run_rel,
+        "atoms": atoms,
+        "source_counts": dict(source_counts),
+        "severity_counts": dict(severity_counts),
+        "capture_entries": run_capture_entries,
+    }
+
+
+ATOM_EXTRACTION_JOBS_ENV = "BACKLOG_ATOM_EXTRACTION_JOBS"
+_ATOM_BUNDLE_CACHE_SCHEMA_VERSION = 1
+# Below this many uncached runs, starting worker processes costs more than it saves.
+_PARALLEL_MIN_UNCACHED_RUNS = 16
+_ATOM_EXTRACTION_CODE_STAMP: str | None = None
+
+
+def _atom_extraction_jobs(jobs: int | None) -> int:
+    # Opt-in only: callers may run on threads, where forking worker processes is unsafe.
+    if jobs is None:
+        jobs = _env_int(ATOM_EXTRACTION_JOBS_ENV, 1)
+    return max(1, jobs)
+
+
+def _atom_extraction_code_stamp() -> str:
+    """Fingerprint the modules that shape extracted atoms so code changes invalidate caches."""
+
+    global _ATOM_EXTRACTION_CODE_STAMP
+    if _ATOM_EXTRACTION_CODE_STAMP is None:
+        parts: list[list[Any]] = []
+        for module_name in sorted(
+            {
+                __name__,
+                capture_text_artifact.__module__,
+                classify_history_record_lifecycle.__module__,
+                render_failure_text.__module__,
+                record_lineage_context.__module__,
+                normalize_agent_path.__module__,
+            }
+        ):
+            module_file = getattr(sys.modules.get(module_name), "__file__", None)
+            try:
+                stat = os.stat(str(module_file))
+            except OSError:
+                parts.append([module_name])
+                continue
+            parts.append([module_name, stat.st_size, stat.st_mtime_ns])
+        _ATOM_EXTRACTION_CODE_STAMP = json.dumps(parts, separators=(",", ":"))
+    return _ATOM_EXTRACTION_CODE_STAMP
+
+
+def _atom_bundle_cache_entry(
+    cache_dir: Path,
+    record: dict[str, Any],
+    *,
+    run_id: str,
+    repo_root: Path | None,
+    policy: TextCapturePolicy,
+    max_command_failure_atoms: int | None,
+) -> tuple[Path, str] | None:
+    """Return ``(cache_file, fingerprint)`` for a record, or ``None`` if it cannot be cached.
+
+    The fingerprint covers the full history record, the size/mtime stamps of the run
+    artifacts read directly during extraction, the extraction settings and the code stamp.
+    """
+
+    run_dir_raw = record.get("run_dir")
+    if not isinstance(run_dir_raw, str):
+        return None
+    try:
+        payload = json.dumps(
+            [
+                _ATOM_BUNDLE_CACHE_SCHEMA_VERSION,
+                _atom_extraction_code_stamp(),
+                run_id,
+                str(repo_root) if repo_root is not None else None,
+                asdict(policy),
+                max_command_failure_atoms,
+                artifact_stamp(
+                    Path(run_dir_raw), BACKLOG_ATOM_EXTRACTION_RUN_ARTIFACT_RELATIVE_PATHS
+                ),
+                record,
+            ],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+    except (TypeError, ValueError):
+        return None
+    identity = sha256(json.dumps([run_dir_raw, run_id]).encode("utf-8")).hexdigest()
+    path = cache_dir / identity[:2] / f"{identity}.json"
+    return path, sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load_cached_atom_bundle(path: Path, fingerprint: str) -> dict[str, Any] | None:
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+        return None
+    bundle = cached.get("bundle")
+    return bundle if isinstance(bundle, dict) else None
+
+
+def _store_atom_bundle(path: Path, fingerprint: str, bundle: dict[str, Any]) -> None:
+    try:
+        text = json.dumps({"fingerprint": fingerprint, "bundle": bundle}, ensure_ascii=False)
+        # Only bundles that survive a JSON round trip unchanged can be served from cache.
+        if json.loads(text)["bundle"] != bundle:
+            return
+    except (TypeError, ValueError):
+        return
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp.write_text(text, encoding="utf-8")
+        os.replace(temp, path)
+    except OSError:
+        temp.unlink(missing_ok=True)
+
+
+def _extract_run_atom_bundle_task(
+    task: tuple[dict[str, Any], str, Path | None, TextCapturePolicy, int | None],
+) -> dict[str, Any]:
+    record, run_id, repo_root, policy, max_command_failure_atoms = task
+    return _extract_run_atom_bundle(
+        record,
+        run_id=run_id,
+        repo_root=repo_root,
+        policy=policy,
+        max_command_failure_atoms=max_command_failure_atoms,
+    )
+
+
+def _extract_run_atom_bundles(
+    tasks: list[tuple[dict[str, Any], str, Path | None, TextCapturePolicy, int | None]],
+    *,
+    jobs: int,
+) -> list[dict[str, Any]]:
+    """Extract bundles in task order, fanning out over a process pool when worthwhile."""
+
+    if jobs > 1 and len(tasks) >= _PARALLEL_MIN_UNCACHED_RUNS:
+        workers = min(jobs, len(tasks))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(
+                    executor.map(
+                        _extract_run_atom_bundle_task,
+                        tasks,
+                        chunksize=max(1, len(tasks) // (workers * 4)),
+                    )
+                )
+        except (OSError, BrokenProcessPool, pickle.PicklingError):
+            # Restricted environments may refuse to start workers; extract in-process.
+            pass
+    return [_extract_run_atom_bundle_task(task) for task in tasks]
+
+
+def extract_backlog_atoms(
+    records: list[dict[str, Any]],
+    repo_root: Path | None = None,
+    capture_policy: TextCapturePolicy | None = None,
+    *,
+    cache_dir: Path | None = None,
+    jobs: int | None = None,
+) -> dict[str, Any]:
+    """Extract evidence atoms from history records, merged in record order.
+
+    With *cache_dir*, each run's atoms are cached under a fingerprint of its record, directly
+    read artifacts and extraction settings, so unchanged runs are not re-extracted.  Uncached
+    runs are spread over *jobs* worker processes (default ``BACKLOG_ATOM_EXTRACTION_JOBS``,
+    otherwise 1, i.e. in-process) when there are enough of them.
+    """
+
+    policy = capture_policy or _default_capture_policy()
+    max_command_failure_atoms = _max_command_failure_atoms_per_run()
+    atoms: list[dict[str, Any]] = []
+    source_counts: Counter[str] = Counter()
+    severity_counts: Counter[str] = Counter()
+    run_ids: set[str] = set()
+    capture_manifest: dict[str, list[dict[str, Any]]] = {}
+
+    bundles: list[dict[str, Any] | None] = []
+    pending: list[int] = []
+    tasks: list[tuple[dict[str, Any], str, Path | None, TextCapturePolicy, int | None]] = []
+    cache_entries: dict[int, tuple[Path, str]] = {}
+    for record in records:
+        run_dir_raw = record.get("run_dir")
+        run_id = str(record.get("run_rel") or run_dir_raw or f"run_{len(run_ids) + 1}")
+        run_ids.add(run_id)
+        entry = (
+            _atom_bundle_cache_entry(
+                cache_dir,
+                record,
+                run_id=run_id,
+                repo_root=repo_root,
+                policy=policy,
+                max_command_failure_atoms=max_command_failure_atoms,
             )
+            if cache_dir is not None
+            else None
+        )
+        cached = _load_cached_atom_bundle(*entry) if entry is not None else None
+        if cached is None:
+            if entry is not None:
+                cache_entries[len(bundles)] = entry
+            pending.append(len(bundles))
+            tasks.append((record, run_id, repo_root, policy, max_command_failure_atoms))
+        bundles.append(cached)
+
+    extracted = _extract_run_atom_bundles(tasks, jobs=_atom_extraction_jobs(jobs))
+    for index, bundle in zip(pending, extracted, strict=True):
+        bundles[index] = bundle
+        if index in cache_entries:
+            _store_atom_bundle(*cache_entries[index], bundle)
+
+    for bundle in bundles:
+        assert bundle is not None
+        atoms.extend(bundle["atoms"])
+        source_counts.update(bundle["source_counts"])
+        severity_counts.update(bundle["severity_counts"])
+        capture_manifest[bundle["run_rel"]] = bundle["capture_entries"]
 
     return {
         "atoms": atoms,
@@ -14,10 +14,13 @@ from collections.abc import Mapping, Sequence
 from copy import deepcopy
 from hashlib import sha256
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from backlog_core.ticket_readiness import plan_revision_id_for
 
+if TYPE_CHECKING:
+    from backlog_core.case_registry_store import CaseRegistryStore
+
 CASE_REGISTRY_SCHEMA_VERSION = 1
 DOWNSTREAM_CHAIN_CONTRACT_REVISION = "runner_downstream_chain_v2"
 SOURCE_EVIDENCE_PROJECTION_VERSION = 1
@@ -878,10 +881,20 @@ def empty_case_registry() -> dict[str, Any]:
 
 
 def load_case_registry(path: Path) -> dict[str, Any]:
-    """Load a registry, returning an empty one when no historical registry exists."""
+    """Load a registry, returning an empty one when no historical registry exists.
+
+    When the registry has a store sidecar (see
+    :func:`~backlog_core.case_registry_store.enable_case_registry_store`) the rows are read
+    from the store, re-importing the JSON file first if it changed behind the store's back.
+    """
 
     if not path.exists():
         return empty_case_registry()
+    store = _case_registry_store_for(path)
+    if store is not None:
+        if not store.json_file_matches_export(path):
+            store.import_json_file(path)
+        return store.load()
     try:
         payload = json.loads(path.read_text(encoding="utf-8"))
     except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
@@ -904,14 +917,35 @@ def load_case_registry(path: Path) -> dict[str, Any]:
     return normalized
 
 
+def _case_registry_store_for(path: Path) -> CaseRegistryStore | None:
+    from backlog_core.case_registry_store import (
+        case_registry_store_path,
+        open_case_registry_store,
+    )
+
+    store_path = case_registry_store_path(path)
+    if store_path == path or not store_path.exists():
+        return None
+    return open_case_registry_store(store_path)
+
+
 def write_case_registry(path: Path, registry: Mapping[str, Any]) -> None:
-    """Validate and persist a case registry as deterministic JSON."""
+    """Validate and persist a case registry as deterministic JSON.
+
+    With a store sidecar, only the changed rows are written to the store and the JSON
+    export is rewritten only when something changed or the file no longer matches it.
+    """
 
     payload = dict(registry)
     if payload.get("schema_version") != CASE_REGISTRY_SCHEMA_VERSION:
         raise ValueError("write_case_registry: unsupported or missing schema_version")
+    store = _case_registry_store_for(path)
+    if store is not None and not store.write(payload) and store.json_export_is_current(path):
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    if store is not None:
+        store.record_json_export(path)
 
 
 def _registry_mapping(registry: Mapping[str, Any] | None, key: str) -> dict[str, str]:
@@ -0,0 +1,571 @@
+"""SQLite-backed storage for the case registry.
+
+``case_registry.json`` is one indented document that every workflow step re-reads and
+rewrites in full.  :class:`CaseRegistryStore` keeps the same content in SQLite with one row per
+registry entry (``cases`` records and every alias/membership mapping), so:
+
+- single lookups (:meth:`CaseRegistryStore.get_case`, :meth:`CaseRegistryStore.lookup`,
+  :meth:`CaseRegistryStore.case_ids_for_atom`) read only the rows they need;
+- :meth:`CaseRegistryStore.write` compares the registry with an in-memory snapshot of the
+  stored rows and serializes, upserts and deletes only the entries that changed, inside one
+  transaction;
+- :meth:`CaseRegistryStore.export_json` reproduces, byte for byte, the document
+  :func:`backlog_core.case_lineage.write_case_registry` would write for the same registry,
+  including key order.
+
+The store is opt-in per registry: :func:`enable_case_registry_store` creates
+``case_registry.sqlite`` next to ``case_registry.json``.  While that sidecar exists,
+``load_case_registry`` and ``write_case_registry`` go through the store and the JSON file is
+kept as an export, rewritten only when the registry changed, for readers that parse it
+directly.  A JSON file changed behind the store's back is re-imported on the next load.
+Delete the sidecar to go back to plain JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from backlog_core.case_lineage import CASE_REGISTRY_SCHEMA_VERSION, empty_case_registry
+
+__all__ = [
+    "CASE_REGISTRY_STORE_SUFFIX",
+    "CaseRegistryStore",
+    "case_registry_store_path",
+    "enable_case_registry_store",
+    "is_case_registry_store_path",
+    "migrate_case_registry_json",
+    "open_case_registry_store",
+]
+
+CASE_REGISTRY_STORE_SUFFIX = ".sqlite"
+_STORE_FORMAT_VERSION = 1
+_BUSY_TIMEOUT_SECONDS = 30.0
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (
+    section TEXT PRIMARY KEY,
+    ord INTEGER NOT NULL,
+    scalar TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS entries (
+    section TEXT NOT NULL,
+    key TEXT NOT NULL,
+    ord INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (section, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_by_value ON entries (section, value);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+_OPEN_STORES: dict[tuple[int, str], CaseRegistryStore] = {}
+_OPEN_STORES_LOCK = threading.Lock()
+
+
+def is_case_registry_store_path(path: Path) -> bool:
+    return path.suffix == CASE_REGISTRY_STORE_SUFFIX
+
+
+def case_registry_store_path(json_path: Path) -> Path:
+    """Return the store sidecar that backs *json_path* once enabled."""
+
+    return json_path.with_suffix(CASE_REGISTRY_STORE_SUFFIX)
+
+
+def _json_file_stamp(path: Path) -> list[int] | None:
+    """Return ``[size, mtime_ns]`` for *path*, or ``None`` when it does not exist."""
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class CaseRegistryStore:
+    """One SQLite database holding a case registry.
+
+    Top-level registry keys are *sections*.  Mapping-valued sections (``cases`` and the
+    ``*_to_case_id(s)`` maps) are stored one entry per row with their insertion order;
+    any other top-level value (``schema_version``) is stored on the section row itself.
+
+    The store keeps a parsed snapshot of its rows so :meth:`write` can diff a registry
+    without reading or re-serializing unchanged entries.  A ``revision`` counter bumped by
+    every write detects writers in other processes; a stale snapshot is reloaded.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            path, timeout=_BUSY_TIMEOUT_SECONDS, check_same_thread=False
+        )
+        self._lock = threading.RLock()
+        self._snapshot: _Snapshot | None = None
+        try:
+            version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, _STORE_FORMAT_VERSION):
+                raise ValueError(
+                    f"Invalid case registry store {path}: unsupported format {version!r}"
+                )
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {_STORE_FORMAT_VERSION}")
+            self._connection.commit()
+        except (sqlite3.Error, ValueError):
+            self._connection.close()
+            raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._connection.close()
+
+    def __enter__(self) -> CaseRegistryStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run several row-level updates atomically."""
+
+        with self._lock, self._connection:
+            yield self._connection
+            self._bump_revision(self._connection)
+            self._snapshot = None
+
+    # -- whole-document access -------------------------------------------------------
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM sections LIMIT 1").fetchone() is None
+
+    def document(self) -> dict[str, Any]:
+        """Return the stored registry exactly as it was last written."""
+
+        with self._lock:
+            return self._current_snapshot().document()
+
+    def load(self) -> dict[str, Any]:
+        """Return the registry normalized the same way as ``load_case_registry``."""
+
+        document = self.document()
+        version = document.get("schema_version")
+        if version != CASE_REGISTRY_SCHEMA_VERSION:
+            raise ValueError(
+                f"Invalid case registry {self.path}: expected schema_version "
+                f"{CASE_REGISTRY_SCHEMA_VERSION}, got {version!r}"
+            )
+        normalized = empty_case_registry()
+        for key in normalized:
+            if key != "schema_version" and isinstance(document.get(key), dict):
+                normalized[key] = document[key]
+        return normalized
+
+    def export_json(self) -> str:
+        """Render the deterministic JSON document ``write_case_registry`` produces."""
+
+        return json.dumps(self.document(), ensure_ascii=False, indent=2) + "\n"
+
+    def write(self, registry: Mapping[str, Any]) -> int:
+        """Make the store equal to *registry*, touching only changed rows.
+
+        Entries are compared with the snapshot as Python values, so only new or changed
+        entries are serialized.  Returns the number of section and entry rows inserted,
+        updated or deleted.
+        """
+
+        payload = dict(registry)
+        if payload.get("schema_version") != CASE_REGISTRY_SCHEMA_VERSION:
+            raise ValueError("write_case_registry: unsupported or missing schema_version")
+
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                snapshot = self._current_snapshot()
+                section_rows: list[tuple[str, int, str | None]] = []
+                for section_ord, (section, value) in enumerate(payload.items()):
+                    scalar = None if isinstance(value, Mapping) else _dumps(value)
+                    section_rows.append((str(section), section_ord, scalar))
+                sections_changed = section_rows != snapshot.sections
+                deletions: list[tuple[str, str]] = []
+                upserts: list[tuple[str, str, int, str]] = []
+                renumbered: list[str] = []
+                for section in snapshot.entries:
+                    if not isinstance(payload.get(section), Mapping):
+                        deletions.extend((section, key) for key in snapshot.entries[section])
+                for section, value in payload.items():
+                    if isinstance(value, Mapping) and not self._diff_section(
+                        snapshot, str(section), value, deletions, upserts
+                    ):
+                        renumbered.append(str(section))
+
+                if sections_changed:
+                    connection.execute("DELETE FROM sections")
+                    connection.executemany("INSERT INTO sections VALUES (?, ?, ?)", section_rows)
+                connection.executemany(
+                    "DELETE FROM entries WHERE section = ? AND key = ?", deletions
+                )
+                connection.executemany(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (section, key) DO UPDATE SET ord = excluded.ord, "
+                    "value = excluded.value",
+                    upserts,
+                )
+                changed = len(upserts) + len(deletions) + (1 if sections_changed else 0)
+                if changed:
+                    snapshot.revision = self._bump_revision(connection)
+                connection.commit()
+            except BaseException:
+                connection.rollback()
+                self._snapshot = None
+                raise
+
+            snapshot.sections = section_rows
+            for section, key in deletions:
+                snapshot.drop(section, key)
+            for section, key, entry_ord, text in upserts:
+                snapshot.put(section, key, entry_ord, json.loads(text))
+            for section in list(snapshot.entries):
+                if not isinstance(payload.get(section), Mapping):
+                    del snapshot.entries[section]
+                    snapshot.ords.pop(section, None)
+            for section in renumbered:
+                snapshot.reorder(section)
+            return changed
+
+    # -- indexed lookups and row-level updates --------------------------------------
+
+    def lookup(self, section: str, key: str) -> Any | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM entries WHERE section = ? AND key = ?", (section, key)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def keys_for_value(self, section: str, value: str) -> list[str]:
+        """Return aliases in a ``*_to_case_id`` section that map to *value*."""
+
+        with self._lock:
+            return [
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT key FROM entries WHERE section = ? AND value = ? ORDER BY ord",
+                    (section, _dumps(value)),
+                )
+            ]
+
+    def get_case(self, case_id: str) -> dict[str, Any] | None:
+        case = self.lookup("cases", case_id)
+        return case if isinstance(case, dict) else None
+
+    def case_ids_for_atom(self, atom_id: str) -> list[str]:
+        """Return every case an atom supports, including its legacy primary case."""
+
+        case_ids: set[str] = set()
+        memberships = self.lookup("atom_id_to_case_ids", atom_id)
+        if isinstance(memberships, list):
+            case_ids.update(
+                entry.strip() for entry in memberships if isinstance(entry, str) and entry.strip()
+            )
+        primary = self.lookup("atom_id_to_case_id", atom_id)
+        if isinstance(primary, str) and primary.strip():
+            case_ids.add(primary.strip())
+        return sorted(case_ids)
+
+    def upsert_entries(
+        self,
+        section: str,
+        entries: Mapping[str, Any],
+        *,
+        connection: sqlite3.Connection | None = None,
+    ) -> None:
+        """Insert or replace entries of a mapping section; new keys are appended.
+
+        Pass the connection from :meth:`transaction` to group several calls atomically.
+        """
+
+        if connection is None:
+            with self.transaction() as owned:
+                self.upsert_entries(section, entries, connection=owned)
+            return
+        self._ensure_mapping_section(connection, section)
+        next_ord = connection.execute(
+            "SELECT COALESCE(MAX(ord) + 1, 0) FROM entries WHERE section = ?", (section,)
+        ).fetchone()[0]
+        for key, value in entries.items():
+            updated = connection.execute(
+                "UPDATE entries SET value = ? WHERE section = ? AND key = ?",
+                (_dumps(value), section, str(key)),
+            ).rowcount
+            if not updated:
+                connection.execute(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?)",
+                    (section, str(key), next_ord, _dumps(value)),
+                )
+                next_ord += 1
+
+    def delete_entries(
+        self,
+        section: str,
+        keys: list[str],
+        *,
+        connection: sqlite3.Connection | None = None,
+    ) -> None:
+        if connection is None:
+            with self.transaction() as owned:
+                self.delete_entries(section, keys, connection=owned)
+            return
+        connection.executemany(
+            "DELETE FROM entries WHERE section = ? AND key = ?",
+            [(section, str(key)) for key in keys],
+        )
+
+    @staticmethod
+    def _ensure_mapping_section(connection: sqlite3.Connection, section: str) -> None:
+        row = connection.execute(
+            "SELECT scalar FROM sections WHERE section = ?", (section,)
+        ).fetchone()
+        if row is None:
+            connection.execute(
+                "INSERT INTO sections VALUES (?, "
+                "(SELECT COALESCE(MAX(ord) + 1, 0) FROM sections), NULL)",
+                (section,),
+            )
+        elif row[0] is not None:
+            raise ValueError(f"case registry section {section!r} is not a mapping")
+
+    # -- JSON export bookkeeping ---------------------------------------------------------
+
+    def json_file_matches_export(self, json_path: Path) -> bool:
+        """Return whether *json_path* is still the file this store last exported."""
+
+        stamp = _json_file_stamp(json_path)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = 'json_stamp'"
+            ).fetchone()
+        return row is not None and stamp is not None and json.loads(row[0])[:2] == stamp
+
+    def json_export_is_current(self, json_path: Path) -> bool:
+        """Return whether *json_path* matches the export and holds the latest revision.
+
+        Row-level updates (:meth:`upsert_entries`, :meth:`delete_entries`) change the store
+        without rewriting the export, so the file is then unchanged but out of date.
+        """
+
+        stamp = _json_file_stamp(json_path)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = 'json_stamp'"
+            ).fetchone()
+            revision = self._stored_revision()
+        return row is not None and stamp is not None and json.loads(row[0]) == [*stamp, revision]
+
+    def import_json_file(self, json_path: Path) -> int:
+        """Make the store equal to the registry in *json_path*; returns rows changed."""
+
+        try:
+            payload = json.loads(json_path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ValueError(f"Invalid case registry {json_path}: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise ValueError(f"Invalid case registry {json_path}: expected a JSON object")
+        with self._lock:
+            # The raw document is stored as-is so ``export_json`` reproduces the file.
+            changed = self.write(payload)
+            self.record_json_export(json_path)
+            return changed
+
+    def record_json_export(self, json_path: Path) -> None:
+        """Remember *json_path*, just written from this store's registry, as current."""
+
+        stamp = _json_file_stamp(json_path)
+        if stamp is None:
+            raise FileNotFoundError(json_path)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('json_stamp', ?)",
+                (_dumps([*stamp, self._stored_revision()]),),
+            )
+
+    # -- snapshot maintenance ---------------------------------------------------------
+
+    def _stored_revision(self) -> int:
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = 'revision'"
+        ).fetchone()
+        return int(row[0]) if row is not None else 0
+
+    def _bump_revision(self, connection: sqlite3.Connection) -> int:
+        revision = self._stored_revision() + 1
+        connection.execute(
+            "INSERT OR REPLACE INTO meta VALUES ('revision', ?)", (str(revision),)
+        )
+        return revision
+
+    def _current_snapshot(self) -> _Snapshot:
+        revision = self._stored_revision()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.revision != revision:
+            snapshot = self._snapshot = _Snapshot.read(self._connection, revision)
+        return snapshot
+
+    @staticmethod
+    def _diff_section(
+        snapshot: _Snapshot,
+        section: str,
+        value: Mapping[Any, Any],
+        deletions: list[tuple[str, str]],
+        upserts: list[tuple[str, str, int, str]],
+    ) -> bool:
+        """Queue row changes for one mapping section; returns ``False`` if renumbered."""
+
+        stored = snapshot.entries.get(section, {})
+        ords = snapshot.ords.get(section, {})
+        keys = [str(key) for key in value]
+        # Surviving rows keep their ``ord`` when their relative order is unchanged and
+        # every new key comes after them; any other reordering renumbers the section.
+        in_order = True
+        last_ord = -1
+        seen_new = False
+        for key in keys:
+            previous = ords.get(key)
+            if previous is None:
+                seen_new = True
+            elif seen_new or previous <= last_ord:
+                in_order = False
+                break
+            else:
+                last_ord = previous
+        deletions.extend((section, key) for key in stored if key not in value)
+        next_ord = snapshot.next_ord(section)
+        for index, (key, entry) in enumerate(zip(keys, value.values(), strict=True)):
+            if in_order:
+                entry_ord = ords.get(key)
+                if entry_ord is None:
+                    entry_ord = next_ord
+                    next_ord += 1
+                elif stored[key] == entry:
+                    continue
+            else:
+                entry_ord = index
+                if ords.get(key) == index and stored[key] == entry:
+                    continue
+            upserts.append((section, key, entry_ord, _dumps(entry)))
+        return in_order
+
+
+class _Snapshot:
+    """Parsed copy of a store's rows, independent of any caller-owned registry."""
+
+    def __init__(self, revision: int) -> None:
+        self.revision = revision
+        self.sections: list[tuple[str, int, str | None]] = []
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.ords: dict[str, dict[str, int]] = {}
+
+    @classmethod
+    def read(cls, connection: sqlite3.Connection, revision: int) -> _Snapshot:
+        snapshot = cls(revision)
+        snapshot.sections = [
+            (section, ord_, scalar)
+            for section, ord_, scalar in connection.execute(
+                "SELECT section, ord, scalar FROM sections ORDER BY ord"
+            )
+        ]
+        for section, key, ord_, value in connection.execute(
+            "SELECT section, key, ord, value FROM entries ORDER BY section, ord"
+        ):
+            snapshot.put(section, key, ord_, json.loads(value))
+        return snapshot
+
+    def put(self, section: str, key: str, entry_ord: int, value: Any) -> None:
+        # New keys land at the end, which matches ``ord`` order for appends; a
+        # renumbered section is put back in order by :meth:`reorder`.
+        self.entries.setdefault(section, {})[key] = value
+        self.ords.setdefault(section, {})[key] = entry_ord
+
+    def reorder(self, section: str) -> None:
+        ords = self.ords.get(section, {})
+        entries = self.entries.get(section, {})
+        self.entries[section] = {key: entries[key] for key in sorted(entries, key=ords.__getitem__)}
+
+    def drop(self, section: str, key: str) -> None:
+        self.entries.get(section, {}).pop(key, None)
+        self.ords.get(section, {}).pop(key, None)
+
+    def next_ord(self, section: str) -> int:
+        return max(self.ords.get(section, {}).values(), default=-1) + 1
+
+    def document(self) -> dict[str, Any]:
+        document: dict[str, Any] = {}
+        for section, _, scalar in self.sections:
+            if scalar is None:
+                # Round-trip through JSON so callers never share objects with the snapshot.
+                document[section] = json.loads(_dumps(self.entries.get(section, {})))
+            else:
+                document[section] = json.loads(scalar)
+        return document
+
+
+def open_case_registry_store(store_path: Path) -> CaseRegistryStore:
+    """Return this process's shared store for *store_path*.
+
+    Sharing one instance keeps its snapshot warm across ``load_case_registry`` and
+    ``write_case_registry`` calls.  Do not close the returned store.
+    """
+
+    key = (os.getpid(), str(store_path.resolve()))
+    with _OPEN_STORES_LOCK:
+        store = _OPEN_STORES.get(key)
+        if store is None:
+            store = _OPEN_STORES[key] = CaseRegistryStore(store_path)
+        return store
+
+
+def enable_case_registry_store(json_path: Path) -> Path:
+    """Back *json_path* with a store sidecar, importing the current JSON registry.
+
+    Returns the sidecar path.  Enabling an already enabled registry is a no-op apart from
+    re-importing a JSON file that changed since the store last exported it.
+    """
+
+    store_path = case_registry_store_path(json_path)
+    store = open_case_registry_store(store_path)
+    if json_path.exists() and not store.json_file_matches_export(json_path):
+        store.import_json_file(json_path)
+    return store_path
+
+
+def migrate_case_registry_json(json_path: Path, store_path: Path) -> CaseRegistryStore:
+    """Create or refresh *store_path* from an existing ``case_registry.json``."""
+
+    store = CaseRegistryStore(store_path)
+    try:
+        store.import_json_file(json_path)
+    except BaseException:
+        store.close()
+        raise
+    return store
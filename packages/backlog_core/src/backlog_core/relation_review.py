@@ -23,8 +23,9 @@ decides whether to act on them.
 
 from __future__ import annotations
 
+import heapq
 import logging
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from hashlib import sha256
 from typing import Any, Protocol
 
@@ -255,6 +256,53 @@ def _compute_split_hints(item: dict[str, Any], *, disjoint_fraction: float) -> l
 # ---------------------------------------------------------------------------
 # Neighborhood building
 # ---------------------------------------------------------------------------
+#
+# Neighbor lists only contain items that share at least one evidence id, routing key,
+# title token or path anchor with the focus item, so each signal is scored through an
+# inverted index (value -> item indices) instead of comparing every pair.  Results are
+# identical to the pairwise scan, including tie order (score descending, index ascending).
+
+
+def _postings(sets: Sequence[frozenset[str]]) -> dict[str, list[int]]:
+    """Map each value to the ascending indices of the sets containing it."""
+    postings: dict[str, list[int]] = {}
+    for index, values in enumerate(sets):
+        for value in values:
+            postings.setdefault(value, []).append(index)
+    return postings
+
+
+def _shared_counts(
+    i: int,
+    sets: Sequence[frozenset[str]],
+    postings: Mapping[str, list[int]],
+) -> dict[int, int]:
+    """Return ``{j: len(sets[i] & sets[j])}`` for every ``j != i`` with a non-empty overlap."""
+    counts: dict[int, int] = {}
+    for value in sets[i]:
+        for j in postings[value]:
+            if j != i:
+                counts[j] = counts.get(j, 0) + 1
+    return counts
+
+
+def _jaccard_scores(
+    i: int,
+    sets: Sequence[frozenset[str]],
+    postings: Mapping[str, list[int]],
+) -> list[tuple[float, int]]:
+    size_i = len(sets[i])
+    return [
+        (inter / (size_i + len(sets[j]) - inter), j)
+        for j, inter in _shared_counts(i, sets, postings).items()
+    ]
+
+
+def _top_k(scores: Iterable[tuple[float, int]], k: int) -> list[tuple[float, int]]:
+    """Return ``sorted(scores, key=(-score, index))[:k]`` without sorting every candidate."""
+    if k > 0:
+        return heapq.nsmallest(k, scores, key=lambda x: (-x[0], x[1]))
+    return sorted(scores, key=lambda x: (-x[0], x[1]))[:k]
 
 
 def _build_neighborhoods_no_embedder(
@@ -300,74 +348,55 @@ def _build_neighborhoods_no_embedder(
         frozenset(_item_evidence_routing_keys(it)) for it in items
     ]
 
+    evidence_postings = _postings(evidence_sets)
+    routing_postings = _postings(routing_sets)
+    token_postings = _postings(token_sets)
+    focus_ids = [_item_focus_id(it) for it in items]
+
     neighborhoods: list[dict[str, Any]] = []
 
     for i, item in enumerate(items):
-        fid = _item_focus_id(item)
-        ev_i = evidence_sets[i]
+        fid = focus_ids[i]
         routing_i = routing_sets[i]
-        tok_i = token_sets[i]
 
         # Evidence overlap neighbors.
-        ev_scores: list[tuple[float, int]] = []
-        for j, ev_j in enumerate(evidence_sets):
-            if j == i:
-                continue
-            if not ev_i or not ev_j:
-                continue
-            overlap = len(ev_i & ev_j)
-            if overlap > 0:
-                ev_scores.append((overlap, j))
-        ev_scores.sort(key=lambda x: (-x[0], x[1]))
+        ev_scores = [
+            (overlap, j)
+            for j, overlap in _shared_counts(i, evidence_sets, evidence_postings).items()
+        ]
         ev_neighbors = [
             {
-                "item_id": _item_focus_id(items[j]),
+                "item_id": focus_ids[j],
                 "evidence_overlap": int(score),
                 "index": j,
             }
-            for score, j in ev_scores[:top_k_ev]
+            for score, j in _top_k(ev_scores, top_k_ev)
         ]
 
         # Matching evidence provenance only routes a comparison to the reviewer;
         # it remains separate from source-atom overlap and makes no relation decision.
-        routing_scores: list[tuple[float, int]] = []
-        for j, routing_j in enumerate(routing_sets):
-            if j == i or not routing_i or not routing_j:
-                continue
-            overlap = len(routing_i & routing_j)
-            if overlap > 0:
-                routing_scores.append((float(overlap), j))
-        routing_scores.sort(key=lambda x: (-x[0], x[1]))
+        routing_scores = [
+            (float(overlap), j)
+            for j, overlap in _shared_counts(i, routing_sets, routing_postings).items()
+        ]
         routing_neighbors = [
             {
-                "item_id": _item_focus_id(items[j]),
+                "item_id": focus_ids[j],
                 "routing_key_overlap": int(score),
                 "shared_routing_keys": sorted(routing_i & routing_sets[j]),
                 "index": j,
             }
-            for score, j in routing_scores[:top_k_routing]
+            for score, j in _top_k(routing_scores, top_k_routing)
         ]
 
         # Metadata (title-token) neighbors.
-        meta_scores: list[tuple[float, int]] = []
-        for j, tok_j in enumerate(token_sets):
-            if j == i:
-                continue
-            if not tok_i or not tok_j:
-                continue
-            inter = len(tok_i & tok_j)
-            union = len(tok_i | tok_j)
-            jac = inter / union if union else 0.0
-            if jac > 0.0:
-                meta_scores.append((jac, j))
-        meta_scores.sort(key=lambda x: (-x[0], x[1]))
         meta_neighbors = [
             {
-                "item_id": _item_focus_id(items[j]),
+                "item_id": focus_ids[j],
                 "title_jaccard": round(score, 4),
                 "index": j,
             }
-            for score, j in meta_scores[:top_k_meta]
+            for score, j in _top_k(_jaccard_scores(i, token_sets, token_postings), top_k_meta)
         ]
 
         split_hints = _compute_split_hints(item, disjoint_fraction=disjoint_frac)
@@ -414,7 +443,12 @@ def _build_neighborhoods_with_embedder(
     list[dict[str, Any]]
         One neighborhood dict per item in *items*.
     """
-    from triage_engine.similarity import build_item_vectors, compute_pair_similarity
+    from triage_engine.similarity import (
+        build_item_vectors,
+        compute_pair_similarity,
+        min_cosine_for_overall_similarity,
+    )
+    from triage_engine.vector_engine import make_vector_engine
 
     top_k_sem = int(cfg.get("top_k_by_semantic", 3))
     top_k_ev = int(cfg.get("top_k_by_evidence_overlap", 3))
@@ -436,82 +470,96 @@ def _build_neighborhoods_with_embedder(
     routing_sets: list[frozenset[str]] = [
         frozenset(_item_evidence_routing_keys(it)) for it in items
     ]
+    evidence_sets = [v.evidence_ids for v in vectors]
+    token_sets = [v.title_tokens for v in vectors]
+    anchor_sets = [v.anchors for v in vectors]
+    evidence_postings = _postings(evidence_sets)
+    routing_postings = _postings(routing_sets)
+    token_postings = _postings(token_sets)
+    anchor_postings = _postings(anchor_sets)
+    focus_ids = [_item_focus_id(it) for it in items]
+
+    # Semantic candidates: pairs whose cosine can still reach ``min_sem`` plus exact
+    # duplicates (which score 1.0 regardless of cosine).  Scores are then recomputed with
+    # ``compute_pair_similarity`` so they match the pairwise scan exactly.
+    semantic_candidates: list[set[int]] = [set() for _ in range(n)]
+    min_cosine = min_cosine_for_overall_similarity(min_sem)
+    if min_cosine is None or min_cosine <= -1.0:
+        for i in range(n):
+            semantic_candidates[i].update(j for j in range(n) if j != i)
+    else:
+        engine = make_vector_engine([v.vector for v in vectors])
+        for left, right in engine.pairs_with_min_cosine(min_cosine):
+            semantic_candidates[left].add(right)
+            semantic_candidates[right].add(left)
+        for fingerprint_members in _postings(
+            [frozenset([v.fingerprint]) if v.fingerprint else frozenset() for v in vectors]
+        ).values():
+            for i in fingerprint_members:
+                semantic_candidates[i].update(j for j in fingerprint_members if j != i)
+
     neighborhoods: list[dict[str, Any]] = []
 
     for i, item in enumerate(items):
-        fid = _item_focus_id(item)
+        fid = focus_ids[i]
         vi = vectors[i]
 
         sem_scores: list[tuple[float, int]] = []
-        ev_scores: list[tuple[float, int]] = []
-        meta_scores: list[tuple[float, int]] = []
-        anchor_scores: list[tuple[float, int]] = []
-        routing_scores: list[tuple[float, int]] = []
-
-        for j in range(n):
-            if j == i:
-                continue
-            vj = vectors[j]
-            sim = compute_pair_similarity(vi, vj)
-
-            if sim.overall_similarity >= min_sem:
-                sem_scores.append((sim.overall_similarity, j))
-            if sim.evidence_overlap > 0:
-                ev_scores.append((float(sim.evidence_overlap), j))
-            if sim.title_jaccard > 0.0:
-                meta_scores.append((sim.title_jaccard, j))
-            if sim.anchor_jaccard > 0.0:
-                anchor_scores.append((sim.anchor_jaccard, j))
-            routing_overlap = len(routing_sets[i] & routing_sets[j])
-            if routing_overlap > 0:
-                routing_scores.append((float(routing_overlap), j))
-
-        sem_scores.sort(key=lambda x: (-x[0], x[1]))
-        ev_scores.sort(key=lambda x: (-x[0], x[1]))
-        meta_scores.sort(key=lambda x: (-x[0], x[1]))
-        anchor_scores.sort(key=lambda x: (-x[0], x[1]))
-        routing_scores.sort(key=lambda x: (-x[0], x[1]))
+        for j in semantic_candidates[i]:
+            overall = compute_pair_similarity(vi, vectors[j]).overall_similarity
+            if overall >= min_sem:
+                sem_scores.append((overall, j))
+        ev_scores = [
+            (float(overlap), j)
+            for j, overlap in _shared_counts(i, evidence_sets, evidence_postings).items()
+        ]
+        routing_scores = [
+            (float(overlap), j)
+            for j, overlap in _shared_counts(i, routing_sets, routing_postings).items()
+        ]
 
         sem_neighbors = [
             {
-                "item_id": _item_focus_id(items[j]),
+                "item_id": focus_ids[j],
                 "overall_similarity": round(score, 4),
                 "index": j,
             }
-            for score, j in sem_scores[:top_k_sem]
+            for score, j in _top_k(sem_scores, top_k_sem)
         ]
         ev_neighbors = [
             {
-                "item_id": _item_focus_id(items[j]),
+                "item_id": focus_ids[j],
                 "evidence_overlap": int(score),
                 "index": j,
             }
-            for score, j in ev_scores[:top_k_ev]
+            for score, j in _top_k(ev_scores, top_k_ev)
         ]
         routing_neighbors = [
             {
-                "item_id": _item_focus_id(items[j]),
+                "item_id": focus_ids[j],
                 "routing_key_overlap": int(score),
                 "shared_routing_keys": sorted(routing_sets[i] & routing_sets[j]),
                 "index": j,
             }
-            for score, j in routing_scores[:top_k_routing]
+            for score, j in _top_k(routing_scores, top_k_routing)
         ]
         meta_neighbors = [
             {
-                "item_id": _item_focus_id(items[j]),
+                "item_id": focus_ids[j],
                 "title_jaccard": round(score, 4),
                 "index": j,
             }
-            for score, j in meta_scores[:top_k_meta]
+            for score, j in _top_k(_jaccard_scores(i, token_sets, token_postings), top_k_meta)
         ]
         anchor_neighbors = [
             {
-                "item_id": _item_focus_id(items[j]),
+                "item_id": focus_ids[j],
                 "anchor_jaccard": round(score, 4),
                 "index": j,
             }
-            for score, j in anchor_scores[:top_k_anchor]
+            for score, j in _top_k(
+                _jaccard_scores(i, anchor_sets, anchor_postings), top_k_anchor
+            )
         ]
 
         split_hints = _compute_split_hints(item, disjoint_fraction=disjoint_frac)
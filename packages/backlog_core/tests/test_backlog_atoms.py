@@ -4,8 +4,10 @@ import json
 from collections.abc import Sequence
 from pathlib import Path
 
+import pytest
 from run_artifacts.history import iter_report_history
 
+from backlog_core import backlog as backlog_module
 from backlog_core.backlog import (
     add_atom_links,
     build_backlog_document,
@@ -1856,3 +1858,62 @@ def test_ticket_low_allowed_when_evidence_spans_two_models() -> None:
     assert out["stage"] == "triage"
     assert "insufficient_run_breadth_for_non_high_severity" not in out.get("risks", [])
     assert "insufficient_model_breadth_for_low_severity" not in out.get("risks", [])
+
+
+def test_extract_backlog_atoms_caches_runs_and_merges_parallel_results_in_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    records: list[dict[str, object]] = []
+    for index in range(20):
+        run_rel = f"target_a/20260101T0000{index:02d}Z/codex/0"
+        run_dir = tmp_path / "runs" / run_rel
+        run_dir.mkdir(parents=True)
+        (run_dir / "agent_stderr.txt").write_text(f"stderr line {index}\n", encoding="utf-8")
+        records.append(
+            {
+                "run_dir": str(run_dir),
+                "run_rel": run_rel,
+                "agent": "codex",
+                "status": "error" if index % 3 == 0 else "ok",
+                "error": {"type": "AgentExecFailed", "message": f"boom {index}"}
+                if index % 3 == 0
+                else None,
+                "report": {"confusion_points": [{"summary": f"confusing step {index}"}]},
+            }
+        )
+    cache_dir = tmp_path / "cache"
+
+    expected = extract_backlog_atoms(records, repo_root=tmp_path, jobs=1)
+    parallel = extract_backlog_atoms(records, repo_root=tmp_path, cache_dir=cache_dir, jobs=2)
+    assert parallel == expected
+
+    calls: list[str] = []
+    original_task = backlog_module._extract_run_atom_bundle_task
+
+    def _counting_task(task: tuple[object, ...]) -> dict[str, object]:
+        calls.append(str(task[1]))
+        return original_task(task)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(backlog_module, "_extract_run_atom_bundle_task", _counting_task)
+    assert extract_backlog_atoms(records, repo_root=tmp_path, cache_dir=cache_dir) == expected
+    assert calls == []
+
+    changed = Path(str(records[4]["run_dir"])) / "agent_stderr.txt"
+    changed.write_text("a much longer replacement stderr line\n", encoding="utf-8")
+    refreshed = extract_backlog_atoms(records, repo_root=tmp_path, cache_dir=cache_dir)
+    assert calls == [records[4]["run_rel"]]
+    assert any(
+        atom["text"] == "a much longer replacement stderr line" for atom in refreshed["atoms"]
+    )
+
+    # Without an explicit jobs= or BACKLOG_ATOM_EXTRACTION_JOBS, extraction stays in-process.
+    def _no_pool(*args: object, **kwargs: object) -> None:
+        raise AssertionError("process pool started without opting in")
+
+    monkeypatch.delenv(backlog_module.ATOM_EXTRACTION_JOBS_ENV, raising=False)
+    monkeypatch.setattr(backlog_module, "ProcessPoolExecutor", _no_pool)
+    calls.clear()
+    assert extract_backlog_atoms(records, repo_root=tmp_path)["atoms"] == refreshed["atoms"]
+    assert len(calls) == len(records)
+
@@ -3,9 +3,11 @@ from __future__ import annotations
 import json
 from hashlib import sha256
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from backlog_core import case_registry_store
 from backlog_core.case_lineage import (
     apply_atom_disposition_decision,
     apply_atom_dispositions,
@@ -17,6 +19,7 @@ from backlog_core.case_lineage import (
     build_case_registry,
     build_source_evidence_snapshot,
     eligible_problem_mining_atoms,
+    empty_case_registry,
     load_case_registry,
     normalize_atom_lineage,
     problem_case_records_from_registry,
@@ -27,6 +30,7 @@ from backlog_core.case_lineage import (
     verified_mechanism_identities_from_case_registry,
     write_case_registry,
 )
+from backlog_core.case_registry_store import CaseRegistryStore, enable_case_registry_store
 from backlog_core.stage_contracts import (
     evidence_assignment_sha256,
     evidence_verification_sha256,
@@ -612,6 +616,112 @@ def test_deferred_source_observation_is_revisited_next_cycle() -> None:
     assert [item["atom_id"] for item in eligible] == [atom["atom_id"]]
 
 
+def test_sqlite_case_registry_store_migrates_and_exports_identical_json(
+    tmp_path: Path,
+) -> None:
+    atoms = normalize_atom_lineage(
+        [
+            _atom("target/run/agent/1:confusion_point:1"),
+            _atom("target/run/agent/2:confusion_point:1"),
+        ],
+        strict_new_output=True,
+    )
+    problems = assign_problem_case_ids(
+        [
+            {
+                "problem_id": f"problem:{index}",
+                "title": f"Problem {index}",
+                "evidence_atom_ids": [atom["atom_id"]],
+            }
+            for index, atom in enumerate(atoms)
+        ],
+        atoms,
+    )
+    registry = build_case_registry(problems)
+    json_path = tmp_path / "case_registry.json"
+    write_case_registry(json_path, registry)
+    plain = load_case_registry(json_path)
+
+    store_path = enable_case_registry_store(json_path)
+    assert store_path == tmp_path / "case_registry.sqlite"
+    assert load_case_registry(json_path) == plain
+    with CaseRegistryStore(store_path) as store:
+        assert store.export_json() == json_path.read_text(encoding="utf-8")
+        case_id = problems[0]["case_id"]
+        assert store.get_case(case_id) == registry["cases"][case_id]
+        assert store.lookup("problem_id_to_case_id", "problem:0") == case_id
+        assert store.case_ids_for_atom(atoms[0]["atom_id"]) == [case_id]
+
+        updated = store.load()
+        updated["problem_id_to_case_id"]["problem:alias"] = case_id
+        del updated["problem_id_to_case_id"]["problem:1"]
+        assert store.write(updated) == 2
+        assert store.write(updated) == 0
+        assert store.keys_for_value("problem_id_to_case_id", case_id) == [
+            "problem:0",
+            "problem:alias",
+        ]
+        reordered = dict(updated)
+        reordered["problem_id_to_case_id"] = dict(
+            reversed(list(updated["problem_id_to_case_id"].items()))
+        )
+        assert store.write(reordered) == 2
+        assert store.export_json() == (
+            json.dumps(reordered, ensure_ascii=False, indent=2) + "\n"
+        )
+
+    # The JSON file changed while this process's shared store still holds the old
+    # snapshot; the next load re-imports it and writes go through the store.
+    json_path.write_text(json.dumps(updated, ensure_ascii=False, indent=2) + "\n")
+    assert load_case_registry(json_path)["problem_id_to_case_id"] == (
+        updated["problem_id_to_case_id"]
+    )
+    write_case_registry(json_path, registry)
+    assert json.loads(json_path.read_text(encoding="utf-8")) == registry
+    with CaseRegistryStore(store_path) as store:
+        assert store.export_json() == json_path.read_text(encoding="utf-8")
+
+
+def test_case_registry_store_skips_unchanged_rows_and_json_exports(tmp_path: Path) -> None:
+    json_path = tmp_path / "case_registry.json"
+    registry = empty_case_registry()
+    registry["cases"] = {f"case:{index}": {"title": f"Case {index}"} for index in range(50)}
+    write_case_registry(json_path, registry)
+    enable_case_registry_store(json_path)
+
+    serialized: list[Any] = []
+    original_dumps = case_registry_store._dumps
+
+    def _counting_dumps(value: Any) -> str:
+        serialized.append(value)
+        return original_dumps(value)
+
+    loaded = load_case_registry(json_path)
+    exported_at = json_path.stat().st_mtime_ns
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(case_registry_store, "_dumps", _counting_dumps)
+        write_case_registry(json_path, loaded)
+        assert json_path.stat().st_mtime_ns == exported_at
+
+        loaded["cases"]["case:7"]["title"] = "Renamed"
+        loaded["cases"]["case:new"] = {"title": "New"}
+        write_case_registry(json_path, loaded)
+
+    assert [value for value in serialized if isinstance(value, dict)] == [
+        {"title": "Renamed"},
+        {"title": "New"},
+    ]
+    assert json.loads(json_path.read_text(encoding="utf-8")) == loaded
+    assert list(load_case_registry(json_path)["cases"])[-1] == "case:new"
+
+    store = case_registry_store.open_case_registry_store(tmp_path / "case_registry.sqlite")
+    store.upsert_entries("cases", {"case:row": {"title": "Row"}})
+    reloaded = load_case_registry(json_path)
+    assert "case:row" in reloaded["cases"]
+    write_case_registry(json_path, reloaded)
+    assert "case:row" in json.loads(json_path.read_text(encoding="utf-8"))["cases"]
+
+
 def test_case_identity_uses_evidence_not_title_and_persists_aliases(tmp_path: Path) -> None:
     atoms = normalize_atom_lineage(
         [_atom("target/run/agent/1:confusion_point:1")],
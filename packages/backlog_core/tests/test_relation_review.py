@@ -11,6 +11,8 @@ Key invariants asserted here:
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from backlog_core.relation_review import apply_relation_decisions, rank_stage_related_items
@@ -237,6 +239,53 @@ def test_rank_split_hint_on_disjoint_evidence() -> None:
     assert nb["split_hints"][0]["hint_type"] == "disjoint_evidence_groups"
 
 
+def test_rank_lexical_neighborhoods_match_pairwise_reference() -> None:
+    rng = random.Random(7)
+    words = ["install", "fails", "windows", "path", "docs", "flag", "timeout", "crash"]
+    items = []
+    for index in range(80):
+        item = _make_problem_record(
+            f"problem:{index}",
+            evidence_atom_ids=[f"run/{rng.randint(1, 3)}/a{rng.randint(0, 20)}" for _ in range(3)],
+            title=" ".join(rng.sample(words, rng.randint(1, 4))),
+        )
+        item["_relation_evidence_routing_keys"] = [f"key{rng.randint(0, 9)}"]
+        items.append(item)
+
+    result = rank_stage_related_items(
+        items,
+        stage="problem_mining",
+        relation_config=_MINIMAL_RELATION_CONFIG,
+    )
+
+    from triage_engine.text import tokenize
+
+    def _reference(sets: list[frozenset[str]], i: int, k: int, *, jaccard: bool) -> list:
+        scored = []
+        for j, other in enumerate(sets):
+            inter = len(sets[i] & other)
+            if j != i and inter:
+                scored.append((inter / len(sets[i] | other) if jaccard else inter, j))
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        return scored[:k]
+
+    evidence_sets = [frozenset(item["evidence_atom_ids"]) for item in items]
+    routing_sets = [frozenset(item["_relation_evidence_routing_keys"]) for item in items]
+    token_sets = [frozenset(tokenize(item["title"])) for item in items]
+    for i, neighborhood in enumerate(result):
+        assert [
+            (n["evidence_overlap"], n["index"])
+            for n in neighborhood["most_related_by_evidence_overlap"]
+        ] == _reference(evidence_sets, i, 3, jaccard=False)
+        assert [
+            (n["routing_key_overlap"], n["index"])
+            for n in neighborhood["most_related_by_evidence_routing"]
+        ] == _reference(routing_sets, i, 3, jaccard=False)
+        assert [
+            (n["title_jaccard"], n["index"]) for n in neighborhood["most_related_by_metadata"]
+        ] == [(round(score, 4), j) for score, j in _reference(token_sets, i, 2, jaccard=True)]
+
+
 def test_rank_all_valid_stages_accepted() -> None:
     items = [_make_problem_record("problem:a")]
     for stage in (
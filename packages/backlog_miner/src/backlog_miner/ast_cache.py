@@ -0,0 +1,171 @@
+"""Content-addressed cache of parsed Python modules for evidence verification.
+
+Evidence receipts inspect the same workspace files from many independent helpers.  Every
+helper parses through :func:`parse_python_module`, which keys a bounded LRU by the SHA-256 of
+the source text, so one verification pass parses each distinct file body once.
+
+Cached trees are shared between callers and must be treated as read-only.
+
+Definition sets are small and JSON-serializable; when
+``BACKLOG_MINER_AST_CACHE_DIR`` is set they are also persisted there by content hash, so later
+processes can resolve symbols without parsing at all.  Syntax trees themselves are not
+persisted.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+
+__all__ = [
+    "AstCacheStats",
+    "ast_cache_stats",
+    "clear_ast_cache",
+    "parse_python_module",
+    "python_module_definitions",
+]
+
+# Parsed trees for large modules are several MB; keep enough for one dossier's working set.
+_MAX_TREES = 128
+_MAX_DEFINITION_SETS = 4096
+
+
+@dataclass
+class AstCacheStats:
+    """Process-wide counters; ``parses_saved`` counts lookups answered from cache."""
+
+    parses: int = 0
+    parses_saved: int = 0
+    definition_hits: int = 0
+    persisted_hits: int = 0
+    evictions: int = 0
+
+
+@dataclass(frozen=True)
+class _ParseFailure:
+    args: tuple[object, ...]
+
+
+_LOCK = threading.Lock()
+_TREES: OrderedDict[str, ast.Module | _ParseFailure] = OrderedDict()
+_DEFINITIONS: OrderedDict[str, frozenset[str]] = OrderedDict()
+_STATS = AstCacheStats()
+
+
+def _content_key(content: str) -> str:
+    return sha256(content.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def parse_python_module(content: str) -> ast.Module:
+    """Return ``ast.parse(content)``, reusing a cached tree for identical source text.
+
+    Raises ``SyntaxError`` exactly when ``ast.parse`` would; failures are cached too.
+    """
+
+    key = _content_key(content)
+    with _LOCK:
+        cached = _TREES.get(key)
+        if cached is not None:
+            _TREES.move_to_end(key)
+            _STATS.parses_saved += 1
+    if cached is None:
+        try:
+            cached = ast.parse(content)
+        except SyntaxError as exc:
+            cached = _ParseFailure(exc.args)
+        with _LOCK:
+            _STATS.parses += 1
+            _TREES[key] = cached
+            while len(_TREES) > _MAX_TREES:
+                _TREES.popitem(last=False)
+                _STATS.evictions += 1
+    if isinstance(cached, _ParseFailure):
+        raise SyntaxError(*cached.args)
+    return cached
+
+
+def _persist_dir() -> Path | None:
+    raw = (os.getenv("BACKLOG_MINER_AST_CACHE_DIR") or "").strip()
+    return Path(raw) if raw else None
+
+
+def _load_persisted(directory: Path, key: str) -> frozenset[str] | None:
+    try:
+        raw = json.loads((directory / f"{key}.definitions.json").read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(raw, list) or not all(isinstance(item, str) for item in raw):
+        return None
+    return frozenset(raw)
+
+
+def _store_persisted(directory: Path, key: str, definitions: frozenset[str]) -> None:
+    target = directory / f"{key}.definitions.json"
+    temp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        temp.write_text(json.dumps(sorted(definitions)), encoding="utf-8")
+        os.replace(temp, target)
+    except OSError:
+        # Persistence is an optimization only.
+        temp.unlink(missing_ok=True)
+
+
+def python_module_definitions(
+    content: str,
+    collect: Callable[[ast.Module], set[str]],
+) -> frozenset[str]:
+    """Return ``collect(tree)`` for *content*, cached by content hash.
+
+    Unparseable content yields an empty set.  *collect* must depend only on the tree; its
+    qualified name is part of the cache key.
+    """
+
+    key = _content_key(f"{collect.__module__}.{collect.__qualname__}\x00{content}")
+    with _LOCK:
+        cached = _DEFINITIONS.get(key)
+        if cached is not None:
+            _DEFINITIONS.move_to_end(key)
+            _STATS.definition_hits += 1
+            return cached
+    directory = _persist_dir()
+    definitions = _load_persisted(directory, key) if directory is not None else None
+    if definitions is not None:
+        with _LOCK:
+            _STATS.persisted_hits += 1
+    else:
+        try:
+            definitions = frozenset(collect(parse_python_module(content)))
+        except SyntaxError:
+            definitions = frozenset()
+        if directory is not None:
+            _store_persisted(directory, key, definitions)
+    with _LOCK:
+        _DEFINITIONS[key] = definitions
+        while len(_DEFINITIONS) > _MAX_DEFINITION_SETS:
+            _DEFINITIONS.popitem(last=False)
+    return definitions
+
+
+def ast_cache_stats() -> AstCacheStats:
+    """Return a snapshot of the process-wide counters."""
+
+    with _LOCK:
+        return AstCacheStats(**vars(_STATS))
+
+
+def clear_ast_cache() -> None:
+    """Drop cached trees and definition sets and reset counters."""
+
+    with _LOCK:
+        _TREES.clear()
+        _DEFINITIONS.clear()
+        for name in vars(_STATS):
+            setattr(_STATS, name, 0)
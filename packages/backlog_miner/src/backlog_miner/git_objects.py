@@ -0,0 +1,180 @@
+"""Long-lived ``git cat-file`` readers shared across one evidence verification pass.
+
+Research evidence verification resolves many ``HEAD:<path>`` objects in the same workspace.
+Spawning ``git rev-parse`` per path dominates that work, so :func:`git_object_session` keeps one
+``git cat-file --batch-check`` process per workspace for the duration of the session and answers
+every lookup over that pipe.
+
+``HEAD`` is resolved once when a reader starts, so all lookups in a session observe the same
+commit.  Outside a session :func:`git_object_reader` returns ``None`` and callers keep their
+one-shot subprocess behavior.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+__all__ = [
+    "GitObjectInfo",
+    "GitObjectReader",
+    "git_object_reader",
+    "git_object_session",
+]
+
+
+@dataclass(frozen=True)
+class GitObjectInfo:
+    oid: str
+    object_type: str
+    size: int
+
+
+class GitObjectReader:
+    """Answer object lookups for one workspace over a persistent ``git cat-file`` pipe.
+
+    Transport failures raise ``OSError`` so callers can fall back to one-shot commands; objects
+    that do not exist resolve to ``None``.
+    """
+
+    def __init__(self, workspace: Path) -> None:
+        self.workspace = workspace
+        self._lock = threading.Lock()
+        self._check: subprocess.Popen[bytes] | None = None
+        self._head: str | None = None
+        self._head_resolved = False
+        self._info_by_path: dict[str, GitObjectInfo | None] = {}
+        self._closed = False
+
+    def _spawn(self, mode: str) -> subprocess.Popen[bytes]:
+        return subprocess.Popen(
+            ["git", "-C", str(self.workspace), "cat-file", mode],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _query(self, process: subprocess.Popen[bytes], spec: str) -> GitObjectInfo | None:
+        if "\n" in spec:
+            raise OSError("git cat-file batch specs cannot contain newlines")
+        stdin: IO[bytes] | None = process.stdin
+        stdout: IO[bytes] | None = process.stdout
+        if stdin is None or stdout is None:
+            raise OSError("git cat-file pipes are unavailable")
+        stdin.write(spec.encode("utf-8", errors="surrogateescape") + b"\n")
+        stdin.flush()
+        header = stdout.readline()
+        if not header.endswith(b"\n"):
+            raise OSError("git cat-file exited unexpectedly")
+        fields = header.rstrip(b"\n").decode("utf-8", errors="replace").split(" ")
+        if len(fields) != 3 or fields[-1] in {"missing", "ambiguous"}:
+            return None
+        try:
+            size = int(fields[2])
+        except ValueError:
+            return None
+        return GitObjectInfo(oid=fields[0], object_type=fields[1], size=size)
+
+    def _check_process(self) -> subprocess.Popen[bytes]:
+        if self._closed:
+            raise OSError("git object reader is closed")
+        if self._check is None:
+            self._check = self._spawn("--batch-check")
+        return self._check
+
+    def _resolved_head(self) -> str | None:
+        if not self._head_resolved:
+            info = self._query(self._check_process(), "HEAD")
+            self._head = info.oid if info is not None else None
+            self._head_resolved = True
+        return self._head
+
+    def head(self) -> str | None:
+        """Return the commit ``HEAD`` pointed at when this reader started."""
+
+        with self._lock:
+            return self._resolved_head()
+
+    def info(self, relative_path: str) -> GitObjectInfo | None:
+        """Return object id, type and size of ``HEAD:<relative_path>``."""
+
+        with self._lock:
+            if relative_path in self._info_by_path:
+                return self._info_by_path[relative_path]
+            head = self._resolved_head()
+            info = (
+                None
+                if head is None
+                else self._query(self._check_process(), f"{head}:{relative_path}")
+            )
+            self._info_by_path[relative_path] = info
+            return info
+
+    def blob_sha(self, relative_path: str) -> str | None:
+        info = self.info(relative_path)
+        return info.oid if info is not None else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            process = self._check
+            self._check = None
+            if process is None:
+                return
+            if process.stdin is not None:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            if process.stdout is not None:
+                process.stdout.close()
+
+
+_ACTIVE_READERS: ContextVar[dict[Path, GitObjectReader] | None] = ContextVar(
+    "backlog_miner_git_object_readers", default=None
+)
+
+
+@contextmanager
+def git_object_session() -> Iterator[None]:
+    """Share one :class:`GitObjectReader` per workspace until the block exits.
+
+    Nested sessions reuse the outermost session's readers.  Usable as a decorator.
+    """
+
+    if _ACTIVE_READERS.get() is not None:
+        yield
+        return
+    readers: dict[Path, GitObjectReader] = {}
+    token = _ACTIVE_READERS.set(readers)
+    try:
+        yield
+    finally:
+        _ACTIVE_READERS.reset(token)
+        for reader in readers.values():
+            reader.close()
+
+
+def git_object_reader(workspace: Path) -> GitObjectReader | None:
+    """Return the session reader for *workspace*, or ``None`` outside a session."""
+
+    readers = _ACTIVE_READERS.get()
+    if readers is None:
+        return None
+    key = workspace.resolve()
+    reader = readers.get(key)
+    if reader is None:
+        reader = GitObjectReader(key)
+        readers[key] = reader
+    return reader
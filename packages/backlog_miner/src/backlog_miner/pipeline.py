@@ -936,6 +936,7 @@ def run_stage_prompt_json_result(
         When the agent backend returns an empty response.
     """
     from backlog_miner.agent import BacklogProviderExternalWait, run_backlog_prompt_result
+    from backlog_miner.stage_concurrency import stage_prompt_slot
 
     out_dir.mkdir(parents=True, exist_ok=True)
     prompt_path = out_dir / f"{tag}.prompt.txt"
@@ -949,18 +950,19 @@ def run_stage_prompt_json_result(
     invocation_started_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
     invocation_started_monotonic = time.monotonic()
     try:
-        prompt_result = run_backlog_prompt_result(
-            prompt=prompt,
-            agent=agent,
-            model=model,
-            cfg=cfg,
-            out_dir=out_dir,
-            tag=tag,
-            workspace_dir=workspace_dir,
-            allowed_tools=allowed_tools,
-            include_directories=include_directories,
-            resume_session_id=resume_session_id,
-        )
+        with stage_prompt_slot(agent):
+            prompt_result = run_backlog_prompt_result(
+                prompt=prompt,
+                agent=agent,
+                model=model,
+                cfg=cfg,
+                out_dir=out_dir,
+                tag=tag,
+                workspace_dir=workspace_dir,
+                allowed_tools=allowed_tools,
+                include_directories=include_directories,
+                resume_session_id=resume_session_id,
+            )
         response = prompt_result.response
         if (not response or not response.strip()) and not allow_empty:
             raise RuntimeError(
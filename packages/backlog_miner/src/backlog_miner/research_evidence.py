@@ -50,6 +50,8 @@ from runner_core.codex_execpolicy import verify_controlled_codex_execpolicy_rece
 from runner_core.target_acquire import acquire_target
 from sandbox_runner import DockerSandbox, SandboxSpec
 
+from backlog_miner.ast_cache import parse_python_module, python_module_definitions
+from backlog_miner.git_objects import git_object_reader, git_object_session
 from backlog_miner.origin_evidence import (
     RESEARCH_RUN_CONTEXT_FILES,
     origin_attachment_read_scope,
@@ -3572,6 +3574,13 @@ def _inspection_receipts(
 
 
 def _git_blob_sha(workspace: Path, relative_path: str) -> str | None:
+    reader = git_object_reader(workspace)
+    if reader is not None:
+        try:
+            return reader.blob_sha(relative_path)
+        except OSError:
+            # Fall back to a one-shot lookup when the batch pipe is unusable.
+            pass
     try:
         result = subprocess.run(
             ["git", "-C", str(workspace), "rev-parse", f"HEAD:{relative_path}"],
@@ -3587,10 +3596,10 @@ def _git_blob_sha(workspace: Path, relative_path: str) -> str | None:
 
 
 def _python_definitions(content: str) -> set[str]:
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
-        return set()
+    return set(python_module_definitions(content, _collect_python_definitions))
+
+
+def _collect_python_definitions(tree: ast.Module) -> set[str]:
     definitions: set[str] = set()
 
     def add_binding(name: str, prefix: tuple[str, ...]) -> None:
@@ -4321,7 +4330,7 @@ def _harness_mechanism_touches(
         return relative, [], None
     try:
         content = path.read_text(encoding="utf-8-sig", errors="strict")
-        tree = ast.parse(content)
+        tree = parse_python_module(content)
     except (OSError, UnicodeDecodeError, SyntaxError):
         return relative, [], None
 
@@ -4799,7 +4808,7 @@ def _verified_declared_mechanism_link(
             return None
         try:
             content = caller_path.read_text(encoding="utf-8-sig", errors="strict")
-            tree = ast.parse(content)
+            tree = parse_python_module(content)
         except (OSError, UnicodeDecodeError, SyntaxError):
             return None
         node = symbol_node(tree, caller["symbol"])
@@ -5441,7 +5450,7 @@ def _pytest_test_selection_receipt(
         )
         return None
     try:
-        tree = ast.parse(content)
+        tree = parse_python_module(content)
     except SyntaxError:
         errors.append(
             f"causal_control_test_file_ast_invalid:{hypothesis_id}:{experiment_id}:{test_path}"
@@ -6371,7 +6380,7 @@ def _retained_harness_scalar_argv_difference(
                 return None
     try:
         content = baseline_harness_path.read_text(encoding="utf-8-sig", errors="strict")
-        tree = ast.parse(content)
+        tree = parse_python_module(content)
     except (OSError, UnicodeDecodeError, SyntaxError):
         return None
     aliases = _module_import_aliases(tree)
@@ -7767,7 +7776,7 @@ def _research_harness_dependency_edges(
             continue
         try:
             content = path.read_text(encoding="utf-8-sig", errors="strict")
-            tree = ast.parse(content)
+            tree = parse_python_module(content)
         except (OSError, UnicodeDecodeError, SyntaxError):
             continue
         content_sha256 = _sha256_path(path)
@@ -10407,7 +10416,7 @@ def _restricted_outcome_assertion_dataflow(
         return None
     try:
         content = path.read_text(encoding="utf-8-sig", errors="strict")
-        tree = ast.parse(content)
+        tree = parse_python_module(content)
     except (OSError, UnicodeDecodeError, SyntaxError):
         return None
 
@@ -11135,7 +11144,7 @@ def _retained_harness_positive_contract(
         return None
     try:
         content = path.read_text(encoding="utf-8-sig", errors="strict")
-        tree = ast.parse(content)
+        tree = parse_python_module(content)
     except (OSError, UnicodeDecodeError, SyntaxError):
         return None
     stderr_raw = _text(replay.get("stderr_path"))
@@ -14176,6 +14185,7 @@ def _clear_failed_receipt_success_projections(receipt: dict[str, Any]) -> None:
     receipt["verification_boundaries"] = []
 
 
+@git_object_session()
 def verify_research_evidence(
     dossier: dict[str, Any],
     *,
@@ -14893,6 +14903,7 @@ def _persisted_research_attempt_errors(dossier: dict[str, Any]) -> list[str]:
     return errors
 
 
+@git_object_session()
 def verify_persisted_research_evidence(
     dossier: dict[str, Any],
 ) -> tuple[bool, list[str]]:
@@ -0,0 +1,121 @@
+"""Bounded concurrency for independent stage-prompt batches.
+
+Several backlog stages split their input into batches whose prompts do not depend on each
+other (one cross-job routing level, the batches of one relation review pass) and only combine
+the receipts afterwards.  :func:`run_stage_prompt_batches` runs such batches on a thread pool
+and returns their results in batch order, so tags, artifact paths and receipt ordering are the
+same as in a sequential run.
+
+Two limits apply, both per agent (the agent name is the provider boundary here):
+
+- ``BACKLOG_MINER_STAGE_PROMPT_CONCURRENCY_<AGENT>`` (for example ``..._CODEX``), falling back
+  to ``BACKLOG_MINER_STAGE_PROMPT_CONCURRENCY``, sets how many batches run at once.  The
+  default is ``1``, which keeps every stage sequential.
+- :func:`stage_prompt_slot` caps the model invocations actually in flight for an agent at the
+  same number across all threads of the process.  ``run_stage_prompt_json_result`` holds a
+  slot for the duration of each invocation, so retries, reviews and nested batches never exceed
+  the configured provider concurrency.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+__all__ = [
+    "STAGE_PROMPT_CONCURRENCY_ENV",
+    "run_stage_prompt_batches",
+    "stage_prompt_concurrency",
+    "stage_prompt_slot",
+]
+
+STAGE_PROMPT_CONCURRENCY_ENV = "BACKLOG_MINER_STAGE_PROMPT_CONCURRENCY"
+
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
+
+_LOCK = threading.Lock()
+_SLOTS: dict[str, tuple[int, threading.BoundedSemaphore]] = {}
+
+
+def _agent_env_suffix(agent: str) -> str:
+    return "".join(ch if ch.isalnum() else "_" for ch in agent.strip().upper())
+
+
+def stage_prompt_concurrency(agent: str) -> int:
+    """Return the configured max in-flight stage prompts for *agent* (at least 1)."""
+
+    for name in (
+        f"{STAGE_PROMPT_CONCURRENCY_ENV}_{_agent_env_suffix(agent)}",
+        STAGE_PROMPT_CONCURRENCY_ENV,
+    ):
+        raw = (os.environ.get(name) or "").strip()
+        if not raw:
+            continue
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            continue
+    return 1
+
+
+@contextmanager
+def stage_prompt_slot(agent: str) -> Iterator[None]:
+    """Hold one of the agent's in-flight invocation slots for the duration of the block."""
+
+    limit = stage_prompt_concurrency(agent)
+    key = agent.strip().lower()
+    with _LOCK:
+        current = _SLOTS.get(key)
+        if current is None or current[0] != limit:
+            current = (limit, threading.BoundedSemaphore(limit))
+            _SLOTS[key] = current
+    semaphore = current[1]
+    with semaphore:
+        yield
+
+
+def run_stage_prompt_batches(
+    items: Sequence[_ItemT],
+    worker: Callable[[int, _ItemT], _ResultT],
+    *,
+    agent: str,
+    on_result: Callable[[int, _ResultT], None] | None = None,
+) -> list[_ResultT]:
+    """Return ``[worker(index, item) ...]`` for 1-based indexes, running batches concurrently.
+
+    Results are always in item order, and *on_result* is called on the calling thread in the
+    same order as soon as a result and all earlier ones are available (for checkpoints).  Once
+    a batch fails, batches that have not started are cancelled, running ones finish, and the
+    exception of the earliest failed batch is raised, which is the exception a sequential run
+    would have raised.
+    """
+
+    workers = min(stage_prompt_concurrency(agent), len(items))
+    results: list[_ResultT] = []
+    if workers <= 1:
+        for index, item in enumerate(items, start=1):
+            result = worker(index, item)
+            results.append(result)
+            if on_result is not None:
+                on_result(index, result)
+        return results
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stage-prompt") as executor:
+        futures = [
+            executor.submit(worker, index, item) for index, item in enumerate(items, start=1)
+        ]
+        try:
+            for index, future in enumerate(futures, start=1):
+                result = future.result()
+                results.append(result)
+                if on_result is not None:
+                    on_result(index, result)
+        except BaseException:
+            for pending in futures:
+                pending.cancel()
+            raise
+    return results
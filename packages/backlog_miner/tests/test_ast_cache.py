@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import ast
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from backlog_miner import research_evidence as evidence_mod
+from backlog_miner.ast_cache import (
+    ast_cache_stats,
+    clear_ast_cache,
+    parse_python_module,
+    python_module_definitions,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    clear_ast_cache()
+    yield
+    clear_ast_cache()
+
+
+def test_parse_python_module_reuses_tree_for_identical_content() -> None:
+    content = "def run():\n    return True\n"
+
+    first = parse_python_module(content)
+    second = parse_python_module(str(content))
+
+    assert first is second
+    assert ast.dump(first) == ast.dump(ast.parse(content))
+    stats = ast_cache_stats()
+    assert (stats.parses, stats.parses_saved) == (1, 1)
+
+
+def test_parse_python_module_caches_syntax_errors() -> None:
+    for _ in range(2):
+        with pytest.raises(SyntaxError):
+            parse_python_module("def broken(:\n")
+
+    assert ast_cache_stats().parses == 1
+
+
+def test_symbol_resolution_parses_each_file_once() -> None:
+    content = "class Engine:\n    def start(self):\n        pass\n\nLIMIT = 3\n"
+
+    for symbol in ("Engine", "Engine.start", "LIMIT", "core.Engine"):
+        assert evidence_mod._symbol_definition_exists(
+            path="src/core.py", content=content, symbol=symbol
+        )
+    assert not evidence_mod._symbol_definition_exists(
+        path="src/core.py", content=content, symbol="Engine.stop"
+    )
+
+    stats = ast_cache_stats()
+    assert stats.parses == 1
+    assert stats.definition_hits >= 4
+
+
+def test_definitions_are_persisted_by_content_hash(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("BACKLOG_MINER_AST_CACHE_DIR", str(tmp_path))
+    content = "import os\n\ndef helper():\n    pass\n"
+
+    def collect(tree: ast.Module) -> set[str]:
+        return {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+
+    assert python_module_definitions(content, collect) == {"helper"}
+    assert len(list(tmp_path.glob("*.definitions.json"))) == 1
+
+    clear_ast_cache()
+    assert python_module_definitions(content, collect) == {"helper"}
+    stats = ast_cache_stats()
+    assert (stats.parses, stats.persisted_hits) == (0, 1)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from backlog_miner import research_evidence as evidence_mod
+from backlog_miner.git_objects import git_object_reader, git_object_session
+
+
+def _git(repository: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args],
+        cwd=repository,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+def _repository(path: Path) -> Path:
+    path.mkdir()
+    (path / "src").mkdir()
+    (path / "src" / "core.py").write_text("def run():\n    return True\n", encoding="utf-8")
+    (path / "notes with space.txt").write_bytes(b"line\r\nbinary\x00tail")
+    _git(path, "init", "-q")
+    _git(path, "add", ".")
+    _git(
+        path,
+        "-c",
+        "user.name=Test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "-q",
+        "-m",
+        "baseline",
+    )
+    return path
+
+
+def test_reader_matches_rev_parse(tmp_path: Path) -> None:
+    workspace = _repository(tmp_path / "repo")
+
+    assert git_object_reader(workspace) is None
+    with git_object_session():
+        reader = git_object_reader(workspace)
+        assert reader is not None
+        assert git_object_reader(workspace) is reader
+
+        assert reader.head() == _git(workspace, "rev-parse", "HEAD")
+        for relative in ("src/core.py", "src", "notes with space.txt"):
+            assert reader.blob_sha(relative) == _git(workspace, "rev-parse", f"HEAD:{relative}")
+        assert reader.blob_sha("missing.py") is None
+        info = reader.info("src/core.py")
+        assert info is not None
+        assert (info.object_type, info.size) == ("blob", len("def run():\n    return True\n"))
+
+    assert git_object_reader(workspace) is None
+    with pytest.raises(OSError):
+        reader.blob_sha("src/other.py")
+
+
+def test_git_blob_sha_reuses_one_batch_process_per_session(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    workspace = _repository(tmp_path / "repo")
+    expected = _git(workspace, "rev-parse", "HEAD:src/core.py")
+    spawned: list[list[str]] = []
+    real_popen = subprocess.Popen
+
+    def popen(argv: list[str], **kwargs: object) -> subprocess.Popen[bytes]:
+        spawned.append(list(argv))
+        return real_popen(argv, **kwargs)  # type: ignore[call-overload,no-any-return]
+
+    def fail_run(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("one-shot git lookups should not run inside a session")
+
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    with git_object_session():
+        for _ in range(5):
+            assert evidence_mod._git_blob_sha(workspace, "src/core.py") == expected
+            assert evidence_mod._git_blob_sha(workspace, "absent.py") is None
+
+    assert [argv[-2:] for argv in spawned] == [["cat-file", "--batch-check"]]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from backlog_miner.stage_concurrency import (
+    STAGE_PROMPT_CONCURRENCY_ENV,
+    run_stage_prompt_batches,
+    stage_prompt_concurrency,
+    stage_prompt_slot,
+)
+
+
+def test_stage_prompt_concurrency_prefers_agent_specific_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv(STAGE_PROMPT_CONCURRENCY_ENV, raising=False)
+    monkeypatch.delenv(f"{STAGE_PROMPT_CONCURRENCY_ENV}_CODEX", raising=False)
+    assert stage_prompt_concurrency("codex") == 1
+
+    monkeypatch.setenv(STAGE_PROMPT_CONCURRENCY_ENV, "3")
+    assert stage_prompt_concurrency("codex") == 3
+    monkeypatch.setenv(f"{STAGE_PROMPT_CONCURRENCY_ENV}_CODEX", "5")
+    assert stage_prompt_concurrency("codex") == 5
+    assert stage_prompt_concurrency("claude") == 3
+    monkeypatch.setenv(STAGE_PROMPT_CONCURRENCY_ENV, "bogus")
+    assert stage_prompt_concurrency("claude") == 1
+
+
+def test_batches_run_concurrently_but_report_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(f"{STAGE_PROMPT_CONCURRENCY_ENV}_TESTAGENT", "3")
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    observed: list[int] = []
+
+    def _worker(index: int, item: str) -> str:
+        nonlocal in_flight, peak
+        with stage_prompt_slot("testagent"):
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            # Later batches finish first.
+            time.sleep(0.01 * (6 - index))
+            with lock:
+                in_flight -= 1
+        return f"{index}:{item}"
+
+    results = run_stage_prompt_batches(
+        ["a", "b", "c", "d", "e"],
+        _worker,
+        agent="testagent",
+        on_result=lambda index, _result: observed.append(index),
+    )
+
+    assert results == ["1:a", "2:b", "3:c", "4:d", "5:e"]
+    assert observed == [1, 2, 3, 4, 5]
+    assert 1 < peak <= 3
+
+
+def test_earliest_failed_batch_is_raised(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(f"{STAGE_PROMPT_CONCURRENCY_ENV}_TESTAGENT", "4")
+    observed: list[int] = []
+
+    def _worker(index: int, _item: int) -> int:
+        if index == 4:
+            raise RuntimeError("batch 4")
+        if index == 2:
+            time.sleep(0.02)
+            raise ValueError("batch 2")
+        return index
+
+    with pytest.raises(ValueError, match="batch 2"):
+        run_stage_prompt_batches(
+            [0, 0, 0, 0],
+            _worker,
+            agent="testagent",
+            on_result=lambda index, _result: observed.append(index),
+        )
+    assert observed == [1]
@@ -17,7 +17,7 @@ from reporter.materialize import (
     discover_lifecycle_event_logs,
     materialize_lifecycle_metrics,
 )
-from reporter.metrics import compute_metrics
+from reporter.metrics import MetricsAccumulator, compute_metrics
 from reporter.normalized_events import iter_events_jsonl, make_event, write_events_jsonl
 from reporter.render import render_report_markdown
 from reporter.schema import load_schema, validate_report
@@ -35,6 +35,7 @@ __all__ = [
     "CASE_METRICS_VERSION",
     "compare_cohorts",
     "compute_metrics",
+    "MetricsAccumulator",
     "EXACT_DISPOSITIONS",
     "iter_events_jsonl",
     "load_schema",
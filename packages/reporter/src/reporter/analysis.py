@@ -256,21 +256,74 @@ def _capture_manifest_entry(result: CaptureResult) -> dict[str, Any]:
     return entry
 
 
+_OTHER_THEME: tuple[str, str] = ("other", "Other / Unclassified")
+
+
+class _ThemeClassifier:
+    """All theme rules compiled into one named-group alternation plus one presence pattern.
+
+    A text that matches no rule is rejected by a single scan of the combined pattern.  The
+    leftmost combined match always belongs to a matching rule, so first-match classification
+    only searches the rules ordered before it.  Multi-theme classification runs the presence
+    pattern once: an optional lookahead per rule, anchored at the start, records every rule
+    that matches anywhere in the text, including matches the combined scan's leftmost
+    non-overlapping winners hide.
+    """
+
+    def __init__(self, rules: tuple[_ThemeRule, ...]) -> None:
+        self._rules = rules
+        self._rule_patterns = tuple(
+            re.compile("|".join(f"(?:{p.pattern})" for p in rule.patterns), re.IGNORECASE)
+            for rule in rules
+        )
+        self._combined = re.compile(
+            "|".join(
+                f"(?P<r{index}>{pattern.pattern})"
+                for index, pattern in enumerate(self._rule_patterns)
+            ),
+            re.IGNORECASE,
+        )
+        self._presence = re.compile(
+            "".join(
+                f"(?=(?:[\\s\\S]*?(?P<r{index}>{pattern.pattern}))?)"
+                for index, pattern in enumerate(self._rule_patterns)
+            ),
+            re.IGNORECASE,
+        )
+
+    def first(self, text: str) -> tuple[str, str]:
+        match = self._combined.search(text)
+        if match is None:
+            return _OTHER_THEME
+        hit = int(str(match.lastgroup)[1:])
+        for index in range(hit):
+            if self._rule_patterns[index].search(text):
+                hit = index
+                break
+        rule = self._rules[hit]
+        return rule.theme_id, rule.title
+
+    def all(self, text: str) -> list[tuple[str, str]]:
+        if self._combined.search(text) is None:
+            return [_OTHER_THEME]
+        present = self._presence.match(text)
+        assert present is not None
+        return [
+            (rule.theme_id, rule.title)
+            for index, rule in enumerate(self._rules)
+            if present.start(f"r{index}") != -1
+        ]
+
+
+_THEME_CLASSIFIER = _ThemeClassifier(_THEME_RULES)
+
+
 def _classify_theme(text: str) -> tuple[str, str]:
-    for rule in _THEME_RULES:
-        if any(p.search(text) for p in rule.patterns):
-            return rule.theme_id, rule.title
-    return "other", "Other / Unclassified"
+    return _THEME_CLASSIFIER.first(text)
 
 
 def _classify_themes(text: str) -> list[tuple[str, str]]:
-    matches: list[tuple[str, str]] = []
-    for rule in _THEME_RULES:
-        if any(p.search(text) for p in rule.patterns):
-            matches.append((rule.theme_id, rule.title))
-    if matches:
-        return matches
-    return [("other", "Other / Unclassified")]
+    return _THEME_CLASSIFIER.all(text)
 
 
 def _normalize_similarity_key(text: str) -> str:
@@ -542,6 +595,7 @@ def _action_matches_signal(
     signature: str,
     raw_signature: str,
     text: str,
+    text_lc: str | None = None,
 ) -> bool:
     theme_ids = action.get("theme_ids")
     if isinstance(theme_ids, tuple) and theme_ids and theme_id not in theme_ids:
@@ -560,7 +614,8 @@ def _action_matches_signal(
     ):
         return False
 
-    text_lc = text.lower()
+    if text_lc is None:
+        text_lc = text.lower()
     contains_any = action.get("contains_any")
     if isinstance(contains_any, tuple) and contains_any:
         if not any(isinstance(token, str) and token and token in text_lc for token in contains_any):
@@ -577,26 +632,85 @@ def _action_matches_signal(
     return True
 
 
-def _match_issue_action(
-    actions: list[dict[str, Any]],
-    *,
-    theme_id: str,
-    source: str,
-    signature: str,
-    raw_signature: str,
-    text: str,
-) -> dict[str, Any] | None:
-    for action in actions:
-        if _action_matches_signal(
-            action,
-            theme_id=theme_id,
-            source=source,
-            signature=signature,
-            raw_signature=raw_signature,
-            text=text,
-        ):
-            return action
-    return None
+class _IssueActionMatcher:
+    """First matching issue action for a signal, with actions pre-indexed by theme, source and
+    signature.
+
+    Candidates for a ``(theme_id, source)`` pair keep the configured order and are split into
+    actions without a signature filter and a signature -> positions index, so a signal only
+    visits actions that can match its signature; text checks run only on those.  The result is
+    the same as testing every action in turn.
+    """
+
+    def __init__(self, actions: list[dict[str, Any]]) -> None:
+        self._actions = actions
+        self._candidates: dict[
+            tuple[str, str],
+            tuple[tuple[dict[str, Any], ...], tuple[int, ...], dict[str, tuple[int, ...]]],
+        ] = {}
+
+    def _candidates_for(
+        self, theme_id: str, source: str
+    ) -> tuple[tuple[dict[str, Any], ...], tuple[int, ...], dict[str, tuple[int, ...]]]:
+        key = (theme_id, source)
+        cached = self._candidates.get(key)
+        if cached is None:
+            candidates = tuple(
+                action
+                for action in self._actions
+                if (not action.get("theme_ids") or theme_id in action["theme_ids"])
+                and (not action.get("sources") or source in action["sources"])
+            )
+            unsigned: list[int] = []
+            by_signature: dict[str, list[int]] = {}
+            for position, action in enumerate(candidates):
+                signatures = action.get("signatures")
+                if isinstance(signatures, tuple) and signatures:
+                    for item in set(signatures):
+                        by_signature.setdefault(item, []).append(position)
+                else:
+                    unsigned.append(position)
+            cached = (
+                candidates,
+                tuple(unsigned),
+                {item: tuple(positions) for item, positions in by_signature.items()},
+            )
+            self._candidates[key] = cached
+        return cached
+
+    def match(
+        self,
+        *,
+        theme_id: str,
+        source: str,
+        signature: str,
+        raw_signature: str,
+        text: str,
+    ) -> dict[str, Any] | None:
+        candidates, unsigned, by_signature = self._candidates_for(theme_id, source)
+        positions = sorted(
+            {
+                *unsigned,
+                *by_signature.get(signature, ()),
+                *by_signature.get(raw_signature, ()),
+            }
+        )
+        if not positions:
+            return None
+        text_lc = text.lower()
+        for position in positions:
+            action = candidates[position]
+            if _action_matches_signal(
+                action,
+                theme_id=theme_id,
+                source=source,
+                signature=signature,
+                raw_signature=raw_signature,
+                text=text,
+                text_lc=text_lc,
+            ):
+                return action
+        return None
 
 
 def analyze_report_history(
@@ -624,6 +738,9 @@ def analyze_report_history(
     normalization_counts: Counter[str] = Counter()
 
     actions, actions_meta = _load_issue_actions(issue_actions_path)
+    action_matcher = _IssueActionMatcher(actions)
+    # The same texts recur across runs (agent stderr, failure envelopes); classify each once.
+    theme_match_cache: dict[tuple[bool, str], list[tuple[str, str]]] = {}
     total_addressed_mentions = 0
 
     run_summaries: list[dict[str, Any]] = []
@@ -730,11 +847,15 @@ def analyze_report_history(
                 source=source, text=raw_text
             )
             classification_text = normalized_text if normalized_text else raw_text
-            theme_matches = (
-                _classify_themes(classification_text)
-                if source == "run_failure_event"
-                else [_classify_theme(classification_text)]
-            )
+            multi_theme = source == "run_failure_event"
+            theme_matches = theme_match_cache.get((multi_theme, classification_text))
+            if theme_matches is None:
+                theme_matches = (
+                    _classify_themes(classification_text)
+                    if multi_theme
+                    else [_classify_theme(classification_text)]
+                )
+                theme_match_cache[(multi_theme, classification_text)] = theme_matches
             signature = _normalize_similarity_key(classification_text)
             raw_signature = _normalize_similarity_key(raw_text)
             display_text = _to_singleline_display(raw_text)
@@ -745,8 +866,7 @@ def analyze_report_history(
                 normalization_counts[normalization_kind] += 1
 
             for theme_id, title in theme_matches:
-                action = _match_issue_action(
-                    actions,
+                action = action_matcher.match(
                     theme_id=theme_id,
                     source=source,
                     signature=signature,
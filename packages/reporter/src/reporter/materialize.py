@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import os
+import sys
 import tempfile
+import warnings
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -21,6 +25,11 @@ CASE_METRICS_FILENAME = "case_metrics.json"
 COHORT_METRICS_FILENAME = "cohort_metrics.json"
 COHORT_COMPARISON_FILENAME = "cohort_comparison.json"
 LIFECYCLE_EVENTS_FILENAME = "lifecycle_events.jsonl"
+MATERIALIZE_STATE_FILENAME = "materialize_state.json"
+FULL_REBUILD_INTERVAL_ENV = "USERTEST_LIFECYCLE_METRICS_FULL_REBUILD_EVERY"
+_DEFAULT_FULL_REBUILD_INTERVAL = 50
+_STATE_SCHEMA_VERSION = 1
+_CURSOR_WINDOW_BYTES = 4096
 
 
 @dataclass(frozen=True)
@@ -30,6 +39,9 @@ class MaterializedMetrics:
     comparison_path: Path | None
     source_event_count: int
     retained_event_count: int
+    # ``full`` without a state dir; otherwise ``incremental``, ``unchanged``, ``rebuilt``,
+    # ``verified`` or ``rebuilt_after_mismatch`` (see ``materialize_lifecycle_metrics``).
+    ingest_mode: str = "full"
 
 
 def discover_lifecycle_event_logs(roots: Iterable[Path]) -> list[Path]:
@@ -105,6 +117,117 @@ def _data_through_at(events: Sequence[Mapping[str, Any]]) -> str | None:
     return max(observed).isoformat().replace("+00:00", "Z")
 
 
+class _IndexedEvent:
+    __slots__ = ("_canonical", "_encoded", "event")
+
+    def __init__(
+        self,
+        event: dict[str, Any],
+        *,
+        canonical: str | None = None,
+        encoded: str | None = None,
+    ) -> None:
+        self.event = event
+        self._canonical = canonical
+        self._encoded = encoded
+
+    @property
+    def canonical(self) -> str:
+        if self._canonical is None:
+            self._canonical = _canonical_event(self.event)
+        return self._canonical
+
+    @property
+    def encoded(self) -> str:
+        """Compact encoding that keeps the producer's key order (the persisted form)."""
+
+        if self._encoded is None:
+            self._encoded = json.dumps(
+                self.event, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+            )
+        return self._encoded
+
+
+class _EventIndex:
+    """Reconciliation state: the latest event per event id plus every event without one."""
+
+    def __init__(self) -> None:
+        self.by_id: dict[str, _IndexedEvent] = {}
+        self.without_id: list[_IndexedEvent] = []
+        self.source_event_count = 0
+
+    def add(self, event: dict[str, Any], *, stored: str | None = None) -> _IndexedEvent | None:
+        """Add one event and return its entry, or ``None`` when it is an exact replay.
+
+        *stored* marks an event reloaded from materialization state; it was validated
+        when first ingested, so its canonical form is only computed if needed.
+        """
+
+        event_id = _event_id(event)
+        if stored is not None:
+            entry = _IndexedEvent(event, encoded=stored)
+        else:
+            # Validates every source event exactly like the original single-pass merge.
+            entry = _IndexedEvent(event, canonical=_canonical_event(event))
+        if event_id is None:
+            self.without_id.append(entry)
+            return entry
+        previous = self.by_id.get(event_id)
+        if previous is not None and stored is None and previous.canonical != entry.canonical:
+            raise LifecycleMetricsError(
+                f"conflicting lifecycle events share event_id {event_id!r}"
+            )
+        self.by_id[event_id] = entry
+        if previous is not None and previous.encoded == entry.encoded:
+            return None
+        return entry
+
+    def retained(self) -> list[_IndexedEvent]:
+        linked_source_ids = {
+            linked
+            for entry in self.by_id.values()
+            if (linked := _linked_source_event_id(entry.event)) is not None
+        }
+        retained = [
+            entry
+            for event_id, entry in sorted(self.by_id.items())
+            if event_id not in linked_source_ids
+        ]
+        # Events without an id cannot be safely collapsed; the aggregator will withhold
+        # reconciliation/certification where the missing identity matters.
+        retained.extend(self.without_id)
+        return _ordered_by_occurrence(retained)
+
+
+def _ordered_by_occurrence(entries: list[_IndexedEvent]) -> list[_IndexedEvent]:
+    """Sort by ``(occurred_at, event_id, canonical JSON)``.
+
+    The canonical form is only compared inside runs of equal ``(occurred_at, event_id)``,
+    so events reloaded from state are not re-serialized just to be ordered.
+    """
+
+    def _prefix(entry: _IndexedEvent) -> tuple[str, str]:
+        event = entry.event
+        return (
+            str(event.get("occurred_at", event.get("timestamp", ""))),
+            str(event.get("event_id", "")),
+        )
+
+    keyed = sorted(((_prefix(entry), entry) for entry in entries), key=lambda item: item[0])
+    ordered: list[_IndexedEvent] = []
+    start = 0
+    while start < len(keyed):
+        end = start + 1
+        while end < len(keyed) and keyed[end][0] == keyed[start][0]:
+            end += 1
+        group = [entry for _, entry in keyed[start:end]]
+        if len(group) > 1:
+            group.sort(key=lambda entry: entry.canonical)
+        ordered.extend(group)
+        start = end
+    return ordered
+
+
 def reconcile_event_streams(sources: Sequence[Path]) -> tuple[list[dict[str, Any]], int]:
     """Merge streams without double-counting mirrored or linked events.
 
@@ -114,49 +237,294 @@ def reconcile_event_streams(sources: Sequence[Path]) -> tuple[list[dict[str, Any
     rather than silently choosing one version.
     """
 
-    loaded: list[dict[str, Any]] = []
+    index = _EventIndex()
     for source in sources:
-        loaded.extend(load_lifecycle_events(source))
+        for event in load_lifecycle_events(source):
+            index.source_event_count += 1
+            index.add(event)
+    return [entry.event for entry in index.retained()], index.source_event_count
 
-    by_id: dict[str, tuple[str, dict[str, Any]]] = {}
-    without_id: list[dict[str, Any]] = []
-    for event in loaded:
-        event_id = _event_id(event)
-        if event_id is None:
-            without_id.append(event)
+
+# -- incremental materialization state ---------------------------------------------
+
+
+class _StaleState(Exception):
+    """A source no longer continues from its recorded cursor."""
+
+
+@dataclass
+class _SourceRead:
+    events: list[dict[str, Any]]
+    cursor: dict[str, Any]
+    # False when the file ends in an unterminated line (a writer may be mid-append).
+    complete: bool
+
+
+@dataclass
+class _StatefulReconciliation:
+    index: _EventIndex
+    cursors: dict[str, dict[str, Any]]
+    appended: list[_IndexedEvent]
+    complete: bool = True
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _full_rebuild_interval(value: int | None) -> int:
+    if value is not None:
+        return max(1, value)
+    raw = (os.environ.get(FULL_REBUILD_INTERVAL_ENV) or "").strip()
+    try:
+        return max(1, int(raw)) if raw else _DEFAULT_FULL_REBUILD_INTERVAL
+    except ValueError:
+        return _DEFAULT_FULL_REBUILD_INTERVAL
+
+
+def _materialize_code_stamp() -> list[Any]:
+    """Fingerprint the aggregation code so reused outputs never outlive a code change."""
+
+    parts: list[Any] = []
+    for module_name in sorted({__name__, aggregate_case_metrics.__module__}):
+        module_file = getattr(sys.modules.get(module_name), "__file__", None)
+        try:
+            stat = os.stat(str(module_file))
+        except OSError:
+            parts.append([module_name])
             continue
-        canonical = _canonical_event(event)
-        previous = by_id.get(event_id)
-        if previous is not None and previous[0] != canonical:
-            raise LifecycleMetricsError(
-                f"conflicting lifecycle events share event_id {event_id!r}"
-            )
-        by_id[event_id] = (canonical, event)
-
-    linked_source_ids = {
-        linked
-        for _, event in by_id.values()
-        if (linked := _linked_source_event_id(event)) is not None
-    }
-    retained = [
-        event
-        for event_id, (_, event) in sorted(by_id.items())
-        if event_id not in linked_source_ids
-    ]
-    # Events without an id cannot be safely collapsed; the aggregator will withhold
-    # reconciliation/certification where the missing identity matters.
-    retained.extend(without_id)
-    retained.sort(
-        key=lambda event: (
-            str(event.get("occurred_at", event.get("timestamp", ""))),
-            str(event.get("event_id", "")),
-            _canonical_event(event),
+        parts.append([module_name, stat.st_size, stat.st_mtime_ns])
+    return parts
+
+
+def _read_source(path: Path, cursor: Mapping[str, Any] | None) -> _SourceRead:
+    """Read the events appended to *path* since *cursor* (the whole file without one).
+
+    A cursor records the file identity, the byte offset just after the last consumed
+    newline and a hash of the bytes before it; any mismatch means the stream was
+    rewritten or truncated and raises :class:`_StaleState`.
+    """
+
+    with path.open("rb") as stream:
+        stat = os.fstat(stream.fileno())
+        offset = 0
+        previous = b""
+        if cursor is not None:
+            recorded = cursor.get("offset")
+            if (
+                not isinstance(recorded, int)
+                or [cursor.get("device"), cursor.get("inode")] != [stat.st_dev, stat.st_ino]
+                or not 0 <= recorded <= stat.st_size
+            ):
+                raise _StaleState(str(path))
+            offset = recorded
+            stream.seek(max(0, offset - _CURSOR_WINDOW_BYTES))
+            previous = stream.read(offset - stream.tell())
+            if _sha256(previous) != cursor.get("window_sha256"):
+                raise _StaleState(str(path))
+        data = stream.read()
+    consumed = data.rfind(b"\n") + 1
+    text_stream = io.StringIO(data.decode("utf-8"), newline=None)
+    text_stream.name = str(path) if not offset else f"{path}@{offset}"
+    return _SourceRead(
+        events=load_lifecycle_events(text_stream),
+        cursor={
+            "device": stat.st_dev,
+            "inode": stat.st_ino,
+            "offset": offset + consumed,
+            "window_sha256": _sha256((previous + data[:consumed])[-_CURSOR_WINDOW_BYTES:]),
+        },
+        complete=not data[consumed:].strip(),
+    )
+
+
+def _load_state(state_dir: Path) -> tuple[dict[str, Any], _EventIndex] | None:
+    try:
+        state = json.loads((state_dir / MATERIALIZE_STATE_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(state, dict)
+        or state.get("schema_version") != _STATE_SCHEMA_VERSION
+        or not isinstance(state.get("sources"), dict)
+        or not isinstance(state.get("events_file"), str)
+        or not isinstance(state.get("events_bytes"), int)
+        or not isinstance(state.get("source_event_count"), int)
+        or not isinstance(state.get("runs_since_full_rebuild"), int)
+    ):
+        return None
+    index = _EventIndex()
+    try:
+        with (state_dir / state["events_file"]).open("rb") as stream:
+            data = stream.read(state["events_bytes"])
+        if len(data) != state["events_bytes"]:
+            return None
+        for line in data.decode("utf-8").split("\n"):
+            if line:
+                event = json.loads(line)
+                if not isinstance(event, dict):
+                    return None
+                index.add(event, stored=line)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    index.source_event_count = state["source_event_count"]
+    return state, index
+
+
+def _read_all_sources(sources: Sequence[Path]) -> _StatefulReconciliation:
+    result = _StatefulReconciliation(index=_EventIndex(), cursors={}, appended=[])
+    for source in sources:
+        read = _read_source(source, None)
+        result.cursors[str(source)] = read.cursor
+        result.complete = result.complete and read.complete
+        for event in read.events:
+            result.index.source_event_count += 1
+            result.index.add(event)
+    return result
+
+
+def _resume_from_state(
+    sources: Sequence[Path],
+    state: Mapping[str, Any],
+    index: _EventIndex,
+) -> _StatefulReconciliation | None:
+    """Ingest only appended events; ``None`` when a full rebuild is required."""
+
+    source_keys = {str(source) for source in sources}
+    if not set(state["sources"]) <= source_keys:
+        # A source was dropped, so its events must leave the retained set.
+        return None
+    result = _StatefulReconciliation(index=index, cursors={}, appended=[])
+    for source in sources:
+        try:
+            read = _read_source(source, state["sources"].get(str(source)))
+        except _StaleState:
+            return None
+        result.cursors[str(source)] = read.cursor
+        result.complete = result.complete and read.complete
+        for event in read.events:
+            index.source_event_count += 1
+            entry = index.add(event)
+            if entry is not None:
+                result.appended.append(entry)
+    return result
+
+
+def _retained_stream(index: _EventIndex) -> bytes:
+    return "\n".join(entry.encoded for entry in index.retained()).encode("utf-8")
+
+
+def _save_state(
+    state_dir: Path,
+    state: Mapping[str, Any] | None,
+    reconciliation: _StatefulReconciliation,
+    *,
+    rebuilt: bool,
+    outputs: Mapping[str, Any],
+) -> None:
+    """Persist cursors and reconciled events next to the outputs they produced.
+
+    Incremental runs append to the current events file (dropping any bytes a crashed run
+    left past the recorded length); rebuilds write a new file so the previous state stays
+    valid until ``materialize_state.json`` is replaced.
+    """
+
+    state_dir.mkdir(parents=True, exist_ok=True)
+    generation = int(state.get("generation", 0)) if state is not None else 0
+    if rebuilt or state is None:
+        generation += 1
+        events_file = f"events-{generation:06d}.jsonl"
+        index = reconciliation.index
+        entries = [*index.by_id.values(), *index.without_id]
+        encoded = "".join(f"{entry.encoded}\n" for entry in entries).encode("utf-8")
+        (state_dir / events_file).write_bytes(encoded)
+        events_bytes = len(encoded)
+        runs_since_full_rebuild = 0
+    else:
+        events_file = str(state["events_file"])
+        events_bytes = int(state["events_bytes"])
+        encoded = "".join(f"{entry.encoded}\n" for entry in reconciliation.appended).encode(
+            "utf-8"
         )
+        with (state_dir / events_file).open("r+b") as stream:
+            stream.truncate(events_bytes)
+            stream.seek(events_bytes)
+            stream.write(encoded)
+            stream.flush()
+            os.fsync(stream.fileno())
+        events_bytes += len(encoded)
+        runs_since_full_rebuild = int(state["runs_since_full_rebuild"]) + 1
+    _atomic_write_json(
+        state_dir / MATERIALIZE_STATE_FILENAME,
+        {
+            "schema_version": _STATE_SCHEMA_VERSION,
+            "generation": generation,
+            "events_file": events_file,
+            "events_bytes": events_bytes,
+            "source_event_count": reconciliation.index.source_event_count,
+            "runs_since_full_rebuild": runs_since_full_rebuild,
+            "sources": reconciliation.cursors,
+            "outputs": dict(outputs),
+        },
+    )
+    if state is not None and state["events_file"] != events_file:
+        (state_dir / str(state["events_file"])).unlink(missing_ok=True)
+
+
+def _reusable_cohort_report(
+    outputs: Any,
+    outputs_key: str,
+    case_path: Path,
+    cohort_path: Path,
+) -> dict[str, Any] | None:
+    if not isinstance(outputs, Mapping) or outputs.get("key") != outputs_key:
+        return None
+    try:
+        case_bytes = case_path.read_bytes()
+        cohort_bytes = cohort_path.read_bytes()
+    except OSError:
+        return None
+    if (
+        _sha256(case_bytes) != outputs.get("case_sha256")
+        or _sha256(cohort_bytes) != outputs.get("cohort_sha256")
+    ):
+        return None
+    decoded = json.loads(cohort_bytes)
+    return decoded if isinstance(decoded, dict) else None
+
+
+def _reconcile_with_state(
+    sources: Sequence[Path],
+    state_dir: Path,
+    *,
+    full_rebuild_interval: int,
+) -> tuple[_StatefulReconciliation, dict[str, Any] | None, str]:
+    loaded = _load_state(state_dir)
+    if loaded is None:
+        return _read_all_sources(sources), None, "rebuilt"
+    state, index = loaded
+    resumed = _resume_from_state(sources, state, index)
+    if resumed is None:
+        return _read_all_sources(sources), state, "rebuilt"
+    if not resumed.complete or state["runs_since_full_rebuild"] + 1 < full_rebuild_interval:
+        return resumed, state, "incremental" if resumed.appended else "unchanged"
+    # Periodic full rebuild: the incremental result must match it byte for byte.
+    rebuilt = _read_all_sources(sources)
+    if (
+        rebuilt.index.source_event_count == resumed.index.source_event_count
+        and _retained_stream(rebuilt.index) == _retained_stream(resumed.index)
+    ):
+        return rebuilt, state, "verified"
+    warnings.warn(
+        f"incremental lifecycle metrics state in {state_dir} diverged from a full rebuild; "
+        "using the rebuilt events",
+        RuntimeWarning,
+        stacklevel=3,
     )
-    return retained, len(loaded)
+    return rebuilt, state, "rebuilt_after_mismatch"
 
 
-def _atomic_write_json(path: Path, payload: Mapping[str, Any]) -> None:
+def _atomic_write_json(path: Path, payload: Mapping[str, Any]) -> bytes:
     path.parent.mkdir(parents=True, exist_ok=True)
     encoded = (
         json.dumps(payload, ensure_ascii=False, sort_keys=True, indent=2, allow_nan=False)
@@ -177,6 +545,7 @@ def _atomic_write_json(path: Path, payload: Mapping[str, Any]) -> None:
             temporary_path.unlink(missing_ok=True)
         except OSError:
             pass
+    return encoded
 
 
 def materialize_lifecycle_metrics(
@@ -186,24 +555,87 @@ def materialize_lifecycle_metrics(
     cohort_id: str | None = None,
     case_lifecycle_ids: Iterable[str] | None = None,
     comparison_cohort: Mapping[str, Any] | Path | None = None,
+    state_dir: Path | None = None,
+    full_rebuild_interval: int | None = None,
 ) -> MaterializedMetrics:
-    """Deterministically derive the authoritative case/cohort metric artifacts."""
+    """Deterministically derive the authoritative case/cohort metric artifacts.
+
+    With *state_dir*, per-source cursors (byte offset plus a hash of the bytes before
+    it) and the reconciled events are persisted there, so a refresh only reads and
+    reconciles events appended since the previous run, and reuses the written artifacts
+    when the retained events did not change.  Rewritten, truncated or dropped sources
+    trigger a full rebuild.  Every *full_rebuild_interval* runs (default
+    ``USERTEST_LIFECYCLE_METRICS_FULL_REBUILD_EVERY`` or 50) the sources are re-read from
+    scratch and the retained event stream must be byte-identical to the incremental one;
+    a mismatch warns and replaces the state.
+
+    Case metrics are still aggregated over the whole retained set: work units are shared
+    across cases and events without ids receive position-based synthetic identities, so
+    a per-case slice would not reproduce the full report.
+    """
 
     sources = [path.resolve() for path in event_sources]
-    events, source_event_count = reconcile_event_streams(sources)
-    case_report = aggregate_case_metrics(events)
-    cohort_report = aggregate_cohort_metrics(
-        case_report,
-        cohort_id=cohort_id,
-        case_ids=case_lifecycle_ids,
-    )
-    cohort_report["data_through_at"] = _data_through_at(events)
-
+    case_ids = list(case_lifecycle_ids) if case_lifecycle_ids is not None else None
     output = output_dir.resolve()
     case_path = output / CASE_METRICS_FILENAME
     cohort_path = output / COHORT_METRICS_FILENAME
-    _atomic_write_json(case_path, case_report)
-    _atomic_write_json(cohort_path, cohort_report)
+
+    reconciliation: _StatefulReconciliation | None = None
+    state: dict[str, Any] | None = None
+    ingest_mode = "full"
+    if state_dir is None:
+        events, source_event_count = reconcile_event_streams(sources)
+    else:
+        state_dir = state_dir.resolve()
+        reconciliation, state, ingest_mode = _reconcile_with_state(
+            sources,
+            state_dir,
+            full_rebuild_interval=_full_rebuild_interval(full_rebuild_interval),
+        )
+        events = [entry.event for entry in reconciliation.index.retained()]
+        source_event_count = reconciliation.index.source_event_count
+    outputs_key = _sha256(
+        json.dumps(
+            [_materialize_code_stamp(), cohort_id, case_ids, str(case_path), str(cohort_path)],
+            sort_keys=True,
+        ).encode("utf-8")
+    )
+
+    cohort_report: dict[str, Any] | None = None
+    if ingest_mode == "unchanged" and state is not None:
+        cohort_report = _reusable_cohort_report(
+            state.get("outputs"), outputs_key, case_path, cohort_path
+        )
+    if cohort_report is None:
+        case_report = aggregate_case_metrics(events)
+        cohort_report = aggregate_cohort_metrics(
+            case_report,
+            cohort_id=cohort_id,
+            case_ids=case_ids,
+        )
+        cohort_report["data_through_at"] = _data_through_at(events)
+        case_bytes = _atomic_write_json(case_path, case_report)
+        cohort_bytes = _atomic_write_json(cohort_path, cohort_report)
+    else:
+        case_bytes = case_path.read_bytes()
+        cohort_bytes = cohort_path.read_bytes()
+
+    if reconciliation is not None and state_dir is not None and reconciliation.complete:
+        try:
+            _save_state(
+                state_dir,
+                state,
+                reconciliation,
+                rebuilt=ingest_mode not in ("incremental", "unchanged"),
+                outputs={
+                    "key": outputs_key,
+                    "case_sha256": _sha256(case_bytes),
+                    "cohort_sha256": _sha256(cohort_bytes),
+                },
+            )
+        except OSError:
+            # The state is an optimization only; the next run rebuilds it.
+            pass
 
     comparison_path: Path | None = None
     if comparison_cohort is not None:
@@ -229,6 +661,7 @@ def materialize_lifecycle_metrics(
         comparison_path=comparison_path,
         source_event_count=source_event_count,
         retained_event_count=len(events),
+        ingest_mode=ingest_mode,
     )
 
 
@@ -236,7 +669,9 @@ __all__ = [
     "CASE_METRICS_FILENAME",
     "COHORT_COMPARISON_FILENAME",
     "COHORT_METRICS_FILENAME",
+    "FULL_REBUILD_INTERVAL_ENV",
     "LIFECYCLE_EVENTS_FILENAME",
+    "MATERIALIZE_STATE_FILENAME",
     "MaterializedMetrics",
     "discover_lifecycle_event_logs",
     "materialize_lifecycle_metrics",
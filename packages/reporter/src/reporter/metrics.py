@@ -52,32 +52,39 @@ def _is_ripgrep_no_matches(*, argv: object, exit_code: int) -> bool:
     return tool in {"rg", "rg.exe"}
 
 
-def compute_metrics(events: Iterable[dict[str, Any]]) -> dict[str, Any]:
-    event_counts: Counter[str] = Counter()
-    distinct_files_read: set[str] = set()
-    distinct_docs_read: set[str] = set()
-    distinct_files_written: set[str] = set()
-
-    commands_executed = 0
-    commands_failed = 0
-    commands_no_matches = 0
-    commands_blocked_by_policy = 0
-    failed_commands: list[dict[str, Any]] = []
-    failed_commands_total = 0
-    no_match_commands: list[dict[str, Any]] = []
-    no_match_commands_total = 0
-
-    lines_added_total = 0
-    lines_removed_total = 0
-
-    step_count = 0
-
-    for event in events:
+class MetricsAccumulator:
+    """Incremental form of :func:`compute_metrics`.
+
+    Feed normalized events one at a time with :meth:`add` (for example from a live normalizer
+    callback) and call :meth:`metrics` at any point for the metrics of the events seen so far.
+    """
+
+    def __init__(self) -> None:
+        self.event_counts: Counter[str] = Counter()
+        self.distinct_files_read: set[str] = set()
+        self.distinct_docs_read: set[str] = set()
+        self.distinct_files_written: set[str] = set()
+
+        self.commands_executed = 0
+        self.commands_failed = 0
+        self.commands_no_matches = 0
+        self.commands_blocked_by_policy = 0
+        self.failed_commands: list[dict[str, Any]] = []
+        self.failed_commands_total = 0
+        self.no_match_commands: list[dict[str, Any]] = []
+        self.no_match_commands_total = 0
+
+        self.lines_added_total = 0
+        self.lines_removed_total = 0
+
+        self.step_count = 0
+
+    def add(self, event: dict[str, Any]) -> None:
         event_type = event.get("type")
         if not isinstance(event_type, str):
-            continue
+            return
 
-        event_counts[event_type] += 1
+        self.event_counts[event_type] += 1
 
         if event_type in {
             "read_file",
@@ -88,39 +95,39 @@ def compute_metrics(events: Iterable[dict[str, Any]]) -> dict[str, Any]:
             "delegation_invocation",
             "delegation_result",
         }:
-            step_count += 1
+            self.step_count += 1
 
         data = event.get("data", {})
         if not isinstance(data, dict):
-            continue
+            return
 
         if event_type == "read_file":
             path = data.get("path")
             if isinstance(path, str):
-                distinct_files_read.add(path)
+                self.distinct_files_read.add(path)
                 if _maybe_doc_path(path):
-                    distinct_docs_read.add(path)
+                    self.distinct_docs_read.add(path)
 
         if event_type == "write_file":
             path = data.get("path")
             if isinstance(path, str):
-                distinct_files_written.add(path)
+                self.distinct_files_written.add(path)
             lines_added = data.get("lines_added")
             lines_removed = data.get("lines_removed")
             if isinstance(lines_added, int) and lines_added > 0:
-                lines_added_total += lines_added
+                self.lines_added_total += lines_added
             if isinstance(lines_removed, int) and lines_removed > 0:
-                lines_removed_total += lines_removed
+                self.lines_removed_total += lines_removed
 
         if event_type == "run_command":
-            commands_executed += 1
+            self.commands_executed += 1
             exit_code = data.get("exit_code")
             if isinstance(exit_code, int) and exit_code != 0:
                 argv = data.get("argv")
                 if _is_ripgrep_no_matches(argv=argv, exit_code=exit_code):
-                    commands_no_matches += 1
-                    no_match_commands_total += 1
-                    if len(no_match_commands) < _MAX_NO_MATCH_COMMANDS:
+                    self.commands_no_matches += 1
+                    self.no_match_commands_total += 1
+                    if len(self.no_match_commands) < _MAX_NO_MATCH_COMMANDS:
                         command = data.get("command")
                         if not isinstance(command, str) or not command.strip():
                             argv_list = argv if isinstance(argv, list) else []
@@ -129,10 +136,10 @@ def compute_metrics(events: Iterable[dict[str, Any]]) -> dict[str, Any]:
                         cwd = data.get("cwd")
                         if isinstance(cwd, str) and cwd.strip():
                             entry["cwd"] = cwd.strip()
-                        no_match_commands.append(entry)
+                        self.no_match_commands.append(entry)
                 else:
-                    commands_failed += 1
-                    failed_commands_total += 1
+                    self.commands_failed += 1
+                    self.failed_commands_total += 1
 
                     output_excerpt = data.get("output_excerpt")
                     lowered_excerpt = (
@@ -145,7 +152,7 @@ def compute_metrics(events: Iterable[dict[str, Any]]) -> dict[str, Any]:
                         or "denied by policy" in lowered_excerpt
                     )
                     if is_policy_denial:
-                        commands_blocked_by_policy += 1
+                        self.commands_blocked_by_policy += 1
 
                     command = data.get("command")
                     if not isinstance(command, str) or not command.strip():
@@ -186,35 +193,43 @@ def compute_metrics(events: Iterable[dict[str, Any]]) -> dict[str, Any]:
                                 "Consult preflight.json for allowed capabilities "
                                 "or rewrite using file tools."
                             )
-                    failed_commands.append(entry)
+                    self.failed_commands.append(entry)
             for inferred in _infer_files_from_run_command(event):
-                distinct_files_read.add(inferred)
+                self.distinct_files_read.add(inferred)
                 if _maybe_doc_path(inferred):
-                    distinct_docs_read.add(inferred)
-
-    metrics: dict[str, Any] = {
-        "event_counts": dict(event_counts),
-        "distinct_files_read": sorted(distinct_files_read),
-        "distinct_docs_read": sorted(distinct_docs_read),
-        "distinct_files_written": sorted(distinct_files_written),
-        "commands_executed": commands_executed,
-        "commands_failed": commands_failed,
-        "commands_no_matches": commands_no_matches,
-        "commands_blocked_by_policy": commands_blocked_by_policy,
-        "lines_added_total": lines_added_total,
-        "lines_removed_total": lines_removed_total,
-        "step_count": step_count,
-    }
-
-    if failed_commands_total:
-        metrics["failed_commands"] = failed_commands
-
-    if no_match_commands_total:
-        metrics["no_match_commands"] = no_match_commands
-        omitted = max(0, int(no_match_commands_total) - len(no_match_commands))
-        if omitted:
-            metrics["no_match_commands_truncated"] = True
-            metrics["no_match_commands_omitted_count"] = omitted
-            metrics["no_match_commands_max"] = _MAX_NO_MATCH_COMMANDS
-
-    return metrics
+                    self.distinct_docs_read.add(inferred)
+
+    def metrics(self) -> dict[str, Any]:
+        metrics: dict[str, Any] = {
+            "event_counts": dict(self.event_counts),
+            "distinct_files_read": sorted(self.distinct_files_read),
+            "distinct_docs_read": sorted(self.distinct_docs_read),
+            "distinct_files_written": sorted(self.distinct_files_written),
+            "commands_executed": self.commands_executed,
+            "commands_failed": self.commands_failed,
+            "commands_no_matches": self.commands_no_matches,
+            "commands_blocked_by_policy": self.commands_blocked_by_policy,
+            "lines_added_total": self.lines_added_total,
+            "lines_removed_total": self.lines_removed_total,
+            "step_count": self.step_count,
+        }
+
+        if self.failed_commands_total:
+            metrics["failed_commands"] = list(self.failed_commands)
+
+        if self.no_match_commands_total:
+            metrics["no_match_commands"] = list(self.no_match_commands)
+            omitted = max(0, int(self.no_match_commands_total) - len(self.no_match_commands))
+            if omitted:
+                metrics["no_match_commands_truncated"] = True
+                metrics["no_match_commands_omitted_count"] = omitted
+                metrics["no_match_commands_max"] = _MAX_NO_MATCH_COMMANDS
+
+        return metrics
+
+
+def compute_metrics(events: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    accumulator = MetricsAccumulator()
+    for event in events:
+        accumulator.add(event)
+    return accumulator.metrics()
@@ -3,7 +3,15 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from reporter.analysis import analyze_report_history, render_issue_analysis_markdown
+from reporter.analysis import (
+    _THEME_RULES,
+    _action_matches_signal,
+    _classify_theme,
+    _classify_themes,
+    _IssueActionMatcher,
+    analyze_report_history,
+    render_issue_analysis_markdown,
+)
 
 
 def test_analyze_report_history_clusters_themes(tmp_path: Path) -> None:
@@ -603,3 +611,80 @@ def test_analyze_report_history_classifies_limit_message_as_provider_capacity(
     summary = analyze_report_history(records, repo_root=tmp_path)
     theme_ids = {item["theme_id"] for item in summary["themes"]}
     assert "provider_capacity" in theme_ids
+
+
+def test_compiled_theme_classifier_matches_rule_by_rule_scan() -> None:
+    def _expected(text: str) -> list[tuple[str, str]]:
+        return [
+            (rule.theme_id, rule.title)
+            for rule in _THEME_RULES
+            if any(pattern.search(text) for pattern in rule.patterns)
+        ] or [("other", "Other / Unclassified")]
+
+    texts = [
+        "",
+        "nothing to see here",
+        "exit code 2 after the sandbox denied it",
+        "see README: commands are blocked by permission_policy",
+        "Traceback: RuntimeError in quick start (429 quota)",
+        "return only the JSON object; the agent produced no JSON output",
+        "PATH points at a precreated venv; binary not found",
+        "agent_last_message report_json_envelope outside the allowed workspace",
+        # The output-contract match spans the README mention and the sandbox binary message.
+        "return only the README quick start as JSON",
+        "return only sandbox output; binary not found in json",
+    ]
+    for text in texts:
+        expected = _expected(text)
+        assert _classify_themes(text) == expected, text
+        assert _classify_theme(text) == expected[0], text
+
+
+def test_issue_action_matcher_matches_linear_scan_in_configured_order() -> None:
+    def _action(action_id: str, **match: tuple[str, ...]) -> dict[str, object]:
+        return {
+            "id": action_id,
+            "theme_ids": match.get("theme_ids", ()),
+            "sources": match.get("sources", ()),
+            "signatures": match.get("signatures", ()),
+            "contains_any": match.get("contains_any", ()),
+            "text_patterns": (),
+        }
+
+    actions = [
+        _action("sig-b", signatures=("sig b",)),
+        _action("stderr-any", sources=("agent_stderr",), contains_any=("quota",)),
+        _action("sig-a-or-raw", signatures=("sig a", "raw a")),
+        _action("theme-only", theme_ids=("tooling",)),
+    ]
+    matcher = _IssueActionMatcher(actions)
+    signature_pairs = (("sig a", "x"), ("x", "raw a"), ("sig b", "y"), ("z", "z"))
+    for theme_id in ("tooling", "other"):
+        for source in ("agent_stderr", "error_message"):
+            for signature, raw_signature in signature_pairs:
+                for text in ("quota exceeded", "nothing"):
+                    expected = next(
+                        (
+                            action
+                            for action in actions
+                            if _action_matches_signal(
+                                action,
+                                theme_id=theme_id,
+                                source=source,
+                                signature=signature,
+                                raw_signature=raw_signature,
+                                text=text,
+                            )
+                        ),
+                        None,
+                    )
+                    assert (
+                        matcher.match(
+                            theme_id=theme_id,
+                            source=source,
+                            signature=signature,
+                            raw_signature=raw_signature,
+                            text=text,
+                        )
+                        is expected
+                    )
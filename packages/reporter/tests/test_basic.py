@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from reporter import compute_metrics, load_schema, render_report_markdown, validate_report
+from reporter import (
+    MetricsAccumulator,
+    compute_metrics,
+    load_schema,
+    render_report_markdown,
+    validate_report,
+)
 
 
 def test_compute_metrics_basic_counts() -> None:
@@ -86,6 +92,19 @@ def test_compute_metrics_keeps_all_failed_commands_without_truncation() -> None:
     assert "failed_commands_max" not in metrics
 
 
+def test_metrics_accumulator_snapshots_match_compute_metrics() -> None:
+    events = [
+        {"type": "read_file", "data": {"path": "README.md"}},
+        {"type": "run_command", "data": {"argv": ["rg", "x"], "command": "rg x", "exit_code": 1}},
+        {"type": "run_command", "data": {"argv": ["pytest"], "command": "pytest", "exit_code": 2}},
+        {"type": "write_file", "data": {"path": "a.py", "lines_added": 3, "lines_removed": 1}},
+    ]
+    accumulator = MetricsAccumulator()
+    for count, event in enumerate(events, start=1):
+        accumulator.add(event)
+        assert accumulator.metrics() == compute_metrics(events[:count])
+
+
 def test_validate_report_errors() -> None:
     schema = {
         "$schema": "https://json-schema.org/draft/2020-12/schema",
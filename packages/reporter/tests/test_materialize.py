@@ -141,3 +141,62 @@ def test_materialization_removes_stale_comparison_when_disabled(tmp_path: Path)
 
     assert without_comparison.comparison_path is None
     assert not (output / "cohort_comparison.json").exists()
+
+
+def test_incremental_materialization_matches_full_rebuild(tmp_path: Path) -> None:
+    stream = tmp_path / "runs" / "lifecycle_events.jsonl"
+    mirror = tmp_path / "mirror" / "lifecycle_events.jsonl"
+    opened = _event("open", "lifecycle.opened", "2026-07-01T00:00:00Z")
+    _write_events(stream, [opened])
+    _write_events(mirror, [opened])
+    state_dir = tmp_path / "state"
+
+    def _materialize(output: str, **kwargs: object) -> tuple[str, bytes, bytes]:
+        result = materialize_lifecycle_metrics(
+            event_sources=[stream, mirror],
+            output_dir=tmp_path / output,
+            cohort_id="cohort-a",
+            **kwargs,  # type: ignore[arg-type]
+        )
+        return (
+            result.ingest_mode,
+            result.case_metrics_path.read_bytes(),
+            result.cohort_metrics_path.read_bytes(),
+        )
+
+    def _assert_matches_full(incremental: tuple[str, bytes, bytes]) -> None:
+        assert incremental[1:] == _materialize("full")[1:]
+
+    first = _materialize("metrics", state_dir=state_dir)
+    assert first[0] == "rebuilt"
+    _assert_matches_full(first)
+    assert _materialize("metrics", state_dir=state_dir)[0] == "unchanged"
+
+    with stream.open("a", encoding="utf-8") as handle:
+        handle.write(
+            json.dumps(
+                _event(
+                    "closed",
+                    "disposition.verified",
+                    "2026-07-01T00:01:00Z",
+                    disposition="already_addressed",
+                    verified=True,
+                )
+            )
+            + "\n"
+        )
+    appended = _materialize("metrics", state_dir=state_dir)
+    assert appended[0] == "incremental"
+    _assert_matches_full(appended)
+
+    # Every third run re-reads the sources and checks the incremental state against them.
+    verified = _materialize("metrics", state_dir=state_dir, full_rebuild_interval=3)
+    assert verified[0] == "verified"
+    _assert_matches_full(verified)
+
+    # Rewriting a stream in place invalidates its cursor.
+    _write_events(stream, [_event("open", "lifecycle.opened", "2026-07-02T00:00:00Z")])
+    _write_events(mirror, [])
+    rewritten = _materialize("metrics", state_dir=state_dir)
+    assert rewritten[0] == "rebuilt"
+    _assert_matches_full(rewritten)
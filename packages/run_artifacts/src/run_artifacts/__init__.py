@@ -10,6 +10,7 @@ from run_artifacts.history import (
     HISTORY_RUN_ARTIFACT_RELATIVE_PATHS,
     MAINTENANCE_IMAGE_CLEANUP_ARTIFACT_PATH,
     iter_report_history,
+    refresh_history_index,
     write_report_history_jsonl,
 )
 from run_artifacts.lifecycle_events import (
@@ -135,6 +136,7 @@ __all__ = [
     "extract_error_artifacts",
     "fingerprint_command",
     "iter_report_history",
+    "refresh_history_index",
     "lifecycle_context_env",
     "load_context_from_env",
     "make_lifecycle_event",
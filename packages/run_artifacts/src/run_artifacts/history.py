@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import time
 from collections.abc import Iterator
 from datetime import datetime, timezone
 from hashlib import sha256
@@ -10,6 +11,7 @@ from pathlib import Path
 from typing import Any
 
 from run_artifacts.capture import TextCapturePolicy, TextExcerpt, capture_text_artifact
+from run_artifacts.history_index import IndexedRun, RunHistoryIndex, artifact_stamp
 from run_artifacts.lifecycle import (
     STATUS_ERROR as _STATUS_ERROR,
 )
@@ -39,6 +41,10 @@ from run_artifacts.lifecycle import (
 from run_artifacts.path_normalization import normalize_agent_path
 
 _TIMESTAMP_DIR_RE = re.compile(r"^[0-9]{8}T[0-9]{6}Z$")
+_INDEX_COMMIT_INTERVAL = 256
+# Directory listings are only stored once the directory's mtime is this old, so an entry added
+# within the filesystem's timestamp granularity of the listing cannot hide behind an equal mtime.
+_DIR_LISTING_SETTLE_NS = 2_000_000_000
 _EMBED_DEFINITION_KEYS = {
     "persona_source_md",
     "persona_resolved_md",
@@ -207,11 +213,14 @@ def select_recent_run_dirs(
     target_slug: str | None = None,
     repo_input: str | None = None,
     limit: int,
+    use_index: bool = True,
 ) -> list[Path]:
     """
     Select the most recent run directories under `runs_dir`.
 
     Returns run directories in chronological order (oldest-to-newest within the selection).
+    With `use_index`, `repo_input` is matched against the persistent history index (opened
+    read-only; see `refresh_history_index`) instead of re-reading every `target_ref.json`.
     """
 
     if limit <= 0:
@@ -221,6 +230,19 @@ def select_recent_run_dirs(
     if isinstance(repo_input, str) and repo_input.strip():
         normalized_repo_input = _normalize_repo_input(repo_input)
 
+    index = RunHistoryIndex.open(runs_dir, readonly=True) if use_index else None
+    if index is not None:
+        with index:
+            rows = [
+                row
+                for _, row in _sync_history_index(index, runs_dir, target_slug=target_slug)
+                if row is not None
+                and row.timestamp_dir is not None
+                and (normalized_repo_input is None or row.repo_input == normalized_repo_input)
+            ]
+        rows.sort(key=lambda row: (row.timestamp_dir or "", row.run_rel))
+        return [runs_dir.joinpath(*row.run_rel.split("/")) for row in rows[-limit:]]
+
     candidates: list[tuple[datetime, str, Path]] = []
     for run_dir in iter_run_dirs(runs_dir, target_slug=target_slug):
         try:
@@ -258,6 +280,131 @@ def select_recent_run_dirs(
     return [item[2] for item in selected]
 
 
+def _run_dir_parts(run_dir: Path, runs_dir: Path) -> tuple[str, str, str, str] | None:
+    try:
+        parts = run_dir.relative_to(runs_dir).parts
+    except ValueError:
+        return None
+    if len(parts) != 4:
+        return None
+    return parts[0], parts[1], parts[2], parts[3]
+
+
+def _indexed_run(run_dir: Path, runs_dir: Path, *, stamp: str) -> IndexedRun | None:
+    parts = _run_dir_parts(run_dir, runs_dir)
+    if parts is None:
+        return None
+    target, ts_dir, agent, seed = parts
+    target_ref = _read_json(run_dir / "target_ref.json")
+    repo_input: str | None = None
+    if isinstance(target_ref, dict):
+        raw = target_ref.get("repo_input")
+        repo_input = _normalize_repo_input(raw) if isinstance(raw, str) else None
+    return IndexedRun(
+        run_rel="/".join(parts),
+        target_slug=target,
+        timestamp_dir=ts_dir if _TIMESTAMP_DIR_RE.match(ts_dir) else None,
+        agent=agent,
+        seed=seed,
+        repo_input=repo_input,
+        target_ref_stamp=stamp,
+    )
+
+
+def _walk_listed_run_dirs(
+    index: RunHistoryIndex,
+    runs_dir: Path,
+    *,
+    target_slug: str | None,
+) -> list[Path]:
+    """Return the `iter_run_dirs` run directories, listing only directories whose mtime changed.
+
+    Every directory is still `stat`ed; listings whose mtime matches the index are reused.
+    """
+
+    known = index.dirs(prefix=target_slug)
+    upserts: dict[str, tuple[int, list[str]]] = {}
+    visited: set[str] = set()
+    now_ns = time.time_ns()
+
+    def _entries(rel: str, path: Path, *, seed: bool = False) -> list[str]:
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return []
+        cached = known.get(rel)
+        if cached is not None and cached[0] == mtime_ns:
+            visited.add(rel)
+            return cached[1]
+        try:
+            if seed:
+                entries = ["target_ref.json"] if (path / "target_ref.json").exists() else []
+            else:
+                entries = sorted(
+                    child.name
+                    for child in path.iterdir()
+                    if child.is_dir() and not child.name.startswith("_")
+                )
+        except OSError:
+            return []
+        visited.add(rel)
+        if now_ns - mtime_ns >= _DIR_LISTING_SETTLE_NS:
+            upserts[rel] = (mtime_ns, entries)
+        return entries
+
+    run_dirs: list[Path] = []
+    targets = [target_slug] if target_slug is not None else _entries("", runs_dir)
+    for target in targets:
+        for ts_dir in _entries(target, runs_dir / target):
+            ts_rel = f"{target}/{ts_dir}"
+            for agent in _entries(ts_rel, runs_dir / target / ts_dir):
+                agent_rel = f"{ts_rel}/{agent}"
+                agent_path = runs_dir / target / ts_dir / agent
+                for seed in _entries(agent_rel, agent_path):
+                    if _entries(f"{agent_rel}/{seed}", agent_path / seed, seed=True):
+                        run_dirs.append(agent_path / seed)
+    removals = [rel for rel in known if rel not in visited]
+    if upserts or removals:
+        index.sync_dirs(upserts=upserts, removals=removals)
+    return run_dirs
+
+
+def _sync_history_index(
+    index: RunHistoryIndex,
+    runs_dir: Path,
+    *,
+    target_slug: str | None,
+) -> list[tuple[Path, IndexedRun | None]]:
+    """Walk `runs_dir`, refresh index rows whose `target_ref.json` changed, drop vanished runs.
+
+    Returns the walked run directories in `iter_run_dirs` order with their current rows.  On a
+    read-only index the refreshed rows are returned but not stored.
+    """
+
+    known = index.runs(target_slug=target_slug)
+    walked: list[tuple[Path, IndexedRun | None]] = []
+    upserts: list[IndexedRun] = []
+    seen: set[str] = set()
+    for run_dir in _walk_listed_run_dirs(index, runs_dir, target_slug=target_slug):
+        parts = _run_dir_parts(run_dir, runs_dir)
+        if parts is None:
+            walked.append((run_dir, None))
+            continue
+        run_rel = "/".join(parts)
+        seen.add(run_rel)
+        stamp = artifact_stamp(run_dir, ("target_ref.json",))
+        row = known.get(run_rel)
+        if row is None or row.target_ref_stamp != stamp:
+            row = _indexed_run(run_dir, runs_dir, stamp=stamp)
+            if row is not None:
+                upserts.append(row)
+        walked.append((run_dir, row))
+    removals = [run_rel for run_rel in known if run_rel not in seen]
+    if upserts or removals:
+        index.sync_runs(upserts=upserts, removals=removals)
+    return walked
+
+
 def _read_json_artifact(path: Path) -> JsonArtifactReadResult:
     rel_path = path.name
     try:
@@ -503,6 +650,7 @@ def iter_report_history(
     repo_input: str | None = None,
     embed: str = "definitions",
     max_embed_bytes: int = 200_000,
+    use_index: bool = True,
 ) -> Iterator[dict[str, Any]]:
     """
     Iterate run records suitable for longitudinal analysis.
@@ -511,6 +659,10 @@ def iter_report_history(
     - path-derived identifiers (target_slug/timestamp/agent/seed)
     - parsed JSON artifacts (target_ref, effective_run_spec, report, metrics, errors)
     - optional embedded text artifacts (persona/mission/prompt/users) depending on `embed`.
+
+    With `use_index`, records are served from the persistent history index
+    (`<runs>/_index/run_history.sqlite`, opened read-only; see `refresh_history_index`) and only
+    runs whose artifacts changed since it was refreshed are re-read.
     """
 
     embed_rank = {"none": 0, "definitions": 1, "prompt": 2, "all": 3}.get(embed)
@@ -535,158 +687,300 @@ def iter_report_history(
         return
 
     policy = _history_text_policy(max_embed_bytes)
+    index = RunHistoryIndex.open(source_path, readonly=True) if use_index else None
+    if index is not None:
+        yield from _iter_indexed_report_history(
+            index,
+            source_path,
+            target_slug=target_slug,
+            normalized_repo_input=normalized_repo_input,
+            embed=embed,
+            embed_rank=embed_rank,
+            max_embed_bytes=max_embed_bytes,
+            policy=policy,
+        )
+        return
+
     for run_dir in iter_run_dirs(source_path, target_slug=target_slug):
-        run_rel = None
-        target = None
-        ts_dir = None
-        agent = None
-        seed = None
+        target_ref = _read_json(run_dir / "target_ref.json")
+        if normalized_repo_input is not None and not _target_ref_matches_repo(
+            target_ref, normalized_repo_input
+        ):
+            continue
+        yield _build_history_record(
+            run_dir,
+            runs_dir=source_path,
+            target_ref=target_ref,
+            embed_rank=embed_rank,
+            policy=policy,
+        )
 
-        try:
-            run_rel = normalize_agent_path(str(run_dir.relative_to(source_path)))
-            parts = run_dir.relative_to(source_path).parts
-            if len(parts) >= 4:
-                target, ts_dir, agent, seed = parts[0], parts[1], parts[2], parts[3]
-        except Exception:  # noqa: BLE001
-            run_rel = None
 
-        target_ref = _read_json(run_dir / "target_ref.json")
-        evidence_assignment, evidence_assignment_read_status = (
-            _verified_evidence_assignment_sidecar(
+def refresh_history_index(
+    runs_dir: Path,
+    *,
+    target_slug: str | None = None,
+    embed: str = "none",
+    max_embed_bytes: int = 200_000,
+) -> int | None:
+    """Bring the persistent history index of `runs_dir` up to date and return its run count.
+
+    This is the only writer of the index: it records new and changed runs, drops vanished ones
+    and caches their `iter_report_history` records for `embed`/`max_embed_bytes`.  Returns
+    `None` when the index cannot be created, for example on a read-only runs directory.
+    """
+
+    embed_rank = {"none": 0, "definitions": 1, "prompt": 2, "all": 3}.get(embed)
+    if embed_rank is None:
+        raise ValueError("embed must be one of: none, definitions, prompt, all")
+    if max_embed_bytes <= 0:
+        raise ValueError("max_embed_bytes must be > 0")
+    index = RunHistoryIndex.open(runs_dir)
+    if index is None:
+        return None
+    count = 0
+    for _ in _iter_indexed_report_history(
+        index,
+        runs_dir,
+        target_slug=target_slug,
+        normalized_repo_input=None,
+        embed=embed,
+        embed_rank=embed_rank,
+        max_embed_bytes=max_embed_bytes,
+        policy=_history_text_policy(max_embed_bytes),
+    ):
+        count += 1
+    return count
+
+
+def _target_ref_matches_repo(target_ref: Any, normalized_repo_input: str) -> bool:
+    candidate = None
+    if isinstance(target_ref, dict):
+        raw = target_ref.get("repo_input")
+        candidate = raw if isinstance(raw, str) else None
+    return candidate is not None and _normalize_repo_input(candidate) == normalized_repo_input
+
+
+def _history_stamp_paths(embed_rank: int) -> tuple[str, ...]:
+    paths = list(HISTORY_NONE_RUN_ARTIFACT_RELATIVE_PATHS)
+    if embed_rank >= 1:
+        paths.extend(HISTORY_DEFINITION_EMBED_RELATIVE_PATHS)
+    if embed_rank >= 2:
+        paths.extend(HISTORY_PROMPT_EMBED_RELATIVE_PATHS)
+    if embed_rank >= 3:
+        paths.extend(HISTORY_ALL_EMBED_RELATIVE_PATHS)
+    return tuple(paths)
+
+
+def _iter_indexed_report_history(
+    index: RunHistoryIndex,
+    runs_dir: Path,
+    *,
+    target_slug: str | None,
+    normalized_repo_input: str | None,
+    embed: str,
+    embed_rank: int,
+    max_embed_bytes: int,
+    policy: TextCapturePolicy,
+) -> Iterator[dict[str, Any]]:
+    variant = "none" if embed_rank == 0 else f"{embed}:{max_embed_bytes}"
+    stamp_paths = _history_stamp_paths(embed_rank)
+    with index:
+        uncommitted = 0
+        for run_dir, row in _sync_history_index(index, runs_dir, target_slug=target_slug):
+            if row is None:
+                target_ref = _read_json(run_dir / "target_ref.json")
+                if normalized_repo_input is None or _target_ref_matches_repo(
+                    target_ref, normalized_repo_input
+                ):
+                    yield _build_history_record(
+                        run_dir,
+                        runs_dir=runs_dir,
+                        target_ref=target_ref,
+                        embed_rank=embed_rank,
+                        policy=policy,
+                    )
+                continue
+            if normalized_repo_input is not None and row.repo_input != normalized_repo_input:
+                continue
+            # Stamp before reading so a concurrent write invalidates the stored record.
+            stamp = artifact_stamp(run_dir, stamp_paths)
+            cached = index.cached_record(row.run_rel, variant=variant, stamp=stamp)
+            if cached is not None:
+                yield {"run_dir": str(run_dir), **cached}
+                continue
+            record = _build_history_record(
                 run_dir,
-                target_ref=target_ref,
+                runs_dir=runs_dir,
+                target_ref=_read_json(run_dir / "target_ref.json"),
+                embed_rank=embed_rank,
+                policy=policy,
             )
-        )
-        if normalized_repo_input is not None:
-            candidate = None
-            if isinstance(target_ref, dict):
-                raw = target_ref.get("repo_input")
-                candidate = raw if isinstance(raw, str) else None
-            if candidate is None or _normalize_repo_input(candidate) != normalized_repo_input:
-                continue
+            index.store_record(
+                row.run_rel,
+                variant=variant,
+                stamp=stamp,
+                record={key: value for key, value in record.items() if key != "run_dir"},
+            )
+            uncommitted += 1
+            if uncommitted >= _INDEX_COMMIT_INTERVAL:
+                index.commit()
+                uncommitted = 0
+            yield record
 
-        effective_run_spec = _read_json(run_dir / "effective_run_spec.json")
-        report_read = _read_json_artifact(run_dir / "report.json")
-        report = report_read.value
-        metrics = _read_json(run_dir / "metrics.json")
-        preflight = _read_json(run_dir / "preflight.json")
-        error_read = _read_json_artifact(run_dir / "error.json")
-        error = error_read.value
-        report_validation_errors_read = _read_json_artifact(
-            run_dir / "report_validation_errors.json"
-        )
-        report_validation_errors = report_validation_errors_read.value
-        run_meta_read = _read_json_artifact(run_dir / "run_meta.json")
-        run_meta = run_meta_read.value
-        agent_attempts = _read_json(run_dir / "agent_attempts.json")
-        ticket_ref = _read_json(run_dir / "ticket_ref.json")
-        timing = _read_json(run_dir / "timing.json")
-        (
-            maintenance_image_cleanup,
-            maintenance_image_cleanup_read,
-            maintenance_image_cleanup_artifact_ref,
-        ) = _read_maintenance_image_cleanup_sidecar(run_dir)
-
-        agent_exit_code: int | None = None
-        if isinstance(error, dict):
-            exit_code_raw = error.get("exit_code")
-            agent_exit_code = exit_code_raw if isinstance(exit_code_raw, int) else None
-
-        status, terminal_artifact_reads = _derive_run_status(
-            report_read=report_read,
-            error_read=error_read,
-            report_validation_errors_read=report_validation_errors_read,
-            run_meta_read=run_meta_read,
+
+def _build_history_record(
+    run_dir: Path,
+    *,
+    runs_dir: Path,
+    target_ref: Any,
+    embed_rank: int,
+    policy: TextCapturePolicy,
+) -> dict[str, Any]:
+    run_rel = None
+    target = None
+    ts_dir = None
+    agent = None
+    seed = None
+
+    try:
+        run_rel = normalize_agent_path(str(run_dir.relative_to(runs_dir)))
+        parts = run_dir.relative_to(runs_dir).parts
+        if len(parts) >= 4:
+            target, ts_dir, agent, seed = parts[0], parts[1], parts[2], parts[3]
+    except Exception:  # noqa: BLE001
+        run_rel = None
+
+    evidence_assignment, evidence_assignment_read_status = (
+        _verified_evidence_assignment_sidecar(
+            run_dir,
+            target_ref=target_ref,
         )
+    )
 
-        embedded: dict[str, Any] = {}
-        embedded_capture_manifest: dict[str, Any] = {}
-        if embed_rank >= 1:
-            embedded["persona_source_md"], embedded_capture_manifest["persona_source_md"] = (
-                _capture_embedded_text(
-                    run_dir,
-                    "persona.source.md",
-                    policy=policy,
-                )
-            )
-            embedded["persona_resolved_md"], embedded_capture_manifest["persona_resolved_md"] = (
-                _capture_embedded_text(
-                    run_dir,
-                    "persona.resolved.md",
-                    policy=policy,
-                )
+    effective_run_spec = _read_json(run_dir / "effective_run_spec.json")
+    report_read = _read_json_artifact(run_dir / "report.json")
+    report = report_read.value
+    metrics = _read_json(run_dir / "metrics.json")
+    preflight = _read_json(run_dir / "preflight.json")
+    error_read = _read_json_artifact(run_dir / "error.json")
+    error = error_read.value
+    report_validation_errors_read = _read_json_artifact(
+        run_dir / "report_validation_errors.json"
+    )
+    report_validation_errors = report_validation_errors_read.value
+    run_meta_read = _read_json_artifact(run_dir / "run_meta.json")
+    run_meta = run_meta_read.value
+    agent_attempts = _read_json(run_dir / "agent_attempts.json")
+    ticket_ref = _read_json(run_dir / "ticket_ref.json")
+    timing = _read_json(run_dir / "timing.json")
+    (
+        maintenance_image_cleanup,
+        maintenance_image_cleanup_read,
+        maintenance_image_cleanup_artifact_ref,
+    ) = _read_maintenance_image_cleanup_sidecar(run_dir)
+
+    agent_exit_code: int | None = None
+    if isinstance(error, dict):
+        exit_code_raw = error.get("exit_code")
+        agent_exit_code = exit_code_raw if isinstance(exit_code_raw, int) else None
+
+    status, terminal_artifact_reads = _derive_run_status(
+        report_read=report_read,
+        error_read=error_read,
+        report_validation_errors_read=report_validation_errors_read,
+        run_meta_read=run_meta_read,
+    )
+
+    embedded: dict[str, Any] = {}
+    embedded_capture_manifest: dict[str, Any] = {}
+    if embed_rank >= 1:
+        embedded["persona_source_md"], embedded_capture_manifest["persona_source_md"] = (
+            _capture_embedded_text(
+                run_dir,
+                "persona.source.md",
+                policy=policy,
             )
-            embedded["mission_source_md"], embedded_capture_manifest["mission_source_md"] = (
-                _capture_embedded_text(
-                    run_dir,
-                    "mission.source.md",
-                    policy=policy,
-                )
+        )
+        embedded["persona_resolved_md"], embedded_capture_manifest["persona_resolved_md"] = (
+            _capture_embedded_text(
+                run_dir,
+                "persona.resolved.md",
+                policy=policy,
             )
-            embedded["mission_resolved_md"], embedded_capture_manifest["mission_resolved_md"] = (
-                _capture_embedded_text(
-                    run_dir,
-                    "mission.resolved.md",
-                    policy=policy,
-                )
+        )
+        embedded["mission_source_md"], embedded_capture_manifest["mission_source_md"] = (
+            _capture_embedded_text(
+                run_dir,
+                "mission.source.md",
+                policy=policy,
             )
-            embedded["prompt_template_md"], embedded_capture_manifest["prompt_template_md"] = (
-                _capture_embedded_text(
-                    run_dir,
-                    "prompt.template.md",
-                    policy=policy,
-                )
+        )
+        embedded["mission_resolved_md"], embedded_capture_manifest["mission_resolved_md"] = (
+            _capture_embedded_text(
+                run_dir,
+                "mission.resolved.md",
+                policy=policy,
             )
-            embedded["report_schema_json"] = _read_json(run_dir / "report.schema.json")
-        if embed_rank >= 2:
-            embedded["prompt_txt"], embedded_capture_manifest["prompt_txt"] = (
-                _capture_embedded_text(
-                    run_dir,
-                    "prompt.txt",
-                    policy=policy,
-                )
+        )
+        embedded["prompt_template_md"], embedded_capture_manifest["prompt_template_md"] = (
+            _capture_embedded_text(
+                run_dir,
+                "prompt.template.md",
+                policy=policy,
             )
-        if embed_rank >= 3:
-            embedded["users_md"], embedded_capture_manifest["users_md"] = _capture_embedded_text(
+        )
+        embedded["report_schema_json"] = _read_json(run_dir / "report.schema.json")
+    if embed_rank >= 2:
+        embedded["prompt_txt"], embedded_capture_manifest["prompt_txt"] = (
+            _capture_embedded_text(
                 run_dir,
-                "users.md",
+                "prompt.txt",
                 policy=policy,
             )
+        )
+    if embed_rank >= 3:
+        embedded["users_md"], embedded_capture_manifest["users_md"] = _capture_embedded_text(
+            run_dir,
+            "users.md",
+            policy=policy,
+        )
+
+    ts_utc = _parse_timestamp_dirname(ts_dir) if isinstance(ts_dir, str) else None
+
+    return {
+        "run_dir": str(run_dir),
+        "run_rel": run_rel,
+        "target_slug": target,
+        "timestamp_dir": ts_dir,
+        "timestamp_utc": ts_utc,
+        "agent": agent,
+        "seed": int(seed) if isinstance(seed, str) and seed.isdigit() else seed,
+        "status": status,
+        "agent_exit_code": agent_exit_code,
+        "target_ref": target_ref,
+        "evidence_assignment": evidence_assignment,
+        "evidence_assignment_read_status": evidence_assignment_read_status,
+        "effective_run_spec": effective_run_spec,
+        "report": report,
+        "metrics": metrics,
+        "preflight": preflight,
+        "error": error,
+        "report_validation_errors": report_validation_errors,
+        "run_meta": run_meta,
+        "agent_attempts": agent_attempts,
+        "ticket_ref": ticket_ref if isinstance(ticket_ref, dict) else None,
+        "timing": timing if isinstance(timing, dict) else None,
+        "maintenance_image_cleanup": maintenance_image_cleanup,
+        "maintenance_image_cleanup_read": maintenance_image_cleanup_read,
+        "maintenance_image_cleanup_artifact_ref": (
+            maintenance_image_cleanup_artifact_ref
+        ),
+        "terminal_artifact_reads": terminal_artifact_reads,
+        "embedded": embedded,
+        "embedded_capture_manifest": embedded_capture_manifest,
+    }
 
-        ts_utc = _parse_timestamp_dirname(ts_dir) if isinstance(ts_dir, str) else None
-
-        yield {
-            "run_dir": str(run_dir),
-            "run_rel": run_rel,
-            "target_slug": target,
-            "timestamp_dir": ts_dir,
-            "timestamp_utc": ts_utc,
-            "agent": agent,
-            "seed": int(seed) if isinstance(seed, str) and seed.isdigit() else seed,
-            "status": status,
-            "agent_exit_code": agent_exit_code,
-            "target_ref": target_ref,
-            "evidence_assignment": evidence_assignment,
-            "evidence_assignment_read_status": evidence_assignment_read_status,
-            "effective_run_spec": effective_run_spec,
-            "report": report,
-            "metrics": metrics,
-            "preflight": preflight,
-            "error": error,
-            "report_validation_errors": report_validation_errors,
-            "run_meta": run_meta,
-            "agent_attempts": agent_attempts,
-            "ticket_ref": ticket_ref if isinstance(ticket_ref, dict) else None,
-            "timing": timing if isinstance(timing, dict) else None,
-            "maintenance_image_cleanup": maintenance_image_cleanup,
-            "maintenance_image_cleanup_read": maintenance_image_cleanup_read,
-            "maintenance_image_cleanup_artifact_ref": (
-                maintenance_image_cleanup_artifact_ref
-            ),
-            "terminal_artifact_reads": terminal_artifact_reads,
-            "embedded": embedded,
-            "embedded_capture_manifest": embedded_capture_manifest,
-        }
 
 
 def write_report_history_jsonl(
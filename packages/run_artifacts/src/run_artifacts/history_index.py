@@ -0,0 +1,336 @@
+"""Persistent index of run-history records under ``<runs_dir>/_index``.
+
+``iter_report_history`` and ``select_recent_run_dirs`` re-read and re-parse every run's JSON
+artifacts on each call.  :class:`RunHistoryIndex` stores, per run, the path-derived identifiers,
+the normalized ``repo_input`` and the fully built history record, each tagged with a *stamp* of
+the size and mtime of the artifacts it was derived from.  It also stores the mtime and child
+listing of every directory of the ``<target>/<timestamp>/<agent>/<seed>`` layout, so a refresh
+only lists directories whose mtime changed and otherwise costs one ``stat`` per directory plus
+the artifact stamps.
+
+The index lives in ``<runs_dir>/_index/run_history.sqlite``; directories starting with ``_`` are
+already skipped by :func:`run_artifacts.history.iter_run_dirs`.  It is written only by
+:func:`run_artifacts.history.refresh_history_index` (the runner calls it when a run finishes).
+History reads open it read-only and re-read whatever it has not caught up with.  The index is a
+cache only: it can be deleted at any time, and callers fall back to scanning without it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+__all__ = [
+    "HISTORY_INDEX_DIRNAME",
+    "HISTORY_INDEX_FILENAME",
+    "IndexedRun",
+    "RunHistoryIndex",
+    "artifact_stamp",
+]
+
+HISTORY_INDEX_DIRNAME = "_index"
+HISTORY_INDEX_FILENAME = "run_history.sqlite"
+_SCHEMA_VERSION = 2
+_BUSY_TIMEOUT_SECONDS = 30.0
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_rel TEXT PRIMARY KEY,
+    target_slug TEXT NOT NULL,
+    timestamp_dir TEXT,
+    agent TEXT NOT NULL,
+    seed TEXT NOT NULL,
+    repo_input TEXT,
+    target_ref_stamp TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_by_target_time ON runs (target_slug, timestamp_dir, run_rel);
+CREATE INDEX IF NOT EXISTS runs_by_repo_time ON runs (repo_input, timestamp_dir, run_rel);
+CREATE TABLE IF NOT EXISTS dirs (
+    rel TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    entries TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS records (
+    run_rel TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    stamp TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (run_rel, variant)
+) WITHOUT ROWID;
+"""
+
+
+def artifact_stamp(run_dir: Path, relative_paths: Iterable[str]) -> str:
+    """Return a compact fingerprint of size and mtime for *relative_paths* under *run_dir*."""
+
+    parts: list[list[Any]] = []
+    for relative in relative_paths:
+        try:
+            stat = os.stat(run_dir / relative)
+        except OSError:
+            parts.append([relative])
+            continue
+        parts.append([relative, stat.st_size, stat.st_mtime_ns])
+    return json.dumps(parts, separators=(",", ":"))
+
+
+@dataclass(frozen=True)
+class IndexedRun:
+    run_rel: str
+    target_slug: str
+    timestamp_dir: str | None
+    agent: str
+    seed: str
+    repo_input: str | None
+    target_ref_stamp: str
+
+
+class RunHistoryIndex:
+    """SQLite-backed cache of run identifiers, directory listings and parsed history records.
+
+    Use :meth:`open`, which returns ``None`` when the index cannot be created (for example on
+    a read-only runs directory) or, with ``readonly=True``, when it does not exist yet.  On a
+    read-only index the ``sync_*`` and ``store_*`` methods do nothing.  Write failures after
+    opening are ignored; the affected runs are simply re-read on the next call.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, path: Path, *, readonly: bool) -> None:
+        self._connection = connection
+        self.path = path
+        self.readonly = readonly
+
+    @classmethod
+    def open(cls, runs_dir: Path, *, readonly: bool = False) -> RunHistoryIndex | None:
+        path = runs_dir / HISTORY_INDEX_DIRNAME / HISTORY_INDEX_FILENAME
+        connection: sqlite3.Connection | None = None
+        try:
+            if not runs_dir.is_dir():
+                return None
+            if readonly:
+                if not path.is_file():
+                    return None
+                connection = sqlite3.connect(
+                    f"{path.resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    timeout=_BUSY_TIMEOUT_SECONDS,
+                )
+                if connection.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                    connection.close()
+                    return None
+                return cls(connection, path, readonly=True)
+            path.parent.mkdir(exist_ok=True)
+            connection = sqlite3.connect(path, timeout=_BUSY_TIMEOUT_SECONDS)
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, _SCHEMA_VERSION):
+                connection.executescript(
+                    "DROP TABLE IF EXISTS runs; DROP TABLE IF EXISTS dirs; "
+                    "DROP TABLE IF EXISTS records;"
+                )
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            connection.commit()
+        except (OSError, ValueError, sqlite3.Error):
+            if connection is not None:
+                connection.close()
+            return None
+        return cls(connection, path, readonly=False)
+
+    def close(self) -> None:
+        try:
+            self._connection.commit()
+        except sqlite3.Error:
+            pass
+        self._connection.close()
+
+    def __enter__(self) -> RunHistoryIndex:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def commit(self) -> None:
+        try:
+            self._connection.commit()
+        except sqlite3.Error:
+            pass
+
+    def runs(self, *, target_slug: str | None = None) -> dict[str, IndexedRun]:
+        """Return indexed runs keyed by ``run_rel``, optionally for one target."""
+
+        sql = (
+            "SELECT run_rel, target_slug, timestamp_dir, agent, seed, repo_input, "
+            "target_ref_stamp FROM runs"
+        )
+        params: tuple[str, ...] = ()
+        if target_slug is not None:
+            sql += " WHERE target_slug = ?"
+            params = (target_slug,)
+        try:
+            rows = self._connection.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            return {}
+        return {row[0]: IndexedRun(*row) for row in rows}
+
+    def dirs(self, *, prefix: str | None = None) -> dict[str, tuple[int, list[str]]]:
+        """Return stored ``(mtime_ns, entries)`` keyed by directory path relative to the runs dir.
+
+        With *prefix*, only that directory and the directories below it are returned.
+        """
+
+        sql = "SELECT rel, mtime_ns, entries FROM dirs"
+        params: tuple[Any, ...] = ()
+        if prefix is not None:
+            sql += " WHERE rel = ? OR substr(rel, 1, ?) = ?"
+            params = (prefix, len(prefix) + 1, f"{prefix}/")
+        try:
+            rows = self._connection.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            return {}
+        out: dict[str, tuple[int, list[str]]] = {}
+        for rel, mtime_ns, entries_raw in rows:
+            try:
+                entries = json.loads(entries_raw)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entries, list):
+                out[rel] = (int(mtime_ns), [str(entry) for entry in entries])
+        return out
+
+    def sync_dirs(
+        self,
+        *,
+        upserts: dict[str, tuple[int, list[str]]],
+        removals: Sequence[str],
+    ) -> None:
+        if self.readonly:
+            return
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)",
+                    [
+                        (rel, mtime_ns, json.dumps(entries, ensure_ascii=False))
+                        for rel, (mtime_ns, entries) in upserts.items()
+                    ],
+                )
+                self._connection.executemany(
+                    "DELETE FROM dirs WHERE rel = ?", [(rel,) for rel in removals]
+                )
+        except sqlite3.Error:
+            pass
+
+    def sync_runs(self, *, upserts: Sequence[IndexedRun], removals: Sequence[str]) -> None:
+        if self.readonly:
+            return
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            run.run_rel,
+                            run.target_slug,
+                            run.timestamp_dir,
+                            run.agent,
+                            run.seed,
+                            run.repo_input,
+                            run.target_ref_stamp,
+                        )
+                        for run in upserts
+                    ],
+                )
+                for table in ("runs", "records"):
+                    self._connection.executemany(
+                        f"DELETE FROM {table} WHERE run_rel = ?",
+                        [(run_rel,) for run_rel in removals],
+                    )
+        except sqlite3.Error:
+            pass
+
+    def select_run_rels(
+        self,
+        *,
+        target_slug: str | None = None,
+        repo_input: str | None = None,
+        agent: str | None = None,
+        since_timestamp_dir: str | None = None,
+        until_timestamp_dir: str | None = None,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Return ``run_rel`` values ordered oldest to newest, keeping the newest *limit*.
+
+        *repo_input* must already be normalized the way the history module normalizes it;
+        the timestamp bounds are inclusive ``YYYYMMDDTHHMMSSZ`` directory names.  Runs whose
+        timestamp directory does not match that format are excluded.
+        """
+
+        clauses = ["timestamp_dir IS NOT NULL"]
+        params: list[Any] = []
+        for column, value in (
+            ("target_slug", target_slug),
+            ("repo_input", repo_input),
+            ("agent", agent),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since_timestamp_dir is not None:
+            clauses.append("timestamp_dir >= ?")
+            params.append(since_timestamp_dir)
+        if until_timestamp_dir is not None:
+            clauses.append("timestamp_dir <= ?")
+            params.append(until_timestamp_dir)
+        sql = (
+            "SELECT run_rel FROM runs WHERE "
+            + " AND ".join(clauses)
+            + " ORDER BY timestamp_dir DESC, run_rel DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        rows = self._connection.execute(sql, params).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def cached_record(self, run_rel: str, *, variant: str, stamp: str) -> dict[str, Any] | None:
+        try:
+            row = self._connection.execute(
+                "SELECT stamp, record FROM records WHERE run_rel = ? AND variant = ?",
+                (run_rel, variant),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[0] != stamp:
+            return None
+        try:
+            record = json.loads(row[1])
+        except json.JSONDecodeError:
+            return None
+        return record if isinstance(record, dict) else None
+
+    def store_record(
+        self,
+        run_rel: str,
+        *,
+        variant: str,
+        stamp: str,
+        record: dict[str, Any],
+    ) -> None:
+        if self.readonly:
+            return
+        try:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                (run_rel, variant, stamp, json.dumps(record, ensure_ascii=False)),
+            )
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
@@ -1692,9 +1692,13 @@ def _read_jsonl_objects(
     path: Path,
     *,
     repair_truncated_tail: bool = False,
+    start_offset: int = 0,
 ) -> tuple[list[Mapping[str, Any]], bool]:
     try:
-        payload = path.read_bytes()
+        with path.open("rb") as handle:
+            if start_offset:
+                handle.seek(start_offset)
+            payload = handle.read()
     except FileNotFoundError:
         return [], False
     except OSError as exc:
@@ -1702,9 +1706,10 @@ def _read_jsonl_objects(
     if not payload:
         return [], False
     objects: list[Mapping[str, Any]] = []
-    offset = 0
+    offset = start_offset
     repaired = False
     lines = payload.splitlines(keepends=True)
+    location = "" if not start_offset else f" (after byte {start_offset})"
     for line_number, line in enumerate(lines, start=1):
         terminated = line.endswith((b"\n", b"\r"))
         stripped = line.strip()
@@ -1730,7 +1735,7 @@ def _read_jsonl_objects(
                 repaired = True
                 break
             raise TelemetryArtifactError(
-                f"invalid lifecycle event JSON at {path}:{line_number}: {exc}"
+                f"invalid lifecycle event JSON at {path}:{line_number}{location}: {exc}"
             ) from exc
         objects.append(obj)
         offset = next_offset
@@ -1761,79 +1766,258 @@ def read_lifecycle_events(path: Path) -> list[LifecycleEvent]:
     return events
 
 
+_EVENT_INDEX_SCHEMA_VERSION = 1
+_EVENT_INDEX_TAIL_BYTES = 4096
+_EVENT_INDEX_CACHE: dict[str, tuple[tuple[int, int, int], _LifecycleEventIndex]] = {}
+
+
+@dataclass
+class _LifecycleEventIndex:
+    """Append-time view of a lifecycle event log, valid up to ``log_size`` bytes.
+
+    The index is persisted next to the log as ``<log>.index`` (one JSON record per
+    event plus a checkpoint record per append) so appends do not re-parse every
+    retained event. It is a cache: any mismatch with the log triggers a rebuild.
+    """
+
+    log_size: int = 0
+    tail_sha256: str = field(default_factory=lambda: sha256(b"").hexdigest())
+    digest_by_event_id: dict[str, str] = field(default_factory=dict)
+    idempotency_keys: set[str] = field(default_factory=set)
+    action_by_work_unit: dict[str, str] = field(default_factory=dict)
+    work_unit_by_action: dict[str, str] = field(default_factory=dict)
+
+    def bind_action(self, work_unit_id: str, action_id: str) -> None:
+        existing_action = self.action_by_work_unit.get(work_unit_id)
+        if existing_action is not None and existing_action != action_id:
+            raise IdempotencyConflictError(
+                f"work_unit_id {work_unit_id!r} is already bound to action "
+                f"{existing_action!r}; cannot bind it to {action_id!r}"
+            )
+        existing_work = self.work_unit_by_action.get(action_id)
+        if existing_work is not None and existing_work != work_unit_id:
+            raise IdempotencyConflictError(
+                f"action_id {action_id!r} is already bound to work unit "
+                f"{existing_work!r}; cannot bind it to {work_unit_id!r}"
+            )
+        self.action_by_work_unit[work_unit_id] = action_id
+        self.work_unit_by_action[action_id] = work_unit_id
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        binding = record.get("binding")
+        if binding:
+            work_unit_id, action_id = binding
+            self.bind_action(str(work_unit_id), str(action_id))
+        self.digest_by_event_id[record["event_id"]] = record["sha256"]
+        self.idempotency_keys.add(record["idempotency_key"])
+
+    def checkpoint(self) -> dict[str, Any]:
+        return {
+            "checkpoint": {
+                "schema_version": _EVENT_INDEX_SCHEMA_VERSION,
+                "log_size": self.log_size,
+                "tail_sha256": self.tail_sha256,
+            }
+        }
+
+
+def _event_index_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.index")
+
+
+def _event_index_record(event: LifecycleEvent) -> dict[str, Any]:
+    binding: list[str] | None = None
+    if event.event_type.startswith("action."):
+        action_id = str(event.attributes.get("action_id") or "").strip()
+        work_unit_id = event.context.work_unit_id
+        if action_id and work_unit_id is not None:
+            binding = [work_unit_id, action_id]
+    return {
+        "event_id": event.event_id,
+        "idempotency_key": event.idempotency_key,
+        "sha256": canonical_sha256(event.to_dict()),
+        "binding": binding,
+    }
+
+
+def _log_tail_sha256(path: Path, end: int) -> str | None:
+    start = max(0, end - _EVENT_INDEX_TAIL_BYTES)
+    try:
+        with path.open("rb") as handle:
+            handle.seek(start)
+            tail = handle.read(end - start)
+    except FileNotFoundError:
+        tail = b""
+    except OSError:
+        return None
+    if len(tail) != end - start:
+        return None
+    return sha256(tail).hexdigest()
+
+
+def _index_stamp(index_path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = index_path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _load_event_index(index_path: Path) -> _LifecycleEventIndex | None:
+    """Return the persisted index, or ``None`` when it is missing or unusable."""
+
+    stamp = _index_stamp(index_path)
+    if stamp is None:
+        return None
+    cached = _EVENT_INDEX_CACHE.get(str(index_path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        payload = index_path.read_bytes()
+    except OSError:
+        return None
+    if not payload.endswith(b"\n"):
+        return None
+    index = _LifecycleEventIndex()
+    checkpointed = False
+    try:
+        for line in payload.splitlines():
+            record = json.loads(line)
+            checkpoint = record.get("checkpoint")
+            if checkpoint is None:
+                index.add(record)
+                checkpointed = False
+                continue
+            if checkpoint.get("schema_version") != _EVENT_INDEX_SCHEMA_VERSION:
+                return None
+            index.log_size = int(checkpoint["log_size"])
+            index.tail_sha256 = str(checkpoint["tail_sha256"])
+            checkpointed = True
+    except (ValueError, TypeError, KeyError, AttributeError, TelemetryArtifactError):
+        return None
+    if not checkpointed:
+        return None
+    _EVENT_INDEX_CACHE[str(index_path)] = (stamp, index)
+    return index
+
+
+def _store_event_index(
+    index_path: Path,
+    index: _LifecycleEventIndex,
+    records: Sequence[Mapping[str, Any]],
+    *,
+    rewrite: bool,
+) -> None:
+    lines = [*records, index.checkpoint()]
+    payload = "".join(canonical_json(line) + "\n" for line in lines).encode("utf-8")
+    try:
+        if rewrite:
+            _atomic_write_bytes(index_path, payload)
+        else:
+            descriptor = os.open(index_path, os.O_CREAT | os.O_APPEND | os.O_WRONLY, 0o600)
+            try:
+                view = memoryview(payload)
+                while view:
+                    written = os.write(descriptor, view)
+                    if written <= 0:
+                        raise OSError(f"short write while appending {index_path}")
+                    view = view[written:]
+            finally:
+                os.close(descriptor)
+    except (OSError, TelemetryArtifactError):
+        # The index only accelerates appends; a failed update is recovered by
+        # the rebuild that the next append performs when the index is stale.
+        _EVENT_INDEX_CACHE.pop(str(index_path), None)
+        return
+    stamp = _index_stamp(index_path)
+    if stamp is None:
+        _EVENT_INDEX_CACHE.pop(str(index_path), None)
+    else:
+        _EVENT_INDEX_CACHE[str(index_path)] = (stamp, index)
+
+
 def append_lifecycle_events(
     path: Path,
     events: Sequence[LifecycleEvent | Mapping[str, Any]],
     *,
     lock_timeout_seconds: float = 10.0,
 ) -> int:
-    """Append validated events in one durable write and return the inserted count."""
+    """Append validated events in one durable write and return the inserted count.
+
+    Duplicate and binding checks run against the ``<log>.index`` sidecar, which is
+    verified against the log size and a hash of its tail. Only bytes written after
+    the indexed offset are re-parsed; a missing or mismatched index is rebuilt
+    from the full log.
+    """
 
     validated_events = [validate_lifecycle_event(event) for event in events]
     if not validated_events:
         return 0
     path.parent.mkdir(parents=True, exist_ok=True)
+    index_path = _event_index_path(path)
     with _artifact_lock(path, timeout_seconds=lock_timeout_seconds):
-        objects, repaired = _read_jsonl_objects(path, repair_truncated_tail=True)
-        existing_by_event_id: dict[str, LifecycleEvent] = {}
-        idempotency_keys: set[str] = set()
-        action_by_work_unit: dict[str, str] = {}
-        work_unit_by_action: dict[str, str] = {}
-
-        def register_action_binding(event: LifecycleEvent) -> None:
-            if not event.event_type.startswith("action."):
-                return
-            action_id = str(event.attributes.get("action_id") or "").strip()
-            work_unit_id = event.context.work_unit_id
-            if not action_id or work_unit_id is None:
-                return
-            existing_action = action_by_work_unit.get(work_unit_id)
-            if existing_action is not None and existing_action != action_id:
-                raise IdempotencyConflictError(
-                    f"work_unit_id {work_unit_id!r} is already bound to action "
-                    f"{existing_action!r}; cannot bind it to {action_id!r}"
-                )
-            existing_work = work_unit_by_action.get(action_id)
-            if existing_work is not None and existing_work != work_unit_id:
-                raise IdempotencyConflictError(
-                    f"action_id {action_id!r} is already bound to work unit "
-                    f"{existing_work!r}; cannot bind it to {work_unit_id!r}"
-                )
-            action_by_work_unit[work_unit_id] = action_id
-            work_unit_by_action[action_id] = work_unit_id
+        try:
+            return _append_lifecycle_events_locked(path, index_path, validated_events)
+        except BaseException:
+            # Checks mutate the cached index in place; never reuse it after a failure.
+            _EVENT_INDEX_CACHE.pop(str(index_path), None)
+            raise
 
-        for raw in objects:
-            retained_event = LifecycleEvent.from_dict(raw)
-            if retained_event.event_id in existing_by_event_id:
-                raise TelemetryArtifactError(
-                    f"duplicate event_id in {path}: {retained_event.event_id}"
-                )
-            if retained_event.idempotency_key in idempotency_keys:
-                raise TelemetryArtifactError(
-                    f"duplicate idempotency_key in {path}: {retained_event.idempotency_key}"
+
+def _append_lifecycle_events_locked(
+    path: Path,
+    index_path: Path,
+    validated_events: Sequence[LifecycleEvent],
+) -> int:
+    try:
+        log_size = path.stat().st_size
+    except FileNotFoundError:
+        log_size = 0
+    except OSError as exc:
+        raise TelemetryArtifactError(f"cannot stat lifecycle event log {path}: {exc}") from exc
+    loaded_index = _load_event_index(index_path)
+    rewrite_index = (
+        loaded_index is None
+        or loaded_index.log_size > log_size
+        or _log_tail_sha256(path, loaded_index.log_size) != loaded_index.tail_sha256
+    )
+    index = _LifecycleEventIndex() if loaded_index is None or rewrite_index else loaded_index
+    objects, repaired = _read_jsonl_objects(
+        path, repair_truncated_tail=True, start_offset=index.log_size
+    )
+
+    index_records: list[dict[str, Any]] = []
+    for raw in objects:
+        retained_event = LifecycleEvent.from_dict(raw)
+        if retained_event.event_id in index.digest_by_event_id:
+            raise TelemetryArtifactError(
+                f"duplicate event_id in {path}: {retained_event.event_id}"
+            )
+        if retained_event.idempotency_key in index.idempotency_keys:
+            raise TelemetryArtifactError(
+                f"duplicate idempotency_key in {path}: {retained_event.idempotency_key}"
+            )
+        record = _event_index_record(retained_event)
+        index.add(record)
+        index_records.append(record)
+
+    inserted: list[LifecycleEvent] = []
+    for validated in validated_events:
+        record = _event_index_record(validated)
+        matching_digest = index.digest_by_event_id.get(validated.event_id)
+        if matching_digest is not None:
+            if matching_digest != record["sha256"]:
+                raise IdempotencyConflictError(
+                    f"event_id {validated.event_id!r} already has different content"
                 )
-            existing_by_event_id[retained_event.event_id] = retained_event
-            idempotency_keys.add(retained_event.idempotency_key)
-            register_action_binding(retained_event)
-
-        inserted: list[LifecycleEvent] = []
-        for validated in validated_events:
-            matching_event = existing_by_event_id.get(validated.event_id)
-            if matching_event is not None:
-                if matching_event.to_dict() != validated.to_dict():
-                    raise IdempotencyConflictError(
-                        f"event_id {validated.event_id!r} already has different content"
-                    )
-                continue
-            if validated.idempotency_key in idempotency_keys:
-                continue
-            register_action_binding(validated)
-            existing_by_event_id[validated.event_id] = validated
-            idempotency_keys.add(validated.idempotency_key)
-            inserted.append(validated)
+            continue
+        if validated.idempotency_key in index.idempotency_keys:
+            continue
+        index.add(record)
+        index_records.append(record)
+        inserted.append(validated)
 
-        if not inserted:
-            return 0
+    if inserted:
         lines = b"".join(
             (canonical_json(event.to_dict()) + "\n").encode("utf-8")
             for event in inserted
@@ -1861,6 +2045,19 @@ def append_lifecycle_events(
                 f"cannot append lifecycle events to {path}: {exc}"
             ) from exc
         _fsync_directory(path.parent)
+    elif not index_records and not rewrite_index and not repaired:
+        return 0
+
+    try:
+        index.log_size = path.stat().st_size
+    except FileNotFoundError:
+        index.log_size = 0
+    tail_sha256 = _log_tail_sha256(path, index.log_size)
+    if tail_sha256 is None:
+        _EVENT_INDEX_CACHE.pop(str(index_path), None)
+        return len(inserted)
+    index.tail_sha256 = tail_sha256
+    _store_event_index(index_path, index, index_records, rewrite=rewrite_index)
     return len(inserted)
 
 
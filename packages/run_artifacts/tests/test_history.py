@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import json
+import os
+import time
+from collections.abc import Iterator
 from hashlib import sha256
 from pathlib import Path
 
+import pytest
+
+import run_artifacts.history as history_mod
 from run_artifacts.history import (
     HISTORY_RUN_ARTIFACT_RELATIVE_PATHS,
     MAINTENANCE_IMAGE_CLEANUP_ARTIFACT_PATH,
     iter_report_history,
     load_run_record,
+    refresh_history_index,
     select_recent_run_dirs,
     write_report_history_jsonl,
 )
@@ -230,6 +237,129 @@ def test_select_recent_run_dirs_orders_and_limits(tmp_path: Path) -> None:
     assert selected[1].parts[-4:] == ("tiktok_vids", "20260103T000000Z", "codex", "0")
 
 
+def _write_indexed_runs(runs_dir: Path) -> list[Path]:
+    run_dirs: list[Path] = []
+    for ts_dir, agent, repo in (
+        ("20260101T000000Z", "codex", "C:/repo/a"),
+        ("20260102T000000Z", "claude", "C:/repo/b"),
+        ("20260103T000000Z", "codex", "C:/repo/a"),
+    ):
+        run_dir = runs_dir / "target_a" / ts_dir / agent / "0"
+        run_dir.mkdir(parents=True)
+        _write_json(run_dir / "target_ref.json", {"repo_input": repo, "agent": agent})
+        _write_json(run_dir / "metrics.json", {"commands_executed": 1})
+        (run_dir / "persona.source.md").write_text("persona\n", encoding="utf-8")
+        run_dirs.append(run_dir)
+    return run_dirs
+
+
+def test_iter_report_history_index_matches_scan_and_rereads_only_changed_runs(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    runs_dir = tmp_path / "runs"
+    run_dirs = _write_indexed_runs(runs_dir)
+    built: list[str] = []
+    real_build = history_mod._build_history_record
+
+    def _counting_build(run_dir: Path, **kwargs: object) -> dict[str, object]:
+        built.append(run_dir.parts[-3])
+        return real_build(run_dir, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(history_mod, "_build_history_record", _counting_build)
+
+    scanned = list(iter_report_history(runs_dir, use_index=False))
+    built.clear()
+    assert list(iter_report_history(runs_dir)) == scanned
+    assert not (runs_dir / "_index").exists()
+    assert len(built) == 3
+
+    built.clear()
+    assert refresh_history_index(runs_dir, embed="definitions") == 3
+    assert (runs_dir / "_index" / "run_history.sqlite").is_file()
+    assert len(built) == 3
+
+    built.clear()
+    assert list(iter_report_history(runs_dir)) == scanned
+    assert built == []
+
+    _write_json(run_dirs[1] / "metrics.json", {"commands_executed": 22})
+    stat = (run_dirs[1] / "metrics.json").stat()
+    os.utime(run_dirs[1] / "metrics.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    for child in sorted(run_dirs[0].iterdir()):
+        child.unlink()
+    run_dirs[0].rmdir()
+    built.clear()
+    refreshed = list(iter_report_history(runs_dir))
+    assert built == ["20260102T000000Z"]
+    assert refreshed == list(iter_report_history(runs_dir, use_index=False))
+    assert [item["metrics"]["commands_executed"] for item in refreshed] == [22, 1]
+
+
+def test_history_index_lists_only_directories_whose_mtime_changed(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    runs_dir = tmp_path / "runs"
+    run_dirs = _write_indexed_runs(runs_dir)
+    # Creating ``_index`` touches the runs dir, so create it before settling the mtimes.
+    index = history_mod.RunHistoryIndex.open(runs_dir)
+    assert index is not None
+    index.close()
+    settled_ns = time.time_ns() - 3600 * 10**9
+    for path in [runs_dir, *sorted(runs_dir.rglob("*"))]:
+        if path.is_dir():
+            os.utime(path, ns=(settled_ns, settled_ns))
+    assert refresh_history_index(runs_dir, embed="none") == 3
+
+    listed: list[str] = []
+    real_iterdir = Path.iterdir
+
+    def _counting_iterdir(self: Path) -> Iterator[Path]:
+        listed.append(self.name)
+        return real_iterdir(self)
+
+    monkeypatch.setattr(Path, "iterdir", _counting_iterdir)
+    assert select_recent_run_dirs(runs_dir, limit=5) == run_dirs
+    assert listed == []
+
+    new_run = runs_dir / "target_a" / "20260103T000000Z" / "codex" / "1"
+    new_run.mkdir()
+    _write_json(new_run / "target_ref.json", {"repo_input": "C:/repo/a"})
+    assert select_recent_run_dirs(runs_dir, repo_input="C:/repo/a", limit=5) == [
+        run_dirs[0],
+        run_dirs[2],
+        new_run,
+    ]
+    assert listed == ["codex"]
+
+
+def test_select_recent_run_dirs_filters_repo_from_index(tmp_path: Path) -> None:
+    runs_dir = tmp_path / "runs"
+    run_dirs = _write_indexed_runs(runs_dir)
+
+    for use_index in (False, True, True):
+        assert select_recent_run_dirs(
+            runs_dir, repo_input="C:/repo/a", limit=5, use_index=use_index
+        ) == [run_dirs[0], run_dirs[2]]
+        assert select_recent_run_dirs(
+            runs_dir, target_slug="target_a", limit=1, use_index=use_index
+        ) == [run_dirs[2]]
+
+    _write_json(run_dirs[1] / "target_ref.json", {"repo_input": "C:/repo/a", "moved": True})
+    assert select_recent_run_dirs(runs_dir, repo_input="C:/repo/a", limit=5) == run_dirs
+
+    assert refresh_history_index(runs_dir) == 3
+    index = history_mod.RunHistoryIndex.open(runs_dir)
+    assert index is not None
+    with index:
+        assert index.select_run_rels(agent="claude") == ["target_a/20260102T000000Z/claude/0"]
+        assert index.select_run_rels(since_timestamp_dir="20260102T000000Z") == [
+            "target_a/20260102T000000Z/claude/0",
+            "target_a/20260103T000000Z/codex/0",
+        ]
+
+
 def test_iter_report_history_distinguishes_nonterminal_missing_report_and_unreadable_artifacts(
     tmp_path: Path,
 ) -> None:
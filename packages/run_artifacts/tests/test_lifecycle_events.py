@@ -328,6 +328,52 @@ def test_jsonl_append_serializes_concurrent_writers(tmp_path: Path) -> None:
     assert {event.event_id for event in loaded} == {event.event_id for event in events}
 
 
+def test_jsonl_append_uses_index_instead_of_reparsing_retained_events(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "lifecycle_events.jsonl"
+    first = _event()
+    assert append_lifecycle_event(path, first)
+    assert (tmp_path / "lifecycle_events.jsonl.index").is_file()
+
+    parsed: list[str] = []
+    original_from_dict = LifecycleEvent.from_dict.__func__  # type: ignore[attr-defined]
+
+    def _counting_from_dict(cls: type[LifecycleEvent], raw: dict[str, object]) -> LifecycleEvent:
+        parsed.append(str(raw.get("event_id")))
+        return original_from_dict(cls, raw)
+
+    monkeypatch.setattr(LifecycleEvent, "from_dict", classmethod(_counting_from_dict))
+    second = _event("event-2", "case-1:stage-1:completed", occurred_at=T1)
+    assert append_lifecycle_event(path, second)
+    assert append_lifecycle_event(path, first) is False
+    assert parsed == []
+
+    external = _event("event-3", "case-1:stage-1:external", occurred_at=T2)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(external.to_dict()) + "\n")
+    assert append_lifecycle_event(path, external) is False
+    assert parsed == ["event-3"]
+    monkeypatch.undo()
+    assert read_lifecycle_events(path) == [first, second, external]
+
+
+def test_jsonl_append_rebuilds_a_stale_index(tmp_path: Path) -> None:
+    path = tmp_path / "lifecycle_events.jsonl"
+    first = _event()
+    second = _event("event-2", "case-1:stage-1:completed", occurred_at=T1)
+    assert append_lifecycle_events(path, (first, second)) == 2
+
+    path.write_text(json.dumps(second.to_dict()) + "\n", encoding="utf-8")
+    assert append_lifecycle_event(path, first) is True
+    assert read_lifecycle_events(path) == [second, first]
+
+    (tmp_path / "lifecycle_events.jsonl.index").write_bytes(b'{"truncated')
+    with pytest.raises(IdempotencyConflictError, match="different content"):
+        append_lifecycle_event(path, replace(first, event_type="stage.completed"))
+    assert append_lifecycle_event(path, first) is False
+
+
 @pytest.mark.skipif(os.name != "nt", reason="Windows lock contention semantics")
 def test_jsonl_append_retries_windows_lock_permission_race(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
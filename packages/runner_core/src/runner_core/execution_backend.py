@@ -16,7 +16,9 @@ from typing import TYPE_CHECKING, Any, Literal, cast
 
 import yaml
 from sandbox_runner import DockerSandbox, MountSpec, SandboxInstance, SandboxSpec
+from sandbox_runner.docker import DockerSandboxInstance
 from sandbox_runner.image_hash import compute_image_hash
+from sandbox_runner.pool import shared_docker_sandbox_pool
 
 if TYPE_CHECKING:
     from runner_core.runner import RunRequest
@@ -1792,12 +1794,18 @@ def prepare_execution_backend(
 
     container_name = f"sandbox-{workspace_id}"
     container_start_monotonic = time.monotonic()
-    instance = DockerSandbox(
-        workspace_dir=workspace_dir,
-        artifacts_dir=sandbox_dir,
-        spec=spec,
-        container_name=container_name,
-    ).start()
+    # Pooled containers only see this run's directories, bind-mounted for the checkout.
+    pool = None if keep_container else shared_docker_sandbox_pool()
+    instance: DockerSandboxInstance
+    if pool is not None:
+        instance = pool.acquire(workspace_dir, sandbox_dir, spec)
+    else:
+        instance = DockerSandbox(
+            workspace_dir=workspace_dir,
+            artifacts_dir=sandbox_dir,
+            spec=spec,
+            container_name=container_name,
+        ).start()
     container_start_seconds = max(0.0, time.monotonic() - container_start_monotonic)
 
     _update_json_artifact(
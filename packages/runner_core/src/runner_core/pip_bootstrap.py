@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
+import uuid
 from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
@@ -121,6 +125,282 @@ def _write_log(path: Path, lines: list[str]) -> None:
     path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
 
 
+VENV_TEMPLATE_SCHEMA_VERSION = 1
+_VENV_TEMPLATE_MANIFEST = "template.json"
+# Requirement lines that point at workspace files or other inputs the key cannot see.
+_NON_RELOCATABLE_REQUIREMENT = re.compile(
+    r"^(?:-e\b|--editable\b|-r\b|--requirement\b|-c\b|--constraint\b|\.|/|~|file:|[A-Za-z]:[\\/])"
+    r"|\s@\s*file:",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class _VenvTemplate:
+    key: str
+    path: Path
+    inputs: dict[str, Any]
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _resolve_venv_template(
+    *,
+    cache_dir: Path,
+    workspace_dir: Path,
+    requirements_relpath: str,
+    installer_mode: str,
+    index_url: str | None,
+    extra_index_url: str | None,
+) -> tuple[_VenvTemplate | None, str | None]:
+    """Return the content-addressed template for this install, or ``(None, reason)``."""
+
+    if os.name == "nt":
+        # Console-script launchers embed the interpreter path inside the .exe.
+        return None, "windows_launchers_not_relocatable"
+    if installer_mode == "pdm":
+        input_paths = ["pyproject.toml", "pdm.lock"]
+    else:
+        input_paths = [requirements_relpath]
+    files: dict[str, str] = {}
+    for relpath in input_paths:
+        path = workspace_dir / relpath
+        if not path.is_file():
+            return None, f"missing_input:{relpath}"
+        files[relpath] = _sha256_file(path)
+    if installer_mode == "pip":
+        try:
+            lines = (workspace_dir / requirements_relpath).read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            return None, "unreadable_requirements"
+        for line in lines:
+            stripped = line.split(" #", 1)[0].strip()
+            if stripped and not stripped.startswith("#"):
+                if _NON_RELOCATABLE_REQUIREMENT.search(stripped):
+                    return None, "workspace_relative_requirement"
+    inputs: dict[str, Any] = {
+        "installer": installer_mode,
+        "python": os.path.realpath(sys.executable),
+        "python_version": sys.version,
+        "platform": sys.platform,
+        "index_url": index_url,
+        "extra_index_url": extra_index_url,
+        "files": files,
+    }
+    key = hashlib.sha256(
+        json.dumps(inputs, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    return _VenvTemplate(key=key, path=cache_dir / key, inputs=inputs), None
+
+
+def _clone_tree(source: Path, destination: Path) -> str:
+    """Copy *source* to *destination*, sharing blocks copy-on-write where the filesystem can.
+
+    Hardlinks are not used: agents and verification commands may edit the venv in place.
+    """
+
+    cp = shutil.which("cp") if sys.platform.startswith("linux") else None
+    if cp is not None:
+        proc = subprocess.run(
+            [cp, "-a", "--reflink=auto", str(source), str(destination)],
+            capture_output=True,
+            check=False,
+        )
+        if proc.returncode == 0:
+            return "cp_reflink_auto"
+        shutil.rmtree(destination, ignore_errors=True)
+    shutil.copytree(source, destination, symlinks=True)
+    return "copytree"
+
+
+def _relocate_venv(venv_dir: Path, *, old_prefix: str, new_prefix: str) -> int:
+    """Rewrite absolute venv paths (script shebangs, activate scripts, .pth files)."""
+
+    old = old_prefix.encode("utf-8")
+    new = new_prefix.encode("utf-8")
+    candidates = [venv_dir / "pyvenv.cfg"]
+    candidates.extend(sorted((venv_dir / "bin").glob("*")))
+    candidates.extend(sorted(venv_dir.glob("lib/python*/site-packages/*.pth")))
+    rewritten = 0
+    for path in candidates:
+        if path.is_symlink() or not path.is_file():
+            continue
+        data = path.read_bytes()
+        if old not in data:
+            continue
+        path.write_bytes(data.replace(old, new))
+        rewritten += 1
+    return rewritten
+
+
+def _materialize_venv_template(
+    template: _VenvTemplate,
+    venv_dir: Path,
+    *,
+    log: list[str],
+) -> dict[str, Any] | None:
+    try:
+        manifest = json.loads((template.path / _VENV_TEMPLATE_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    source_prefix = manifest.get("source_prefix") if isinstance(manifest, dict) else None
+    if (
+        manifest.get("schema_version") != VENV_TEMPLATE_SCHEMA_VERSION
+        or not isinstance(source_prefix, str)
+        or not (template.path / "venv" / "pyvenv.cfg").is_file()
+    ):
+        return None
+    started = time.monotonic()
+    try:
+        method = _clone_tree(template.path / "venv", venv_dir)
+        rewritten = _relocate_venv(venv_dir, old_prefix=source_prefix, new_prefix=str(venv_dir))
+    except OSError as exc:
+        log.append(f"venv template clone failed ({exc}); installing from scratch.")
+        log.append("")
+        shutil.rmtree(venv_dir, ignore_errors=True)
+        return None
+    clone_seconds = time.monotonic() - started
+    build_seconds = manifest.get("build_seconds")
+    log.append(f"Cloned venv template {template.key} via {method} in {clone_seconds:.2f}s.")
+    log.append("")
+    return {
+        "status": "hit",
+        "key": template.key,
+        "clone_method": method,
+        "clone_seconds": round(clone_seconds, 3),
+        "files_relocated": rewritten,
+        "build_seconds": build_seconds,
+        "time_saved_seconds": (
+            round(max(0.0, float(build_seconds) - clone_seconds), 3)
+            if isinstance(build_seconds, (int, float))
+            else None
+        ),
+    }
+
+
+def _store_venv_template(template: _VenvTemplate, venv_dir: Path, *, build_seconds: float) -> bool:
+    staging = template.path.with_name(f".{template.key}.{os.getpid()}-{uuid.uuid4().hex}.tmp")
+    try:
+        staging.mkdir(parents=True)
+        _clone_tree(venv_dir, staging / "venv")
+        (staging / _VENV_TEMPLATE_MANIFEST).write_text(
+            json.dumps(
+                {
+                    "schema_version": VENV_TEMPLATE_SCHEMA_VERSION,
+                    "key": template.key,
+                    "source_prefix": str(venv_dir),
+                    "build_seconds": round(build_seconds, 3),
+                    "created_at_epoch": time.time(),
+                    "inputs": template.inputs,
+                },
+                indent=2,
+                ensure_ascii=False,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        # A concurrent run may have stored the same template first; keep theirs.
+        os.rename(staging, template.path)
+        return True
+    except OSError:
+        return False
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _install_local_venv(
+    *,
+    workspace_dir: Path,
+    venv_python: Path,
+    run_dir: Path,
+    base_env: dict[str, str],
+    temp_root_str: str | None,
+    installer_mode: str,
+    requirements_relpath: str,
+    gitlab_index_url: str | None,
+    extra_index_url: str | None,
+    log_lines: list[str],
+) -> None:
+    proc = _run_logged(
+        [sys.executable, "-m", "venv", ".venv"],
+        cwd=workspace_dir,
+        env=None,
+        log=log_lines,
+    )
+    if proc.returncode != 0:
+        _write_log(run_dir / "bootstrap_pip.log", log_lines)
+        raise RuntimeError("Failed to create virtualenv for pip bootstrap. See bootstrap_pip.log.")
+
+    def _run_pip(argv: list[str], *, env: dict[str, str]) -> subprocess.CompletedProcess[str]:
+        return _run_logged(argv, cwd=workspace_dir, env=env, log=log_lines)
+
+    td_kwargs: dict[str, str] = {}
+    if temp_root_str is not None:
+        td_kwargs["dir"] = temp_root_str
+
+    with tempfile.TemporaryDirectory(prefix="usertest_pip_home_", **td_kwargs) as td:
+        home = Path(td)
+        authenticated_index_url: str | None = None
+        if gitlab_index_url is not None:
+            username = base_env.get("GITLAB_PYPI_USERNAME", "").strip()
+            secret = base_env.get("GITLAB_PYPI_PASSWORD", "").strip()
+            authenticated_index_url = _authenticated_url(gitlab_index_url, username, secret)
+
+        env = {**base_env}
+        env["HOME"] = str(home)
+        if os.name == "nt":
+            env["USERPROFILE"] = str(home)
+
+        upgrade = _run_pip([str(venv_python), "-m", "pip", "install", "--upgrade", "pip"], env=env)
+        if upgrade.returncode != 0:
+            _write_log(run_dir / "bootstrap_pip.log", log_lines)
+            raise RuntimeError(
+                "pip bootstrap failed while upgrading pip. See bootstrap_pip.log."
+            )
+
+        if installer_mode == "pdm":
+            install_pdm = _run_pip([str(venv_python), "-m", "pip", "install", "pdm"], env=env)
+            if install_pdm.returncode != 0:
+                _write_log(run_dir / "bootstrap_pip.log", log_lines)
+                raise RuntimeError(
+                    "pdm bootstrap failed while installing pdm. See bootstrap_pip.log."
+                )
+
+            pdm_install = [str(venv_python), "-m", "pdm", "install", "--no-self"]
+            if gitlab_index_url is not None:
+                assert extra_index_url is not None
+                assert authenticated_index_url is not None
+                env["PIP_INDEX_URL"] = authenticated_index_url
+                env["PIP_EXTRA_INDEX_URL"] = extra_index_url
+            proc = _run_pip(pdm_install, env=env)
+        else:
+            pip_install = [str(venv_python), "-m", "pip", "install", "-r", requirements_relpath]
+            if gitlab_index_url is not None:
+                assert extra_index_url is not None
+                assert authenticated_index_url is not None
+                env["PIP_INDEX_URL"] = authenticated_index_url
+                env["PIP_EXTRA_INDEX_URL"] = extra_index_url
+                pip_install = [
+                    str(venv_python),
+                    "-m",
+                    "pip",
+                    "install",
+                    "--pre",
+                    "-r",
+                    requirements_relpath,
+                ]
+            proc = _run_pip(pip_install, env=env)
+        _write_log(run_dir / "bootstrap_pip.log", log_lines)
+        if proc.returncode != 0:
+            raise RuntimeError("pip bootstrap failed. See bootstrap_pip.log.")
+
+
 def bootstrap_pip_requirements(
     *,
     workspace_dir: Path,
@@ -129,10 +409,18 @@ def bootstrap_pip_requirements(
     command_prefix: list[str],
     workspace_mount: str | None,
     installer: str = "pip",
+    template_cache_dir: Path | None = None,
 ) -> PipBootstrapResult:
     """
     Create a fresh `.venv/` in the workspace and install requirements via pip or pdm.
 
+    Venv templates
+    --------------
+    With `template_cache_dir` (local backend only), a successful install is also stored as a
+    template keyed by the requirements/lock file hashes, interpreter, installer and index URLs.
+    Later runs with the same key clone the template and rewrite its absolute paths instead of
+    installing; `meta["venv_template"]` records the hit/miss and the time saved.
+
     GitLab PyPI support
     -------------------
     If `GITLAB_PYPI_PROJECT_ID` is set, we treat it as the default index and scope credentials
@@ -389,17 +677,7 @@ def bootstrap_pip_requirements(
     if local_venv_dir.exists():
         shutil.rmtree(local_venv_dir, ignore_errors=True)
 
-    proc = _run_logged(
-        [sys.executable, "-m", "venv", ".venv"],
-        cwd=workspace_dir,
-        env=None,
-        log=log_lines,
-    )
-    if proc.returncode != 0:
-        _write_log(run_dir / "bootstrap_pip.log", log_lines)
-        raise RuntimeError("Failed to create virtualenv for pip bootstrap. See bootstrap_pip.log.")
-
-    venv_python = workspace_dir / Path(venv_python)
+    local_venv_python = workspace_dir / Path(venv_python)
     base_env = os.environ.copy()
     base_env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
     base_env["PIP_NO_INPUT"] = "1"
@@ -425,71 +703,52 @@ def bootstrap_pip_requirements(
         log_lines.append(f"TEMP={base_env.get('TEMP', '')}")
         log_lines.append("")
 
-    def _run_pip(argv: list[str], *, env: dict[str, str]) -> subprocess.CompletedProcess[str]:
-        return _run_logged(argv, cwd=workspace_dir, env=env, log=log_lines)
-
-    td_kwargs: dict[str, str] = {}
-    if temp_root_str is not None:
-        td_kwargs["dir"] = temp_root_str
-
-    with tempfile.TemporaryDirectory(prefix="usertest_pip_home_", **td_kwargs) as td:
-        home = Path(td)
-        authenticated_index_url: str | None = None
-        if gitlab_index_url is not None:
-            username = base_env.get("GITLAB_PYPI_USERNAME", "").strip()
-            secret = base_env.get("GITLAB_PYPI_PASSWORD", "").strip()
-            authenticated_index_url = _authenticated_url(gitlab_index_url, username, secret)
-
-        env = {**base_env}
-        env["HOME"] = str(home)
-        if os.name == "nt":
-            env["USERPROFILE"] = str(home)
-
-        upgrade = _run_pip([str(venv_python), "-m", "pip", "install", "--upgrade", "pip"], env=env)
-        if upgrade.returncode != 0:
-            _write_log(run_dir / "bootstrap_pip.log", log_lines)
-            raise RuntimeError(
-                "pip bootstrap failed while upgrading pip. See bootstrap_pip.log."
-            )
-
-        if installer_mode == "pdm":
-            install_pdm = _run_pip([str(venv_python), "-m", "pip", "install", "pdm"], env=env)
-            if install_pdm.returncode != 0:
-                _write_log(run_dir / "bootstrap_pip.log", log_lines)
-                raise RuntimeError(
-                    "pdm bootstrap failed while installing pdm. See bootstrap_pip.log."
-                )
+    template: _VenvTemplate | None = None
+    template_hit: dict[str, Any] | None = None
+    if template_cache_dir is not None:
+        template, bypass_reason = _resolve_venv_template(
+            cache_dir=template_cache_dir,
+            workspace_dir=workspace_dir,
+            requirements_relpath=requirements_relpath,
+            installer_mode=installer_mode,
+            index_url=gitlab_index_url,
+            extra_index_url=extra_index_url,
+        )
+        if template is None:
+            bootstrap_meta["venv_template"] = {"status": "bypass", "reason": bypass_reason}
+        elif template.path.is_dir():
+            template_hit = _materialize_venv_template(template, local_venv_dir, log=log_lines)
 
-            pdm_install = [str(venv_python), "-m", "pdm", "install", "--no-self"]
-            if gitlab_index_url is not None:
-                assert extra_index_url is not None
-                assert authenticated_index_url is not None
-                env["PIP_INDEX_URL"] = authenticated_index_url
-                env["PIP_EXTRA_INDEX_URL"] = extra_index_url
-            proc = _run_pip(pdm_install, env=env)
-        else:
-            pip_install = [str(venv_python), "-m", "pip", "install", "-r", requirements_relpath]
-            if gitlab_index_url is not None:
-                assert extra_index_url is not None
-                assert authenticated_index_url is not None
-                env["PIP_INDEX_URL"] = authenticated_index_url
-                env["PIP_EXTRA_INDEX_URL"] = extra_index_url
-                pip_install = [
-                    str(venv_python),
-                    "-m",
-                    "pip",
-                    "install",
-                    "--pre",
-                    "-r",
-                    requirements_relpath,
-                ]
-            proc = _run_pip(pip_install, env=env)
+    if template_hit is not None:
+        bootstrap_meta["venv_template"] = template_hit
         _write_log(run_dir / "bootstrap_pip.log", log_lines)
-        if proc.returncode != 0:
-            raise RuntimeError("pip bootstrap failed. See bootstrap_pip.log.")
+    else:
+        build_started = time.monotonic()
+        _install_local_venv(
+            workspace_dir=workspace_dir,
+            venv_python=local_venv_python,
+            run_dir=run_dir,
+            base_env=base_env,
+            temp_root_str=temp_root_str,
+            installer_mode=installer_mode,
+            requirements_relpath=requirements_relpath,
+            gitlab_index_url=gitlab_index_url,
+            extra_index_url=extra_index_url,
+            log_lines=log_lines,
+        )
+        if template is not None:
+            build_seconds = time.monotonic() - build_started
+            bootstrap_meta["venv_template"] = {
+                "status": "miss",
+                "key": template.key,
+                "build_seconds": round(build_seconds, 3),
+                "stored": _store_venv_template(
+                    template, local_venv_dir, build_seconds=build_seconds
+                ),
+            }
 
     pip_list = subprocess.run(
-        [str(venv_python), "-m", "pip", "list", "--format=json"],
+        [str(local_venv_python), "-m", "pip", "list", "--format=json"],
         cwd=str(workspace_dir),
         capture_output=True,
         text=True,
@@ -0,0 +1,277 @@
+"""Process-wide cache of preflight capability probes.
+
+Every ``run_once`` preflight spawns the same short-lived subprocesses: ``<agent> --version``,
+the interpreter health probe for each Python candidate, and ``python -m pip/pytest --version``.
+Inside a :func:`capability_probe_session` those probes go through :func:`cached_probe`, which
+keys each answer by
+
+- the probed executable's absolute path plus its inode, size and mtime,
+- ``PATH`` and the other environment variables that can change the answer,
+- any probe-specific inputs (for example the agent's env overrides),
+
+and reuses it for ``USERTEST_PROBE_CACHE_TTL_SECONDS`` (default 15 minutes).  Only successful
+probes are cached, so a missing tool is re-probed every run.  With ``mode="persist"`` the cache
+is also loaded from and saved to ``<runs_dir>/_cache/capability_probes.json`` so later processes
+start warm.  ``refresh=True`` re-probes everything and replaces the cached answers.
+
+Each session records one entry per probe (kind, key digest and whether it was answered from
+``memory``, ``disk`` or a fresh ``probe``); the runner stores them in ``preflight.json``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+__all__ = [
+    "PROBE_CACHE_FILENAME",
+    "PROBE_CACHE_MODES",
+    "PROBE_CACHE_TTL_ENV",
+    "CapabilityProbeSession",
+    "active_capability_probe_session",
+    "cached_probe",
+    "capability_probe_session",
+    "clear_capability_probe_cache",
+    "environment_fingerprint",
+    "executable_fingerprint",
+]
+
+PROBE_CACHE_MODES = ("off", "process", "persist")
+PROBE_CACHE_TTL_ENV = "USERTEST_PROBE_CACHE_TTL_SECONDS"
+PROBE_CACHE_FILENAME = "capability_probes.json"
+_DEFAULT_TTL_SECONDS = 900.0
+_PERSIST_SCHEMA_VERSION = 1
+_MAX_ENTRIES = 512
+
+# Variables that change which interpreter/tool a probe reaches or how it behaves.
+_PROBE_ENV_NAMES = (
+    "PATH",
+    "PATHEXT",
+    "PYTHONPATH",
+    "PYTHONHOME",
+    "PYTHONNOUSERSITE",
+    "VIRTUAL_ENV",
+    "CONDA_PREFIX",
+)
+
+
+@dataclass
+class _CacheEntry:
+    value: dict[str, Any]
+    stored_at: float
+    source: str
+
+
+@dataclass
+class CapabilityProbeSession:
+    """Per-run view of the process cache: refresh flag, persistence target and hit records."""
+
+    refresh: bool = False
+    persist_path: Path | None = None
+    records: list[dict[str, Any]] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        sources = [record["source"] for record in self.records]
+        return {
+            "refresh": self.refresh,
+            "persist_path": str(self.persist_path) if self.persist_path is not None else None,
+            "hits": sum(1 for source in sources if source != "probe"),
+            "misses": sources.count("probe"),
+            "records": [dict(record) for record in self.records],
+        }
+
+
+_LOCK = threading.Lock()
+_ENTRIES: dict[str, _CacheEntry] = {}
+_LOADED_PERSIST_PATHS: set[Path] = set()
+_SESSION: ContextVar[CapabilityProbeSession | None] = ContextVar(
+    "runner_core_capability_probe_session",
+    default=None,
+)
+
+
+def _ttl_seconds() -> float:
+    raw = (os.environ.get(PROBE_CACHE_TTL_ENV) or "").strip()
+    if not raw:
+        return _DEFAULT_TTL_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return _DEFAULT_TTL_SECONDS
+
+
+def executable_fingerprint(path_text: str | None) -> list[Any] | None:
+    """Return ``[abspath, inode, size, mtime_ns]`` for an executable, or ``None`` if missing.
+
+    The unresolved absolute path is kept on purpose: a venv's ``bin/python`` symlinks to the
+    base interpreter but reports a different ``sys.prefix``.
+    """
+
+    if not path_text:
+        return None
+    try:
+        absolute = os.path.abspath(path_text)
+        stat = os.stat(absolute)
+    except (OSError, ValueError):
+        return None
+    return [absolute, stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+
+def environment_fingerprint(
+    env: Mapping[str, str] | None,
+    *,
+    names: Iterable[str] = _PROBE_ENV_NAMES,
+) -> list[Any]:
+    source = os.environ if env is None else env
+    return [[name, source.get(name)] for name in names]
+
+
+def _cache_key(kind: str, key_parts: object) -> str:
+    payload = json.dumps([kind, key_parts], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load_persisted(path: Path) -> None:
+    with _LOCK:
+        if path in _LOADED_PERSIST_PATHS:
+            return
+        _LOADED_PERSIST_PATHS.add(path)
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return
+    if not isinstance(raw, dict) or raw.get("schema_version") != _PERSIST_SCHEMA_VERSION:
+        return
+    entries = raw.get("entries")
+    if not isinstance(entries, dict):
+        return
+    with _LOCK:
+        for key, entry in entries.items():
+            if key in _ENTRIES or not isinstance(entry, dict):
+                continue
+            value = entry.get("value")
+            stored_at = entry.get("stored_at")
+            if isinstance(value, dict) and isinstance(stored_at, (int, float)):
+                _ENTRIES[key] = _CacheEntry(value=value, stored_at=float(stored_at), source="disk")
+
+
+def _save_persisted(path: Path) -> None:
+    now = time.time()
+    ttl = _ttl_seconds()
+    with _LOCK:
+        entries = {
+            key: {"value": entry.value, "stored_at": entry.stored_at}
+            for key, entry in _ENTRIES.items()
+            if now - entry.stored_at <= ttl
+        }
+    temp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp.write_text(
+            json.dumps({"schema_version": _PERSIST_SCHEMA_VERSION, "entries": entries}),
+            encoding="utf-8",
+        )
+        os.replace(temp, path)
+    except (OSError, TypeError, ValueError):
+        # Persistence is an optimization only.
+        temp.unlink(missing_ok=True)
+
+
+def active_capability_probe_session() -> CapabilityProbeSession | None:
+    return _SESSION.get()
+
+
+@contextmanager
+def capability_probe_session(
+    *,
+    mode: str = "process",
+    refresh: bool = False,
+    runs_dir: Path | None = None,
+) -> Iterator[CapabilityProbeSession | None]:
+    """Enable :func:`cached_probe` for the current thread/context.
+
+    Yields ``None`` when *mode* is ``"off"``; probes then always run.
+    """
+
+    if mode not in PROBE_CACHE_MODES:
+        raise ValueError(f"Unsupported probe cache mode: {mode!r}")
+    if mode == "off":
+        off_token = _SESSION.set(None)
+        try:
+            yield None
+        finally:
+            _SESSION.reset(off_token)
+        return
+    persist_path = (
+        runs_dir / "_cache" / PROBE_CACHE_FILENAME
+        if mode == "persist" and runs_dir is not None
+        else None
+    )
+    if persist_path is not None and not refresh:
+        _load_persisted(persist_path)
+    session = CapabilityProbeSession(refresh=refresh, persist_path=persist_path)
+    token = _SESSION.set(session)
+    try:
+        yield session
+    finally:
+        _SESSION.reset(token)
+        if persist_path is not None and any(
+            record["source"] == "probe" for record in session.records
+        ):
+            _save_persisted(persist_path)
+
+
+def cached_probe(
+    kind: str,
+    key_parts: object,
+    probe: Callable[[], dict[str, Any]],
+    *,
+    cacheable: Callable[[dict[str, Any]], bool],
+) -> dict[str, Any]:
+    """Return ``probe()``, reusing a cached answer inside an active session.
+
+    *key_parts* must be JSON-serializable and include everything the answer depends on;
+    callers pass ``None`` when the probe target cannot be fingerprinted, which bypasses the
+    cache.  The returned mapping is a copy and may be modified.
+    """
+
+    session = _SESSION.get()
+    if session is None or key_parts is None:
+        return probe()
+    key = _cache_key(kind, key_parts)
+    now = time.time()
+    if not session.refresh:
+        with _LOCK:
+            entry = _ENTRIES.get(key)
+        if entry is not None and now - entry.stored_at <= _ttl_seconds():
+            session.records.append({"kind": kind, "key": key[:16], "source": entry.source})
+            return json.loads(json.dumps(entry.value))
+    value = probe()
+    session.records.append({"kind": kind, "key": key[:16], "source": "probe"})
+    if cacheable(value):
+        try:
+            stored = json.loads(json.dumps(value))
+        except (TypeError, ValueError):
+            return value
+        with _LOCK:
+            _ENTRIES[key] = _CacheEntry(value=stored, stored_at=now, source="memory")
+            while len(_ENTRIES) > _MAX_ENTRIES:
+                _ENTRIES.pop(next(iter(_ENTRIES)))
+    return value
+
+
+def clear_capability_probe_cache() -> None:
+    """Forget every cached probe answer in this process."""
+
+    with _LOCK:
+        _ENTRIES.clear()
+        _LOADED_PERSIST_PATHS.clear()
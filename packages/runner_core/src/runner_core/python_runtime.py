@@ -8,10 +8,12 @@ import shutil
 import subprocess
 import sys
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
 from typing import Any
 
+from runner_core.probe_cache import cached_probe, environment_fingerprint, executable_fingerprint
+
 _LOG = logging.getLogger(__name__)
 
 _PYTHON_HEALTH_PROBE = (
@@ -365,6 +367,25 @@ def _probe_python_executable(
             ),
         )
 
+    fingerprint = executable_fingerprint(raw)
+    payload = cached_probe(
+        "python_interpreter",
+        None if fingerprint is None else [fingerprint, environment_fingerprint(env)],
+        lambda: asdict(
+            _run_python_health_probe(raw, timeout_seconds=timeout_seconds, source=source, env=env)
+        ),
+        cacheable=lambda value: bool(value.get("usable")),
+    )
+    return replace(PythonRuntimeCandidate(**payload), source=source, path=raw)
+
+
+def _run_python_health_probe(
+    raw: str,
+    *,
+    timeout_seconds: float,
+    source: str,
+    env: dict[str, str] | None,
+) -> PythonRuntimeCandidate:
     try:
         run_kwargs: dict[str, Any] = {
             "capture_output": True,
@@ -873,8 +894,32 @@ def probe_pytest_module(
 ) -> dict[str, Any]:
     """
     Probe `python -m pytest --version`, capturing stdout/stderr for actionable diagnostics.
+
+    Passing results are reused from the capability probe cache when a session is active.
     """
 
+    fingerprint = executable_fingerprint(python_executable)
+    result = cached_probe(
+        "pytest_module",
+        None if fingerprint is None else [fingerprint, environment_fingerprint(None)],
+        lambda: _run_pytest_module_probe(
+            python_executable=python_executable,
+            cwd=cwd,
+            timeout_seconds=timeout_seconds,
+        ),
+        cacheable=lambda value: bool(value.get("passed")),
+    )
+    result["cwd"] = str(cwd)
+    return result
+
+
+def _run_pytest_module_probe(
+    *,
+    python_executable: str,
+    cwd: Path,
+    timeout_seconds: float,
+) -> dict[str, Any]:
+
     argv = [python_executable, "-m", "pytest", "--version"]
     stdout_text = ""
     stderr_text = ""
@@ -980,8 +1025,32 @@ def probe_pip_module(
 ) -> dict[str, Any]:
     """
     Probe `python -m pip --version`, capturing stdout/stderr for actionable diagnostics.
+
+    Passing results are reused from the capability probe cache when a session is active.
     """
 
+    fingerprint = executable_fingerprint(python_executable)
+    result = cached_probe(
+        "pip_module",
+        None if fingerprint is None else [fingerprint, environment_fingerprint(None)],
+        lambda: _run_pip_module_probe(
+            python_executable=python_executable,
+            cwd=cwd,
+            timeout_seconds=timeout_seconds,
+        ),
+        cacheable=lambda value: bool(value.get("passed")),
+    )
+    result["cwd"] = str(cwd)
+    return result
+
+
+def _run_pip_module_probe(
+    *,
+    python_executable: str,
+    cwd: Path,
+    timeout_seconds: float,
+) -> dict[str, Any]:
+
     argv = [python_executable, "-m", "pip", "--version"]
     stdout_text = ""
     stderr_text = ""
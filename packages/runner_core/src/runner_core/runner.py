@@ -19,7 +19,9 @@ from pathlib import Path
 from typing import Any
 
 from agent_adapters import (
+    LiveEventNormalizer,
     build_codex_subscription_config_overrides,
+    live_normalizer_for_agent,
     normalize_claude_events,
     normalize_codex_events,
     normalize_gemini_events,
@@ -41,6 +43,7 @@ from reporter import (
     render_report_markdown,
     validate_report,
 )
+from run_artifacts.history import refresh_history_index
 from sandbox_runner.diagnostics import (
     capture_container_artifacts,
     capture_dns_snapshot,
@@ -105,6 +108,13 @@ from runner_core.preflight import (
     _probe_commands_local,
     _run_bounded_command_probe,
 )
+from runner_core.probe_cache import (
+    active_capability_probe_session,
+    cached_probe,
+    capability_probe_session,
+    environment_fingerprint,
+    executable_fingerprint,
+)
 from runner_core.prompt import (
     CANONICAL_EXECUTION_NOTES_MD,
     TemplateSubstitutionError,
@@ -219,7 +229,10 @@ from runner_core.verification_prompts import (
     _build_followup_prompt,
     _build_verification_followup_prompt,
 )
-from runner_core.verification_timing_profile import build_verification_timing_profile
+from runner_core.verification_timing_profile import (
+    build_verification_timing_profile,
+    record_verification_timings,
+)
 from runner_core.workspace_state_hash import WorkspaceStateHash, compute_workspace_state_hash
 
 
@@ -292,6 +305,17 @@ class RunRequest:
     # telemetry must withhold the continued invocation's token delta.
     codex_resume_usage_source_run_dir: Path | None = None
     keep_workspace: bool = False
+    # "mirror" clones git targets from a shared bare mirror under
+    # `<runs_dir>/_cache/git_mirrors` (fetched at most once per process) instead of from source.
+    target_cache: str = "off"
+    # "process" reuses successful preflight capability probes (agent `--version`, Python
+    # interpreter and pip/pytest module probes) within this process; "persist" also keeps them
+    # in `<runs_dir>/_cache/capability_probes.json`. `refresh_probes` re-probes and replaces them.
+    probe_cache: str = "off"
+    refresh_probes: bool = False
+    # "reuse" clones local pip/pdm bootstrap venvs from content-addressed templates under
+    # `<runs_dir>/_cache/venv_templates` (built on the first miss) instead of reinstalling.
+    venv_template_cache: str = "off"
     preflight_commands: tuple[str, ...] = ()
     preflight_required_commands: tuple[str, ...] = ()
     verification_commands: tuple[str, ...] = ()
@@ -1193,6 +1217,35 @@ def _probe_agent_cli_version(
     argv = [binary_to_run, "--version"]
     full_argv = [*command_prefix, *argv] if command_prefix else argv
 
+    key_parts: list[Any] | None = None
+    if not command_prefix:
+        # Probes through a sandbox prefix target a container, not the host executable.
+        search_path = (env or os.environ).get("PATH")
+        fingerprint = executable_fingerprint(shutil.which(binary_to_run, path=search_path))
+        if fingerprint is not None:
+            key_parts = [
+                fingerprint,
+                environment_fingerprint(env),
+                sorted((env_overrides or {}).items()),
+            ]
+    return cached_probe(
+        "agent_cli_version",
+        key_parts,
+        lambda: _run_agent_cli_version_probe(
+            full_argv,
+            env=env,
+            timeout_seconds=timeout_seconds,
+        ),
+        cacheable=lambda value: bool(value.get("ok")),
+    )
+
+
+def _run_agent_cli_version_probe(
+    full_argv: list[str],
+    *,
+    env: dict[str, str] | None,
+    timeout_seconds: float,
+) -> dict[str, Any]:
     try:
         probe = _run_bounded_command_probe(
             full_argv,
@@ -3284,6 +3337,7 @@ def capture_local_verification(
     commands: Sequence[str],
     timeout_seconds: float | None,
     python_executable: str | None = None,
+    runs_dir: Path | None = None,
 ) -> dict[str, Any]:
     """Execute an immutable command list without starting an agent turn.
 
@@ -3292,7 +3346,8 @@ def capture_local_verification(
     implementation head needs a fresh receipt for the exact stage-6 command
     contract.  The command text is retained byte-for-byte, no workspace mirror
     is produced, and the canonical summary is written at ``verification.json``
-    in ``run_dir``.
+    in ``run_dir``.  When ``runs_dir`` is given the capture is appended to its
+    verification timing store, like the verification of a full run.
     """
 
     resolved_run_dir = run_dir.expanduser().resolve()
@@ -3350,6 +3405,8 @@ def capture_local_verification(
     summary["model_invoked"] = False
     summary["workspace_mirror_written"] = False
     _write_json(resolved_run_dir / "verification.json", summary)
+    if runs_dir is not None:
+        record_verification_timings(runs_dir=runs_dir, run_dir=resolved_run_dir)
     return summary
 
 
@@ -3371,11 +3428,24 @@ def _utc_now_z() -> str:
     return datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def _maybe_write_token_monitoring_artifacts(run_dir: Path) -> None:
+def _maybe_write_token_monitoring_artifacts(
+    run_dir: Path,
+    *,
+    runs_dir: Path | None = None,
+) -> None:
     try:
         from token_monitoring import write_run_monitoring
 
-        write_run_monitoring(run_dir)
+        if runs_dir is None:
+            write_run_monitoring(run_dir)
+        else:
+            from token_monitoring import CODEX_SESSION_INDEX_FILENAME
+
+            # Shared across runs so session joins only rescan new or changed files.
+            write_run_monitoring(
+                run_dir,
+                codex_session_index_path=runs_dir / "_cache" / CODEX_SESSION_INDEX_FILENAME,
+            )
     except Exception as exc:  # noqa: BLE001
         _write_json(
             run_dir / "token_monitoring_error.json",
@@ -3662,6 +3732,15 @@ def _finalize_controlled_codex_execpolicy(
 
 
 def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
+    with capability_probe_session(
+        mode=request.probe_cache,
+        refresh=request.refresh_probes,
+        runs_dir=config.runs_dir,
+    ):
+        return _run_once(config, request)
+
+
+def _run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
     policy_cfg = config.policies.get(request.policy, {})
     if not isinstance(policy_cfg, dict):
         policy_cfg = {}
@@ -3764,6 +3843,11 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                 repo=request.repo,
                 dest_dir=preferred_workspace_dir,
                 ref=request.ref,
+                mirror_cache_dir=(
+                    config.runs_dir / "_cache" / "git_mirrors"
+                    if request.target_cache == "mirror"
+                    else None
+                ),
             )
         using_existing_workspace = acquired.mode == "existing"
 
@@ -4498,6 +4582,8 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
         sandbox = backend.sandbox_instance
         command_prefix = backend.command_prefix
         workspace_mount = backend.workspace_mount
+        # Raw attempt path -> (live normalized output, raw size, raw mtime_ns) once finished.
+        live_normalized_events: dict[Path, tuple[Path, int, int]] = {}
         # When executing inside a docker sandbox, `workspace_mount` is a POSIX path like
         # `/workspace`. On Windows hosts, `Path("/workspace")` becomes `\\workspace`, which
         # break agents that interpret `--cd` literally. Keep it as a string when mounted.
@@ -4630,6 +4716,11 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                 request.verification_commands
             )
             bootstrap: PipBootstrapResult | None = None
+            venv_template_cache_dir = (
+                config.runs_dir / "_cache" / "venv_templates"
+                if request.venv_template_cache == "reuse"
+                else None
+            )
             if is_pip_repo_input(request.repo):
                 pip_spec = parse_pip_repo_input(request.repo)
                 req_path = pip_requirements_path(acquired.workspace_dir)
@@ -4641,6 +4732,7 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                     command_prefix=command_prefix,
                     workspace_mount=workspace_mount,
                     installer=pip_spec.installer,
+                    template_cache_dir=venv_template_cache_dir,
                 )
             else:
                 requirements_dev = acquired.workspace_dir / "requirements-dev.txt"
@@ -4654,6 +4746,7 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                         command_prefix=command_prefix,
                         workspace_mount=workspace_mount,
                         installer="pip",
+                        template_cache_dir=venv_template_cache_dir,
                     )
                     bootstrap.meta["source_repo_bootstrap"] = True
 
@@ -5358,6 +5451,9 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                 preflight_meta["agent_cli_version_probes"] = {
                     agent: dict(probe) for agent, probe in agent_cli_version_probes.items()
                 }
+            probe_session = active_capability_probe_session()
+            if probe_session is not None:
+                preflight_meta["capability_probe_cache"] = probe_session.summary()
 
             delegation_capabilities_summary = _resolve_delegation_capabilities(
                 agents_cfg=agents_cfg_for_capabilities,
@@ -6362,12 +6458,39 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                     run_dir / f"agent_stderr.{suffix}.txt",
                 )
 
+            def _start_live_normalizer(raw_path: Path) -> LiveEventNormalizer:
+                # Attempt events are normalized while the agent runs so watchdogs can follow
+                # normalized_events.attemptN.jsonl and the post-run pass can reuse the output.
+                return live_normalizer_for_agent(
+                    request.agent if request.agent in {"codex", "claude"} else "gemini",
+                    raw_events_path=raw_path,
+                    normalized_events_path=raw_path.with_name(
+                        raw_path.name.replace("raw_events.", "normalized_events.", 1)
+                    ),
+                    workspace_root=acquired.workspace_dir,
+                    workspace_mount=workspace_mount,
+                )
+
+            def _finish_live_normalizer(live: LiveEventNormalizer) -> None:
+                try:
+                    live.close(timeout=60.0)
+                    raw_stat = live.raw_events_path.stat()
+                except Exception:
+                    live_normalized_events.pop(live.raw_events_path, None)
+                    return
+                live_normalized_events[live.raw_events_path] = (
+                    live.normalized_events_path,
+                    raw_stat.st_size,
+                    raw_stat.st_mtime_ns,
+                )
+
             def _run_agent_attempt(
                 *,
                 prompt_text: str,
                 raw_events_attempt_path: Path,
                 last_message_attempt_path: Path,
                 stderr_attempt_path: Path,
+                live_normalizer: LiveEventNormalizer | None = None,
             ) -> tuple[int, list[str]]:
                 nonlocal codex_last_invocation_resumed
                 nonlocal codex_session_id
@@ -6406,6 +6529,7 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                         env_overrides=agent_env_overrides,
                         agent_last_message_path=codex_last_message_for_attempt,
                         resume_session_id=resume_session_id,
+                        live_normalizer=live_normalizer,
                     )
                     result_thread_id = getattr(codex_result, "thread_id", None)
                     if isinstance(result_thread_id, str) and result_thread_id.strip():
@@ -6430,6 +6554,7 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                         append_system_prompt_file=append_system_prompt_path_for_agent,
                         command_prefix=command_prefix,
                         env_overrides=agent_env_overrides,
+                        live_normalizer=live_normalizer,
                     )
                     return claude_result.exit_code, claude_result.argv
 
@@ -6454,6 +6579,7 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                     ),
                     command_prefix=command_prefix,
                     env_overrides=gemini_env_overrides,
+                    live_normalizer=live_normalizer,
                 )
                 return gemini_result.exit_code, gemini_result.argv
 
@@ -6601,14 +6727,17 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
                     )
                     broker_session.start()
                 agent_exec_start_monotonic = time.monotonic()
+                live_normalizer = _start_live_normalizer(raw_events_attempt_path)
                 try:
                     agent_exit_code, agent_argv = _run_agent_attempt(
                         prompt_text=current_prompt,
                         raw_events_attempt_path=raw_events_attempt_path,
                         last_message_attempt_path=last_message_attempt_path,
                         stderr_attempt_path=stderr_attempt_path,
+                        live_normalizer=live_normalizer,
                     )
                 finally:
+                    _finish_live_normalizer(live_normalizer)
                     if broker_session is not None:
                         broker_session.stop(
                             cancel_pending=False,
@@ -7985,6 +8114,21 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
             source_path: Path,
             destination_path: Path,
         ) -> None:
+            live_output = live_normalized_events.get(source_path)
+            if live_output is not None:
+                live_path, live_size, live_mtime_ns = live_output
+                try:
+                    source_stat = source_path.stat()
+                    if (
+                        live_path.is_file()
+                        and source_stat.st_size == live_size
+                        and source_stat.st_mtime_ns == live_mtime_ns
+                    ):
+                        # The raw file is unchanged since live normalization finished.
+                        os.replace(live_path, destination_path)
+                        return
+                except OSError:
+                    pass
             source_ts_path = source_path.with_suffix(".ts.jsonl")
             raw_ts_f = None
             raw_ts_iter = None
@@ -8313,9 +8457,15 @@ def run_once(config: RunnerConfig, request: RunRequest) -> RunResult:
         except Exception:  # noqa: BLE001
             pass
 
-        _maybe_write_token_monitoring_artifacts(run_dir)
+        record_verification_timings(runs_dir=config.runs_dir, run_dir=run_dir)
+        _maybe_write_token_monitoring_artifacts(run_dir, runs_dir=config.runs_dir)
         _maybe_write_lifecycle_telemetry(
             run_dir=run_dir,
             request=request,
             model=effective_model,
         )
+        try:
+            # History reads only open the index read-only; the runner keeps it current.
+            refresh_history_index(config.runs_dir, target_slug=target_slug)
+        except Exception:  # noqa: BLE001
+            pass
@@ -6,10 +6,15 @@ import shutil
 import stat
 import subprocess
 import tempfile
-from collections.abc import Callable
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
+from runner_core.pathing import slugify
 from runner_core.pip_target import (
     is_pip_repo_input,
     parse_pip_repo_input,
@@ -488,7 +493,156 @@ def _raise_enospc_validation_error(
     ) from validation_error
 
 
-def acquire_target(*, repo: str, dest_dir: Path, ref: str | None) -> AcquiredTarget:
+MIRROR_LOCK_TIMEOUT_SECONDS = 600.0
+MIRROR_LOCK_STALE_SECONDS = 3600.0
+
+# Mirrors refreshed by this process. A batch or matrix executes in one process, so each mirror is
+# fetched at most once per batch no matter how many runs acquire the same repo input.
+_REFRESHED_MIRRORS: set[str] = set()
+_MIRROR_THREAD_LOCKS: dict[str, threading.Lock] = {}
+_MIRROR_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+def git_mirror_path(*, cache_dir: Path, source: str) -> Path:
+    """Return the bare mirror location used for one repo input under *cache_dir*."""
+
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{slugify(source)}-{digest}.git"
+
+
+@contextmanager
+def _mirror_lock(mirror_dir: Path) -> Iterator[None]:
+    """Serialize mirror creation/refresh across threads and processes."""
+
+    key = str(mirror_dir)
+    with _MIRROR_THREAD_LOCKS_GUARD:
+        thread_lock = _MIRROR_THREAD_LOCKS.setdefault(key, threading.Lock())
+    with thread_lock:
+        lock_path = mirror_dir.with_name(f"{mirror_dir.name}.lock")
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        started = time.monotonic()
+        while True:
+            try:
+                descriptor = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except (FileExistsError, PermissionError):
+                try:
+                    age = time.time() - lock_path.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                except PermissionError:
+                    age = 0.0
+                if age > MIRROR_LOCK_STALE_SECONDS:
+                    lock_path.unlink(missing_ok=True)
+                    continue
+                if time.monotonic() - started >= MIRROR_LOCK_TIMEOUT_SECONDS:
+                    raise TimeoutError(
+                        f"timed out waiting for git mirror lock: {lock_path}"
+                    ) from None
+                time.sleep(0.1)
+                continue
+            os.close(descriptor)
+            break
+        try:
+            yield
+        finally:
+            lock_path.unlink(missing_ok=True)
+
+
+def _ensure_git_mirror(*, source: str, cache_dir: Path) -> Path | None:
+    """
+    Create or refresh the bare mirror for *source* and return its path.
+
+    Returns None when the mirror cannot be created or refreshed so callers fall back to a direct
+    clone, which then reports the authoritative acquisition error.
+    """
+
+    mirror_dir = git_mirror_path(cache_dir=cache_dir, source=source)
+    key = str(mirror_dir)
+    try:
+        with _mirror_lock(mirror_dir):
+            if (mirror_dir / "HEAD").is_file():
+                if key not in _REFRESHED_MIRRORS:
+                    _run_git(["fetch", "--prune", "--quiet", "origin"], cwd=mirror_dir)
+                    _sync_mirror_head(mirror_dir)
+            else:
+                if os.path.lexists(mirror_dir):
+                    remove_acquired_workspace(mirror_dir)
+                staging = mirror_dir.with_name(f".{mirror_dir.name}.{uuid.uuid4().hex}.tmp")
+                try:
+                    # --no-local keeps the mirror from hardlinking into a local source repository.
+                    _git_clone_mirror(source=source, dest_dir=staging)
+                    os.replace(staging, mirror_dir)
+                finally:
+                    if os.path.lexists(staging):
+                        remove_acquired_workspace(staging)
+            _REFRESHED_MIRRORS.add(key)
+    except (OSError, RuntimeError):
+        return None
+    return mirror_dir
+
+
+def _sync_mirror_head(mirror_dir: Path) -> None:
+    """Point the mirror's HEAD where the source's HEAD points; fetch leaves HEAD untouched."""
+
+    out = _run_git(["ls-remote", "--symref", "origin", "HEAD"], cwd=mirror_dir)
+    head_sha: str | None = None
+    for line in out.splitlines():
+        value, _, name = line.partition("\t")
+        if name.strip() != "HEAD":
+            continue
+        if value.startswith("ref: "):
+            _run_git(["symbolic-ref", "HEAD", value.removeprefix("ref: ").strip()], cwd=mirror_dir)
+            return
+        head_sha = value.strip()
+    if head_sha:
+        _run_git(["update-ref", "--no-deref", "HEAD", head_sha], cwd=mirror_dir)
+
+
+def _git_clone_mirror(*, source: str, dest_dir: Path) -> None:
+    proc = subprocess.run(
+        ["git", "clone", "--mirror", "--no-local", "--quiet", source, str(dest_dir)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        msg = proc.stderr.strip() or proc.stdout.strip()
+        raise RuntimeError(msg or f"git clone --mirror failed (exit {proc.returncode})")
+
+
+def _clone_source_for(
+    *, source: str, mirror_cache_dir: Path | None
+) -> tuple[str, bool, Path | None]:
+    """
+    Return (clone_from, no_local, mirror_dir) for one acquisition.
+
+    Without a cache the source is cloned directly, as before. With a cache, workspaces are cloned
+    from the runner-owned mirror with local hardlinked objects, which is safe because Git never
+    rewrites object files in place.
+    """
+
+    if mirror_cache_dir is None:
+        return source, _looks_like_existing_path(source), None
+    mirror_dir = _ensure_git_mirror(source=source, cache_dir=mirror_cache_dir)
+    if mirror_dir is None:
+        return source, _looks_like_existing_path(source), None
+    return str(mirror_dir), False, mirror_dir
+
+
+def acquire_target(
+    *,
+    repo: str,
+    dest_dir: Path,
+    ref: str | None,
+    mirror_cache_dir: Path | None = None,
+) -> AcquiredTarget:
+    """Materialize *repo* at *dest_dir* (or a relocated fallback) and pin its commit.
+
+    When *mirror_cache_dir* is set, git sources are cloned from a shared bare mirror kept under
+    that directory (created on first use and fetched at most once per process) instead of from
+    the source itself. The workspace's ``origin`` still points at the original repo input.
+    """
+
     if is_pip_repo_input(repo):
         spec = parse_pip_repo_input(repo)
         dest_dir.parent.mkdir(parents=True, exist_ok=True)
@@ -587,15 +741,20 @@ def acquire_target(*, repo: str, dest_dir: Path, ref: str | None) -> AcquiredTar
                         )
                     except RuntimeError:
                         resolved_ref = None
+                clone_from, no_local, mirror_dir = _clone_source_for(
+                    source=str(src), mirror_cache_dir=mirror_cache_dir
+                )
                 clone_outcome = _git_clone_with_windows_recovery(
-                    repo=str(src),
+                    repo=clone_from,
                     dest_dir=dest_dir,
-                    no_local=True,
+                    no_local=no_local,
                     protected_source=src,
                     enospc_owned_destinations=enospc_owned_destinations,
                 )
                 dest_dir = clone_outcome.destination
                 try:
+                    if mirror_dir is not None:
+                        _run_git(["remote", "set-url", "origin", str(src)], cwd=dest_dir)
                     if resolved_ref is not None:
                         _run_git(["fetch", "--no-tags", str(src), resolved_ref], cwd=dest_dir)
                         _run_git(["checkout", "--detach", resolved_ref], cwd=dest_dir)
@@ -641,8 +800,11 @@ def acquire_target(*, repo: str, dest_dir: Path, ref: str | None) -> AcquiredTar
                 mode="copy",
             )
 
+        clone_from, _no_local, mirror_dir = _clone_source_for(
+            source=repo, mirror_cache_dir=mirror_cache_dir
+        )
         clone_outcome = _git_clone_with_windows_recovery(
-            repo=repo,
+            repo=clone_from,
             dest_dir=dest_dir,
             no_local=False,
             protected_source=None,
@@ -650,6 +812,8 @@ def acquire_target(*, repo: str, dest_dir: Path, ref: str | None) -> AcquiredTar
         )
         dest_dir = clone_outcome.destination
         try:
+            if mirror_dir is not None:
+                _run_git(["remote", "set-url", "origin", repo], cwd=dest_dir)
             if ref is not None:
                 _run_git(["checkout", ref], cwd=dest_dir)
             sha = _run_git(["rev-parse", "HEAD"], cwd=dest_dir)
@@ -4,11 +4,13 @@ import json
 import os
 import shlex
 import shutil
+import socket
 import subprocess
 import threading
 import time
 import uuid
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -48,6 +50,16 @@ _BROKER_NONTERMINAL_STATUSES = {"pending", "running", "cancelling"}
 _BROKER_ALL_STATUSES = _BROKER_NONTERMINAL_STATUSES | _BROKER_TERMINAL_STATUSES
 _BROKER_ARTIFACT_REQUIRED_STATUSES = {"passed", "failed", "timed_out"}
 _BROKER_WORKSPACE_HASH_REQUIRED_STATUSES = {"passed"}
+_BROKER_POLL_SECONDS = 0.2
+# With the socket transport active, clients ring the broker directly; the request
+# directory is still rescanned as a safety net for clients that cannot connect.
+_BROKER_SOCKET_RESCAN_SECONDS = 2.0
+_BROKER_SOCKET_NAME = "broker.sock"
+_BROKER_SOCKET_READ_TIMEOUT_SECONDS = 2.0
+# sun_path is 108 bytes on Linux and 104 on macOS; stay below both.
+_BROKER_SOCKET_MAX_PATH_BYTES = 100
+_BROKER_TRANSPORT_ENV = "USERTEST_VERIFICATION_BROKER_TRANSPORT"
+_BROKER_TRANSPORTS = ("auto", "socket", "poll")
 
 
 def default_verification_hang_guard_seconds() -> float:
@@ -309,6 +321,21 @@ def resolve_verification_broker_timeout_seconds(
     return float(verification_timeout_seconds), False
 
 
+def resolve_verification_broker_transport(transport: str | None = None) -> str:
+    """Return ``auto``, ``socket`` or ``poll`` from *transport* or the environment.
+
+    ``auto`` uses the Unix socket transport when it can be bound and polling otherwise;
+    ``socket`` makes an unavailable socket an error; ``poll`` disables it.
+    """
+
+    raw = transport if transport is not None else os.environ.get(_BROKER_TRANSPORT_ENV, "")
+    value = str(raw).strip().lower() or "auto"
+    if value not in _BROKER_TRANSPORTS:
+        allowed = ", ".join(_BROKER_TRANSPORTS)
+        raise ValueError(f"verification broker transport must be one of: {allowed}")
+    return value
+
+
 def _compute_broker_internal_deadline_seconds(
     *,
     effective_timeout_seconds: float | None = None,
@@ -793,6 +820,149 @@ def _normalize_progress_snapshot(progress: dict[str, Any] | None) -> dict[str, A
     return payload or None
 
 
+@contextmanager
+def _unix_socket_address(path: Path) -> Iterator[str]:
+    """Yield a bindable address for *path*, shortening it through ``/proc`` when needed.
+
+    Run directories routinely exceed the ~100 byte ``sun_path`` limit. On Linux the
+    socket can still live there by addressing it relative to an open directory fd.
+    """
+
+    address = str(path)
+    if len(os.fsencode(address)) <= _BROKER_SOCKET_MAX_PATH_BYTES:
+        yield address
+        return
+    if not os.path.isdir("/proc/self/fd"):
+        raise OSError(f"unix socket path is too long: {address}")
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        yield f"/proc/self/fd/{dir_fd}/{path.name}"
+    finally:
+        os.close(dir_fd)
+
+
+class _BrokerDoorbell:
+    """Unix socket that lets verify clients wake the broker and wait for their result.
+
+    A client writes its request file as before, connects, and sends the request id on one
+    line. The broker wakes its worker immediately and answers ``done`` once the terminal
+    response file for that id has been written; the client then reads that file. The
+    on-disk request/response artifacts are unchanged, so a client that cannot connect
+    (e.g. a sandbox on another kernel) simply keeps polling them.
+    """
+
+    def __init__(self, path: Path, *, on_request: Callable[[], None]) -> None:
+        self.path = path
+        self._on_request = on_request
+        self._lock = threading.Lock()
+        self._waiters: dict[str, list[socket.socket]] = {}
+        self._terminal_ids: set[str] = set()
+        self._listener: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def start(self) -> None:
+        if os.name == "nt" or not hasattr(socket, "AF_UNIX"):
+            raise OSError("unix socket transport is unavailable on this platform")
+        self.path.unlink(missing_ok=True)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            with _unix_socket_address(self.path) as address:
+                listener.bind(address)
+            listener.listen(16)
+        except OSError:
+            listener.close()
+            raise
+        self._listener = listener
+        self._thread = threading.Thread(
+            target=self._accept_loop,
+            name=f"verification-broker-doorbell-{self.path.parent.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _accept_loop(self) -> None:
+        listener = self._listener
+        assert listener is not None
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            if self._closed:
+                conn.close()
+                return
+            try:
+                request_id = self._read_request_id(conn)
+            except OSError:
+                conn.close()
+                continue
+            if not request_id:
+                conn.close()
+                continue
+            with self._lock:
+                if request_id in self._terminal_ids:
+                    self._send_done(conn)
+                else:
+                    self._waiters.setdefault(request_id, []).append(conn)
+            self._on_request()
+
+    @staticmethod
+    def _read_request_id(conn: socket.socket) -> str:
+        conn.settimeout(_BROKER_SOCKET_READ_TIMEOUT_SECONDS)
+        buffer = b""
+        while b"\n" not in buffer and len(buffer) < 256:
+            chunk = conn.recv(256)
+            if not chunk:
+                break
+            buffer += chunk
+        conn.settimeout(None)
+        return buffer.split(b"\n", 1)[0].decode("utf-8", errors="replace").strip()
+
+    @staticmethod
+    def _send_done(conn: socket.socket) -> None:
+        try:
+            conn.sendall(b"done\n")
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    def notify_terminal(self, request_id: str) -> None:
+        with self._lock:
+            self._terminal_ids.add(request_id)
+            waiters = self._waiters.pop(request_id, [])
+            for conn in waiters:
+                self._send_done(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            waiters = [conn for conns in self._waiters.values() for conn in conns]
+            self._waiters.clear()
+        for conn in waiters:
+            # EOF without ``done`` sends the client back to polling the response file.
+            conn.close()
+        if self._listener is not None:
+            # Closing a listening socket does not reliably interrupt accept(); connect once
+            # so the accept loop observes ``_closed`` and exits.
+            try:
+                with (
+                    socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wake,
+                    _unix_socket_address(self.path) as address,
+                ):
+                    wake.settimeout(_BROKER_SOCKET_READ_TIMEOUT_SECONDS)
+                    wake.connect(address)
+            except OSError:
+                pass
+            if self._thread is not None:
+                self._thread.join(timeout=_BROKER_SOCKET_READ_TIMEOUT_SECONDS)
+            self._listener.close()
+        self.path.unlink(missing_ok=True)
+
+
 class VerificationBrokerAttempt:
     def __init__(
         self,
@@ -809,6 +979,7 @@ class VerificationBrokerAttempt:
         run_async_verifier: bool = True,
         request_token: str | None = None,
         existing_client: VerificationBrokerClient | None = None,
+        transport: str | None = None,
     ) -> None:
         self.run_dir = run_dir
         self.attempt_number = attempt_number
@@ -832,11 +1003,16 @@ class VerificationBrokerAttempt:
         self.python_script = client_root / "verify_client.py"
         self.shell_script = client_root / "verify_client.sh"
         self.powershell_script = client_root / "verify_client.ps1"
-        self._poll_seconds = 0.2
+        self.socket_path = self.attempt_root / _BROKER_SOCKET_NAME
+        self.requested_transport = resolve_verification_broker_transport(transport)
+        self._poll_seconds = _BROKER_POLL_SECONDS
         self._processed_ids: set[str] = set()
         self._request_counter = 0
         self._results: list[VerificationBrokerRequestResult] = []
         self._results_lock = threading.Lock()
+        self._results_changed = threading.Condition(self._results_lock)
+        self._wake = threading.Event()
+        self._doorbell: _BrokerDoorbell | None = None
         self._active_request_lock = threading.Lock()
         self._active_cancel_event: threading.Event | None = None
         self._stop = threading.Event()
@@ -871,12 +1047,31 @@ class VerificationBrokerAttempt:
     def client(self) -> VerificationBrokerClient:
         return self._client
 
+    @property
+    def transport(self) -> str:
+        """The active request transport: ``socket`` or ``poll``."""
+
+        return "socket" if self._doorbell is not None else "poll"
+
     def start(self) -> None:
         self.requests_dir.mkdir(parents=True, exist_ok=True)
         self.responses_dir.mkdir(parents=True, exist_ok=True)
         if self._thread is not None:
+            self._start_doorbell()
             self._thread.start()
 
+    def _start_doorbell(self) -> None:
+        if self.requested_transport == "poll":
+            return
+        doorbell = _BrokerDoorbell(self.socket_path, on_request=self._wake.set)
+        try:
+            doorbell.start()
+        except OSError:
+            if self.requested_transport == "socket":
+                raise
+            return
+        self._doorbell = doorbell
+
     def stop(
         self,
         *,
@@ -890,6 +1085,7 @@ class VerificationBrokerAttempt:
         self._request_settle_seconds = max(0.0, float(request_settle_seconds))
         self._drain_deadline_monotonic = time.monotonic() + self._request_settle_seconds
         self._stop.set()
+        self._wake.set()
         with self._active_request_lock:
             if self._cancel_pending_on_stop and self._active_cancel_event is not None:
                 self._active_cancel_event.set()
@@ -902,6 +1098,8 @@ class VerificationBrokerAttempt:
         if join_timeout_seconds is None and self._cancel_pending_on_stop:
             join_timeout_seconds = _BROKER_STOP_JOIN_TIMEOUT_SECONDS
         self._thread.join(timeout=join_timeout_seconds)
+        if self._doorbell is not None:
+            self._doorbell.close()
 
     def latest_success_result(self) -> VerificationBrokerRequestResult | None:
         with self._results_lock:
@@ -974,20 +1172,26 @@ class VerificationBrokerAttempt:
                 "request_origin": origin or "runner",
             },
         )
+        self._wake.set()
         wait_timeout = (
             self.contract.client_wait_timeout_seconds
             if timeout_seconds is None
             else max(0.0, float(timeout_seconds))
         )
         deadline = time.monotonic() + wait_timeout
-        while True:
-            with self._results_lock:
+        with self._results_changed:
+            while True:
                 for result in self._results:
                     if result.request_id == request_id:
                         return result
-            if time.monotonic() >= deadline:
-                return None
-            time.sleep(self._poll_seconds)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0.0:
+                    return None
+                self._results_changed.wait(timeout=remaining)
+
+    def _wait_for_requests(self, timeout_seconds: float) -> None:
+        self._wake.wait(timeout=timeout_seconds)
+        self._wake.clear()
 
     def _worker_loop(self) -> None:
         while True:
@@ -1006,10 +1210,14 @@ class VerificationBrokerAttempt:
                     and time.monotonic() >= self._drain_deadline_monotonic
                 ):
                     break
-                self._stop.wait(self._poll_seconds)
+                self._wait_for_requests(self._poll_seconds)
                 continue
             if not processed:
-                self._stop.wait(self._poll_seconds)
+                self._wait_for_requests(
+                    _BROKER_SOCKET_RESCAN_SECONDS
+                    if self._doorbell is not None
+                    else self._poll_seconds
+                )
 
     def _process_ready_requests(self, *, cancel_pending: bool) -> bool:
         processed_any = False
@@ -1384,9 +1592,12 @@ class VerificationBrokerAttempt:
         result: VerificationBrokerRequestResult,
         response_path: Path,
     ) -> None:
-        with self._results_lock:
+        with self._results_changed:
             self._results.append(result)
+            self._results_changed.notify_all()
         self._write_response_snapshot(response_path=response_path, result=result)
+        if self._doorbell is not None:
+            self._doorbell.notify_terminal(result.request_id)
 
     def _write_client_files(
         self,
@@ -1399,10 +1610,16 @@ class VerificationBrokerAttempt:
         self.client_root.mkdir(parents=True, exist_ok=True)
         request_dir_for_agent = agent_path_join(self.attempt_root_for_agent, "requests")
         response_dir_for_agent = agent_path_join(self.attempt_root_for_agent, "responses")
+        broker_socket_for_agent = (
+            ""
+            if self.requested_transport == "poll"
+            else agent_path_join(self.attempt_root_for_agent, _BROKER_SOCKET_NAME)
+        )
         python_payload = _render_client_python(
             request_token=self.request_token,
             request_dir=request_dir_for_agent,
             response_dir=response_dir_for_agent,
+            broker_socket=broker_socket_for_agent,
             wait_timeout_seconds=wait_timeout_seconds,
             required_terminal_artifacts=required_terminal_artifacts,
         )
@@ -1448,11 +1665,14 @@ def _render_client_python(
     response_dir: str,
     wait_timeout_seconds: float,
     required_terminal_artifacts: Sequence[str],
+    broker_socket: str = "",
 ) -> str:
     contract = _verification_broker_response_contract()
     payload = """from __future__ import annotations
 
 import json
+import os
+import socket
 import sys
 import time
 import uuid
@@ -1461,6 +1681,8 @@ from pathlib import Path
 REQUEST_TOKEN = __REQUEST_TOKEN__
 REQUEST_DIR = Path(__REQUEST_DIR__)
 RESPONSE_DIR = Path(__RESPONSE_DIR__)
+BROKER_SOCKET = __BROKER_SOCKET__
+SOCKET_MAX_PATH_BYTES = __SOCKET_MAX_PATH_BYTES__
 WAIT_TIMEOUT_SECONDS = __WAIT_TIMEOUT_SECONDS__
 REQUIRED_TERMINAL_ARTIFACT_FIELDS = __REQUIRED_TERMINAL_ARTIFACT_FIELDS__
 NO_ARTIFACT_FAILURE_REASONS = __NO_ARTIFACT_FAILURE_REASONS__
@@ -1536,6 +1758,30 @@ def _load_response(path: Path, request_id: str) -> tuple[dict[str, object] | Non
     return payload, None
 
 
+def _wait_for_broker_signal(request_id: str, deadline: float) -> None:
+    # Best effort: block until the broker reports a terminal response for request_id.
+    # Any failure (no socket, other kernel, broker restart) falls back to polling.
+    family = getattr(socket, "AF_UNIX", None)
+    if not BROKER_SOCKET or family is None:
+        return
+    dir_fd = None
+    try:
+        address = BROKER_SOCKET
+        if len(os.fsencode(address)) > SOCKET_MAX_PATH_BYTES:
+            dir_fd = os.open(os.path.dirname(address), os.O_RDONLY)
+            address = f"/proc/self/fd/{dir_fd}/{os.path.basename(address)}"
+        with socket.socket(family, socket.SOCK_STREAM) as conn:
+            conn.settimeout(max(0.1, deadline - time.monotonic()))
+            conn.connect(address)
+            conn.sendall(request_id.encode("utf-8") + b"\\n")
+            conn.recv(64)
+    except OSError:
+        return
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+
 def _failure_reason_allows_missing_artifacts(failure_reason: str) -> bool:
     normalized = failure_reason.strip()
     if not normalized:
@@ -1658,6 +1904,7 @@ def main() -> int:
     print(f"verification requested (request_id={request_id})", flush=True)
 
     deadline = time.monotonic() + float(WAIT_TIMEOUT_SECONDS)
+    _wait_for_broker_signal(request_id, deadline)
     while True:
         if response_path.exists():
             response_payload, error = _load_response(response_path, request_id)
@@ -1695,6 +1942,8 @@ if __name__ == "__main__":
         payload.replace("__REQUEST_TOKEN__", json.dumps(request_token))
         .replace("__REQUEST_DIR__", json.dumps(request_dir))
         .replace("__RESPONSE_DIR__", json.dumps(response_dir))
+        .replace("__BROKER_SOCKET__", json.dumps(broker_socket))
+        .replace("__SOCKET_MAX_PATH_BYTES__", str(_BROKER_SOCKET_MAX_PATH_BYTES))
         .replace("__WAIT_TIMEOUT_SECONDS__", repr(float(wait_timeout_seconds)))
         .replace(
             "__REQUIRED_TERMINAL_ARTIFACT_FIELDS__",
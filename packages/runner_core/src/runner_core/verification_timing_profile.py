@@ -1,16 +1,36 @@
+"""Verification timing guidance built from earlier runs.
+
+Timings come from an append-only store at ``<runs_dir>/_cache/verification_timing.jsonl``
+with one compact line per ``verification.json`` artifact.  The runner appends a run's
+artifacts when the run finishes (:func:`record_verification_timings`), and
+:func:`build_verification_timing_profile` reads only the tail of the store, newest line
+first, until it has ``max_artifacts`` distinct artifacts.  Startup cost therefore no longer
+grows with the size of the runs tree.
+
+The first profile build for a runs dir with no store seeds it from a full scan of the tree.
+Appends made before the store exists are skipped, because that scan picks them up.  Deleting
+the store forces a fresh scan.  Lines whose ``verification.json`` no longer exists (pruned
+run dirs) are skipped when the profile is built, so deleted runs stop counting as history.
+"""
+
 from __future__ import annotations
 
 import json
 import os
 import statistics
+import threading
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 MIN_HISTORY_RUNS_FOR_EXPECTED_WAIT = 5
 DEFAULT_FALLBACK_INITIAL_WAIT_SECONDS = 900.0
 DEFAULT_SUCCESS_MARGIN_SECONDS = 300.0
 SLOWEST_COMMAND_LIMIT = 5
+VERIFICATION_TIMING_STORE_FILENAME = "verification_timing.jsonl"
+_SKIPPED_DIRECTORY_NAMES = frozenset({"_workspaces", ".git", ".venv", "__pycache__"})
+_TAIL_BLOCK_BYTES = 64 * 1024
 
 
 @dataclass(frozen=True)
@@ -74,9 +94,7 @@ def _iter_verification_json_paths(root: Path) -> list[Path]:
         return paths
     for dirpath, dirnames, filenames in os.walk(root):
         dirnames[:] = [
-            dirname
-            for dirname in dirnames
-            if dirname not in {"_workspaces", ".git", ".venv", "__pycache__"}
+            dirname for dirname in dirnames if dirname not in _SKIPPED_DIRECTORY_NAMES
         ]
         if "verification.json" not in filenames:
             continue
@@ -179,6 +197,152 @@ def _load_records(
     return scanned, run_records, command_records
 
 
+def verification_timing_store_path(runs_dir: Path) -> Path:
+    """Return the path of the verification timing store for *runs_dir*."""
+
+    return runs_dir / "_cache" / VERIFICATION_TIMING_STORE_FILENAME
+
+
+def _store_line(path: Path) -> bytes | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:  # noqa: BLE001
+        return None
+    if not isinstance(payload, dict):
+        return None
+    entry: dict[str, Any] = {
+        key: payload[key]
+        for key in ("status", "passed", "skipped", "wall_seconds")
+        if key in payload
+    }
+    commands = payload.get("commands")
+    if isinstance(commands, list):
+        # Non-dict items stay as placeholders so fallback labels keep their "command #N".
+        entry["commands"] = [
+            {
+                key: item[key]
+                for key in ("label", "command", "wall_seconds")
+                if key in item
+            }
+            if isinstance(item, dict)
+            else None
+            for item in commands
+        ]
+    try:
+        # Resolved so ``current_run_dir`` exclusion works however the run dir was spelled.
+        entry["artifact_path"] = str(path.resolve())
+    except OSError:
+        entry["artifact_path"] = str(path)
+    return (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _store_lines(paths: list[Path]) -> bytes:
+    # ``paths`` are newest first; the store is appended oldest first.
+    lines = (_store_line(path) for path in reversed(paths))
+    return b"".join(line for line in lines if line is not None)
+
+
+def record_verification_timings(*, runs_dir: Path, run_dir: Path) -> int:
+    """Append every ``verification.json`` under *run_dir* to the runs dir timing store.
+
+    Returns the number of bytes appended.  Nothing is written when the store does not exist
+    yet, since seeding it scans the whole runs tree anyway.  Failures are ignored because the
+    store only speeds up timing guidance.
+    """
+
+    store_path = verification_timing_store_path(runs_dir)
+    if not store_path.is_file():
+        return 0
+    data = _store_lines(_iter_verification_json_paths(run_dir))
+    if not data:
+        return 0
+    try:
+        # A single O_APPEND write keeps concurrent runs from interleaving within a line.
+        descriptor = os.open(store_path, os.O_APPEND | os.O_WRONLY)
+        try:
+            os.write(descriptor, data)
+        finally:
+            os.close(descriptor)
+    except OSError:
+        return 0
+    return len(data)
+
+
+def _seed_store(store_path: Path, runs_dir: Path) -> None:
+    temp = store_path.with_name(
+        f".{store_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        store_path.parent.mkdir(parents=True, exist_ok=True)
+        temp.write_bytes(_store_lines(_iter_verification_json_paths(runs_dir)))
+        # link() refuses to replace a store another process seeded or appended to meanwhile.
+        os.link(temp, store_path)
+    except OSError:
+        pass
+    finally:
+        temp.unlink(missing_ok=True)
+
+
+def _reversed_lines(handle: BinaryIO) -> Iterator[bytes]:
+    handle.seek(0, os.SEEK_END)
+    position = handle.tell()
+    remainder = b""
+    while position > 0:
+        step = min(_TAIL_BLOCK_BYTES, position)
+        position -= step
+        handle.seek(position)
+        lines = (handle.read(step) + remainder).split(b"\n")
+        remainder = lines.pop(0)
+        for line in reversed(lines):
+            if line.strip():
+                yield line
+    if remainder.strip():
+        yield remainder
+
+
+def _load_store_records(
+    store_path: Path,
+    *,
+    exclude_paths: set[Path],
+    max_artifacts: int,
+) -> tuple[int, list[_RunRecord], list[_CommandRecord]] | None:
+    run_records: list[_RunRecord] = []
+    command_records: list[_CommandRecord] = []
+    scanned = 0
+    seen: set[str] = set()
+    try:
+        handle = store_path.open("rb")
+    except OSError:
+        return None
+    with handle:
+        for line in _reversed_lines(handle):
+            if scanned >= max_artifacts:
+                break
+            try:
+                entry = json.loads(line)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                # Most likely a line still being appended.
+                continue
+            artifact = entry.get("artifact_path") if isinstance(entry, dict) else None
+            if not isinstance(artifact, str) or artifact in seen:
+                continue
+            seen.add(artifact)
+            artifact_path = Path(artifact)
+            if any(
+                artifact_path == excluded or excluded in artifact_path.parents
+                for excluded in exclude_paths
+            ):
+                continue
+            if not artifact_path.is_file():
+                continue
+            scanned += 1
+            run_record, records = _records_from_payload(entry, artifact_path=artifact_path)
+            if run_record is not None:
+                run_records.append(run_record)
+            command_records.extend(records)
+    return scanned, run_records, command_records
+
+
 def _recommendations(
     *,
     run_stats: dict[str, Any] | None,
@@ -248,7 +412,11 @@ def build_verification_timing_profile(
     current_run_dir: Path | None = None,
     max_artifacts: int = 200,
 ) -> dict[str, Any]:
-    """Build a compact timing profile from recent ``verification.json`` artifacts."""
+    """Build a compact timing profile from recent ``verification.json`` artifacts.
+
+    Artifacts are read from the runs dir timing store, which is seeded by a full scan when
+    missing.  If the store cannot be created the runs tree is scanned directly.
+    """
 
     exclude_paths: set[Path] = set()
     if current_run_dir is not None:
@@ -257,12 +425,23 @@ def build_verification_timing_profile(
         except OSError:
             exclude_paths.add(current_run_dir)
 
-    all_paths = _iter_verification_json_paths(runs_dir)
-    scanned, run_records, command_records = _load_records(
-        all_paths,
-        exclude_paths=exclude_paths,
-        max_artifacts=max(1, int(max_artifacts)),
+    bounded_max_artifacts = max(1, int(max_artifacts))
+    store_path = verification_timing_store_path(runs_dir)
+    loaded = _load_store_records(
+        store_path, exclude_paths=exclude_paths, max_artifacts=bounded_max_artifacts
     )
+    if loaded is None and runs_dir.is_dir():
+        _seed_store(store_path, runs_dir)
+        loaded = _load_store_records(
+            store_path, exclude_paths=exclude_paths, max_artifacts=bounded_max_artifacts
+        )
+    if loaded is None:
+        loaded = _load_records(
+            _iter_verification_json_paths(runs_dir),
+            exclude_paths=exclude_paths,
+            max_artifacts=bounded_max_artifacts,
+        )
+    scanned, run_records, command_records = loaded
 
     run_seconds = [record.wall_seconds for record in run_records]
     command_seconds = [record.wall_seconds for record in command_records]
@@ -286,8 +465,9 @@ def build_verification_timing_profile(
         "source": {
             "runs_dir": str(runs_dir),
             "excluded_directory_names": ["_workspaces"],
+            "timing_store": str(store_path),
             "scanned_artifact_count": scanned,
-            "max_artifacts": max(1, int(max_artifacts)),
+            "max_artifacts": bounded_max_artifacts,
         },
         "run_count": len(run_records),
         "command_count": len(command_records),
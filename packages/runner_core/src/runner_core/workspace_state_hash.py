@@ -1,17 +1,42 @@
+"""Content hash of a workspace's tracked, untracked and deleted files.
+
+The hash is one SHA-256 stream over every entry's encoded path, kind and bytes, in path
+order.  Repeated hashes of the same workspace reuse work through a per-process stat cache,
+much like git's index: each entry's ``lstat`` key (size, mtime, ctime, inode, mode) is
+remembered together with SHA-256 checkpoints of the stream, so
+
+- when every entry's stat key is unchanged, the cached stream state is reused and no file
+  is read;
+- otherwise hashing resumes from the last checkpoint before the first changed entry, and
+  only entries from there on are read again.
+
+Entries modified within :data:`_RACY_WINDOW_NS` of a hash are never trusted on the next
+one, because a same-size rewrite in the same timestamp tick would keep their stat key.
+The resulting ``sha256`` is identical to hashing every file from scratch.
+"""
+
 from __future__ import annotations
 
 import hashlib
 import os
+import stat
 import subprocess
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from runner_core.pathing import LOCAL_BACKEND_RUN_DIR_ALIAS, normalize_agent_path
 
 HashMode = Literal["git", "filesystem"]
 
 _EXCLUDED_TOP_LEVEL_DIRS = (".git", LOCAL_BACKEND_RUN_DIR_ALIAS)
+_RACY_WINDOW_NS = 2_000_000_000
+_CHECKPOINT_BYTES = 8 * 1024 * 1024
+_CHECKPOINT_ENTRIES = 1024
+_MAX_CACHED_WORKSPACES = 16
 
 
 def _is_excluded_rel_path(rel: str) -> bool:
@@ -26,6 +51,8 @@ class WorkspaceStateHash:
     mode: HashMode
     file_count: int
     deleted_count: int
+    rehashed_count: int = 0
+    reused_count: int = 0
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -33,9 +60,102 @@ class WorkspaceStateHash:
             "mode": self.mode,
             "file_count": self.file_count,
             "deleted_count": self.deleted_count,
+            "rehashed_count": self.rehashed_count,
+            "reused_count": self.reused_count,
         }
 
 
+# (rel path, kind, path, stat key); the stat key is ``None`` while the entry is racy.
+_Entry = tuple[str, str, Path, "tuple[int, ...] | None"]
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    keys: list[tuple[str, str, tuple[int, ...] | None]]
+    # ``(entries hashed, sha256 state after them)``; states are copied, never updated.
+    checkpoints: list[tuple[int, Any]]
+
+
+_CACHE_LOCK = threading.Lock()
+_SNAPSHOTS: OrderedDict[tuple[str, str], _Snapshot] = OrderedDict()
+
+
+def clear_workspace_state_hash_cache() -> None:
+    with _CACHE_LOCK:
+        _SNAPSHOTS.clear()
+
+
+def _stat_entry(rel: str, path: Path, started_ns: int) -> _Entry | None:
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if stat.S_ISLNK(st.st_mode):
+        kind = "symlink"
+    elif stat.S_ISREG(st.st_mode):
+        kind = "file"
+    else:
+        return None
+    key: tuple[int, ...] | None = (
+        st.st_size,
+        st.st_mtime_ns,
+        st.st_ctime_ns,
+        st.st_ino,
+        st.st_mode,
+    )
+    if max(st.st_mtime_ns, st.st_ctime_ns) >= started_ns - _RACY_WINDOW_NS:
+        key = None
+    return rel, kind, path, key
+
+
+def _hash_entries(
+    cache_key: tuple[str, str],
+    entries: list[_Entry],
+    trailer: bytes,
+) -> tuple[str, int]:
+    """Return ``(sha256 hex, entries reused from the cache)`` for the encoded stream."""
+
+    keys = [(rel, kind, key) for rel, kind, _path, key in entries]
+    with _CACHE_LOCK:
+        snapshot = _SNAPSHOTS.get(cache_key)
+    digest = hashlib.sha256()
+    checkpoints: list[tuple[int, Any]] = [(0, digest.copy())]
+    if snapshot is not None:
+        unchanged = 0
+        for previous, current in zip(snapshot.keys, keys, strict=False):
+            if current[2] is None or previous != current:
+                break
+            unchanged += 1
+        checkpoints = [item for item in snapshot.checkpoints if item[0] <= unchanged]
+        digest = checkpoints[-1][1].copy()
+    resume_at = checkpoints[-1][0]
+    pending_bytes = 0
+    for index in range(resume_at, len(entries)):
+        rel, kind, path, _key = entries[index]
+        if kind == "symlink":
+            data = os.readlink(path).encode("utf-8", "surrogateescape")
+        else:
+            data = path.read_bytes()
+        digest.update(_encode_entry(rel, kind, data))
+        pending_bytes += len(data)
+        if (
+            pending_bytes >= _CHECKPOINT_BYTES
+            or index + 1 - checkpoints[-1][0] >= _CHECKPOINT_ENTRIES
+        ):
+            checkpoints.append((index + 1, digest.copy()))
+            pending_bytes = 0
+    if checkpoints[-1][0] != len(entries):
+        checkpoints.append((len(entries), digest.copy()))
+    with _CACHE_LOCK:
+        _SNAPSHOTS[cache_key] = _Snapshot(keys=keys, checkpoints=checkpoints)
+        _SNAPSHOTS.move_to_end(cache_key)
+        while len(_SNAPSHOTS) > _MAX_CACHED_WORKSPACES:
+            _SNAPSHOTS.popitem(last=False)
+    final = digest.copy()
+    final.update(trailer)
+    return final.hexdigest(), resume_at
+
+
 def compute_workspace_state_hash(workspace_dir: Path) -> WorkspaceStateHash:
     try:
         return _compute_git_workspace_state_hash(workspace_dir)
@@ -61,44 +181,40 @@ def _compute_git_workspace_state_hash(workspace_dir: Path) -> WorkspaceStateHash
         workspace_dir,
         ["git", "-C", str(workspace_dir), "ls-files", "--deleted", "-z"],
     )
-    entries: list[tuple[str, bytes]] = []
-    deleted_entries: list[str] = []
+    started_ns = time.time_ns()
+    entries: list[_Entry] = []
+    deleted_entries: set[str] = set()
     for rel in tracked_and_untracked:
         if not rel or _is_excluded_rel_path(rel):
             continue
         rel_norm = normalize_agent_path(rel)
-        path = workspace_dir / Path(rel_norm)
-        if not path.exists() and not path.is_symlink():
-            continue
-        if path.is_symlink():
-            kind = "symlink"
-            data = os.readlink(path).encode("utf-8", "surrogateescape")
-        elif path.is_file():
-            kind = "file"
-            data = path.read_bytes()
-        else:
-            continue
-        entries.append((rel_norm, _encode_entry(rel_norm, kind, data)))
+        entry = _stat_entry(rel_norm, workspace_dir / Path(rel_norm), started_ns)
+        if entry is not None:
+            entries.append(entry)
     for rel in deleted:
         if not rel or _is_excluded_rel_path(rel):
             continue
-        rel_norm = normalize_agent_path(rel)
-        deleted_entries.append(rel_norm)
-    digest = hashlib.sha256()
-    for _rel, encoded in sorted(entries, key=lambda item: item[0]):
-        digest.update(encoded)
-    for deleted_rel in sorted(set(deleted_entries)):
-        digest.update(_encode_deleted_entry(deleted_rel))
+        deleted_entries.add(normalize_agent_path(rel))
+    # Stable sort: duplicate listings (unmerged index stages) keep their order.
+    entries.sort(key=lambda item: item[0])
+    sha256, reused = _hash_entries(
+        (str(workspace_dir.resolve()), "git"),
+        entries,
+        b"".join(_encode_deleted_entry(rel) for rel in sorted(deleted_entries)),
+    )
     return WorkspaceStateHash(
-        sha256=digest.hexdigest(),
+        sha256=sha256,
         mode="git",
         file_count=len(entries),
-        deleted_count=len(set(deleted_entries)),
+        deleted_count=len(deleted_entries),
+        rehashed_count=len(entries) - reused,
+        reused_count=reused,
     )
 
 
 def _compute_filesystem_workspace_state_hash(workspace_dir: Path) -> WorkspaceStateHash:
-    entries: list[tuple[str, bytes]] = []
+    started_ns = time.time_ns()
+    entries: list[_Entry] = []
     for path in sorted(workspace_dir.rglob("*")):
         try:
             rel = path.relative_to(workspace_dir).as_posix()
@@ -106,23 +222,17 @@ def _compute_filesystem_workspace_state_hash(workspace_dir: Path) -> WorkspaceSt
             continue
         if not rel or _is_excluded_rel_path(rel):
             continue
-        if path.is_symlink():
-            kind = "symlink"
-            data = os.readlink(path).encode("utf-8", "surrogateescape")
-        elif path.is_file():
-            kind = "file"
-            data = path.read_bytes()
-        else:
-            continue
-        entries.append((rel, _encode_entry(rel, kind, data)))
-    digest = hashlib.sha256()
-    for _, encoded in entries:
-        digest.update(encoded)
+        entry = _stat_entry(rel, path, started_ns)
+        if entry is not None:
+            entries.append(entry)
+    sha256, reused = _hash_entries((str(workspace_dir.resolve()), "filesystem"), entries, b"")
     return WorkspaceStateHash(
-        sha256=digest.hexdigest(),
+        sha256=sha256,
         mode="filesystem",
         file_count=len(entries),
         deleted_count=0,
+        rehashed_count=len(entries) - reused,
+        reused_count=reused,
     )
 
 
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
+from sandbox_runner import image_hash
+from sandbox_runner import pool as pool_module
 
 from runner_core.execution_backend import prepare_execution_backend
 from runner_core.runner import RunRequest
@@ -1280,3 +1284,153 @@ def test_prepare_maintenance_profile_cleanup_failure_is_best_effort(
     assert json.loads(post_cleanup_artifact.read_text(encoding="utf-8"))["errors"] == [
         "Post-resolution maintenance image cleanup failed: boom"
     ]
+
+
+_STUB_DOCKER = """\
+import json
+import os
+import sys
+
+with open(os.environ["STUB_DOCKER_LOG"], "a", encoding="utf-8") as log:
+    log.write(json.dumps(sys.argv[1:]) + "\\n")
+if sys.argv[1:2] == ["run"]:
+    print("container-id")
+"""
+
+
+def _install_stub_docker(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    stub = bin_dir / "docker"
+    stub.write_text(f"#!{sys.executable}\n{_STUB_DOCKER}", encoding="utf-8")
+    stub.chmod(0o755)
+    log_path = tmp_path / "docker.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{Path(sys.executable).parent}")
+    monkeypatch.setenv("STUB_DOCKER_LOG", str(log_path))
+    return log_path
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="stub docker is a POSIX script")
+def test_prepare_execution_backend_reuses_image_hash_across_per_run_contexts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_stub_docker(tmp_path, monkeypatch)
+    monkeypatch.delenv("SANDBOX_RUNNER_POOL_SIZE", raising=False)
+    image_hash.clear_image_hash_cache()
+    repo_root = tmp_path / "repo"
+    context_dir = _make_default_context(repo_root)
+    _write(context_dir / "scripts" / "large.bin", "x" * 4096)
+    # Checked-in context files are old; per-run copies keep their mtimes.
+    for path in context_dir.rglob("*"):
+        os.utime(path, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+
+    reads: list[Path] = []
+    real_digest = image_hash._file_digest
+
+    def _counting(path: Path) -> bytes:
+        reads.append(path)
+        return real_digest(path)
+
+    monkeypatch.setattr(image_hash, "_file_digest", _counting)
+    req = RunRequest(
+        repo=".", agent="codex", exec_backend="docker", exec_use_host_agent_login=False
+    )
+    agent_cfg = {"sandbox_cli_install": {"pip": ["example-agent-cli"]}}
+
+    tags: list[str] = []
+    for name in ("a", "b"):
+        del reads[:]
+        run_dir = tmp_path / f"run-{name}"
+        workspace_dir = tmp_path / f"workspace-{name}"
+        run_dir.mkdir()
+        workspace_dir.mkdir()
+        ctx = prepare_execution_backend(
+            repo_root=repo_root,
+            run_dir=run_dir,
+            workspace_dir=workspace_dir,
+            request=req,
+            workspace_id=name,
+            agent_cfg=agent_cfg,
+        )
+        assert ctx.sandbox_instance is not None
+        tags.append(ctx.sandbox_instance.image_tag)
+        ctx.sandbox_instance.close()
+        image_context = (run_dir / "sandbox" / "image_context").resolve()
+        read_rel = {path.relative_to(image_context).as_posix() for path in reads}
+        assert "overlays/manifests/pip.txt" in read_rel
+
+    # The second run only re-read the overlay manifests it wrote itself.
+    assert all(rel.startswith("overlays/") for rel in read_rel)
+    assert tags[0] == tags[1]
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="stub docker is a POSIX script")
+def test_prepare_execution_backend_pooled_runs_see_real_workspace_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log_path = _install_stub_docker(tmp_path, monkeypatch)
+    image_hash.clear_image_hash_cache()
+    host_calls: list[list[str]] = []
+
+    def _run_host(argv: list[str]) -> bool:
+        host_calls.append(argv)
+        return True
+
+    monkeypatch.setenv(pool_module.POOL_SIZE_ENV, "1")
+    # Without background refill, the second run deterministically reuses the first container.
+    pool = pool_module.DockerSandboxPool(
+        size=1, staging_root=tmp_path / "staging", background_refill=False
+    )
+    monkeypatch.setattr(pool_module, "_SHARED", {1: pool})
+    monkeypatch.setattr(pool_module, "_host_staging_supported", lambda: True)
+    monkeypatch.setattr(pool_module, "_run_host", _run_host)
+    repo_root = tmp_path / "repo"
+    _make_default_context(repo_root)
+    req = RunRequest(
+        repo=".", agent="codex", exec_backend="docker", exec_use_host_agent_login=False
+    )
+
+    instances = []
+    for name in ("a", "b"):
+        run_dir = tmp_path / f"run-{name}"
+        workspace_dir = tmp_path / f"workspace-{name}"
+        run_dir.mkdir()
+        workspace_dir.mkdir()
+        ctx = prepare_execution_backend(
+            repo_root=repo_root,
+            run_dir=run_dir,
+            workspace_dir=workspace_dir,
+            request=req,
+            workspace_id=name,
+            agent_cfg={},
+        )
+        instance = ctx.sandbox_instance
+        assert isinstance(instance, pool_module.PooledDockerSandboxInstance)
+        assert ctx.workspace_mount == "/workspace"
+        assert ctx.command_prefix[:5] == ["docker", "exec", "-i", "-w", "/workspace"]
+        meta = json.loads((run_dir / "sandbox" / "sandbox.json").read_text(encoding="utf-8"))
+        assert meta["pool"]["staged_paths"] == ["/workspace", "/artifacts", "/run_dir"]
+        instances.append(instance)
+        instance.close()
+
+    first, second = instances
+    assert (first.pool_hit, second.pool_hit) == (False, True)
+    assert second.container_name == first.container_name
+    calls = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    started = [argv for argv in calls if argv[0] == "run"]
+    assert len(started) == 1
+    slot = (tmp_path / "staging").resolve() / first.container_name
+    assert (
+        f"type=bind,source={slot / '0'},target=/workspace,bind-propagation=rslave" in started[0]
+    )
+    # Run directories are mounted onto the slot entries behind /workspace and /run_dir; the
+    # container itself never gets links or the host paths.
+    assert ["mount", "--bind", str((tmp_path / "workspace-b").resolve()), str(slot / "0")] in (
+        host_calls
+    )
+    assert ["mount", "--bind", str((tmp_path / "run-b").resolve()), str(slot / "2")] in (
+        host_calls
+    )
+    assert not any(str(tmp_path / "workspace-a") in arg for arg in started[0])
+    assert not any(argv[0] == "exec" and "ln -s" in argv[-1] for argv in calls)
+    pool.close()
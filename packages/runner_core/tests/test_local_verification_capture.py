@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
 import pytest
 
 from runner_core import capture_local_verification
+from runner_core.verification_timing_profile import verification_timing_store_path
 
 
 def test_capture_local_verification_writes_exact_command_and_stream_artifacts(
@@ -59,3 +61,26 @@ def test_capture_local_verification_refuses_to_overwrite_receipt(
             timeout_seconds=30.0,
             python_executable=sys.executable,
         )
+
+
+def test_capture_local_verification_appends_to_the_timing_store(tmp_path: Path) -> None:
+    runs_dir = tmp_path / "runs"
+    store_path = verification_timing_store_path(runs_dir)
+    store_path.parent.mkdir(parents=True)
+    store_path.write_bytes(b"")
+    run_dir = runs_dir / "_handoff_adoptions" / "fingerprint" / "capture"
+
+    capture_local_verification(
+        run_dir=run_dir,
+        cwd=tmp_path,
+        commands=["python --version"],
+        timeout_seconds=30.0,
+        python_executable=sys.executable,
+        runs_dir=runs_dir,
+    )
+
+    recorded = {
+        json.loads(line)["artifact_path"]
+        for line in store_path.read_text(encoding="utf-8").splitlines()
+    }
+    assert str((run_dir / "verification.json").resolve()) in recorded
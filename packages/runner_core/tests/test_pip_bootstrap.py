@@ -284,3 +284,82 @@ def test_local_gitlab_bootstrap_uses_authenticated_index_env(
     )
     assert install_env["PIP_EXTRA_INDEX_URL"] == "https://pypi.org/simple"
     assert "p@ss word" not in (run_dir / "bootstrap_pip.log").read_text(encoding="utf-8")
+
+
+def test_local_bootstrap_clones_venv_template_on_cache_hit(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    if pb.os.name == "nt":
+        pytest.skip("venv templates are disabled on Windows")
+    for name in ("GITLAB_PYPI_PROJECT_ID", "GITLAB_PYPI_USERNAME", "GITLAB_PYPI_PASSWORD"):
+        monkeypatch.delenv(name, raising=False)
+    cache_dir = tmp_path / "cache"
+    install_calls: list[list[str]] = []
+
+    def _fake_run_logged(
+        argv: list[str],
+        *,
+        cwd: Path | None,
+        env: dict[str, str] | None,
+        log: list[str],
+    ) -> subprocess.CompletedProcess[str]:
+        del env
+        assert cwd is not None
+        log.append("$ " + " ".join(argv))
+        venv = cwd / ".venv"
+        if argv[1:3] == ["-m", "venv"]:
+            (venv / "bin").mkdir(parents=True)
+            (venv / "pyvenv.cfg").write_text(f"command = python -m venv {venv}\n", "utf-8")
+            (venv / "bin" / "activate").write_text(f'VIRTUAL_ENV="{venv}"\n', "utf-8")
+        else:
+            install_calls.append(argv)
+            (venv / "bin" / "tool").write_text(f"#!{venv}/bin/python\n", "utf-8")
+        return subprocess.CompletedProcess(argv, 0, stdout="", stderr="")
+
+    real_run = subprocess.run
+
+    def _fake_subprocess_run(argv: list[str], **kwargs: Any) -> Any:
+        if "--format=json" in argv:
+            return subprocess.CompletedProcess(argv, 0, stdout="[]", stderr="")
+        return real_run(argv, **kwargs)
+
+    monkeypatch.setattr(pb, "_run_logged", _fake_run_logged)
+    monkeypatch.setattr(pb.subprocess, "run", _fake_subprocess_run)
+
+    def _bootstrap(name: str, requirements: str) -> tuple[Path, dict[str, Any]]:
+        workspace_dir = tmp_path / name
+        run_dir = tmp_path / f"{name}_run"
+        workspace_dir.mkdir()
+        run_dir.mkdir()
+        (workspace_dir / "requirements.txt").write_text(requirements, encoding="utf-8")
+        result = pb.bootstrap_pip_requirements(
+            workspace_dir=workspace_dir,
+            requirements_relpath="requirements.txt",
+            run_dir=run_dir,
+            command_prefix=[],
+            workspace_mount=None,
+            template_cache_dir=cache_dir,
+        )
+        return workspace_dir / ".venv", result.meta["venv_template"]
+
+    _, first = _bootstrap("first", "requests==2.32.3\n")
+    assert first["status"] == "miss"
+    assert first["stored"] is True
+    assert len(install_calls) == 2
+
+    venv, second = _bootstrap("second", "requests==2.32.3\n")
+    assert second["status"] == "hit"
+    assert second["key"] == first["key"]
+    assert second["time_saved_seconds"] is not None
+    assert len(install_calls) == 2
+    assert (venv / "bin" / "tool").read_text(encoding="utf-8") == f"#!{venv}/bin/python\n"
+    assert (venv / "bin" / "activate").read_text(encoding="utf-8") == f'VIRTUAL_ENV="{venv}"\n'
+    assert str(tmp_path / "first") not in (venv / "pyvenv.cfg").read_text(encoding="utf-8")
+
+    _, third = _bootstrap("third", "requests==2.32.4\n")
+    assert third["status"] == "miss"
+    assert third["key"] != first["key"]
+
+    _, editable = _bootstrap("editable", "-e .\n")
+    assert editable == {"status": "bypass", "reason": "workspace_relative_requirement"}
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from runner_core.probe_cache import (
+    PROBE_CACHE_FILENAME,
+    cached_probe,
+    capability_probe_session,
+    clear_capability_probe_cache,
+    executable_fingerprint,
+)
+from runner_core.python_runtime import probe_pytest_module
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    clear_capability_probe_cache()
+    yield
+    clear_capability_probe_cache()
+
+
+def _counting_probe(result: dict[str, Any]) -> tuple[list[int], Any]:
+    calls: list[int] = []
+
+    def _probe() -> dict[str, Any]:
+        calls.append(1)
+        return dict(result)
+
+    return calls, _probe
+
+
+def test_cached_probe_reuses_successes_until_the_executable_changes(tmp_path: Path) -> None:
+    tool = tmp_path / "tool"
+    tool.write_text("#!/bin/sh\n", encoding="utf-8")
+    calls, probe = _counting_probe({"ok": True, "version": "1.0"})
+
+    def _run() -> dict[str, Any]:
+        return cached_probe(
+            "tool_version",
+            [executable_fingerprint(str(tool))],
+            probe,
+            cacheable=lambda value: bool(value.get("ok")),
+        )
+
+    assert _run() == {"ok": True, "version": "1.0"}
+    assert calls == [1]
+
+    with capability_probe_session() as session:
+        assert session is not None
+        _run()
+        _run()
+        assert [record["source"] for record in session.records] == ["probe", "memory"]
+        assert session.summary()["hits"] == 1
+
+    stat = tool.stat()
+    os.utime(tool, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with capability_probe_session(), capability_probe_session(mode="off"):
+        _run()
+    with capability_probe_session():
+        _run()
+        _run()
+    with capability_probe_session(refresh=True):
+        _run()
+    assert len(calls) == 5
+
+
+def test_cached_probe_never_caches_failures(tmp_path: Path) -> None:
+    tool = tmp_path / "tool"
+    tool.write_text("", encoding="utf-8")
+    calls, probe = _counting_probe({"ok": False})
+
+    with capability_probe_session():
+        for _ in range(3):
+            cached_probe(
+                "tool_version",
+                [executable_fingerprint(str(tool))],
+                probe,
+                cacheable=lambda value: bool(value.get("ok")),
+            )
+    assert len(calls) == 3
+
+
+def test_persisted_probe_cache_warms_a_new_process(tmp_path: Path) -> None:
+    runs_dir = tmp_path / "runs"
+    key = [executable_fingerprint(sys.executable)]
+    calls, probe = _counting_probe({"ok": True})
+
+    with capability_probe_session(mode="persist", runs_dir=runs_dir):
+        cached_probe("tool_version", key, probe, cacheable=lambda value: True)
+    assert (runs_dir / "_cache" / PROBE_CACHE_FILENAME).is_file()
+
+    clear_capability_probe_cache()
+    with capability_probe_session(mode="persist", runs_dir=runs_dir) as session:
+        assert cached_probe("tool_version", key, probe, cacheable=lambda value: True) == {
+            "ok": True
+        }
+        assert session is not None
+        assert [record["source"] for record in session.records] == ["disk"]
+    assert len(calls) == 1
+
+
+def test_pytest_module_probe_is_shared_across_workspaces(tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    with capability_probe_session() as session:
+        a = probe_pytest_module(python_executable=sys.executable, cwd=first)
+        b = probe_pytest_module(python_executable=sys.executable, cwd=second)
+
+    assert a["passed"] is True
+    assert b["cwd"] == str(second)
+    assert {key: value for key, value in a.items() if key != "cwd"} == {
+        key: value for key, value in b.items() if key != "cwd"
+    }
+    assert session is not None
+    assert [record["source"] for record in session.records] == ["probe", "memory"]
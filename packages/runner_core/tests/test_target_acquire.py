@@ -180,3 +180,57 @@ def test_acquire_target_fetches_ref_reachable_only_from_source_remote_tracking_r
         assert _git(acquired.workspace_dir, "branch", "--show-current") == ""
     finally:
         shutil.rmtree(acquired.workspace_dir, ignore_errors=True)
+
+
+def test_acquire_target_mirror_cache_fetches_once_per_process_and_keeps_origin(
+    tmp_path: Path, monkeypatch
+) -> None:
+    src = tmp_path / "src_repo"
+    _init_git_repo(src)
+    first_commit = _git(src, "rev-parse", "HEAD")
+    cache_dir = tmp_path / "git_mirrors"
+    monkeypatch.setattr(target_acquire, "_REFRESHED_MIRRORS", set())
+
+    fetches: list[Path] = []
+    original_run_git = target_acquire._run_git
+
+    def _recording_run_git(args: list[str], *, cwd: Path) -> str:
+        if args[:1] == ["fetch"] and cwd.name.endswith(".git"):
+            fetches.append(cwd)
+        return original_run_git(args, cwd=cwd)
+
+    monkeypatch.setattr(target_acquire, "_run_git", _recording_run_git)
+
+    first = target_acquire.acquire_target(
+        repo=str(src), dest_dir=tmp_path / "ws1", ref=None, mirror_cache_dir=cache_dir
+    )
+    (src / "later.txt").write_text("later\n", encoding="utf-8")
+    _git(src, "add", "later.txt")
+    _git(src, "commit", "-m", "later")
+    second = target_acquire.acquire_target(
+        repo=str(src), dest_dir=tmp_path / "ws2", ref=None, mirror_cache_dir=cache_dir
+    )
+    mirror = target_acquire.git_mirror_path(cache_dir=cache_dir, source=str(src))
+    try:
+        assert (mirror / "HEAD").is_file()
+        assert first.mode == second.mode == "git"
+        assert first.commit_sha == second.commit_sha == first_commit
+        assert fetches == []
+        assert _git(first.workspace_dir, "remote", "get-url", "origin") == str(src)
+        assert _git(first.workspace_dir, "branch", "--show-current") == _git(
+            src, "branch", "--show-current"
+        )
+
+        # A new batch (process) refreshes the mirror, including a moved source HEAD.
+        target_acquire._REFRESHED_MIRRORS.clear()
+        _git(src, "checkout", "-b", "feature")
+        third = target_acquire.acquire_target(
+            repo=str(src), dest_dir=tmp_path / "ws3", ref=None, mirror_cache_dir=cache_dir
+        )
+        assert fetches == [mirror]
+        assert third.commit_sha == _git(src, "rev-parse", "HEAD")
+        assert _git(third.workspace_dir, "branch", "--show-current") == "feature"
+        assert (third.workspace_dir / "later.txt").is_file()
+    finally:
+        for acquired_dir in (tmp_path / "ws1", tmp_path / "ws2", tmp_path / "ws3"):
+            shutil.rmtree(acquired_dir, ignore_errors=True)
@@ -245,6 +245,7 @@ def _make_broker_attempt(
     run_dir: Path,
     verifier: object,
     wait_timeout_seconds: float | None = 30.0,
+    transport: str | None = None,
 ) -> VerificationBrokerAttempt:
     client_root = run_dir / "verification_broker" / "client"
     attempt_root = run_dir / "verification_broker" / "attempt1"
@@ -272,9 +273,85 @@ def _make_broker_attempt(
         ),
         utc_now_fn=lambda: "2026-03-07T00:00:00Z",
         run_async_verifier=True,
+        transport=transport,
     )
 
 
+def _passing_summary() -> dict[str, object]:
+    return {
+        "schema_version": 1,
+        "attempt_number": 1,
+        "commands_configured": [_verification_command()],
+        "passed": True,
+        "started_utc": "2026-03-07T00:00:00Z",
+        "finished_utc": "2026-03-07T00:00:01Z",
+        "wall_seconds": 0.01,
+        "artifacts_dir": "verification/attempt1/broker_request_01",
+        "commands": [
+            {
+                "command": _verification_command(),
+                "exit_code": 0,
+                "timed_out": False,
+            }
+        ],
+    }
+
+
+@pytest.mark.skipif(os.name == "nt", reason="unix socket transport is POSIX-only")
+def test_verification_broker_socket_transport_wakes_worker_and_client(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    # Only the socket doorbell can wake the worker within the test's deadline.
+    monkeypatch.setattr(broker_mod, "_BROKER_SOCKET_RESCAN_SECONDS", 60.0)
+    run_dir = tmp_path / ("long_" * 20) / "run"
+    summary = _passing_summary()
+    broker = _make_broker_attempt(
+        run_dir=run_dir,
+        verifier=lambda _, **__: summary,
+        transport="socket",
+    )
+    broker.start()
+    try:
+        assert broker.transport == "socket"
+        assert broker.socket_path.exists()
+        started = time.monotonic()
+        completed = _run_broker_wrapper(run_dir=run_dir, workspace_dir=tmp_path)
+        elapsed = time.monotonic() - started
+    finally:
+        broker.stop()
+
+    assert completed.returncode == 0, completed.stderr
+    assert "verification passed" in completed.stdout
+    assert elapsed < 30.0
+    assert not broker.socket_path.exists()
+    response_files = sorted(broker.responses_dir.glob("*.json"))
+    assert [path.stem for path in response_files] == broker.request_ids()
+
+
+def test_verification_broker_poll_transport_keeps_file_protocol(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    summary = _passing_summary()
+    broker = _make_broker_attempt(
+        run_dir=run_dir,
+        verifier=lambda _, **__: summary,
+        transport="poll",
+    )
+    broker.start()
+    try:
+        assert broker.transport == "poll"
+        assert not broker.socket_path.exists()
+        completed = _run_broker_wrapper(run_dir=run_dir, workspace_dir=tmp_path)
+        runner_result = broker.request_and_wait(timeout_seconds=30.0)
+    finally:
+        broker.stop()
+
+    assert completed.returncode == 0, completed.stderr
+    assert runner_result is not None and runner_result.status == "passed"
+    client_python = broker.python_script.read_text(encoding="utf-8")
+    assert 'BROKER_SOCKET = ""' in client_python
+
+
 def test_verification_broker_client_waits_for_async_pass(tmp_path: Path) -> None:
     run_dir = tmp_path / "run"
     summary = {
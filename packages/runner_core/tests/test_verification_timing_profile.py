@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from runner_core.verification_timing_profile import (
     build_verification_timing_profile,
     percentile,
+    record_verification_timings,
+    verification_timing_store_path,
 )
 
 
@@ -113,3 +116,53 @@ def test_sparse_history_returns_conservative_fallback_and_skips_workspaces(
     assert "Need at least 5" in recommendations["insufficient_history_reason"]
     assert recommendations["recommended_initial_wait_seconds"] == 900.0
 
+
+
+def test_profile_reads_timing_store_seeded_once_and_appended_by_runs(tmp_path: Path) -> None:
+    runs_dir = tmp_path / "runs"
+
+    def _write_run(name: str, duration: float) -> Path:
+        run_dir = runs_dir / "target" / name
+        _write_verification(
+            run_dir / "verification.json",
+            {
+                "status": "passed",
+                "passed": True,
+                "wall_seconds": duration,
+                "commands": [{"command": f"pytest {name}", "wall_seconds": duration}],
+            },
+        )
+        return run_dir
+
+    def _profile(current_run_dir: Path | None = None) -> dict[str, Any]:
+        return build_verification_timing_profile(
+            runs_dir=runs_dir,
+            broker_timeout_guard_seconds=10_800.0,
+            generated_utc="2026-07-06T00:00:00Z",
+            current_run_dir=current_run_dir,
+        )
+
+    first_run = _write_run("run1", 10.0)
+    assert record_verification_timings(runs_dir=runs_dir, run_dir=first_run) == 0
+    assert _profile()["run_count"] == 1
+    store_path = verification_timing_store_path(runs_dir)
+    assert store_path.is_file()
+
+    # Artifacts not recorded in the store are no longer discovered by walking the tree.
+    second_run = _write_run("run2", 20.0)
+    assert _profile()["run_count"] == 1
+
+    assert record_verification_timings(runs_dir=runs_dir, run_dir=second_run) > 0
+    # Re-recording the same artifact does not count it twice.
+    record_verification_timings(runs_dir=runs_dir, run_dir=second_run)
+    profile = _profile()
+    assert profile["run_count"] == 2
+    assert profile["source"]["timing_store"] == str(store_path)
+    assert profile["slowest_commands"][0]["label"] == "pytest run2"
+
+    excluded = _profile(current_run_dir=second_run)
+    assert excluded["run_count"] == 1
+
+    # Pruned run dirs stop counting even though their store lines remain.
+    (second_run / "verification.json").unlink()
+    assert _profile()["run_count"] == 1
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+import runner_core.workspace_state_hash as workspace_state_hash
+from runner_core.workspace_state_hash import (
+    clear_workspace_state_hash_cache,
+    compute_workspace_state_hash,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    # Files written by the test are seconds old at most; trust their stat keys anyway.
+    monkeypatch.setattr(workspace_state_hash, "_RACY_WINDOW_NS", 0)
+    clear_workspace_state_hash_cache()
+    yield
+    clear_workspace_state_hash_cache()
+
+
+def _from_scratch(workspace_dir: Path) -> str:
+    clear_workspace_state_hash_cache()
+    return compute_workspace_state_hash(workspace_dir).sha256
+
+
+def test_incremental_hash_reuses_unchanged_entries_and_matches_full_hash(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Checkpoint after every entry so a change in the middle resumes from the entry before it.
+    monkeypatch.setattr(workspace_state_hash, "_CHECKPOINT_ENTRIES", 1)
+    workspace_dir = tmp_path / "workspace"
+    workspace_dir.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (workspace_dir / name).write_text(f"{name}\n", encoding="utf-8")
+    (workspace_dir / "gone.txt").write_text("tracked\n", encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=workspace_dir, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=workspace_dir, check=True)
+    (workspace_dir / "gone.txt").unlink()
+
+    first = compute_workspace_state_hash(workspace_dir)
+    assert first.mode == "git"
+    assert (first.file_count, first.deleted_count, first.rehashed_count) == (3, 1, 3)
+
+    second = compute_workspace_state_hash(workspace_dir)
+    assert second.sha256 == first.sha256
+    assert (second.rehashed_count, second.reused_count) == (0, 3)
+
+    (workspace_dir / "b.txt").write_text("changed content\n", encoding="utf-8")
+    third = compute_workspace_state_hash(workspace_dir)
+    assert third.sha256 != first.sha256
+    assert (third.rehashed_count, third.reused_count) == (2, 1)
+    assert third.sha256 == _from_scratch(workspace_dir)
+
+
+def test_racy_entries_are_always_rehashed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(workspace_state_hash, "_RACY_WINDOW_NS", 3600 * 1_000_000_000)
+    workspace_dir = tmp_path / "workspace"
+    workspace_dir.mkdir()
+    (workspace_dir / "a.txt").write_text("one\n", encoding="utf-8")
+
+    compute_workspace_state_hash(workspace_dir)
+    again = compute_workspace_state_hash(workspace_dir)
+
+    assert again.mode == "filesystem"
+    assert (again.rehashed_count, again.reused_count) == (1, 0)
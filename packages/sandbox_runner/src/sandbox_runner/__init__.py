@@ -1,9 +1,12 @@
 from sandbox_runner.docker import DockerSandbox
+from sandbox_runner.pool import DockerSandboxPool, PooledDockerSandboxInstance
 from sandbox_runner.spec import MountSpec, ResourceSpec, SandboxInstance, SandboxSpec
 
 __all__ = [
     "DockerSandbox",
+    "DockerSandboxPool",
     "MountSpec",
+    "PooledDockerSandboxInstance",
     "ResourceSpec",
     "SandboxInstance",
     "SandboxSpec",
@@ -6,12 +6,12 @@ import re
 import subprocess
 import time
 import uuid
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import Any
 
-from sandbox_runner.image_hash import compute_image_hash
+from sandbox_runner.image_hash import cached_image_hash
 from sandbox_runner.spec import MountSpec, ResourceSpec, SandboxInstance, SandboxSpec
 
 _DEFAULT_DOCKER_IMAGE_REPO = "sandbox-runner"
@@ -206,6 +206,241 @@ class DockerSandboxInstance(SandboxInstance):
             return
 
 
+def _progress_writer(artifacts_dir: Path) -> Callable[[str], None]:
+    progress_path = artifacts_dir / "docker_progress.txt"
+
+    def _progress(message: str) -> None:
+        try:
+            timestamp = time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime())
+            with progress_path.open("a", encoding="utf-8", newline="\n") as f:
+                f.write(f"{timestamp}\t{message}\n")
+        except Exception:
+            return
+
+    return _progress
+
+
+def _resolve_docker_timeout_seconds(spec: SandboxSpec) -> float | None:
+    docker_timeout_seconds = getattr(spec, "docker_timeout_seconds", None)
+    if docker_timeout_seconds is None:
+        docker_timeout_seconds = _get_docker_timeout_seconds()
+    return docker_timeout_seconds
+
+
+@dataclass(frozen=True)
+class _ResolvedImage:
+    tag: str
+    image_hash: str | None
+    image_repo: str
+    image_ref: str
+    context_dir: Path | None
+    dockerfile: Path | None
+
+
+def _resolve_image(
+    spec: SandboxSpec,
+    *,
+    artifacts_dir: Path,
+    progress: Callable[[str], None],
+    timeout_seconds: float | None,
+    present_tags: set[str] | None = None,
+) -> _ResolvedImage:
+    """Return the image to run for ``spec``, building it when it is missing.
+
+    Tags in ``present_tags`` are trusted to exist without ``docker image inspect``; tags found
+    or built here are added to it.
+    """
+
+    image_ref = spec.image_ref.strip() if isinstance(spec.image_ref, str) else ""
+    context_dir: Path | None = None
+    dockerfile_path: Path | None = None
+    image_hash: str | None = None
+    image_repo = spec.image_repo.strip() if isinstance(spec.image_repo, str) else ""
+    image_repo = image_repo if image_repo else _DEFAULT_DOCKER_IMAGE_REPO
+    build_log_path = artifacts_dir / "docker_build.log"
+
+    if image_ref:
+        if spec.rebuild_image:
+            raise ValueError(
+                "SandboxSpec.rebuild_image is not supported with SandboxSpec.image_ref."
+            )
+        image_tag = image_ref
+        progress(f"use image ref {image_tag}")
+    else:
+        context_dir = spec.image_context_path
+        if context_dir is None:
+            raise ValueError(
+                "Docker sandbox requires spec.image_context_path or spec.image_ref."
+            )
+        context_dir = context_dir.resolve()
+        if not context_dir.exists() or not context_dir.is_dir():
+            raise FileNotFoundError(f"Missing Docker image context directory: {context_dir}")
+
+        dockerfile_path = spec.dockerfile
+        if dockerfile_path is None:
+            dockerfile_path = context_dir / "Dockerfile"
+        elif not dockerfile_path.is_absolute():
+            dockerfile_path = context_dir / dockerfile_path
+        dockerfile_path = dockerfile_path.resolve()
+        if not dockerfile_path.exists() or not dockerfile_path.is_file():
+            raise FileNotFoundError(f"Missing Dockerfile: {dockerfile_path}")
+
+        progress("compute image hash")
+        image_hash = cached_image_hash(context_dir=context_dir, dockerfile=dockerfile_path)
+        image_tag = f"{image_repo}:{image_hash[:12]}"
+        progress(f"image tag {image_tag}")
+
+        known = present_tags is not None and image_tag in present_tags
+        if spec.rebuild_image or not (
+            known or _docker_image_exists(image_tag, timeout_seconds=timeout_seconds)
+        ):
+            dockerfile_ref = str(dockerfile_path)
+            try:
+                dockerfile_ref = (
+                    dockerfile_path.resolve().relative_to(context_dir.resolve()).as_posix()
+                )
+            except ValueError:
+                dockerfile_ref = str(dockerfile_path)
+
+            # Stream build output to both the console and a log file so long builds
+            # don't look "hung" when invoked from the CLI.
+            progress("docker build")
+            rc = _docker_build_streaming(
+                argv=[
+                    "docker",
+                    "build",
+                    "--progress=plain",
+                    "-t",
+                    image_tag,
+                    "-f",
+                    dockerfile_ref,
+                    ".",
+                ],
+                cwd=context_dir,
+                log_path=build_log_path,
+            )
+            if rc != 0:
+                raise RuntimeError(
+                    "Docker image build failed.\n"
+                    f"tag={image_tag}\n"
+                    f"context={context_dir}\n"
+                    f"dockerfile={dockerfile_path}\n"
+                    f"build_log={build_log_path}\n"
+                )
+        else:
+            progress("docker build skipped (image exists)")
+
+    if present_tags is not None:
+        present_tags.add(image_tag)
+    return _ResolvedImage(
+        tag=image_tag,
+        image_hash=image_hash,
+        image_repo=image_repo,
+        image_ref=image_ref,
+        context_dir=context_dir,
+        dockerfile=dockerfile_path,
+    )
+
+
+def _cache_mount(spec: SandboxSpec) -> tuple[str | None, list[MountSpec]]:
+    if spec.cache_mode != "warm":
+        return None, []
+    if spec.cache_dir is None:
+        raise ValueError("cache_mode='warm' requires spec.cache_dir.")
+    cache_mount = "/cache"
+    spec.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Best-effort: create a minimal cache directory layout expected by the
+    # built-in sandbox_cli image.
+    #
+    # The sandbox_cli Dockerfile links common tool caches to:
+    #   /cache/pip
+    #   /cache/pdm
+    #   /cache/pdm-share
+    # If these targets don't exist in a fresh host cache dir, some tools can
+    # mis-handle the symlink path and error.
+    for rel in ("pip", "pdm", "pdm-share"):
+        try:
+            (spec.cache_dir / rel).mkdir(parents=True, exist_ok=True)
+        except OSError:
+            # If we can't create these directories (permissions, etc), proceed.
+            # The container may still be able to create what it needs.
+            pass
+    env_overrides = spec.env_overrides or {}
+    enabled_raw = env_overrides.get("USERTEST_MAINT_VENV_CACHE_ENABLED")
+    root_raw = env_overrides.get("USERTEST_MAINT_VENV_CACHE_ROOT")
+    if str(enabled_raw).strip() == "1" and isinstance(root_raw, str):
+        root = root_raw.strip()
+        posix_root = PurePosixPath(root)
+        rel_parts = posix_root.parts[2:] if posix_root.parts[:2] == ("/", "cache") else ()
+        if rel_parts and ".." not in rel_parts:
+            try:
+                (spec.cache_dir / Path(*rel_parts)).mkdir(parents=True, exist_ok=True)
+            except OSError:
+                pass
+    return cache_mount, [
+        MountSpec(
+            host_path=spec.cache_dir.resolve(),
+            container_path=cache_mount,
+            read_only=False,
+        )
+    ]
+
+
+def _network_args(spec: SandboxSpec) -> list[str]:
+    if spec.network_mode == "none":
+        return ["--network", "none"]
+    if spec.network_mode == "open":
+        return []
+    raise ValueError(f"Unsupported network_mode={spec.network_mode!r}")
+
+
+def _sandbox_meta(
+    spec: SandboxSpec,
+    *,
+    image: _ResolvedImage,
+    container_name: str,
+    workspace_mount: str,
+    artifacts_mount: str,
+    docker_timeout_seconds: float | None,
+) -> dict[str, Any]:
+    return {
+        "backend": "docker",
+        "image_tag": image.tag,
+        "image_hash": image.image_hash,
+        "image_repo": image.image_repo if image.image_hash is not None else None,
+        "image_ref": image.image_ref or image.tag,
+        "context_dir": str(image.context_dir) if image.context_dir is not None else None,
+        "dockerfile": str(image.dockerfile) if image.dockerfile is not None else None,
+        "container_name": container_name,
+        "workspace_mount": workspace_mount,
+        "artifacts_mount": artifacts_mount,
+        "cache_mode": spec.cache_mode,
+        "cache_dir": str(spec.cache_dir) if spec.cache_dir is not None else None,
+        "network_mode": spec.network_mode,
+        "docker_timeout_seconds": docker_timeout_seconds,
+        "env_allowlist": [k for k in spec.env_allowlist if isinstance(k, str) and k.strip()],
+        **_env_overrides_meta(getattr(spec, "env_overrides", None)),
+        "extra_mounts": [
+            {
+                "host_path": str(m.host_path),
+                "container_path": m.container_path,
+                "read_only": m.read_only,
+            }
+            for m in spec.extra_mounts
+        ],
+    }
+
+
+def _write_sandbox_meta(artifacts_dir: Path, meta: Mapping[str, Any]) -> None:
+    sandbox_meta_path = artifacts_dir / "sandbox.json"
+    sandbox_meta_path.parent.mkdir(parents=True, exist_ok=True)
+    sandbox_meta_path.write_text(
+        json.dumps(meta, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+
+
 class DockerSandbox:
     def __init__(
         self,
@@ -224,106 +459,26 @@ class DockerSandbox:
     def start(self) -> DockerSandboxInstance:
         # Ensure we can write progress/log artifacts even if Docker hangs.
         self._artifacts_dir.mkdir(parents=True, exist_ok=True)
-        progress_path = self._artifacts_dir / "docker_progress.txt"
-
-        def _progress(message: str) -> None:
-            try:
-                timestamp = time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime())
-                with progress_path.open("a", encoding="utf-8", newline="\n") as f:
-                    f.write(f"{timestamp}\t{message}\n")
-            except Exception:
-                return
+        _progress = _progress_writer(self._artifacts_dir)
 
         _progress("start")
 
         spec = self._spec
 
-        docker_timeout_seconds = getattr(spec, "docker_timeout_seconds", None)
-        if docker_timeout_seconds is None:
-            docker_timeout_seconds = _get_docker_timeout_seconds()
+        docker_timeout_seconds = _resolve_docker_timeout_seconds(spec)
         _progress(f"docker timeout seconds: {docker_timeout_seconds}")
 
         _progress("docker version")
         _ensure_docker_available(timeout_seconds=docker_timeout_seconds)
         _progress("docker available")
 
-        image_ref = spec.image_ref.strip() if isinstance(spec.image_ref, str) else ""
-        context_dir: Path | None = None
-        dockerfile_path: Path | None = None
-        image_hash: str | None = None
-        image_repo = spec.image_repo.strip() if isinstance(spec.image_repo, str) else ""
-        image_repo = image_repo if image_repo else _DEFAULT_DOCKER_IMAGE_REPO
-        build_log_path = self._artifacts_dir / "docker_build.log"
-
-        if image_ref:
-            if spec.rebuild_image:
-                raise ValueError(
-                    "SandboxSpec.rebuild_image is not supported with SandboxSpec.image_ref."
-                )
-            image_tag = image_ref
-            _progress(f"use image ref {image_tag}")
-        else:
-            context_dir = spec.image_context_path
-            if context_dir is None:
-                raise ValueError(
-                    "Docker sandbox requires spec.image_context_path or spec.image_ref."
-                )
-            context_dir = context_dir.resolve()
-            if not context_dir.exists() or not context_dir.is_dir():
-                raise FileNotFoundError(f"Missing Docker image context directory: {context_dir}")
-
-            dockerfile_path = spec.dockerfile
-            if dockerfile_path is None:
-                dockerfile_path = context_dir / "Dockerfile"
-            elif not dockerfile_path.is_absolute():
-                dockerfile_path = context_dir / dockerfile_path
-            dockerfile_path = dockerfile_path.resolve()
-            if not dockerfile_path.exists() or not dockerfile_path.is_file():
-                raise FileNotFoundError(f"Missing Dockerfile: {dockerfile_path}")
-
-            _progress("compute image hash")
-            image_hash = compute_image_hash(context_dir=context_dir, dockerfile=dockerfile_path)
-            image_tag = f"{image_repo}:{image_hash[:12]}"
-            _progress(f"image tag {image_tag}")
-
-            if spec.rebuild_image or not _docker_image_exists(
-                image_tag, timeout_seconds=docker_timeout_seconds
-            ):
-                dockerfile_ref = str(dockerfile_path)
-                try:
-                    dockerfile_ref = (
-                        dockerfile_path.resolve().relative_to(context_dir.resolve()).as_posix()
-                    )
-                except ValueError:
-                    dockerfile_ref = str(dockerfile_path)
-
-                # Stream build output to both the console and a log file so long builds
-                # don't look "hung" when invoked from the CLI.
-                _progress("docker build")
-                rc = _docker_build_streaming(
-                    argv=[
-                        "docker",
-                        "build",
-                        "--progress=plain",
-                        "-t",
-                        image_tag,
-                        "-f",
-                        dockerfile_ref,
-                        ".",
-                    ],
-                    cwd=context_dir,
-                    log_path=build_log_path,
-                )
-                if rc != 0:
-                    raise RuntimeError(
-                        "Docker image build failed.\n"
-                        f"tag={image_tag}\n"
-                        f"context={context_dir}\n"
-                        f"dockerfile={dockerfile_path}\n"
-                        f"build_log={build_log_path}\n"
-                    )
-            else:
-                _progress("docker build skipped (image exists)")
+        image = _resolve_image(
+            spec,
+            artifacts_dir=self._artifacts_dir,
+            progress=_progress,
+            timeout_seconds=docker_timeout_seconds,
+        )
+        image_tag = image.tag
 
         container_name = self._container_name or f"sandbox-{uuid.uuid4().hex[:12]}"
         container_name = _sanitize_container_name(container_name)
@@ -344,58 +499,11 @@ class DockerSandbox:
             ),
         ]
 
-        cache_mount: str | None = None
-        if spec.cache_mode == "warm":
-            if spec.cache_dir is None:
-                raise ValueError("cache_mode='warm' requires spec.cache_dir.")
-            cache_mount = "/cache"
-            spec.cache_dir.mkdir(parents=True, exist_ok=True)
-
-            # Best-effort: create a minimal cache directory layout expected by the
-            # built-in sandbox_cli image.
-            #
-            # The sandbox_cli Dockerfile links common tool caches to:
-            #   /cache/pip
-            #   /cache/pdm
-            #   /cache/pdm-share
-            # If these targets don't exist in a fresh host cache dir, some tools can
-            # mis-handle the symlink path and error.
-            for rel in ("pip", "pdm", "pdm-share"):
-                try:
-                    (spec.cache_dir / rel).mkdir(parents=True, exist_ok=True)
-                except OSError:
-                    # If we can't create these directories (permissions, etc), proceed.
-                    # The container may still be able to create what it needs.
-                    pass
-            env_overrides = spec.env_overrides or {}
-            enabled_raw = env_overrides.get("USERTEST_MAINT_VENV_CACHE_ENABLED")
-            root_raw = env_overrides.get("USERTEST_MAINT_VENV_CACHE_ROOT")
-            if str(enabled_raw).strip() == "1" and isinstance(root_raw, str):
-                root = root_raw.strip()
-                posix_root = PurePosixPath(root)
-                rel_parts = posix_root.parts[2:] if posix_root.parts[:2] == ("/", "cache") else ()
-                if rel_parts and ".." not in rel_parts:
-                    try:
-                        (spec.cache_dir / Path(*rel_parts)).mkdir(parents=True, exist_ok=True)
-                    except OSError:
-                        pass
-            mounts.append(
-                MountSpec(
-                    host_path=spec.cache_dir.resolve(),
-                    container_path=cache_mount,
-                    read_only=False,
-                )
-            )
-
+        cache_mount, cache_mounts = _cache_mount(spec)
+        mounts.extend(cache_mounts)
         mounts.extend(spec.extra_mounts)
 
-        network_args: list[str] = []
-        if spec.network_mode == "none":
-            network_args = ["--network", "none"]
-        elif spec.network_mode == "open":
-            network_args = []
-        else:
-            raise ValueError(f"Unsupported network_mode={spec.network_mode!r}")
+        network_args = _network_args(spec)
 
         run_argv: list[str] = [
             "docker",
@@ -434,43 +542,21 @@ class DockerSandbox:
             command_prefix=command_prefix,
             container_name=container_name,
             image_tag=image_tag,
-            image_hash=image_hash,
+            image_hash=image.image_hash,
             docker_timeout_seconds=docker_timeout_seconds,
             keep_container=spec.keep_container,
         )
 
-        meta: dict[str, Any] = {
-            "backend": "docker",
-            "image_tag": image_tag,
-            "image_hash": image_hash,
-            "image_repo": image_repo if image_hash is not None else None,
-            "image_ref": image_ref or image_tag,
-            "context_dir": str(context_dir) if context_dir is not None else None,
-            "dockerfile": str(dockerfile_path) if dockerfile_path is not None else None,
-            "container_name": container_name,
-            "workspace_mount": workspace_mount,
-            "artifacts_mount": artifacts_mount,
-            "cache_mode": spec.cache_mode,
-            "cache_dir": str(spec.cache_dir) if spec.cache_dir is not None else None,
-            "network_mode": spec.network_mode,
-            "docker_timeout_seconds": docker_timeout_seconds,
-            "env_allowlist": [k for k in spec.env_allowlist if isinstance(k, str) and k.strip()],
-            **_env_overrides_meta(getattr(spec, "env_overrides", None)),
-            "extra_mounts": [
-                {
-                    "host_path": str(m.host_path),
-                    "container_path": m.container_path,
-                    "read_only": m.read_only,
-                }
-                for m in spec.extra_mounts
-            ],
-        }
-
-        sandbox_meta_path = self._artifacts_dir / "sandbox.json"
-        sandbox_meta_path.parent.mkdir(parents=True, exist_ok=True)
-        sandbox_meta_path.write_text(
-            json.dumps(meta, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
+        _write_sandbox_meta(
+            self._artifacts_dir,
+            _sandbox_meta(
+                spec,
+                image=image,
+                container_name=container_name,
+                workspace_mount=workspace_mount,
+                artifacts_mount=artifacts_mount,
+                docker_timeout_seconds=docker_timeout_seconds,
+            ),
         )
 
         _progress("ready")
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import hashlib
 import os
-from collections.abc import Iterator
+import threading
+import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 _EXCLUDED_DIR_NAMES = {
@@ -22,6 +24,15 @@ _EXCLUDED_FILE_NAMES = {
     ".DS_Store",
 }
 
+# Files modified this recently may change again within the same mtime tick without their
+# size changing, so their digests are never memoized.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_DIGEST_LOCK = threading.Lock()
+# Per-file content digests keyed by (relative path, size, mtime_ns) rather than by absolute path,
+# so per-run copies of a context (which keep the source files' mtimes) reuse them.
+_FILE_DIGESTS: dict[tuple[str, int, int], bytes] = {}
+
 
 def _iter_context_files(context_dir: Path) -> Iterator[tuple[str, Path]]:
     context_dir = context_dir.resolve()
@@ -36,23 +47,40 @@ def _iter_context_files(context_dir: Path) -> Iterator[tuple[str, Path]]:
             yield rel, abs_path
 
 
-def _hash_file(hasher: hashlib._Hash, path: Path) -> None:
+def _file_digest(path: Path) -> bytes:
+    hasher = hashlib.sha256()
     with path.open("rb") as f:
         while True:
             chunk = f.read(1024 * 1024)
             if not chunk:
                 break
             hasher.update(chunk)
+    return hasher.digest()
 
 
-def compute_image_hash(*, context_dir: Path, dockerfile: Path) -> str:
+def _cached_file_digest(key: str, path: Path, racy_after: int) -> bytes:
+    stat = path.stat()
+    memo_key = (key, stat.st_size, stat.st_mtime_ns)
+    with _DIGEST_LOCK:
+        digest = _FILE_DIGESTS.get(memo_key)
+    if digest is None:
+        digest = _file_digest(path)
+        if stat.st_mtime_ns < racy_after:
+            with _DIGEST_LOCK:
+                _FILE_DIGESTS[memo_key] = digest
+    return digest
+
+
+def _image_hash(
+    *, context_dir: Path, dockerfile: Path, digest: Callable[[str, Path], bytes]
+) -> str:
     hasher = hashlib.sha256()
 
     for rel_path, abs_path in _iter_context_files(context_dir):
         hasher.update(b"file\0")
         hasher.update(rel_path.encode("utf-8"))
         hasher.update(b"\0")
-        _hash_file(hasher, abs_path)
+        hasher.update(digest(rel_path, abs_path))
         hasher.update(b"\0")
 
     dockerfile_resolved = dockerfile.resolve()
@@ -66,7 +94,38 @@ def compute_image_hash(*, context_dir: Path, dockerfile: Path) -> str:
 
     if not dockerfile_in_context:
         hasher.update(b"dockerfile\0")
-        _hash_file(hasher, dockerfile_resolved)
+        hasher.update(digest(f"\0dockerfile\0{dockerfile_resolved}", dockerfile_resolved))
         hasher.update(b"\0")
 
     return hasher.hexdigest()
+
+
+def compute_image_hash(*, context_dir: Path, dockerfile: Path) -> str:
+    return _image_hash(
+        context_dir=context_dir,
+        dockerfile=dockerfile,
+        digest=lambda _key, path: _file_digest(path),
+    )
+
+
+def cached_image_hash(*, context_dir: Path, dockerfile: Path) -> str:
+    """Like :func:`compute_image_hash`, but skip re-reading files whose content is known.
+
+    The context is still walked and every file ``stat``-ed, but a file is only read when no
+    digest is memoized for its relative path, size and mtime.  Per-run copies of a shared
+    context therefore only read the files a run rewrote, such as agent overlay manifests.
+    """
+
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+    return _image_hash(
+        context_dir=context_dir,
+        dockerfile=dockerfile,
+        digest=lambda key, path: _cached_file_digest(key, path, racy_after),
+    )
+
+
+def clear_image_hash_cache() -> None:
+    """Forget every memoized file digest."""
+
+    with _DIGEST_LOCK:
+        _FILE_DIGESTS.clear()
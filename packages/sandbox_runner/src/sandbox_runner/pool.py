@@ -0,0 +1,723 @@
+"""Warm pool of pre-started Docker sandbox containers.
+
+:meth:`DockerSandbox.start` probes ``docker version``, resolves the image and starts a new
+container for every run, and the container is removed again when the run closes it.
+:class:`DockerSandboxPool` keeps up to ``size`` idle containers per pool key instead, hands
+one to each run and resets it when the run closes it.
+
+Bind mounts cannot be added to a running container, so each pooled container gets its own
+slot directory under the pool's dedicated ``staging_root`` with one empty entry per writable
+mount (``/workspace``, ``/artifacts`` and writable extra mounts).  Each entry is bind-mounted
+at its real container path with ``rslave`` propagation.  A checkout bind-mounts the run's
+directories onto those entries on the host, so they appear at ``/workspace`` and friends
+inside the container (``getcwd``, ``git rev-parse --show-toplevel`` and ``realpath`` all
+report the usual paths); the release unmounts them again.  A container therefore only ever
+sees the directories of the run that holds it.  Read-only mounts and the warm cache stay
+fixed bind mounts and, with the writable container paths, image tag, resources, network mode
+and environment, make up the pool key.
+
+A reset kills every process but PID 1 and empties ``/tmp``.  The container is then kept only
+if ``docker diff`` shows no other change to its writable layer since it started, so anything
+a run left in ``$HOME``, ``/etc`` or the global site-packages throws the container away.  A
+container whose checkout or reset fails is removed as well.
+
+Host bind mounts need root on Linux, so :func:`shared_docker_sandbox_pool` reports pooling as
+unavailable anywhere else.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sandbox_runner.docker import (
+    DockerSandboxInstance,
+    _cache_mount,
+    _docker_run,
+    _ensure_docker_available,
+    _env_args_with_overrides,
+    _mount_args,
+    _network_args,
+    _progress_writer,
+    _resolve_docker_timeout_seconds,
+    _resolve_image,
+    _ResolvedImage,
+    _resource_args,
+    _sandbox_meta,
+    _sanitize_container_name,
+    _write_sandbox_meta,
+)
+from sandbox_runner.spec import MountSpec, SandboxSpec
+
+__all__ = [
+    "POOL_SIZE_ENV",
+    "DockerSandboxPool",
+    "PooledDockerSandboxInstance",
+    "pool_size_from_env",
+    "shared_docker_sandbox_pool",
+]
+
+POOL_SIZE_ENV = "SANDBOX_RUNNER_POOL_SIZE"
+_POOL_LABEL = "sandbox-runner.pool"
+_HOST_COMMAND_TIMEOUT_SECONDS = 60.0
+
+
+def pool_size_from_env() -> int:
+    """Return the idle containers per key requested via ``SANDBOX_RUNNER_POOL_SIZE`` (0 = off)."""
+
+    raw = os.environ.get(POOL_SIZE_ENV)
+    if raw is None or not raw.strip():
+        return 0
+    try:
+        size = int(raw)
+    except ValueError:
+        return 0
+    return max(0, size)
+
+
+def _host_staging_supported() -> bool:
+    return (
+        sys.platform.startswith("linux")
+        and os.geteuid() == 0
+        and shutil.which("mount") is not None
+        and shutil.which("umount") is not None
+    )
+
+
+def _run_host(argv: list[str]) -> bool:
+    try:
+        proc = subprocess.run(
+            argv,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=_HOST_COMMAND_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return proc.returncode == 0
+
+
+@dataclass(frozen=True)
+class _PoolKey:
+    digest: str
+    run_options: tuple[str, ...]
+    # (container path, is a file) for each writable mount staged per checkout.
+    staged_paths: tuple[tuple[str, bool], ...]
+    docker_timeout_seconds: float | None
+
+
+@dataclass(frozen=True)
+class _Checkout:
+    spec: SandboxSpec
+    image: _ResolvedImage
+    cache_mount: str | None
+    staged: list[MountSpec]
+    progress: Callable[[str], None]
+    seconds_saved: float
+
+
+@dataclass
+class _IdleContainer:
+    name: str
+    start_seconds: float
+    slot: Path
+    baseline: frozenset[str]
+
+
+@dataclass
+class PooledDockerSandboxInstance(DockerSandboxInstance):
+    pool_key: str = ""
+    pool_hit: bool = False
+    startup_seconds_saved: float = 0.0
+    _staged: tuple[Path, ...] = ()
+    _container: _IdleContainer | None = field(default=None, repr=False)
+    _pool: DockerSandboxPool | None = field(default=None, repr=False)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._pool is not None:
+            self._pool._release(self)
+
+
+_RESET_SCRIPT = "kill -9 -1 2>/dev/null; rm -rf -- /tmp/* /tmp/.[!.]* /tmp/..?* 2>/dev/null; true"
+# Writable-layer paths a checkout and reset may leave changed.
+_RESET_ALLOWED_CHANGES = frozenset({"/tmp"})
+
+
+class DockerSandboxPool:
+    """Pre-started Docker sandbox containers, ``size`` idle ones per pool key.
+
+    The first :meth:`acquire` for a key starts its container inline; further containers for
+    the key are started in the background (or up front via :meth:`prestart`).  Returned
+    instances are :class:`PooledDockerSandboxInstance` objects whose ``close()`` hands the
+    container back to the pool.
+
+    ``staging_root`` must be a new or empty directory that only the pool uses; by default a
+    fresh temporary directory is created.  Each container gets one slot directory below it.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 1,
+        staging_root: Path | None = None,
+        name_prefix: str = "sandbox-pool",
+        background_refill: bool = True,
+    ) -> None:
+        self.size = max(0, int(size))
+        if staging_root is None:
+            staging_root = Path(tempfile.mkdtemp(prefix=f"{name_prefix}-"))
+        else:
+            staging_root.mkdir(parents=True, exist_ok=True)
+            if any(staging_root.iterdir()):
+                raise ValueError(
+                    f"DockerSandboxPool staging_root must be empty and dedicated to the pool: "
+                    f"{staging_root}"
+                )
+        self.staging_root = staging_root.resolve()
+        self.name_prefix = name_prefix
+        self.background_refill = background_refill
+        self._lock = threading.Lock()
+        self._staging_shared = False
+        self._idle: dict[str, list[_IdleContainer]] = {}
+        self._starting: dict[str, int] = {}
+        self._threads: list[threading.Thread] = []
+        self._present_tags: set[str] = set()
+        self._docker_probe_seconds: float | None = None
+        self._image_seconds: dict[str, float] = {}
+        self._closed = False
+        self._stats: dict[str, Any] = {
+            "acquired": 0,
+            "hits": 0,
+            "misses": 0,
+            "containers_started": 0,
+            "containers_reused": 0,
+            "containers_discarded": 0,
+            "startup_seconds_saved": 0.0,
+        }
+
+    # -- layout ----------------------------------------------------------------------
+
+    def _layout(
+        self,
+        workspace_dir: Path,
+        artifacts_dir: Path,
+        spec: SandboxSpec,
+    ) -> tuple[str | None, list[MountSpec], list[MountSpec]]:
+        """Split a run's mounts into fixed container mounts and per-checkout staged mounts."""
+
+        cache_mount, cache_mounts = _cache_mount(spec)
+        fixed: list[MountSpec] = list(cache_mounts)
+        staged: list[MountSpec] = []
+        for mount in (
+            MountSpec(host_path=workspace_dir.resolve(), container_path="/workspace"),
+            MountSpec(host_path=artifacts_dir.resolve(), container_path="/artifacts"),
+            *spec.extra_mounts,
+        ):
+            # Read-only mounts are identical for every run of a layout, so they stay fixed.
+            (fixed if mount.read_only else staged).append(mount)
+        return cache_mount, fixed, staged
+
+    def _key(
+        self,
+        spec: SandboxSpec,
+        *,
+        image_tag: str,
+        fixed_mounts: list[MountSpec],
+        staged: list[MountSpec],
+        docker_timeout_seconds: float | None,
+    ) -> _PoolKey:
+        run_options = (
+            *_env_args_with_overrides(spec.env_allowlist, spec.env_overrides),
+            *_resource_args(spec.resources),
+            *_network_args(spec),
+            *_mount_args(fixed_mounts),
+            image_tag,
+        )
+        staged_paths = tuple(
+            (mount.container_path, mount.host_path.resolve().is_file()) for mount in staged
+        )
+        digest = hashlib.sha256(
+            json.dumps([run_options, staged_paths]).encode("utf-8")
+        ).hexdigest()
+        return _PoolKey(
+            digest=digest[:16],
+            run_options=run_options,
+            staged_paths=staged_paths,
+            docker_timeout_seconds=docker_timeout_seconds,
+        )
+
+    # -- host staging ------------------------------------------------------------------
+
+    def _ensure_staging_shared(self) -> None:
+        # ``rslave`` propagation needs the slots to live on a shared mount.
+        with self._lock:
+            if self._staging_shared:
+                return
+            root = str(self.staging_root)
+            if not (
+                _run_host(["mount", "--bind", root, root])
+                and _run_host(["mount", "--make-rshared", root])
+            ):
+                raise RuntimeError(
+                    f"Failed to prepare sandbox pool staging dir as a shared mount: {root}"
+                )
+            self._staging_shared = True
+
+    def _stage(self, container: _IdleContainer, staged: list[MountSpec]) -> list[Path] | None:
+        """Bind-mount *staged* onto the container's slot entries; returns the mounted entries."""
+
+        mounted: list[Path] = []
+        for index, mount in enumerate(staged):
+            source = mount.host_path.resolve()
+            target = container.slot / str(index)
+            try:
+                if source.is_file():
+                    target.touch(exist_ok=True)
+                else:
+                    source.mkdir(parents=True, exist_ok=True)
+                    target.mkdir(exist_ok=True)
+            except OSError:
+                self._unstage(mounted)
+                return None
+            if not _run_host(["mount", "--bind", str(source), str(target)]):
+                self._unstage(mounted)
+                return None
+            mounted.append(target)
+        return mounted
+
+    @staticmethod
+    def _unstage(mounted: Sequence[Path]) -> bool:
+        clean = True
+        for target in reversed(mounted):
+            if not (
+                _run_host(["umount", str(target)]) or _run_host(["umount", "-l", str(target)])
+            ):
+                clean = False
+        return clean
+
+    @staticmethod
+    def _remove_slot(slot: Path) -> None:
+        # Only empty mount points are removed; a slot entry that is still mounted shows the
+        # run's files and must never be deleted recursively.
+        try:
+            entries = list(slot.iterdir())
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir() and not entry.is_symlink():
+                    entry.rmdir()
+                elif entry.stat().st_size == 0:
+                    entry.unlink()
+            except OSError:
+                continue
+        try:
+            slot.rmdir()
+        except OSError:
+            return
+
+    # -- containers ------------------------------------------------------------------
+
+    def _diff(self, name: str, timeout_seconds: float | None) -> frozenset[str] | None:
+        try:
+            proc = _docker_run(
+                ["docker", "diff", name], check=False, timeout_seconds=timeout_seconds
+            )
+        except RuntimeError:
+            return None
+        if proc.returncode != 0:
+            return None
+        return frozenset(line.strip() for line in proc.stdout.splitlines() if line.strip())
+
+    def _start_container(self, key: _PoolKey) -> _IdleContainer:
+        self._ensure_staging_shared()
+        name = _sanitize_container_name(
+            f"{self.name_prefix}-{key.digest[:12]}-{uuid.uuid4().hex[:8]}"
+        )
+        slot = self.staging_root / name
+        slot.mkdir()
+        staged_args: list[str] = []
+        for index, (container_path, is_file) in enumerate(key.staged_paths):
+            entry = slot / str(index)
+            if is_file:
+                entry.touch()
+            else:
+                entry.mkdir()
+            staged_args.extend(
+                [
+                    "--mount",
+                    f"type=bind,source={entry},target={container_path},bind-propagation=rslave",
+                ]
+            )
+        argv = [
+            "docker",
+            "run",
+            "-d",
+            "--name",
+            name,
+            "--rm",
+            "--label",
+            f"{_POOL_LABEL}={key.digest}",
+            *staged_args,
+            *key.run_options,
+            "sh",
+            "-lc",
+            "sleep infinity",
+        ]
+        started = time.monotonic()
+        proc = _docker_run(argv, check=False, timeout_seconds=key.docker_timeout_seconds)
+        if proc.returncode != 0:
+            self._remove_slot(slot)
+            raise RuntimeError(
+                "Failed to start pooled Docker sandbox container.\n"
+                f"container_name={name}\n"
+                f"image={key.run_options[-1]}\n"
+                f"stdout:\n{proc.stdout}\n"
+                f"stderr:\n{proc.stderr}\n"
+            )
+        start_seconds = max(0.0, time.monotonic() - started)
+        baseline = self._diff(name, key.docker_timeout_seconds)
+        if baseline is None:
+            self._remove_container(name, slot, key.docker_timeout_seconds)
+            raise RuntimeError(
+                f"Failed to inspect pooled Docker sandbox container.\ncontainer_name={name}\n"
+            )
+        with self._lock:
+            self._stats["containers_started"] += 1
+        return _IdleContainer(
+            name=name, start_seconds=start_seconds, slot=slot, baseline=baseline
+        )
+
+    def _remove_container(self, name: str, slot: Path, timeout_seconds: float | None) -> None:
+        with self._lock:
+            self._stats["containers_discarded"] += 1
+        try:
+            _docker_run(["docker", "rm", "-f", name], check=False, timeout_seconds=timeout_seconds)
+        except Exception:
+            # Best-effort cleanup only.
+            pass
+        self._remove_slot(slot)
+
+    def _exec(self, name: str, script: str, timeout_seconds: float | None) -> bool:
+        try:
+            proc = _docker_run(
+                ["docker", "exec", name, "sh", "-c", script],
+                check=False,
+                timeout_seconds=timeout_seconds,
+            )
+        except RuntimeError:
+            return False
+        return proc.returncode == 0
+
+    def _is_clean(self, container: _IdleContainer, timeout_seconds: float | None) -> bool:
+        """Return whether a reset container's writable layer is back to its start state."""
+
+        diff = self._diff(container.name, timeout_seconds)
+        if diff is None:
+            return False
+        return all(
+            entry in container.baseline or entry.partition(" ")[2] in _RESET_ALLOWED_CHANGES
+            for entry in diff
+        )
+
+    def _fill(self, key: _PoolKey) -> int:
+        started = 0
+        while True:
+            with self._lock:
+                idle = len(self._idle.get(key.digest, ()))
+                if self._closed or idle + self._starting.get(key.digest, 0) >= self.size:
+                    return started
+                self._starting[key.digest] = self._starting.get(key.digest, 0) + 1
+            try:
+                container = self._start_container(key)
+            except RuntimeError:
+                return started
+            finally:
+                with self._lock:
+                    self._starting[key.digest] -= 1
+            with self._lock:
+                if self._closed:
+                    keep = False
+                else:
+                    self._idle.setdefault(key.digest, []).append(container)
+                    keep = True
+            if not keep:
+                self._remove_container(
+                    container.name, container.slot, key.docker_timeout_seconds
+                )
+                return started
+            started += 1
+
+    def _schedule_fill(self, key: _PoolKey) -> None:
+        if not self.background_refill:
+            return
+        thread = threading.Thread(
+            target=self._fill, args=(key,), name="sandbox-pool-fill", daemon=True
+        )
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            self._threads.append(thread)
+        thread.start()
+
+    # -- public API ------------------------------------------------------------------
+
+    def _prepare(
+        self,
+        workspace_dir: Path,
+        artifacts_dir: Path,
+        spec: SandboxSpec,
+    ) -> tuple[_PoolKey, _Checkout]:
+        if spec.backend != "docker":
+            raise ValueError(
+                f"DockerSandboxPool requires spec.backend='docker', got {spec.backend!r}"
+            )
+        if spec.keep_container:
+            raise ValueError("DockerSandboxPool does not support SandboxSpec.keep_container.")
+        artifacts_dir.mkdir(parents=True, exist_ok=True)
+        progress = _progress_writer(artifacts_dir)
+        progress("start (pool)")
+
+        docker_timeout_seconds = _resolve_docker_timeout_seconds(spec)
+        progress(f"docker timeout seconds: {docker_timeout_seconds}")
+
+        seconds_saved = 0.0
+        with self._lock:
+            probe_seconds = self._docker_probe_seconds
+        if probe_seconds is None:
+            progress("docker version")
+            probe_started = time.monotonic()
+            _ensure_docker_available(timeout_seconds=docker_timeout_seconds)
+            with self._lock:
+                self._docker_probe_seconds = time.monotonic() - probe_started
+            progress("docker available")
+        else:
+            seconds_saved += probe_seconds
+            progress("docker version skipped (pool)")
+
+        image_started = time.monotonic()
+        image = _resolve_image(
+            spec,
+            artifacts_dir=artifacts_dir,
+            progress=progress,
+            timeout_seconds=docker_timeout_seconds,
+            present_tags=self._present_tags,
+        )
+        image_seconds = time.monotonic() - image_started
+        with self._lock:
+            first_image_seconds = self._image_seconds.setdefault(image.tag, image_seconds)
+        seconds_saved += max(0.0, first_image_seconds - image_seconds)
+
+        cache_mount, fixed_mounts, staged = self._layout(workspace_dir, artifacts_dir, spec)
+        key = self._key(
+            spec,
+            image_tag=image.tag,
+            fixed_mounts=fixed_mounts,
+            staged=staged,
+            docker_timeout_seconds=docker_timeout_seconds,
+        )
+        return key, _Checkout(
+            spec=spec,
+            image=image,
+            cache_mount=cache_mount,
+            staged=staged,
+            progress=progress,
+            seconds_saved=seconds_saved,
+        )
+
+    def prestart(self, workspace_dir: Path, artifacts_dir: Path, spec: SandboxSpec) -> int:
+        """Start idle containers for the key of this run layout; return how many were started."""
+
+        key, _ = self._prepare(workspace_dir, artifacts_dir, spec)
+        return self._fill(key)
+
+    def acquire(
+        self,
+        workspace_dir: Path,
+        artifacts_dir: Path,
+        spec: SandboxSpec,
+    ) -> PooledDockerSandboxInstance:
+        """Return a running sandbox for this run, reusing an idle container when one is ready."""
+
+        key, checkout = self._prepare(workspace_dir, artifacts_dir, spec)
+        progress = checkout.progress
+        timeout_seconds = key.docker_timeout_seconds
+
+        container: _IdleContainer | None = None
+        mounted: list[Path] | None = None
+        hit = False
+        for _attempt in range(2):
+            with self._lock:
+                idle = self._idle.get(key.digest)
+                container = idle.pop(0) if idle else None
+            hit = container is not None
+            if container is None:
+                progress(f"docker run (pool key {key.digest})")
+                container = self._start_container(key)
+            else:
+                progress(f"pool hit {container.name}")
+            mounted = self._stage(container, checkout.staged)
+            if mounted is not None:
+                break
+            self._remove_container(container.name, container.slot, timeout_seconds)
+            if not hit:
+                raise RuntimeError(
+                    "Failed to prepare pooled Docker sandbox container.\n"
+                    f"container_name={container.name}\n"
+                )
+        assert container is not None and mounted is not None
+        self._schedule_fill(key)
+
+        seconds_saved = checkout.seconds_saved + (container.start_seconds if hit else 0.0)
+        with self._lock:
+            self._stats["acquired"] += 1
+            self._stats["hits" if hit else "misses"] += 1
+            if hit:
+                self._stats["containers_reused"] += 1
+            self._stats["startup_seconds_saved"] += seconds_saved
+
+        image = checkout.image
+        workspace_mount = "/workspace"
+        artifacts_mount = "/artifacts"
+        instance = PooledDockerSandboxInstance(
+            workspace_mount=workspace_mount,
+            artifacts_mount=artifacts_mount,
+            cache_mount=checkout.cache_mount,
+            command_prefix=["docker", "exec", "-i", "-w", workspace_mount, container.name],
+            container_name=container.name,
+            image_tag=image.tag,
+            image_hash=image.image_hash,
+            docker_timeout_seconds=timeout_seconds,
+            pool_key=key.digest,
+            pool_hit=hit,
+            startup_seconds_saved=seconds_saved,
+            _staged=tuple(mounted),
+            _container=container,
+            _pool=self,
+        )
+        meta = _sandbox_meta(
+            checkout.spec,
+            image=image,
+            container_name=container.name,
+            workspace_mount=workspace_mount,
+            artifacts_mount=artifacts_mount,
+            docker_timeout_seconds=timeout_seconds,
+        )
+        meta["pool"] = {
+            "key": key.digest,
+            "hit": hit,
+            "size": self.size,
+            "startup_seconds_saved": round(seconds_saved, 3),
+            "staged_paths": [mount.container_path for mount in checkout.staged],
+        }
+        _write_sandbox_meta(artifacts_dir, meta)
+        progress("ready")
+        return instance
+
+    def _release(self, instance: PooledDockerSandboxInstance) -> None:
+        container = instance._container
+        assert container is not None
+        timeout_seconds = instance.docker_timeout_seconds
+        with self._lock:
+            idle = self._idle.get(instance.pool_key, [])
+            wanted = not self._closed and len(idle) < self.size
+        reset = wanted and self._exec(container.name, _RESET_SCRIPT, timeout_seconds)
+        if not reset:
+            # Stop the run's processes before its directories are unmounted.
+            self._remove_container(container.name, container.slot, timeout_seconds)
+            self._unstage(instance._staged)
+            self._remove_slot(container.slot)
+            return
+        unmounted = self._unstage(instance._staged)
+        if unmounted and self._is_clean(container, timeout_seconds):
+            with self._lock:
+                if not self._closed and len(self._idle.get(instance.pool_key, ())) < self.size:
+                    self._idle.setdefault(instance.pool_key, []).append(container)
+                    return
+        self._remove_container(container.name, container.slot, timeout_seconds)
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool counters, including ``hits`` and ``startup_seconds_saved``."""
+
+        with self._lock:
+            return {
+                **self._stats,
+                "idle": sum(len(containers) for containers in self._idle.values()),
+            }
+
+    def close(self) -> None:
+        """Remove every idle container; containers still checked out are removed on release."""
+
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join()
+        with self._lock:
+            idle = [c for containers in self._idle.values() for c in containers]
+            self._idle.clear()
+        for container in idle:
+            try:
+                _docker_run(["docker", "rm", "-f", container.name], check=False)
+            except Exception:
+                # Best-effort cleanup only.
+                pass
+            self._remove_slot(container.slot)
+        with self._lock:
+            staging_shared, self._staging_shared = self._staging_shared, False
+        # Fails while a checked-out container still has run directories staged.
+        if not staging_shared or _run_host(["umount", str(self.staging_root)]):
+            try:
+                self.staging_root.rmdir()
+            except OSError:
+                pass
+
+
+_SHARED_LOCK = threading.Lock()
+_SHARED: dict[int, DockerSandboxPool] = {}
+
+
+def _close_shared_pools() -> None:
+    with _SHARED_LOCK:
+        pools = list(_SHARED.values())
+        _SHARED.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(_close_shared_pools)
+
+
+def shared_docker_sandbox_pool() -> DockerSandboxPool | None:
+    """Return this process's pool, or ``None`` when pooling is off or unavailable.
+
+    Pooling is enabled by setting ``SANDBOX_RUNNER_POOL_SIZE`` to the number of idle
+    containers to keep per pool key.  It stays off where run directories cannot be
+    bind-mounted into a running container (anything but root on Linux).
+    """
+
+    size = pool_size_from_env()
+    if size <= 0 or not _host_staging_supported():
+        return None
+    with _SHARED_LOCK:
+        pool = _SHARED.get(size)
+        if pool is None:
+            pool = DockerSandboxPool(size=size)
+            _SHARED[size] = pool
+    return pool
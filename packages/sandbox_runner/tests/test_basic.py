@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
+import sandbox_runner.image_hash as image_hash
 from sandbox_runner.image_hash import compute_image_hash
 
 
@@ -25,3 +28,31 @@ def test_compute_image_hash_changes_on_context_change(tmp_path: Path) -> None:
     h2 = compute_image_hash(context_dir=tmp_path, dockerfile=tmp_path / "Dockerfile")
 
     assert h1 != h2
+
+
+def test_cached_image_hash_tracks_context_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(image_hash, "_RACY_WINDOW_NS", 0)
+    image_hash.clear_image_hash_cache()
+    (tmp_path / "Dockerfile").write_text("FROM python:3.11-slim\n", encoding="utf-8")
+    dockerfile = tmp_path / "Dockerfile"
+
+    h1 = image_hash.cached_image_hash(context_dir=tmp_path, dockerfile=dockerfile)
+    assert h1 == compute_image_hash(context_dir=tmp_path, dockerfile=dockerfile)
+
+    reads: list[Path] = []
+    real_digest = image_hash._file_digest
+
+    def _counting(path: Path) -> bytes:
+        reads.append(path)
+        return real_digest(path)
+
+    monkeypatch.setattr(image_hash, "_file_digest", _counting)
+    assert image_hash.cached_image_hash(context_dir=tmp_path, dockerfile=dockerfile) == h1
+    assert reads == []
+
+    (tmp_path / "extra.txt").write_text("extra\n", encoding="utf-8")
+    h2 = image_hash.cached_image_hash(context_dir=tmp_path, dockerfile=dockerfile)
+    assert h2 != h1
+    assert reads == [tmp_path.resolve() / "extra.txt"]
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from sandbox_runner import pool as pool_module
+from sandbox_runner.image_hash import clear_image_hash_cache
+from sandbox_runner.pool import POOL_SIZE_ENV, DockerSandboxPool, shared_docker_sandbox_pool
+from sandbox_runner.spec import MountSpec, SandboxSpec
+
+_STUB_DOCKER = """\
+import json
+import os
+import sys
+
+with open(os.environ["STUB_DOCKER_LOG"], "a", encoding="utf-8") as log:
+    log.write(json.dumps(sys.argv[1:]) + "\\n")
+if sys.argv[1:2] == ["run"]:
+    print("container-id")
+if sys.argv[1:2] == ["diff"] and os.path.exists(os.environ["STUB_DOCKER_DIFF"]):
+    print(open(os.environ["STUB_DOCKER_DIFF"], encoding="utf-8").read())
+"""
+
+
+@pytest.fixture()
+def docker_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    stub = bin_dir / "docker"
+    stub.write_text(f"#!{sys.executable}\n{_STUB_DOCKER}", encoding="utf-8")
+    stub.chmod(0o755)
+    log_path = tmp_path / "docker.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}:{Path(sys.executable).parent}")
+    monkeypatch.setenv("STUB_DOCKER_LOG", str(log_path))
+    monkeypatch.setenv("STUB_DOCKER_DIFF", str(tmp_path / "docker.diff"))
+    clear_image_hash_cache()
+    return log_path
+
+
+@pytest.fixture()
+def host_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    def _run_host(argv: list[str]) -> bool:
+        calls.append(argv)
+        return True
+
+    monkeypatch.setattr(pool_module, "_run_host", _run_host)
+    return calls
+
+
+def _calls(log_path: Path) -> list[list[str]]:
+    if not log_path.exists():
+        return []
+    return [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+
+
+def _spec(tmp_path: Path) -> SandboxSpec:
+    context_dir = tmp_path / "context"
+    context_dir.mkdir(exist_ok=True)
+    (context_dir / "Dockerfile").write_text("FROM scratch\n", encoding="utf-8")
+    return SandboxSpec(
+        backend="docker",
+        image_context_path=context_dir,
+        extra_mounts=[
+            MountSpec(host_path=tmp_path / "runs" / "login", container_path="/root/.login"),
+        ],
+    )
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="stub docker is a POSIX script")
+def test_pool_stages_only_the_current_run_into_reused_containers(
+    tmp_path: Path, docker_log: Path, host_calls: list[list[str]]
+) -> None:
+    runs = tmp_path / "runs"
+    staging = tmp_path / "staging"
+    spec = _spec(tmp_path)
+    pool = DockerSandboxPool(size=1, staging_root=staging, background_refill=False)
+
+    assert pool.prestart(runs / "ws-a", runs / "run-a" / "sandbox", spec) == 1
+    started = [argv for argv in _calls(docker_log) if argv[0] == "run"]
+    assert len(started) == 1
+    name = started[0][started[0].index("--name") + 1]
+    slot = staging.resolve() / name
+    # Each writable path is its own slot entry, mounted at the real container path.
+    for index, container_path in enumerate(("/workspace", "/artifacts", "/root/.login")):
+        assert (
+            f"type=bind,source={slot / str(index)},target={container_path},"
+            "bind-propagation=rslave"
+        ) in started[0]
+    assert not any(str(runs) in arg for arg in started[0])
+    assert host_calls[:2] == [
+        ["mount", "--bind", str(staging.resolve()), str(staging.resolve())],
+        ["mount", "--make-rshared", str(staging.resolve())],
+    ]
+
+    first = pool.acquire(runs / "ws-a", runs / "run-a" / "sandbox", spec)
+    assert first.pool_hit is True
+    assert first.command_prefix[-1] == first.container_name == name
+    assert host_calls[2:] == [
+        ["mount", "--bind", str((runs / "ws-a").resolve()), str(slot / "0")],
+        ["mount", "--bind", str((runs / "run-a" / "sandbox").resolve()), str(slot / "1")],
+        ["mount", "--bind", str((runs / "login").resolve()), str(slot / "2")],
+    ]
+    assert not any(argv[0] == "exec" for argv in _calls(docker_log))
+    meta = json.loads((runs / "run-a" / "sandbox" / "sandbox.json").read_text(encoding="utf-8"))
+    assert meta["pool"]["hit"] is True
+    assert meta["pool"]["staged_paths"] == ["/workspace", "/artifacts", "/root/.login"]
+    assert meta["pool"]["startup_seconds_saved"] >= 0
+
+    del host_calls[:]
+    first.close()
+    reset = [argv for argv in _calls(docker_log) if argv[0] == "exec"][-1]
+    assert reset[:2] == ["exec", name] and "kill -9 -1" in reset[-1]
+    assert host_calls == [["umount", str(slot / index)] for index in ("2", "1", "0")]
+    assert _calls(docker_log)[-1] == ["diff", name]
+
+    second = pool.acquire(runs / "ws-b", runs / "run-b" / "sandbox", spec)
+    assert second.container_name == name
+    assert host_calls[3] == ["mount", "--bind", str((runs / "ws-b").resolve()), str(slot / "0")]
+
+    # The docker probe and the image lookup ran once for all three checkouts.
+    calls = _calls(docker_log)
+    assert sum(argv == ["version"] for argv in calls) == 1
+    assert sum(argv[:2] == ["image", "inspect"] for argv in calls) == 1
+    assert len([argv for argv in calls if argv[0] == "run"]) == 1
+
+    stats = pool.stats()
+    assert (stats["hits"], stats["misses"], stats["containers_started"]) == (2, 0, 1)
+
+    second.close()
+    pool.close()
+    assert _calls(docker_log)[-1] == ["rm", "-f", name]
+    assert not staging.exists()
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="stub docker is a POSIX script")
+def test_pool_discards_containers_whose_writable_layer_changed(
+    tmp_path: Path, docker_log: Path, host_calls: list[list[str]]
+) -> None:
+    runs = tmp_path / "runs"
+    spec = _spec(tmp_path)
+    pool = DockerSandboxPool(size=1, staging_root=tmp_path / "staging", background_refill=False)
+
+    first = pool.acquire(runs / "ws-a", runs / "run-a" / "sandbox", spec)
+    # An emptied /tmp is expected; anything else is left-over run state.
+    (tmp_path / "docker.diff").write_text("C /tmp\n", encoding="utf-8")
+    first.close()
+    assert pool.stats()["idle"] == 1
+
+    second = pool.acquire(runs / "ws-b", runs / "run-b" / "sandbox", spec)
+    assert second.container_name == first.container_name
+    (tmp_path / "docker.diff").write_text("C /root\nA /root/.local\n", encoding="utf-8")
+    second.close()
+    assert _calls(docker_log)[-1] == ["rm", "-f", second.container_name]
+    assert pool.stats()["idle"] == 0
+    pool.close()
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="stub docker is a POSIX script")
+def test_pool_key_separates_layouts_and_discards_extra_containers(
+    tmp_path: Path, docker_log: Path, host_calls: list[list[str]]
+) -> None:
+    runs = tmp_path / "runs"
+    spec = _spec(tmp_path)
+    read_only = SandboxSpec(
+        backend="docker",
+        image_context_path=spec.image_context_path,
+        extra_mounts=[
+            MountSpec(host_path=tmp_path / "elsewhere", container_path="/data", read_only=True)
+        ],
+    )
+    pool = DockerSandboxPool(size=1, staging_root=tmp_path / "staging", background_refill=False)
+
+    a = pool.acquire(runs / "ws-a", runs / "run-a" / "sandbox", spec)
+    b = pool.acquire(runs / "ws-b", runs / "run-b" / "sandbox", read_only)
+    c = pool.acquire(runs / "ws-c", runs / "run-c" / "sandbox", spec)
+    assert (a.pool_hit, b.pool_hit, c.pool_hit) == (False, False, False)
+    assert a.pool_key == c.pool_key != b.pool_key
+    run_b = [argv for argv in _calls(docker_log) if argv[0] == "run"][1]
+    assert (
+        f"type=bind,source={(tmp_path / 'elsewhere').resolve()},target=/data,readonly" in run_b
+    )
+
+    a.close()
+    c.close()
+    # Only one idle container is kept per key; the other one is removed.
+    assert _calls(docker_log)[-1] == ["rm", "-f", c.container_name]
+    assert pool.stats()["idle"] == 1
+
+    b.close()
+    pool.close()
+
+
+def test_pool_requires_a_dedicated_staging_root(tmp_path: Path) -> None:
+    (tmp_path / "runs").mkdir()
+    with pytest.raises(ValueError, match="dedicated"):
+        DockerSandboxPool(staging_root=tmp_path)
+
+
+def test_shared_pool_is_off_unless_configured_and_supported(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pool_module, "_SHARED", {})
+    monkeypatch.setattr(pool_module, "_host_staging_supported", lambda: True)
+    monkeypatch.delenv(POOL_SIZE_ENV, raising=False)
+    assert shared_docker_sandbox_pool() is None
+
+    monkeypatch.setenv(POOL_SIZE_ENV, "2")
+    pool = shared_docker_sandbox_pool()
+    assert pool is not None and pool.size == 2
+    assert shared_docker_sandbox_pool() is pool
+    pool.close()
+
+    # Without host bind mounts into running containers, runs are never pooled.
+    monkeypatch.setattr(pool_module, "_host_staging_supported", lambda: False)
+    assert shared_docker_sandbox_pool() is None
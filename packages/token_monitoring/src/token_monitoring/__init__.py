@@ -13,6 +13,11 @@ from token_monitoring.run_analysis import (
     render_monitoring_markdown,
     write_run_monitoring,
 )
+from token_monitoring.session_index import (
+    CODEX_SESSION_INDEX_FILENAME,
+    CodexSessionIndex,
+    codex_session_index,
+)
 from token_monitoring.usage import (
     TOKEN_DIMENSIONS,
     USAGE_RECEIPT_SCHEMA_VERSION,
@@ -27,6 +32,7 @@ __all__ = [
     "analyze_batch_context",
     "analyze_delegation_ab",
     "analyze_run",
+    "codex_session_index",
     "parse_codex_invocation_usage",
     "parse_codex_usage_jsonl",
     "public_analysis_payload",
@@ -35,6 +41,8 @@ __all__ = [
     "write_batch_context",
     "write_delegation_ab_validation",
     "write_run_monitoring",
+    "CODEX_SESSION_INDEX_FILENAME",
+    "CodexSessionIndex",
     "TOKEN_DIMENSIONS",
     "USAGE_RECEIPT_SCHEMA_VERSION",
     "TokenUsage",
@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from token_monitoring.session_index import codex_session_index
 from token_monitoring.usage import TokenUsage, UsageResult, UsageSemantics
 
 TOKEN_DIMENSIONS: tuple[str, ...] = (
@@ -1007,14 +1008,24 @@ parse_codex_usage_jsonl = parse_codex_invocation_usage
 def find_codex_session_for_thread(
     sessions_root: Path,
     thread_id: str,
+    *,
+    index_path: Path | None = None,
 ) -> tuple[Path | None, list[dict[str, Any]]]:
+    """Join a thread id to exactly one Codex session file.
+
+    Lookups go through the shared :class:`~token_monitoring.session_index.CodexSessionIndex`
+    for *sessions_root* (persisted at *index_path* when given), which only rescans new or
+    changed session files.
+    """
+
     exceptions: list[dict[str, Any]] = []
     if not thread_id.strip():
         return None, [{"code": "missing_thread_id"}]
     if not sessions_root.exists():
         return None, [{"code": "codex_sessions_root_missing", "path": str(sessions_root)}]
 
-    filename_matches = sorted(sessions_root.rglob(f"*{thread_id}*.jsonl"))
+    index = codex_session_index(sessions_root, index_path=index_path)
+    filename_matches = index.filename_matches(thread_id)
     if len(filename_matches) == 1:
         return filename_matches[0], []
     if len(filename_matches) > 1:
@@ -1026,15 +1037,7 @@ def find_codex_session_for_thread(
             }
         ]
 
-    matches: list[Path] = []
-    for candidate in sessions_root.rglob("*.jsonl"):
-        try:
-            with candidate.open("r", encoding="utf-8") as f:
-                head = "".join(line for _, line in zip(range(20), f, strict=False))
-        except OSError:
-            continue
-        if thread_id in head:
-            matches.append(candidate)
+    matches = index.content_matches(thread_id)
     if len(matches) == 1:
         return matches[0], []
     if len(matches) > 1:
@@ -1042,7 +1045,7 @@ def find_codex_session_for_thread(
             {
                 "code": "ambiguous_session_content_matches",
                 "thread_id": thread_id,
-                "paths": [str(p) for p in sorted(matches)],
+                "paths": [str(p) for p in matches],
             }
         )
     else:
@@ -697,7 +697,12 @@ def _artifact_exceptions(run_dir: Path) -> list[dict[str, Any]]:
     return exceptions
 
 
-def analyze_run(run_dir: Path, *, codex_sessions_root: Path | None = None) -> dict[str, Any]:
+def analyze_run(
+    run_dir: Path,
+    *,
+    codex_sessions_root: Path | None = None,
+    codex_session_index_path: Path | None = None,
+) -> dict[str, Any]:
     run_dir = run_dir.resolve()
     sessions_root = codex_sessions_root or default_codex_sessions_root()
     agent = _target_ref_agent(run_dir)
@@ -714,7 +719,9 @@ def analyze_run(run_dir: Path, *, codex_sessions_root: Path | None = None) -> di
         "exception": None,
     }
     if agent == "codex" and thread_id is not None:
-        session_path, join_exceptions = find_codex_session_for_thread(sessions_root, thread_id)
+        session_path, join_exceptions = find_codex_session_for_thread(
+            sessions_root, thread_id, index_path=codex_session_index_path
+        )
         exceptions.extend(join_exceptions)
         if session_path is not None:
             session = parse_codex_session(session_path)
@@ -847,8 +854,13 @@ def write_run_monitoring(
     *,
     codex_sessions_root: Path | None = None,
     output_dir: Path | None = None,
+    codex_session_index_path: Path | None = None,
 ) -> dict[str, Any]:
-    analysis = analyze_run(run_dir, codex_sessions_root=codex_sessions_root)
+    analysis = analyze_run(
+        run_dir,
+        codex_sessions_root=codex_sessions_root,
+        codex_session_index_path=codex_session_index_path,
+    )
     destination = (output_dir or run_dir).resolve()
     destination.mkdir(parents=True, exist_ok=True)
     public = public_analysis_payload(analysis)
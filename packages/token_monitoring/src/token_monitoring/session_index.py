@@ -0,0 +1,329 @@
+"""Incremental index of Codex session files keyed by thread id.
+
+``find_codex_session_for_thread`` used to walk the whole sessions tree for every lookup and,
+on a filename miss, open every ``*.jsonl`` to read its first lines.  :class:`CodexSessionIndex`
+keeps, per session file, its size, mtime, first-event timestamp and the thread/session ids
+found in its first :data:`SESSION_HEAD_LINES` lines, and refreshes itself incrementally:
+
+- a directory whose mtime is unchanged (and was not modified within the last
+  :data:`_RACY_MTIME_SECONDS` of the previous scan) keeps its recorded listing, so no
+  ``scandir`` is needed to find new session files;
+- a file is re-read only when it is new, its size or mtime changed, or its head was still
+  shorter than :data:`SESSION_HEAD_LINES` lines when it was indexed.
+
+Content matches are limited to ids a session head actually declares (``session_meta``
+``payload.id``/``session_id``, ``thread.started`` ``thread_id`` and similar fields) and
+UUID-shaped tokens, which covers every Codex thread id; filename matches use the same
+``*{thread_id}*.jsonl`` pattern as before.
+
+Indexes are shared per ``(sessions_root, index_path)`` within a process.  With an
+``index_path`` the index is also loaded from and saved to that JSON file so later processes
+start warm; a missing or unreadable file just means a cold scan.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+__all__ = [
+    "CODEX_SESSION_INDEX_FILENAME",
+    "SESSION_HEAD_LINES",
+    "CodexSessionIndex",
+    "clear_codex_session_indexes",
+    "codex_session_index",
+]
+
+CODEX_SESSION_INDEX_FILENAME = "codex_session_index.json"
+SESSION_HEAD_LINES = 20
+_SCHEMA_VERSION = 1
+# Directory mtimes this close to the scan may not yet reflect files created in the same tick.
+_RACY_MTIME_SECONDS = 2.0
+_UUID_RE = re.compile(
+    r"[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{12}"
+)
+_ID_FIELDS = ("id", "session_id", "thread_id", "conversation_id")
+
+
+@dataclass
+class _FileEntry:
+    size: int
+    mtime_ns: int
+    head_complete: bool
+    thread_id: str | None = None
+    first_timestamp: str | None = None
+    ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _DirEntry:
+    mtime_ns: int
+    settled: bool
+    files: list[str]
+    dirs: list[str]
+
+
+def _head_ids(events: list[Any], head: str) -> tuple[str | None, list[str]]:
+    thread_id: str | None = None
+    ids: set[str] = set(_UUID_RE.findall(head))
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        payload = event.get("payload")
+        for container in (event, payload if isinstance(payload, dict) else {}):
+            for name in _ID_FIELDS:
+                value = container.get(name)
+                if isinstance(value, str) and value.strip():
+                    ids.add(value.strip())
+        if thread_id is None:
+            if event.get("type") == "session_meta" and isinstance(payload, dict):
+                candidate = payload.get("id") or payload.get("session_id")
+            elif event.get("type") == "thread.started":
+                candidate = event.get("thread_id")
+            else:
+                candidate = None
+            if isinstance(candidate, str) and candidate.strip():
+                thread_id = candidate.strip()
+    return thread_id, sorted(ids)
+
+
+def _read_entry(path: Path, stat: os.stat_result) -> _FileEntry | None:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            lines = [line for _, line in zip(range(SESSION_HEAD_LINES), handle, strict=False)]
+    except (OSError, UnicodeDecodeError):
+        return None
+    events: list[Any] = []
+    for line in lines:
+        try:
+            events.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    head = "".join(lines)
+    thread_id, ids = _head_ids(events, head)
+    first = events[0] if events else None
+    timestamp = first.get("timestamp") if isinstance(first, dict) else None
+    return _FileEntry(
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        # A short head can still gain lines (and ids) while the session is being written.
+        head_complete=len(lines) >= SESSION_HEAD_LINES,
+        thread_id=thread_id,
+        first_timestamp=timestamp if isinstance(timestamp, str) else None,
+        ids=ids,
+    )
+
+
+class CodexSessionIndex:
+    """Thread id to session file index for one sessions root."""
+
+    def __init__(self, sessions_root: Path, *, index_path: Path | None = None) -> None:
+        self.sessions_root = sessions_root
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._files: dict[str, _FileEntry] = {}
+        self._dirs: dict[str, _DirEntry] = {}
+        self._by_id: dict[str, set[str]] | None = None
+        self._dirty = False
+        if index_path is not None:
+            self._load(index_path)
+
+    # -- persistence -----------------------------------------------------------------
+
+    def _load(self, path: Path) -> None:
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return
+        if (
+            not isinstance(raw, dict)
+            or raw.get("schema_version") != _SCHEMA_VERSION
+            or raw.get("sessions_root") != str(self.sessions_root)
+        ):
+            return
+        try:
+            self._files = {
+                str(rel): _FileEntry(**entry) for rel, entry in dict(raw["files"]).items()
+            }
+            self._dirs = {str(rel): _DirEntry(**entry) for rel, entry in dict(raw["dirs"]).items()}
+        except (KeyError, TypeError, ValueError):
+            self._files, self._dirs = {}, {}
+
+    def save(self) -> None:
+        """Write the index to ``index_path`` if it changed; failures are ignored."""
+
+        if self.index_path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "schema_version": _SCHEMA_VERSION,
+                "sessions_root": str(self.sessions_root),
+                "files": {rel: vars(entry) for rel, entry in sorted(self._files.items())},
+                "dirs": {rel: vars(entry) for rel, entry in sorted(self._dirs.items())},
+            }
+            self._dirty = False
+        temp = self.index_path.with_name(
+            f".{self.index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(temp, self.index_path)
+        except OSError:
+            # The index is an optimization only.
+            temp.unlink(missing_ok=True)
+
+    # -- refresh ---------------------------------------------------------------------
+
+    def _mark_changed(self) -> None:
+        self._dirty = True
+        self._by_id = None
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the sessions tree."""
+
+        with self._lock:
+            scan_started = time.time()
+            seen_dirs: set[str] = set()
+            seen_files: set[str] = set()
+            self._refresh_dir("", scan_started, seen_dirs, seen_files)
+            for rel in set(self._dirs) - seen_dirs:
+                del self._dirs[rel]
+                self._mark_changed()
+            for rel in set(self._files) - seen_files:
+                del self._files[rel]
+                self._mark_changed()
+
+    def _refresh_dir(
+        self,
+        rel: str,
+        scan_started: float,
+        seen_dirs: set[str],
+        seen_files: set[str],
+    ) -> None:
+        directory = self.sessions_root / rel if rel else self.sessions_root
+        try:
+            stat = directory.stat()
+        except OSError:
+            return
+        seen_dirs.add(rel)
+        recorded = self._dirs.get(rel)
+        if recorded is None or not recorded.settled or recorded.mtime_ns != stat.st_mtime_ns:
+            files: list[str] = []
+            dirs: list[str] = []
+            try:
+                with os.scandir(directory) as entries:
+                    for dir_entry in entries:
+                        try:
+                            if dir_entry.is_dir(follow_symlinks=False):
+                                dirs.append(dir_entry.name)
+                            elif dir_entry.name.endswith(".jsonl") and dir_entry.is_file():
+                                files.append(dir_entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                return
+            recorded = _DirEntry(
+                mtime_ns=stat.st_mtime_ns,
+                settled=scan_started - stat.st_mtime_ns / 1e9 > _RACY_MTIME_SECONDS,
+                files=sorted(files),
+                dirs=sorted(dirs),
+            )
+            self._dirs[rel] = recorded
+            self._mark_changed()
+            rescan_all = True
+        else:
+            rescan_all = False
+        for name in recorded.files:
+            file_rel = f"{rel}/{name}" if rel else name
+            previous = self._files.get(file_rel)
+            if previous is not None and previous.head_complete and not rescan_all:
+                seen_files.add(file_rel)
+                continue
+            path = directory / name
+            try:
+                file_stat = path.stat()
+            except OSError:
+                continue
+            seen_files.add(file_rel)
+            if (
+                previous is not None
+                and previous.size == file_stat.st_size
+                and previous.mtime_ns == file_stat.st_mtime_ns
+            ):
+                continue
+            entry = _read_entry(path, file_stat)
+            if entry is None:
+                self._files.pop(file_rel, None)
+                seen_files.discard(file_rel)
+            else:
+                self._files[file_rel] = entry
+            self._mark_changed()
+        for name in recorded.dirs:
+            self._refresh_dir(
+                f"{rel}/{name}" if rel else name, scan_started, seen_dirs, seen_files
+            )
+
+    # -- lookups ---------------------------------------------------------------------
+
+    def _path(self, rel: str) -> Path:
+        return self.sessions_root.joinpath(*rel.split("/"))
+
+    def filename_matches(self, thread_id: str) -> list[Path]:
+        pattern = f"*{thread_id}*.jsonl"
+        with self._lock:
+            rels = [
+                rel
+                for rel in self._files
+                if fnmatch.fnmatchcase(rel.rsplit("/", 1)[-1], pattern)
+            ]
+        return sorted(self._path(rel) for rel in rels)
+
+    def content_matches(self, thread_id: str) -> list[Path]:
+        with self._lock:
+            if self._by_id is None:
+                by_id: dict[str, set[str]] = {}
+                for rel, entry in self._files.items():
+                    for value in entry.ids:
+                        by_id.setdefault(value, set()).add(rel)
+                self._by_id = by_id
+            rels = sorted(self._by_id.get(thread_id, ()))
+        return [self._path(rel) for rel in rels]
+
+
+_INDEXES_LOCK = threading.Lock()
+_INDEXES: dict[tuple[Path, Path | None], CodexSessionIndex] = {}
+
+
+def codex_session_index(
+    sessions_root: Path,
+    *,
+    index_path: Path | None = None,
+) -> CodexSessionIndex:
+    """Return the process-wide index for *sessions_root*, refreshed and saved."""
+
+    key = (sessions_root, index_path)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = CodexSessionIndex(sessions_root, index_path=index_path)
+            _INDEXES[key] = index
+    index.refresh()
+    index.save()
+    return index
+
+
+def clear_codex_session_indexes() -> None:
+    """Forget every in-process session index (persisted files are kept)."""
+
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
+import pytest
+
+from token_monitoring import session_index as session_index_module
 from token_monitoring.codex import find_codex_session_for_thread, parse_codex_session
+from token_monitoring.session_index import (
+    CODEX_SESSION_INDEX_FILENAME,
+    clear_codex_session_indexes,
+)
 
 
 def _write_session(path: Path, events: list[dict[str, object]]) -> None:
@@ -237,3 +245,59 @@ def test_codex_session_classifies_delegation_tool_call(tmp_path: Path) -> None:
     assert result.accepted is True
     assert result.trace[0]["action"]["type"] == "delegation"
     assert result.trace[0]["action"]["prompt_chars"] > 0
+
+
+def test_session_index_persists_and_rescans_only_changed_directories(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sessions = tmp_path / "sessions"
+    index_path = tmp_path / "runs" / "_cache" / CODEX_SESSION_INDEX_FILENAME
+    thread_id = "0199a1b2-c3d4-7e5f-8a9b-0c1d2e3f4a5b"
+    first = sessions / "2026" / "07" / "05" / "rollout-2026-07-05T00-00-00.jsonl"
+    _write_session(
+        first,
+        [
+            {
+                "timestamp": "2026-07-05T00:00:00Z",
+                "type": "session_meta",
+                "payload": {"id": thread_id},
+            }
+        ],
+    )
+    _write_session(sessions / "2026" / "07" / "05" / "rollout-other.jsonl", [])
+    past = first.stat().st_mtime - 3600
+    for directory in [sessions, *(path for path in sessions.rglob("*") if path.is_dir())]:
+        os.utime(directory, (past, past))
+
+    assert find_codex_session_for_thread(sessions, thread_id, index_path=index_path) == (
+        first,
+        [],
+    )
+    assert index_path.is_file()
+
+    # A new process loads the index and re-reads no unchanged session file.
+    clear_codex_session_indexes()
+    reads: list[Path] = []
+    original_read = session_index_module._read_entry
+
+    def _counting_read(path: Path, stat: os.stat_result) -> object:
+        reads.append(path)
+        return original_read(path, stat)
+
+    monkeypatch.setattr(session_index_module, "_read_entry", _counting_read)
+    assert find_codex_session_for_thread(sessions, thread_id, index_path=index_path)[0] == first
+    assert reads == []
+
+    second = sessions / "2026" / "07" / "06" / "rollout-2026-07-06T00-00-00.jsonl"
+    _write_session(second, [{"type": "thread.started", "thread_id": thread_id}])
+    found, exceptions = find_codex_session_for_thread(sessions, thread_id, index_path=index_path)
+    assert reads == [second]
+    assert found is None
+    assert exceptions == [
+        {
+            "code": "ambiguous_session_content_matches",
+            "thread_id": thread_id,
+            "paths": [str(first), str(second)],
+        }
+    ]
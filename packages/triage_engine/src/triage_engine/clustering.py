@@ -5,13 +5,15 @@ from collections.abc import Callable, Iterable, Sequence
 from itertools import combinations
 from typing import TypeVar
 
-from triage_engine.embeddings import Embedder, dot
+from triage_engine.embeddings import Embedder
 from triage_engine.similarity import (
     PairSimilarity,
     build_item_vectors,
-    compute_pair_similarity,
+    compute_pair_similarities,
     generate_candidate_pairs,
+    min_cosine_for_overall_similarity,
 )
+from triage_engine.vector_engine import VectorEngine, make_vector_engine
 
 T = TypeVar("T")
 
@@ -52,7 +54,7 @@ def _embedding_similarity(
     left: int,
     right: int,
     *,
-    vectors: Sequence[tuple[float, ...]],
+    engine: VectorEngine,
     pair_similarity_cache: dict[tuple[int, int], PairSimilarity],
 ) -> float:
     if left == right:
@@ -63,7 +65,7 @@ def _embedding_similarity(
     if cached is not None:
         return cached.embedding_similarity
 
-    cosine = dot(vectors[left], vectors[right])
+    cosine = engine.cosine(left, right)
     cosine = max(-1.0, min(1.0, cosine))
     return (cosine + 1.0) / 2.0
 
@@ -71,8 +73,7 @@ def _embedding_similarity(
 def _select_medoid_index(
     component: Sequence[int],
     *,
-    vectors: Sequence[tuple[float, ...]],
-    pair_similarity_cache: dict[tuple[int, int], PairSimilarity],
+    engine: VectorEngine,
 ) -> int:
     if not component:
         raise ValueError("Cannot pick representative from an empty component.")
@@ -81,20 +82,7 @@ def _select_medoid_index(
 
     best_index = component[0]
     best_score = -1.0
-    for candidate in component:
-        sims: list[float] = []
-        for other in component:
-            if other == candidate:
-                continue
-            sims.append(
-                _embedding_similarity(
-                    candidate,
-                    other,
-                    vectors=vectors,
-                    pair_similarity_cache=pair_similarity_cache,
-                )
-            )
-        average = sum(sims) / float(len(sims)) if sims else 1.0
+    for candidate, average in zip(component, engine.mean_similarities(component), strict=True):
         if average > best_score or (average == best_score and candidate < best_index):
             best_index = candidate
             best_score = average
@@ -145,14 +133,16 @@ def cluster_items(
         embedder=embedder,
     )
 
-    candidate_pairs = generate_candidate_pairs(vectors)
+    engine = make_vector_engine([vector.vector for vector in vectors])
+    candidate_pairs = sorted(generate_candidate_pairs(vectors, engine=engine))
+    similarities = compute_pair_similarities(vectors, candidate_pairs, engine=engine)
 
     parent = list(range(len(items)))
 
     threshold = float(title_overlap_threshold)
 
-    for i, j in sorted(candidate_pairs):
-        sim = compute_pair_similarity(vectors[i], vectors[j])
+    for i, j in candidate_pairs:
+        sim = similarities[(i, j)]
 
         edge = (
             sim.exact_duplicate
@@ -215,25 +205,32 @@ def cluster_items_knn(
     top_k = max(0, int(k))
     use_bruteforce = item_count <= max(1, int(brute_force_limit))
 
-    pair_indices: set[tuple[int, int]]
+    engine = make_vector_engine([vector.vector for vector in vectors])
+    # Non-duplicate pairs below this cosine cannot reach the threshold and are never scored.
+    min_cosine = min_cosine_for_overall_similarity(threshold)
+
+    pair_cosines: dict[tuple[int, int], float]
     if use_bruteforce:
-        pair_indices = {
-            (left, right)
-            for left in range(item_count)
-            for right in range(left + 1, item_count)
-        }
+        pair_cosines = engine.pairs_with_min_cosine(
+            float("-inf") if min_cosine is None else min_cosine
+        )
     else:
-        pair_indices = set(generate_candidate_pairs(vectors))
+        lsh_pairs = sorted(generate_candidate_pairs(vectors, engine=engine))
+        pair_cosines = {
+            pair: cosine
+            for pair, cosine in zip(lsh_pairs, engine.pair_cosines(lsh_pairs), strict=True)
+            if min_cosine is None or cosine >= min_cosine
+        }
 
+    pair_indices = set(pair_cosines)
     pair_indices.update(_exact_duplicate_pairs([item.fingerprint for item in vectors]))
 
-    pair_similarity_cache: dict[tuple[int, int], PairSimilarity] = {}
+    pair_similarity_cache = compute_pair_similarities(
+        vectors, sorted(pair_indices), engine=engine
+    )
     neighbor_candidates: list[list[tuple[int, float, bool]]] = [[] for _ in range(item_count)]
 
-    for left, right in sorted(pair_indices):
-        similarity = compute_pair_similarity(vectors[left], vectors[right])
-        pair_similarity_cache[(left, right)] = similarity
-
+    for (left, right), similarity in pair_similarity_cache.items():
         if similarity.exact_duplicate or similarity.overall_similarity >= threshold:
             neighbor_candidates[left].append(
                 (right, similarity.overall_similarity, similarity.exact_duplicate)
@@ -295,18 +292,13 @@ def cluster_items_knn(
             else float(representative_similarity_threshold)
         )
 
-        vector_values = [vector.vector for vector in vectors]
         for component in components:
             if len(component) == 1:
                 if include_singletons:
                     refined_components.append(component)
                 continue
 
-            representative = _select_medoid_index(
-                component,
-                vectors=vector_values,
-                pair_similarity_cache=pair_similarity_cache,
-            )
+            representative = _select_medoid_index(component, engine=engine)
 
             kept: list[int] = []
             removed: list[int] = []
@@ -317,7 +309,7 @@ def cluster_items_knn(
                 similarity_to_representative = _embedding_similarity(
                     representative,
                     member,
-                    vectors=vector_values,
+                    engine=engine,
                     pair_similarity_cache=pair_similarity_cache,
                 )
                 if threshold_rep is None or similarity_to_representative >= threshold_rep:
@@ -5,8 +5,12 @@ import json
 import math
 import os
 import sqlite3
-from collections.abc import Sequence
-from dataclasses import dataclass
+import sys
+import threading
+from array import array
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import Protocol, runtime_checkable
 
 __all__ = [
@@ -14,6 +18,7 @@ __all__ = [
     "get_default_embedder",
     "CachedEmbedder",
     "DiskCachedEmbedder",
+    "DiskCacheStats",
     "OpenAIEmbedder",
     "dot",
     "l2_normalize",
@@ -124,34 +129,127 @@ def _embedder_model_id(embedder: Embedder) -> str:
     return type(embedder).__name__
 
 
+# Schema version stored in ``PRAGMA user_version``. Version 2 keeps float32 blobs in
+# ``embedding_cache``; version 1 JSON rows are moved to ``embedding_cache_v1`` and migrated on read.
+_DISK_CACHE_SCHEMA_VERSION = 2
+_DISK_CACHE_DTYPE = "f32le"
+_LEGACY_TABLE = "embedding_cache_v1"
+# Stay well below SQLite's bound-variable limit (999 on older builds) per lookup query.
+_LOOKUP_CHUNK_SIZE = 500
+
+
 @dataclass
-class DiskCachedEmbedder:
-    """SQLite cache wrapper for any embedder.
+class DiskCacheStats:
+    """Counters for :class:`DiskCachedEmbedder` lookups since construction."""
 
-    Vectors are stored as JSON arrays keyed by model identifier and exact text hash.
-    """
+    hits: int = 0
+    misses: int = 0
+    migrated: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
 
-    inner: Embedder
-    path: str
 
-    def _connect(self) -> sqlite3.Connection:
-        db_path = os.fspath(self.path)
-        parent = os.path.dirname(db_path)
-        if parent:
-            os.makedirs(parent, exist_ok=True)
-        conn = sqlite3.connect(db_path)
-        conn.execute("PRAGMA journal_mode=WAL")
+def _encode_vector(vector: Sequence[float]) -> bytes:
+    packed = array("f", (float(value) for value in vector))
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts only
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _decode_vector(blob: bytes) -> list[float]:
+    packed = array("f")
+    packed.frombytes(blob)
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts only
+        packed.byteswap()
+    return packed.tolist()
+
+
+def _chunks(values: Sequence[str], size: int) -> Iterator[Sequence[str]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+class _PooledConnection:
+    """One SQLite connection per cache file and process, serialized by a lock."""
+
+    def __init__(self, db_path: str) -> None:
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.has_legacy_rows = _ensure_disk_cache_schema(self.conn)
+
+
+_CONNECTION_POOL: dict[tuple[int, str], _PooledConnection] = {}
+_CONNECTION_POOL_LOCK = threading.Lock()
+
+
+def _ensure_disk_cache_schema(conn: sqlite3.Connection) -> bool:
+    """Create or upgrade the cache schema; return whether legacy JSON rows remain."""
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = int(conn.execute("PRAGMA user_version").fetchone()[0])
+        columns = {
+            str(row[1]) for row in conn.execute("PRAGMA table_info(embedding_cache)").fetchall()
+        }
+        if version < _DISK_CACHE_SCHEMA_VERSION and "vector_json" in columns:
+            # Renaming is O(1); rows are converted lazily as they are looked up.
+            conn.execute(f"ALTER TABLE embedding_cache RENAME TO {_LEGACY_TABLE}")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS embedding_cache (
                 model_id TEXT NOT NULL,
                 text_hash TEXT NOT NULL,
-                vector_json TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                dtype TEXT NOT NULL,
+                vector BLOB NOT NULL,
                 PRIMARY KEY (model_id, text_hash)
-            )
+            ) WITHOUT ROWID
             """
         )
-        return conn
+        conn.execute(f"PRAGMA user_version = {_DISK_CACHE_SCHEMA_VERSION}")
+        legacy = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (_LEGACY_TABLE,),
+        ).fetchone()
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return legacy is not None
+
+
+@contextmanager
+def _pooled_connection(path: str) -> Iterator[_PooledConnection]:
+    db_path = os.path.abspath(os.fspath(path))
+    key = (os.getpid(), db_path)
+    with _CONNECTION_POOL_LOCK:
+        pooled = _CONNECTION_POOL.get(key)
+        if pooled is None:
+            parent = os.path.dirname(db_path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            pooled = _PooledConnection(db_path)
+            _CONNECTION_POOL[key] = pooled
+    with pooled.lock:
+        yield pooled
+
+
+@dataclass
+class DiskCachedEmbedder:
+    """SQLite cache wrapper for any embedder.
+
+    Vectors are stored as little-endian float32 blobs with their dimension, keyed by model
+    identifier and exact text hash. Each process keeps one pooled connection per cache file.
+    Caches written by older versions (JSON arrays) are upgraded in place: legacy rows are
+    converted the first time they are looked up. Returned vectors are always float32-rounded, so
+    a miss and a later hit for the same text produce identical values.
+    """
+
+    inner: Embedder
+    path: str
+    stats: DiskCacheStats = field(default_factory=DiskCacheStats)
 
     def embed_texts(self, texts: Sequence[str]) -> list[list[float]]:
         if not texts:
@@ -167,52 +265,109 @@ class DiskCachedEmbedder:
                 unique_text_by_hash[text_hash] = text
                 ordered_unique_hashes.append(text_hash)
 
-        cached_vectors: dict[str, list[float]] = {}
-        with self._connect() as conn:
-            placeholders = ", ".join("?" for _ in ordered_unique_hashes)
+        # The pooled connection's lock covers SQLite reads and writes only, so concurrent
+        # callers are not serialized behind the inner embedder.
+        with _pooled_connection(self.path) as pooled:
+            conn = pooled.conn
+            cached_vectors = self._lookup(conn, model_id, ordered_unique_hashes)
+            self.stats.hits += len(cached_vectors)
+
+            pending = [h for h in ordered_unique_hashes if h not in cached_vectors]
+            if pending and pooled.has_legacy_rows:
+                migrated = self._migrate_legacy(conn, model_id, pending)
+                cached_vectors.update(migrated)
+                self.stats.hits += len(migrated)
+
+            missing_hashes = [h for h in ordered_unique_hashes if h not in cached_vectors]
+            self.stats.misses += len(missing_hashes)
+
+        if missing_hashes:
+            missing_texts = [unique_text_by_hash[text_hash] for text_hash in missing_hashes]
+            missing_vectors = self.inner.embed_texts(missing_texts)
+            if len(missing_vectors) != len(missing_hashes):
+                raise ValueError(
+                    "Embedding backend returned unexpected vector count: "
+                    f"expected {len(missing_hashes)}, got {len(missing_vectors)}"
+                )
+            blobs = {
+                text_hash: _encode_vector(vector)
+                for text_hash, vector in zip(missing_hashes, missing_vectors, strict=True)
+            }
+            with _pooled_connection(self.path) as pooled:
+                self._store(pooled.conn, model_id, blobs)
+            for text_hash, blob in blobs.items():
+                cached_vectors[text_hash] = _decode_vector(blob)
+
+        return [list(cached_vectors[text_hash]) for text_hash in hashes]
+
+    def _lookup(
+        self, conn: sqlite3.Connection, model_id: str, hashes: Sequence[str]
+    ) -> dict[str, list[float]]:
+        out: dict[str, list[float]] = {}
+        for chunk in _chunks(hashes, _LOOKUP_CHUNK_SIZE):
+            placeholders = ", ".join("?" for _ in chunk)
             rows = conn.execute(
                 (
-                    "SELECT text_hash, vector_json FROM embedding_cache "
+                    "SELECT text_hash, dim, dtype, vector FROM embedding_cache "
                     f"WHERE model_id = ? AND text_hash IN ({placeholders})"
                 ),
-                [model_id, *ordered_unique_hashes],
+                [model_id, *chunk],
+            ).fetchall()
+            for text_hash, dim, dtype, blob in rows:
+                # Rows with an unknown encoding or truncated payload are treated as misses.
+                if dtype != _DISK_CACHE_DTYPE or len(blob) != int(dim) * 4:
+                    continue
+                self.stats.bytes_read += len(blob)
+                out[str(text_hash)] = _decode_vector(blob)
+        return out
+
+    def _migrate_legacy(
+        self, conn: sqlite3.Connection, model_id: str, hashes: Sequence[str]
+    ) -> dict[str, list[float]]:
+        blobs: dict[str, bytes] = {}
+        for chunk in _chunks(hashes, _LOOKUP_CHUNK_SIZE):
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = conn.execute(
+                (
+                    f"SELECT text_hash, vector_json FROM {_LEGACY_TABLE} "
+                    f"WHERE model_id = ? AND text_hash IN ({placeholders})"
+                ),
+                [model_id, *chunk],
             ).fetchall()
             for text_hash, vector_json in rows:
-                cached_vectors[str(text_hash)] = list(map(float, json.loads(vector_json)))
-
-            missing_hashes = [
-                text_hash for text_hash in ordered_unique_hashes if text_hash not in cached_vectors
-            ]
-            if missing_hashes:
-                missing_texts = [unique_text_by_hash[text_hash] for text_hash in missing_hashes]
-                missing_vectors = self.inner.embed_texts(missing_texts)
-                if len(missing_vectors) != len(missing_hashes):
-                    raise ValueError(
-                        "Embedding backend returned unexpected vector count: "
-                        f"expected {len(missing_hashes)}, got {len(missing_vectors)}"
-                    )
-
-                rows_to_insert: list[tuple[str, str, str]] = []
-                for text_hash, vector in zip(missing_hashes, missing_vectors, strict=True):
-                    normalized = [float(value) for value in vector]
-                    cached_vectors[text_hash] = normalized
-                    rows_to_insert.append(
-                        (
-                            model_id,
-                            text_hash,
-                            json.dumps(normalized, ensure_ascii=False, separators=(",", ":")),
-                        )
-                    )
+                blobs[str(text_hash)] = _encode_vector(list(map(float, json.loads(vector_json))))
+        if not blobs:
+            return {}
+        self._store(conn, model_id, blobs, legacy_hashes=list(blobs))
+        self.stats.migrated += len(blobs)
+        return {text_hash: _decode_vector(blob) for text_hash, blob in blobs.items()}
+
+    def _store(
+        self,
+        conn: sqlite3.Connection,
+        model_id: str,
+        blobs: dict[str, bytes],
+        *,
+        legacy_hashes: Sequence[str] = (),
+    ) -> None:
+        with conn:
+            # REPLACE also repairs rows that _lookup rejected as unreadable.
+            conn.executemany(
+                (
+                    "INSERT OR REPLACE INTO embedding_cache"
+                    "(model_id, text_hash, dim, dtype, vector) VALUES (?, ?, ?, ?, ?)"
+                ),
+                [
+                    (model_id, text_hash, len(blob) // 4, _DISK_CACHE_DTYPE, blob)
+                    for text_hash, blob in blobs.items()
+                ],
+            )
+            if legacy_hashes:
                 conn.executemany(
-                    (
-                        "INSERT OR IGNORE INTO embedding_cache(model_id, text_hash, vector_json) "
-                        "VALUES (?, ?, ?)"
-                    ),
-                    rows_to_insert,
+                    f"DELETE FROM {_LEGACY_TABLE} WHERE model_id = ? AND text_hash = ?",
+                    [(model_id, text_hash) for text_hash in legacy_hashes],
                 )
-                conn.commit()
-
-        return [list(cached_vectors[text_hash]) for text_hash in hashes]
+        self.stats.bytes_written += sum(len(blob) for blob in blobs.values())
 
 
 @dataclass
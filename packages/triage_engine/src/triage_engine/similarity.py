@@ -17,6 +17,7 @@ from triage_engine.embeddings import (
     l2_normalize,
 )
 from triage_engine.text import extract_path_anchors_from_chunks, tokenize
+from triage_engine.vector_engine import VectorEngine, make_vector_engine
 
 T = TypeVar("T")
 
@@ -24,6 +25,7 @@ __all__ = [
     "ItemVector",
     "PairSimilarity",
     "build_item_vectors",
+    "compute_pair_similarities",
     "compute_pair_similarity",
     "get_similarity_weights",
     "generate_candidate_pairs",
@@ -214,11 +216,69 @@ def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
 def compute_pair_similarity(left: ItemVector, right: ItemVector) -> PairSimilarity:
     """Compute a composite similarity score for two embedded items."""
 
+    # Vectors are L2-normalized; cosine reduces to dot product.
+    return _pair_similarity_from_cosine(
+        left,
+        right,
+        cosine=dot(left.vector, right.vector),
+        weights=get_similarity_weights(),
+    )
+
+
+def compute_pair_similarities(
+    items: Sequence[ItemVector],
+    pairs: Iterable[tuple[int, int]],
+    *,
+    engine: VectorEngine | None = None,
+) -> dict[tuple[int, int], PairSimilarity]:
+    """Compute :func:`compute_pair_similarity` for many index pairs at once.
+
+    Cosines come from one batched engine query and weights are resolved once per call.
+    """
+
+    ordered = list(pairs)
+    if not ordered:
+        return {}
+    chosen = engine or make_vector_engine([item.vector for item in items])
+    weights = get_similarity_weights()
+    return {
+        (left, right): _pair_similarity_from_cosine(
+            items[left], items[right], cosine=cosine, weights=weights
+        )
+        for (left, right), cosine in zip(ordered, chosen.pair_cosines(ordered), strict=True)
+    }
+
+
+def min_cosine_for_overall_similarity(
+    threshold: float,
+    *,
+    weights: SimilarityWeights | None = None,
+) -> float | None:
+    """Smallest embedding cosine at which a non-duplicate pair can reach *threshold*.
+
+    Title, anchor and evidence signals are each at most 1.0, so a pair below the returned cosine
+    cannot score ``overall_similarity >= threshold``. Returns ``None`` when no such bound exists
+    (non-positive embedding weight or negative auxiliary weights).
+    """
+
+    w = weights or get_similarity_weights()
+    if w.embedding <= 0.0 or min(w.title, w.anchor, w.evidence) < 0.0:
+        return None
+    auxiliary = w.title + w.anchor + w.evidence
+    # Keep a margin so floating-point reordering never prunes a boundary pair.
+    return 2.0 * (float(threshold) - auxiliary) / w.embedding - 1.0 - 1e-9
+
+
+def _pair_similarity_from_cosine(
+    left: ItemVector,
+    right: ItemVector,
+    *,
+    cosine: float,
+    weights: SimilarityWeights,
+) -> PairSimilarity:
     exact = bool(left.fingerprint and left.fingerprint == right.fingerprint)
 
-    # Vectors are L2-normalized; cosine reduces to dot product.
-    cos = dot(left.vector, right.vector)
-    cos = max(-1.0, min(1.0, cos))
+    cos = max(-1.0, min(1.0, cosine))
 
     # Normalize cosine into [0, 1] for easier composition.
     emb_sim = (cos + 1.0) / 2.0
@@ -232,7 +292,7 @@ def compute_pair_similarity(left: ItemVector, right: ItemVector) -> PairSimilari
         overall = 1.0
     else:
         # Titles are treated as an auxiliary signal (useful for very short items).
-        w = get_similarity_weights()
+        w = weights
         overall = (
             w.embedding * emb_sim
             + w.title * title_sim
@@ -289,6 +349,13 @@ class _SparseRandomHyperplaneLSH:
     def n_bits(self) -> int:
         return self._n_bits
 
+    def projection_terms(self) -> Iterable[tuple[int, int, float]]:
+        """Yield ``(bit, dimension, sign)`` for every sparse hyperplane entry."""
+
+        for bit in range(self._n_bits):
+            for idx, sign in zip(self._indices[bit], self._signs[bit], strict=True):
+                yield bit, idx, sign
+
     def signature(self, vec: Sequence[float]) -> int:
         if len(vec) != self._dim:
             raise ValueError("Vector length does not match LSH dimension")
@@ -414,8 +481,13 @@ def generate_candidate_pairs(
     seed: int = 1337,
     max_anchors_per_item: int = 8,
     max_title_tokens_per_item: int = 6,
+    engine: VectorEngine | None = None,
 ) -> set[tuple[int, int]]:
-    """Generate candidate index pairs using LSH + exact buckets."""
+    """Generate candidate index pairs using LSH + exact buckets.
+
+    LSH signatures for all items are computed in one batched projection through *engine*
+    (built from ``items`` when omitted).
+    """
 
     n = len(items)
     if n <= 1:
@@ -457,7 +529,8 @@ def generate_candidate_pairs(
         seed=int(seed),
     )
 
-    signatures = [lsh.signature(item.vector) for item in items]
+    chosen = engine or make_vector_engine([item.vector for item in items])
+    signatures = chosen.lsh_signatures(lsh)
 
     bands = max(0, int(sim_bands))
     band_bits = max(0, int(sim_band_bits))
@@ -0,0 +1,206 @@
+"""Batched similarity kernels over a fixed set of L2-normalized item vectors.
+
+Two interchangeable engines are provided:
+
+- a NumPy engine that keeps every vector in one contiguous float64 matrix and answers pair
+  and threshold queries with blocked matrix multiplies, and LSH queries with per-term column
+  sums that give the same signatures bit for bit;
+- a pure-Python engine that reproduces the original per-pair loops exactly.
+
+NumPy is optional. :func:`make_vector_engine` selects it when importable unless
+``TRIAGE_ENGINE_VECTOR_BACKEND`` is set to ``python``.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Sequence
+from typing import Any, Protocol
+
+from triage_engine.embeddings import dot
+
+try:  # pragma: no cover - exercised implicitly depending on the environment
+    import numpy as _np
+except ModuleNotFoundError:  # pragma: no cover
+    _np = None  # type: ignore[assignment]
+
+__all__ = [
+    "VectorEngine",
+    "make_vector_engine",
+    "numpy_available",
+]
+
+# Rows per block for full matrix products; bounds temporary memory to block x item_count floats.
+_ROW_BLOCK = 512
+# Pairs per gather for sparse pair lookups; bounds temporary memory to 2 x block x dim floats.
+_PAIR_BLOCK = 1024
+
+
+def numpy_available() -> bool:
+    return _np is not None
+
+
+class LSHProjection(Protocol):
+    """Sparse hyperplane definition consumed by :meth:`VectorEngine.lsh_signatures`."""
+
+    @property
+    def n_bits(self) -> int: ...
+
+    def signature(self, vec: Sequence[float]) -> int: ...
+
+    def projection_terms(self) -> Iterable[tuple[int, int, float]]: ...
+
+
+class VectorEngine(Protocol):
+    """Similarity queries over ``vectors[i]`` addressed by item index."""
+
+    backend: str
+
+    def cosine(self, left: int, right: int) -> float: ...
+
+    def pair_cosines(self, pairs: Sequence[tuple[int, int]]) -> list[float]: ...
+
+    def pairs_with_min_cosine(self, min_cosine: float) -> dict[tuple[int, int], float]: ...
+
+    def lsh_signatures(self, lsh: LSHProjection) -> list[int]: ...
+
+    def mean_similarities(self, members: Sequence[int]) -> list[float]: ...
+
+
+def _clamp_cosine(value: float) -> float:
+    return max(-1.0, min(1.0, value))
+
+
+class _PythonVectorEngine:
+    backend = "python"
+
+    def __init__(self, vectors: Sequence[tuple[float, ...]]) -> None:
+        self._vectors = vectors
+
+    def cosine(self, left: int, right: int) -> float:
+        return dot(self._vectors[left], self._vectors[right])
+
+    def pair_cosines(self, pairs: Sequence[tuple[int, int]]) -> list[float]:
+        vectors = self._vectors
+        return [dot(vectors[left], vectors[right]) for left, right in pairs]
+
+    def pairs_with_min_cosine(self, min_cosine: float) -> dict[tuple[int, int], float]:
+        vectors = self._vectors
+        out: dict[tuple[int, int], float] = {}
+        for left in range(len(vectors)):
+            for right in range(left + 1, len(vectors)):
+                cosine = dot(vectors[left], vectors[right])
+                if cosine >= min_cosine:
+                    out[(left, right)] = cosine
+        return out
+
+    def lsh_signatures(self, lsh: LSHProjection) -> list[int]:
+        return [lsh.signature(vec) for vec in self._vectors]
+
+    def mean_similarities(self, members: Sequence[int]) -> list[float]:
+        vectors = self._vectors
+        out: list[float] = []
+        for candidate in members:
+            sims = [
+                (_clamp_cosine(dot(vectors[candidate], vectors[other])) + 1.0) / 2.0
+                for other in members
+                if other != candidate
+            ]
+            out.append(sum(sims) / float(len(sims)) if sims else 1.0)
+        return out
+
+
+class _NumpyVectorEngine:
+    backend = "numpy"
+
+    def __init__(self, vectors: Sequence[tuple[float, ...]]) -> None:
+        assert _np is not None
+        self._matrix: Any = _np.ascontiguousarray(_np.asarray(vectors, dtype=_np.float64))
+        if self._matrix.ndim != 2:
+            self._matrix = self._matrix.reshape(len(vectors), -1)
+
+    def cosine(self, left: int, right: int) -> float:
+        return float(self._matrix[left] @ self._matrix[right])
+
+    def pair_cosines(self, pairs: Sequence[tuple[int, int]]) -> list[float]:
+        assert _np is not None
+        if not pairs:
+            return []
+        index = _np.asarray(pairs, dtype=_np.intp)
+        out: list[float] = []
+        for start in range(0, len(index), _PAIR_BLOCK):
+            block = index[start : start + _PAIR_BLOCK]
+            left = self._matrix[block[:, 0]]
+            right = self._matrix[block[:, 1]]
+            out.extend(_np.einsum("ij,ij->i", left, right).tolist())
+        return out
+
+    def pairs_with_min_cosine(self, min_cosine: float) -> dict[tuple[int, int], float]:
+        assert _np is not None
+        matrix = self._matrix
+        count = matrix.shape[0]
+        out: dict[tuple[int, int], float] = {}
+        for start in range(0, count, _ROW_BLOCK):
+            stop = min(count, start + _ROW_BLOCK)
+            # Only the upper triangle is needed: columns after the first row of this block.
+            block = matrix[start:stop] @ matrix[start + 1 :].T
+            rows, cols = _np.nonzero(block >= min_cosine)
+            for row, col, value in zip(
+                rows.tolist(), cols.tolist(), block[rows, cols].tolist(), strict=True
+            ):
+                left = start + row
+                right = start + 1 + col
+                if right > left:
+                    out[(left, right)] = value
+        return out
+
+    def lsh_signatures(self, lsh: LSHProjection) -> list[int]:
+        assert _np is not None
+        count = self._matrix.shape[0]
+        n_bits = int(lsh.n_bits)
+        # Column-major copy so each hyperplane term reads one contiguous column.
+        columns = _np.asfortranarray(self._matrix)
+        acc = _np.zeros((n_bits, count), dtype=_np.float64)
+        # Terms are added one at a time in the scalar loop's order rather than through a
+        # matrix product: sparse vectors put many projections exactly on zero, and a
+        # reordered sum can flip those bits.
+        for bit, index, sign in lsh.projection_terms():
+            acc[bit] += sign * columns[:, index]
+        packed = _np.packbits((acc >= 0.0).T, axis=1, bitorder="little")
+        return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+    def mean_similarities(self, members: Sequence[int]) -> list[float]:
+        assert _np is not None
+        if len(members) <= 1:
+            return [1.0 for _ in members]
+        sub = self._matrix[_np.asarray(members, dtype=_np.intp)]
+        sims = (_np.clip(sub @ sub.T, -1.0, 1.0) + 1.0) / 2.0
+        _np.fill_diagonal(sims, 0.0)
+        means = sims.sum(axis=1) / float(len(members) - 1)
+        return [float(value) for value in means]
+
+
+def make_vector_engine(
+    vectors: Sequence[tuple[float, ...]],
+    *,
+    backend: str | None = None,
+) -> VectorEngine:
+    """Return a similarity engine for *vectors* (assumed L2-normalized).
+
+    ``backend`` (or ``TRIAGE_ENGINE_VECTOR_BACKEND``) may be ``auto`` (default), ``numpy`` or
+    ``python``. Requesting ``numpy`` when it is not installed raises ``ModuleNotFoundError``.
+    """
+
+    choice = (backend or os.getenv("TRIAGE_ENGINE_VECTOR_BACKEND") or "auto").strip().lower()
+    if choice not in {"auto", "numpy", "python"}:
+        raise ValueError(
+            "TRIAGE_ENGINE_VECTOR_BACKEND must be one of 'auto', 'numpy' or 'python'."
+        )
+    if choice == "numpy" and _np is None:
+        raise ModuleNotFoundError(
+            "numpy is not installed. Install triage_engine with the numpy extra "
+            "(or add numpy to your environment)."
+        )
+    if choice != "python" and _np is not None and vectors:
+        return _NumpyVectorEngine(vectors)
+    return _PythonVectorEngine(vectors)
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import random
 from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
+
+import pytest
 
 from triage_engine import cluster_items, cluster_items_knn
+from triage_engine.similarity import _SparseRandomHyperplaneLSH, build_item_vectors
+from triage_engine.testing import HashingEmbedder
+from triage_engine.vector_engine import make_vector_engine, numpy_available
 
 
 class _DeterministicEmbedder:
@@ -152,3 +159,100 @@ def test_cluster_items_knn_refinement_splits_bridged_cluster() -> None:
     )
 
     assert clusters == [[0], [1], [2]]
+
+
+def _synthetic_titles() -> list[str]:
+    topics = ("parser crash", "docs theme", "docker sandbox", "windows install", "cache miss")
+    return [
+        f"{topics[idx % len(topics)]} variant {idx % 4} in module {idx % 3}" for idx in range(24)
+    ]
+
+
+@pytest.mark.parametrize("brute_force_limit", [256, 1])
+def test_cluster_items_knn_matches_across_vector_backends(
+    monkeypatch: pytest.MonkeyPatch, brute_force_limit: int
+) -> None:
+    if not numpy_available():
+        pytest.skip("numpy is not installed")
+
+    titles = _synthetic_titles()
+
+    def _run(backend: str) -> list[list[int]]:
+        monkeypatch.setenv("TRIAGE_ENGINE_VECTOR_BACKEND", backend)
+        return cluster_items_knn(
+            titles,
+            get_title=lambda title: title,
+            get_text_chunks=lambda title: [title],
+            embedder=HashingEmbedder(dim=128),
+            k=3,
+            overall_similarity_threshold=0.6,
+            brute_force_limit=brute_force_limit,
+        )
+
+    assert _run("numpy") == _run("python")
+
+
+def _sparse_titles(count: int) -> list[str]:
+    rng = random.Random(3)
+    words = "parser crash docs theme docker sandbox windows install cache miss retry lint".split()
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(2, 8))) for _ in range(count)]
+
+
+def test_default_vector_backend_matches_python_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Hashing vectors are sparse, so many LSH projections land exactly on zero; the default
+    # backend must resolve those bits (and therefore buckets and clusters) like the scalar loop.
+    titles = _sparse_titles(200)
+    vectors = build_item_vectors(
+        titles,
+        get_title=lambda title: title,
+        get_text_chunks=lambda title: [title],
+        get_evidence_ids=None,
+        embedder=HashingEmbedder(dim=256),
+    )
+    values = [vector.vector for vector in vectors]
+    lsh = _SparseRandomHyperplaneLSH(256)
+    monkeypatch.delenv("TRIAGE_ENGINE_VECTOR_BACKEND", raising=False)
+    assert make_vector_engine(values).lsh_signatures(lsh) == make_vector_engine(
+        values, backend="python"
+    ).lsh_signatures(lsh)
+
+    def _run() -> tuple[list[list[int]], list[list[int]]]:
+        kwargs: dict[str, Any] = {
+            "get_title": lambda title: title,
+            "get_text_chunks": lambda title: [title],
+            "embedder": HashingEmbedder(dim=256),
+        }
+        return (
+            cluster_items(titles, **kwargs),
+            cluster_items_knn(
+                titles, k=5, overall_similarity_threshold=0.6, brute_force_limit=1, **kwargs
+            ),
+        )
+
+    default = _run()
+    monkeypatch.setenv("TRIAGE_ENGINE_VECTOR_BACKEND", "python")
+    assert default == _run()
+
+
+def test_vector_backends_agree_on_lsh_signatures_and_threshold_pairs() -> None:
+    if not numpy_available():
+        pytest.skip("numpy is not installed")
+
+    vectors = build_item_vectors(
+        _synthetic_titles(),
+        get_title=lambda title: title,
+        get_text_chunks=lambda title: [title],
+        get_evidence_ids=None,
+        embedder=HashingEmbedder(dim=64),
+    )
+    values = [vector.vector for vector in vectors]
+    python_engine = make_vector_engine(values, backend="python")
+    numpy_engine = make_vector_engine(values, backend="numpy")
+    lsh = _SparseRandomHyperplaneLSH(64, n_bits=32, indices_per_bit=8)
+
+    assert numpy_engine.lsh_signatures(lsh) == python_engine.lsh_signatures(lsh)
+
+    expected = python_engine.pairs_with_min_cosine(0.2)
+    actual = numpy_engine.pairs_with_min_cosine(0.2)
+    assert actual.keys() == expected.keys()
+    assert all(abs(actual[pair] - expected[pair]) < 1e-9 for pair in expected)
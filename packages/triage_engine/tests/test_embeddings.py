@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import sqlite3
 import sys
+import threading
 import types
 from collections.abc import Sequence
 from pathlib import Path
@@ -122,6 +125,100 @@ def test_disk_cached_embedder_reuses_cached_vectors(tmp_path: Path) -> None:
         assert count is not None
         assert int(count[0]) == 3
 
+    assert embedder.stats.hits == 3
+    assert embedder.stats.misses == 3
+    assert embedder.stats.bytes_written == 3 * 2 * 4
+
+
+def test_disk_cached_embedder_chunks_large_lookups(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.sqlite3"
+    inner = _CountingEmbedder()
+    texts = [f"text-{idx}" for idx in range(2500)]
+
+    first = DiskCachedEmbedder(inner=inner, path=str(cache_path)).embed_texts(texts)
+    reader = DiskCachedEmbedder(inner=inner, path=str(cache_path))
+    second = reader.embed_texts(texts)
+
+    assert inner.calls == 1
+    assert second == first
+    assert reader.stats.hits == len(texts)
+    assert reader.stats.bytes_read == len(texts) * 2 * 4
+
+
+def test_disk_cached_embedder_does_not_hold_cache_lock_while_embedding(tmp_path: Path) -> None:
+    cache_path = str(tmp_path / "cache.sqlite3")
+    barrier = threading.Barrier(2, timeout=10)
+
+    class _RendezvousEmbedder:
+        def embed_texts(self, texts: Sequence[str]) -> list[list[float]]:
+            # Both callers must be inside the inner embedder at the same time.
+            barrier.wait()
+            return [[float(len(text)), 1.0] for text in texts]
+
+    results: dict[str, list[list[float]]] = {}
+    errors: list[BaseException] = []
+
+    def _embed(text: str) -> None:
+        try:
+            embedder = DiskCachedEmbedder(inner=_RendezvousEmbedder(), path=cache_path)
+            results[text] = embedder.embed_texts([text])
+        except BaseException as exc:  # noqa: BLE001 - surfaced through the assertion below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_embed, args=(text,)) for text in ("a", "bb")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert results == {"a": [[1.0, 1.0]], "bb": [[2.0, 1.0]]}
+    reader = DiskCachedEmbedder(inner=_RendezvousEmbedder(), path=cache_path)
+    assert reader.embed_texts(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    assert reader.stats.hits == 2
+
+
+def test_disk_cached_embedder_migrates_legacy_json_rows_lazily(tmp_path: Path) -> None:
+    cache_path = tmp_path / "legacy.sqlite3"
+    inner = _CountingEmbedder()
+    model_id = type(inner).__name__
+
+    with sqlite3.connect(cache_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE embedding_cache (
+                model_id TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector_json TEXT NOT NULL,
+                PRIMARY KEY (model_id, text_hash)
+            )
+            """
+        )
+        for text in ("alpha", "beta"):
+            conn.execute(
+                "INSERT INTO embedding_cache VALUES (?, ?, ?)",
+                (
+                    model_id,
+                    hashlib.sha256(text.encode("utf-8")).hexdigest(),
+                    json.dumps([0.5, 2.0]),
+                ),
+            )
+
+    embedder = DiskCachedEmbedder(inner=inner, path=str(cache_path))
+    vectors = embedder.embed_texts(["alpha", "gamma"])
+
+    assert vectors == [[0.5, 2.0], [5.0, 2.0]]
+    assert inner.calls == 1
+    assert embedder.stats.migrated == 1
+    assert embedder.stats.hits == 1
+    assert embedder.stats.misses == 1
+
+    with sqlite3.connect(cache_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+        upgraded = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        legacy = conn.execute("SELECT COUNT(*) FROM embedding_cache_v1").fetchone()[0]
+    assert (upgraded, legacy) == (2, 1)
+
 
 def test_openai_embedder_batches_and_preserves_order(
     monkeypatch: pytest.MonkeyPatch,
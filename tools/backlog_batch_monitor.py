@@ -13,6 +13,11 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+_TOOLS_DIR = Path(__file__).resolve().parent
+if str(_TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(_TOOLS_DIR))
+
+from monitor_readers import followed_tail  # noqa: E402
 
 BEGIN_RE = re.compile(r"^BEGIN phase=(?P<phase>\S+) .* workers=(?P<workers>\[.*\])$")
 PHASE_RE = re.compile(r"^PHASE (?P<phase>\S+) cycle=(?P<cycle>\d+)$")
@@ -81,12 +86,10 @@ _configure_console_output()
 
 
 def _tail(path: Path | None, limit: int) -> list[str]:
-    if path is None or not path.exists():
-        return []
-    try:
-        return path.read_text(encoding="utf-8", errors="replace").splitlines()[-limit:]
-    except Exception:
+    if path is None:
         return []
+    # Follows the file across polls, so only newly appended bytes are read.
+    return followed_tail(path, limit)
 
 
 def _latest(log_dir: Path, suffix: str) -> Path | None:
@@ -116,6 +119,8 @@ def _read_json(path: Path | None) -> dict[str, Any] | None:
 def _read_jsonl(path: Path | None, *, limit: int | None = None) -> list[dict[str, Any]]:
     if path is None or not path.exists():
         return []
+    if limit is not None:
+        return followed_tail(path, limit, jsonl=True)
     rows: list[dict[str, Any]] = []
     try:
         for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
@@ -3,11 +3,18 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+_TOOLS_DIR = Path(__file__).resolve().parent
+if str(_TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(_TOOLS_DIR))
+
+from monitor_readers import TreeActivity  # noqa: E402
+
 
 def _utc_now_z() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -31,18 +38,18 @@ def _read_json(path: Path) -> dict[str, Any] | None:
     return data if isinstance(data, dict) else None
 
 
-def _latest_activity_epoch(paths: list[Path], *, batch_dir: Path | None) -> float | None:
+def _latest_activity_epoch(paths: list[Path], *, activity: TreeActivity | None) -> float | None:
     candidates: list[float] = []
     for path in paths:
-        if path.exists():
+        try:
             candidates.append(path.stat().st_mtime)
-    if batch_dir is not None and batch_dir.exists():
-        for path in batch_dir.rglob("*"):
-            try:
-                if path.is_file():
-                    candidates.append(path.stat().st_mtime)
-            except OSError:
-                continue
+        except OSError:
+            continue
+    if activity is not None:
+        # Re-lists only batch directories whose mtime changed instead of walking the tree.
+        tree_epoch = activity.latest_epoch()
+        if tree_epoch is not None:
+            candidates.append(tree_epoch)
     return max(candidates) if candidates else None
 
 
@@ -99,6 +106,7 @@ def main(argv: list[str] | None = None) -> int:
         _append_log(log_path, "no batch directory found")
         return 1
 
+    activity = TreeActivity(batch_dir, hot_seconds=float(args.stale_seconds))
     last_status: tuple[str | None, str | None] | None = None
     last_alert_at = 0.0
     _append_log(log_path, f"watching batch_dir={batch_dir}")
@@ -119,7 +127,7 @@ def main(argv: list[str] | None = None) -> int:
 
         activity_epoch = _latest_activity_epoch(
             [launcher_stdout, launcher_stderr, batch_dir / "batch_state.json"],
-            batch_dir=batch_dir,
+            activity=activity,
         )
         now = time.time()
         if activity_epoch is not None and status == "running":
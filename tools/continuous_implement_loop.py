@@ -30,7 +30,6 @@ from run_artifacts.lifecycle_events import (  # noqa: E402
     lifecycle_context_env,
 )
 
-from usertest_implement.batch_state import latest_batch_dir, load_json  # noqa: E402
 from usertest_implement.batch_runner import (  # noqa: E402
     _build_phases,
     _configured_owner_root,
@@ -39,7 +38,9 @@ from usertest_implement.batch_runner import (  # noqa: E402
     _required_exact_resume_roles,
     _resume_ledger_path,
 )
-from usertest_implement.ledger import update_ledger_file  # noqa: E402
+from usertest_implement.batch_state import latest_batch_dir, load_json  # noqa: E402
+from usertest_implement.github_client import GITHUB_CACHE_DIR_ENV  # noqa: E402
+from usertest_implement.ledger import compact_ledger_journal, update_ledger_file  # noqa: E402
 
 _SEVERITY_PATTERN = re.compile(r"^- Severity:\s*`?([^`\r\n]+)`?\s*$", re.MULTILINE)
 _EXPORT_KIND_PATTERN = re.compile(r"^- Export kind:\s*`?([^`\r\n]+)`?\s*$", re.MULTILINE)
@@ -115,6 +116,8 @@ def _write_state(ctx: LoopContext, **payload: Any) -> None:
 
 def _controller_environment(ctx: LoopContext) -> dict[str, str]:
     env = dict(os.environ)
+    # Review, resume and handoff children share immutable GitHub responses (PR diffs per head).
+    env.setdefault(GITHUB_CACHE_DIR_ENV, str(ctx.runs_dir / "_cache" / "github"))
     if ctx.controller_context is not None:
         env.pop(LIFECYCLE_CONTEXT_FILE_ENV, None)
         env.update(lifecycle_context_env(ctx.controller_context))
@@ -481,6 +484,7 @@ def _load_ledger(ctx: LoopContext) -> dict[str, Any]:
     """Load the implementation attempt ledger from `.agents/state`."""
 
     ledger_path = ctx.owner_root / ".agents" / "state" / "backlog_implement_actions.yaml"
+    compact_ledger_journal(ledger_path)
     if not ledger_path.exists():
         return {"actions": {}}
     raw = yaml.safe_load(ledger_path.read_text(encoding="utf-8"))
@@ -0,0 +1,296 @@
+"""Incremental log readers shared by the batch monitor and the batch watchdog.
+
+The monitors poll logs that grow to several GB every few seconds, so they must not re-read
+whole files or re-walk whole trees on each poll.  This module provides:
+
+- :func:`tail_lines` / :func:`tail_jsonl`, which seek backwards from EOF for the last N lines
+  or JSONL records;
+- :class:`FileTail` and :func:`followed_tail`, which remember a file's offset between polls
+  so that later polls only read the bytes appended since;
+- :class:`TreeActivity`, which tracks the newest file mtime under a directory and re-lists
+  only directories whose own mtime changed.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+__all__ = [
+    "DEFAULT_WATCHED_FILE_PATTERNS",
+    "FileTail",
+    "TreeActivity",
+    "followed_tail",
+    "tail_jsonl",
+    "tail_lines",
+]
+
+_BLOCK_BYTES = 64 * 1024
+# Past this many appended bytes, seeking back from EOF is cheaper than reading them all.
+_MAX_CATCH_UP_BYTES = 8 * 1024 * 1024
+# Bytes before the previous offset that must still match for an append-only catch-up.
+_ANCHOR_BYTES = 64
+_MAX_FOLLOWED_FILES = 32
+# Directory mtimes this close to the listing may not yet reflect entries made in the same tick.
+_RACY_MTIME_SECONDS = 2.0
+# Files the batch launcher and its workers keep appending to; stat'ed on every poll.
+DEFAULT_WATCHED_FILE_PATTERNS = ("*.log", "*.stdout.txt", "*.stderr.txt", "*heartbeat*")
+
+
+def _reverse_pieces(handle: BinaryIO, end: int) -> Iterator[bytes]:
+    """Yield the newline-separated pieces of ``handle[:end]``, last piece first.
+
+    The first piece is the unterminated fragment after the last newline, possibly empty.
+    """
+
+    position = end
+    remainder = b""
+    while position > 0:
+        step = min(_BLOCK_BYTES, position)
+        position -= step
+        handle.seek(position)
+        pieces = (handle.read(step) + remainder).split(b"\n")
+        remainder = pieces.pop(0)
+        yield from reversed(pieces)
+    yield remainder
+
+
+class FileTail:
+    """The last ``limit`` lines (or JSONL object records) of one file, kept up to date.
+
+    Lines match ``read_text(errors="replace").splitlines()``, including a final line without
+    a newline.  JSONL records are the dict rows, and lines that do not decode are skipped;
+    an unterminated last record shows up once it decodes.  Each :meth:`read` only reads the
+    bytes appended since the previous one.  The tail is rebuilt from EOF when the file was
+    replaced, truncated or rewritten, or when too much was appended in between.
+    """
+
+    def __init__(self, path: Path, limit: int, *, jsonl: bool = False) -> None:
+        self.path = path
+        self.limit = max(0, int(limit))
+        self.jsonl = jsonl
+        self._lock = threading.Lock()
+        self._items: deque[Any] = deque(maxlen=self.limit)
+        self._identity: tuple[int, int] | None = None
+        self._offset = 0
+        self._anchor = b""
+        self._pending = b""
+
+    def _parse(self, piece: bytes, *, complete: bool) -> list[Any]:
+        if self.jsonl:
+            if not piece.strip():
+                return []
+            try:
+                raw = json.loads(piece.decode("utf-8", errors="replace"))
+            except json.JSONDecodeError:
+                return []
+            return [raw] if isinstance(raw, dict) else []
+        lines = piece.decode("utf-8", errors="replace").splitlines()
+        return lines or ([""] if complete else [])
+
+    def _reset(self) -> None:
+        self._items = deque(maxlen=self.limit)
+        self._identity = None
+        self._offset = 0
+        self._anchor = b""
+        self._pending = b""
+
+    def _reload(self, handle: BinaryIO, size: int) -> None:
+        pieces = _reverse_pieces(handle, size)
+        pending = next(pieces)
+        newest_first: list[Any] = []
+        for piece in pieces:
+            if len(newest_first) >= self.limit:
+                break
+            newest_first.extend(reversed(self._parse(piece, complete=True)))
+        self._items = deque(reversed(newest_first), maxlen=self.limit)
+        self._pending = pending
+        self._remember_anchor(handle, size)
+
+    def _catch_up(self, handle: BinaryIO, size: int) -> bool:
+        start = self._offset - len(self._anchor)
+        handle.seek(start)
+        data = handle.read(size - start)
+        if not data.startswith(self._anchor):
+            return False
+        pieces = (self._pending + data[len(self._anchor) :]).split(b"\n")
+        self._pending = pieces.pop()
+        for piece in pieces:
+            self._items.extend(self._parse(piece, complete=True))
+        self._remember_anchor(handle, size)
+        return True
+
+    def _remember_anchor(self, handle: BinaryIO, size: int) -> None:
+        start = max(0, size - _ANCHOR_BYTES)
+        handle.seek(start)
+        self._anchor = handle.read(size - start)
+        self._offset = size
+
+    def read(self) -> list[Any]:
+        """Return the current tail; a missing or unreadable file yields ``[]``."""
+
+        with self._lock:
+            try:
+                stat = self.path.stat()
+                identity = (stat.st_dev, stat.st_ino)
+                size = stat.st_size
+                if identity != self._identity or size < self._offset:
+                    fresh = True
+                else:
+                    fresh = size - self._offset > _MAX_CATCH_UP_BYTES
+                if fresh or size != self._offset:
+                    with self.path.open("rb") as handle:
+                        if fresh or not self._catch_up(handle, size):
+                            self._reload(handle, size)
+                self._identity = identity
+            except OSError:
+                self._reset()
+                return []
+            if not self.limit:
+                return []
+            items = list(self._items) + self._parse(self._pending, complete=False)
+            return items[-self.limit :]
+
+
+_FOLLOWED_LOCK = threading.Lock()
+_FOLLOWED: OrderedDict[tuple[Path, int, bool], FileTail] = OrderedDict()
+
+
+def followed_tail(path: Path, limit: int, *, jsonl: bool = False) -> list[Any]:
+    """Like :func:`tail_lines`/:func:`tail_jsonl`, but reuse this process's previous read."""
+
+    key = (path, int(limit), jsonl)
+    with _FOLLOWED_LOCK:
+        tail = _FOLLOWED.get(key)
+        if tail is None:
+            tail = FileTail(path, limit, jsonl=jsonl)
+            _FOLLOWED[key] = tail
+        _FOLLOWED.move_to_end(key)
+        while len(_FOLLOWED) > _MAX_FOLLOWED_FILES:
+            _FOLLOWED.popitem(last=False)
+    return tail.read()
+
+
+def tail_lines(path: Path, limit: int) -> list[str]:
+    """Return the last ``limit`` lines of ``path`` without reading the whole file."""
+
+    return FileTail(path, limit).read()
+
+
+def tail_jsonl(path: Path, limit: int) -> list[dict[str, Any]]:
+    """Return the last ``limit`` JSON object rows of ``path`` without reading the whole file."""
+
+    return FileTail(path, limit, jsonl=True).read()
+
+
+class TreeActivity:
+    """Newest mtime of any file under ``root``, refreshed without a full walk.
+
+    Like a full ``rglob`` sweep, only file mtimes count as activity.  A directory is re-listed
+    only when its own mtime changed, which happens whenever entries are created, removed or
+    renamed.  Appends do not touch the directory, so files whose names match
+    ``watched_patterns`` (the launcher's logs and heartbeat) and files that changed within
+    ``hot_seconds`` are stat'ed on every poll.  All other files are stat'ed round-robin,
+    ``sweep_files`` per poll, so a write to a long-idle file is still noticed within a bounded
+    number of polls.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        hot_seconds: float = 600.0,
+        sweep_files: int = 256,
+        watched_patterns: tuple[str, ...] = DEFAULT_WATCHED_FILE_PATTERNS,
+    ) -> None:
+        self.root = root
+        self.hot_seconds = float(hot_seconds)
+        self.sweep_files = max(1, int(sweep_files))
+        self.watched_patterns = tuple(watched_patterns)
+        # directory -> (mtime_ns, listed_at, files, subdirectories)
+        self._dirs: dict[Path, tuple[int, float, list[Path], list[Path]]] = {}
+        self._files: dict[Path, float] = {}
+        self._watched: set[Path] = set()
+        self._sweep_at = 0
+
+    def _is_watched(self, path: Path) -> bool:
+        return any(fnmatch.fnmatch(path.name, pattern) for pattern in self.watched_patterns)
+
+    def _stat_file(self, path: Path) -> None:
+        try:
+            self._files[path] = path.stat().st_mtime
+        except OSError:
+            self._files.pop(path, None)
+
+    def _refresh_dirs(self, now: float) -> None:
+        seen: set[Path] = set()
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                stat = directory.stat()
+            except OSError:
+                continue
+            seen.add(directory)
+            recorded = self._dirs.get(directory)
+            if (
+                recorded is None
+                or recorded[0] != stat.st_mtime_ns
+                or recorded[1] - stat.st_mtime <= _RACY_MTIME_SECONDS
+            ):
+                files: list[Path] = []
+                subdirs: list[Path] = []
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(Path(entry.path))
+                                elif entry.is_file():
+                                    files.append(Path(entry.path))
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+                for path in set(recorded[2] if recorded else ()) - set(files):
+                    self._files.pop(path, None)
+                    self._watched.discard(path)
+                for path in files:
+                    if recorded is None or path not in self._files:
+                        self._stat_file(path)
+                        if self._is_watched(path):
+                            self._watched.add(path)
+                recorded = (stat.st_mtime_ns, now, files, subdirs)
+                self._dirs[directory] = recorded
+            stack.extend(recorded[3])
+        for directory in set(self._dirs) - seen:
+            for path in self._dirs.pop(directory)[2]:
+                self._files.pop(path, None)
+                self._watched.discard(path)
+
+    def latest_epoch(self) -> float | None:
+        """Refresh the tracked tree and return its newest file mtime (``None`` if none)."""
+
+        now = time.time()
+        self._refresh_dirs(now)
+        hot: list[Path] = []
+        cold: list[Path] = []
+        for path, mtime in self._files.items():
+            watched = path in self._watched
+            (hot if watched or now - mtime <= self.hot_seconds else cold).append(path)
+        for path in hot:
+            self._stat_file(path)
+        if cold:
+            start = self._sweep_at % len(cold)
+            count = min(self.sweep_files, len(cold))
+            for offset in range(count):
+                self._stat_file(cold[(start + offset) % len(cold)])
+            self._sweep_at = start + count
+        return max(self._files.values(), default=None)
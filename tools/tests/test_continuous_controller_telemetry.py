@@ -122,6 +122,7 @@ def test_continuous_controller_propagates_verified_versioned_context(
     ctx = SimpleNamespace(
         repo_root=tmp_path,
         owner_root=tmp_path,
+        runs_dir=tmp_path / "runs",
         settings_path=settings,
         batch_config_path=batch,
         backlog_model="gpt-5.6-sol",
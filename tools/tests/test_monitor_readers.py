@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+
+
+def _load_module() -> ModuleType:
+    module_path = Path(__file__).resolve().parents[1] / "monitor_readers.py"
+    spec = importlib.util.spec_from_file_location("monitor_readers", module_path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_tail_lines_matches_splitlines_across_blocks(tmp_path: Path, monkeypatch) -> None:
+    mod = _load_module()
+    monkeypatch.setattr(mod, "_BLOCK_BYTES", 7)
+    path = tmp_path / "log.txt"
+    text = "first\r\nsecond\n\nthïrd\nunterminated"
+    path.write_bytes(text.encode("utf-8"))
+
+    for limit in (1, 2, 3, 10):
+        assert mod.tail_lines(path, limit) == text.splitlines()[-limit:]
+    assert mod.tail_lines(tmp_path / "missing.txt", 5) == []
+
+
+def test_file_tail_reads_only_appended_bytes_and_reloads_after_rewrite(tmp_path: Path) -> None:
+    mod = _load_module()
+    path = tmp_path / "outcomes.jsonl"
+    path.write_text('{"n": 1}\n[2]\nnot json\n{"n": 3}', encoding="utf-8")
+    tail = mod.FileTail(path, 2, jsonl=True)
+
+    assert tail.read() == [{"n": 1}, {"n": 3}]
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('\n{"n": 4}\n{"n": 5')
+    assert tail.read() == [{"n": 3}, {"n": 4}]
+    assert tail._offset == path.stat().st_size
+
+    path.write_text(json.dumps({"n": 9}) + "\n", encoding="utf-8")
+    assert tail.read() == [{"n": 9}]
+
+
+def test_tree_activity_relists_only_changed_directories(tmp_path: Path, monkeypatch) -> None:
+    mod = _load_module()
+    monkeypatch.setattr(mod, "_RACY_MTIME_SECONDS", -1.0)
+    root = tmp_path / "batch"
+    (root / "run").mkdir(parents=True)
+    log = root / "run" / "agent.log"
+    log.write_text("start\n", encoding="utf-8")
+    os.utime(log, (1_000.0, 1_000.0))
+    for directory in (root / "run", root):
+        os.utime(directory, (500.0, 500.0))
+
+    activity = mod.TreeActivity(root, hot_seconds=60.0, sweep_files=1)
+    assert activity.latest_epoch() == 1_000.0
+
+    scanned: list[str] = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(
+        mod.os, "scandir", lambda path: scanned.append(str(path)) or real_scandir(path)
+    )
+    # An append to a cold file is found by the round-robin sweep without re-listing.
+    os.utime(log, (2_000.0, 2_000.0))
+    assert activity.latest_epoch() == 2_000.0
+    assert scanned == []
+
+    (root / "run" / "new.txt").write_text("x", encoding="utf-8")
+    assert activity.latest_epoch() > 2_000.0
+    assert scanned == [str(root / "run")]
+
+
+def test_tree_activity_counts_files_only_and_stats_logs_every_poll(
+    tmp_path: Path, monkeypatch
+) -> None:
+    mod = _load_module()
+    monkeypatch.setattr(mod, "_RACY_MTIME_SECONDS", -1.0)
+    root = tmp_path / "batch"
+    worker = root / "worker_logs" / "worker_0"
+    worker.mkdir(parents=True)
+    log = worker / "ticket.log"
+    paths = [log, *(worker / f"artifact_{index}.json" for index in range(8))]
+    for path in paths:
+        path.write_text("x", encoding="utf-8")
+        os.utime(path, (1_000.0, 1_000.0))
+    # A newer directory mtime alone is not activity.
+    for directory in (worker, worker.parent, root):
+        os.utime(directory, (5_000.0, 5_000.0))
+
+    activity = mod.TreeActivity(root, hot_seconds=60.0, sweep_files=1)
+    assert activity.latest_epoch() == 1_000.0
+
+    # The log is stat'ed on every poll, not when the round-robin sweep reaches it.
+    for epoch in (2_000.0, 3_000.0, 4_000.0):
+        os.utime(log, (epoch, epoch))
+        assert activity.latest_epoch() == epoch